@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+""" Benchmarks for gr_modtool.py. """
+# Copyright 2010 Communications Engineering Lab, KIT, Germany
+#
+# This is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GNU Radio; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+
+import os
+import re
+import sys
+import time
+import json
+import shutil
+import tempfile
+import subprocess
+from datetime import datetime
+from optparse import OptionParser
+
+BLOCK_TYPES = ('sync', 'general', 'decimator', 'interpolator', 'source', 'sink')
+ARGLIST = 'int ntaps, float gain=1.0'
+
+### Benchmark runner #########################################################
+class Benchmark(object):
+    """ Runs gr_modtool.py commands on a synthetic module and records
+    wall time, peak RSS and the number of files written for each of them.
+    Every command runs in its own process, so the peak RSS is that of
+    a single gr_modtool call. """
+    def __init__(self, script, workdir, python=sys.executable):
+        self.script = os.path.abspath(script)
+        self.workdir = workdir
+        self.python = python
+        self.results = []
+
+    def _snapshot(self, directory):
+        """ Return a dict path -> (mtime, size) for all files below directory. """
+        snapshot = {}
+        if not os.path.isdir(directory):
+            return snapshot
+        for root, dirs, files in os.walk(directory):
+            for filename in files:
+                path = os.path.join(root, filename)
+                stat = os.stat(path)
+                snapshot[path] = (stat.st_mtime, stat.st_size)
+        return snapshot
+
+    def _run(self, args, cwd, watch_dir):
+        """ Run a single gr_modtool.py call. Returns a dict with the measured values. """
+        before = self._snapshot(watch_dir)
+        devnull = open(os.devnull, 'r+')
+        start = time.time()
+        proc = subprocess.Popen([self.python, self.script] + args, cwd=cwd,
+                                stdin=devnull, stdout=devnull, stderr=subprocess.PIPE)
+        stderr = proc.stderr.read()
+        (pid, status, rusage) = os.wait4(proc.pid, 0)
+        wall_time = time.time() - start
+        devnull.close()
+        if status != 0:
+            raise RuntimeError("'gr_modtool %s' failed:\n%s" % (' '.join(args), stderr))
+        after = self._snapshot(watch_dir)
+        files_written = len([f for f in after.keys() if before.get(f) != after[f]])
+        files_deleted = len([f for f in before.keys() if f not in after])
+        return {'wall_time': wall_time,
+                'peak_rss_kb': rusage.ru_maxrss,
+                'files_written': files_written,
+                'files_deleted': files_deleted}
+
+    def record(self, layout, size, command, runs):
+        """ Sum up the measurements of one or more calls of the same command. """
+        result = {'layout': layout,
+                  'size': size,
+                  'command': command,
+                  'calls': len(runs),
+                  'wall_time': sum([r['wall_time'] for r in runs]),
+                  'peak_rss_kb': max([r['peak_rss_kb'] for r in runs]),
+                  'files_written': sum([r['files_written'] for r in runs]),
+                  'files_deleted': sum([r['files_deleted'] for r in runs])}
+        result['wall_time_per_call'] = result['wall_time'] / len(runs)
+        print "  %-10s %5d call(s) %9.3fs %8d kB %6d file(s) written" % (
+                command, result['calls'], result['wall_time'],
+                result['peak_rss_kb'], result['files_written'])
+        self.results.append(result)
+        return result
+
+    def make_36_layout(self, moddir, modname):
+        """ Turn a fresh (3.7-style) module into a pre-3.7 one, i.e. move
+        the headers from include/MODNAME/ to include/. """
+        incdir = os.path.join(moddir, 'include')
+        for fname in os.listdir(os.path.join(incdir, modname)):
+            os.rename(os.path.join(incdir, modname, fname), os.path.join(incdir, fname))
+        os.rmdir(os.path.join(incdir, modname))
+        os.rename(os.path.join(incdir, 'api.h'), os.path.join(incdir, '%s_api.h' % modname))
+        for (fname, subs) in (
+                (os.path.join(moddir, 'CMakeLists.txt'),
+                    ((r'add_subdirectory\(include/%s\)' % modname, 'add_subdirectory(include)'),)),
+                (os.path.join(incdir, 'CMakeLists.txt'),
+                    ((r'\bapi\.h', '%s_api.h' % modname),
+                     (r'DESTINATION include/%s' % modname, 'DESTINATION include')))):
+            cfile = open(fname, 'r').read()
+            for (pattern, repl) in subs:
+                cfile = re.sub(pattern, repl, cfile)
+            open(fname, 'w').write(cfile)
+
+    def run_swig_doc(self, moddir, modname, layout, size):
+        """ Run doxygen and the doxyxml/swig_doc pipeline on the module headers,
+        if doxygen is available. Only swig_doc.py is timed. """
+        doxygen = find_executable('doxygen')
+        if doxygen is None:
+            print "  swig_doc   skipped (doxygen not found)"
+            self.results.append({'layout': layout, 'size': size,
+                                 'command': 'swig_doc', 'skipped': 'doxygen not found'})
+            return
+        incdir = os.path.join(moddir, 'include')
+        if layout == '37':
+            incdir = os.path.join(incdir, modname)
+        xmldir = os.path.join(self.workdir, 'swig_doc_%s_%d' % (layout, size))
+        os.mkdir(xmldir)
+        doxyfile = os.path.join(xmldir, 'Doxyfile')
+        open(doxyfile, 'w').write(
+                'INPUT = %s\nOUTPUT_DIRECTORY = %s\nGENERATE_XML = YES\n'
+                'GENERATE_HTML = NO\nGENERATE_LATEX = NO\nQUIET = YES\nWARNINGS = NO\n'
+                % (incdir, xmldir))
+        devnull = open(os.devnull, 'w')
+        subprocess.check_call([doxygen, doxyfile], cwd=xmldir, stdout=devnull, stderr=devnull)
+        devnull.close()
+        doxydir = os.path.join(moddir, 'docs', 'doxygen')
+        swig_doc_script = Benchmark(os.path.join(doxydir, 'swig_doc.py'), self.workdir, self.python)
+        run = swig_doc_script._run([os.path.join(xmldir, 'xml'), os.path.join(xmldir, 'swig_doc.i')],
+                                   doxydir, xmldir)
+        self.record(layout, size, 'swig_doc', [run])
+
+    def run_module(self, layout, size):
+        """ Create a module with 'size' blocks in the given layout ('36' or '37')
+        and time all commands on it. """
+        modname = 'bench%s_%d' % (layout, size)
+        moddir = os.path.join(self.workdir, 'gr-%s' % modname)
+        print "Module %s (%d blocks, layout %s):" % (modname, size, layout)
+        self.record(layout, size, 'newmod',
+                    [self._run(['newmod', modname], self.workdir, moddir)])
+        if layout == '36':
+            self.make_36_layout(moddir, modname)
+        runs = []
+        for i in range(size):
+            blocktype = BLOCK_TYPES[i % len(BLOCK_TYPES)]
+            lang = 'cpp'
+            if i % 4 == 3:
+                lang = 'python'
+            runs.append(self._run(['add', '-t', blocktype, '-l', lang,
+                                   '--argument-list', ARGLIST,
+                                   '--add-python-qa', '--add-cpp-qa',
+                                   'blk%04d_%s' % (i, blocktype)],
+                                  moddir, moddir))
+        self.record(layout, size, 'add', runs)
+        self.record(layout, size, 'info', [self._run(['info'], moddir, moddir)])
+        self.record(layout, size, 'makexml', [self._run(['makexml', '-y', 'blk'], moddir, moddir)])
+        self.run_swig_doc(moddir, modname, layout, size)
+        self.record(layout, size, 'disable', [self._run(['disable', '-y', 'blk..[02468]'], moddir, moddir)])
+        self.record(layout, size, 'rm', [self._run(['rm', '-y', 'blk'], moddir, moddir)])
+
+def find_executable(name):
+    """ Return the full path of an executable in $PATH, or None. """
+    for path in os.environ.get('PATH', '').split(os.pathsep):
+        full_path = os.path.join(path, name)
+        if os.path.isfile(full_path) and os.access(full_path, os.X_OK):
+            return full_path
+    return None
+
+def main():
+    """ Parse options, run benchmarks, write JSON. """
+    parser = OptionParser(usage='%prog [options]')
+    parser.add_option("-s", "--sizes", type="string", default="10,100,1000",
+            help="Comma-separated list of module sizes (number of blocks).")
+    parser.add_option("-l", "--layouts", type="string", default="36,37",
+            help="Comma-separated list of module layouts (36 or 37).")
+    parser.add_option("-o", "--output", type="string", default="benchmark.json",
+            help="File to write the JSON results to.")
+    parser.add_option("--script", type="string",
+            default=os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'gr_modtool.py'),
+            help="The gr_modtool.py to benchmark.")
+    parser.add_option("--keep", action="store_true", default=False,
+            help="Don't delete the synthetic modules afterwards.")
+    (options, args) = parser.parse_args()
+    workdir = tempfile.mkdtemp(prefix='gr_modtool_bench_')
+    bench = Benchmark(options.script, workdir)
+    try:
+        for layout in options.layouts.split(','):
+            for size in options.sizes.split(','):
+                bench.run_module(layout.strip(), int(size))
+    finally:
+        if options.keep:
+            print "Modules are in %s." % workdir
+        else:
+            shutil.rmtree(workdir)
+    json.dump({'script': os.path.abspath(options.script),
+               'python': sys.version.split()[0],
+               'date': datetime.now().isoformat(),
+               'results': bench.results},
+              open(options.output, 'w'), indent=2, sort_keys=True)
+    print "Results written to %s." % options.output
+
+if __name__ == '__main__':
+    main()
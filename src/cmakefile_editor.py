@@ -2,15 +2,19 @@
 
 import re
 
+from profiler import profile_phase
+
 ### CMakeFile.txt editor class ###############################################
 class CMakeFileEditor(object):
     """A tool for editing CMakeLists.txt files. """
+    @profile_phase('edit')
     def __init__(self, filename, separator='\n    ', indent='    '):
         self.filename = filename
         self.cfile = open(filename, 'r').read()
         self.separator = separator
         self.indent = indent
 
+    @profile_phase('edit')
     def get_entry_value(self, entry, to_ignore=''):
         """ Get the value of an entry.
         to_ignore is the part of the entry you don't care about. """
@@ -21,6 +25,7 @@ class CMakeFileEditor(object):
         value = mobj.groups()[0].strip()
         return value
 
+    @profile_phase('edit')
     def append_value(self, entry, value, to_ignore=''):
         """ Add a value to an entry. """
         regexp = re.compile('(%s\([^()]*?)\s*?(\s?%s)\)' % (entry, to_ignore),
@@ -28,26 +33,31 @@ class CMakeFileEditor(object):
         substi = r'\1' + self.separator + value + r'\2)'
         self.cfile = regexp.sub(substi, self.cfile, count=1)
 
+    @profile_phase('edit')
     def remove_value(self, entry, value, to_ignore=''):
         """Remove a value from an entry."""
         regexp = '^\s*(%s\(\s*%s[^()]*?\s*)%s\s*([^()]*\))' % (entry, to_ignore, value)
         regexp = re.compile(regexp, re.MULTILINE)
         self.cfile = re.sub(regexp, r'\1\2', self.cfile, count=1)
 
+    @profile_phase('edit')
     def delete_entry(self, entry, value_pattern=''):
         """Remove an entry from the current buffer."""
         regexp = '%s\s*\([^()]*%s[^()]*\)[^\n]*\n' % (entry, value_pattern)
         regexp = re.compile(regexp, re.MULTILINE)
         self.cfile = re.sub(regexp, '', self.cfile, count=1)
 
+    @profile_phase('write')
     def write(self):
         """ Write the changes back to the file. """
         open(self.filename, 'w').write(self.cfile)
 
+    @profile_phase('edit')
     def remove_double_newlines(self):
         """Simply clear double newlines from the file buffer."""
         self.cfile = re.compile('\n\n\n+', re.MULTILINE).sub('\n\n', self.cfile)
 
+    @profile_phase('edit')
     def find_filenames_match(self, regex):
         """ Find the filenames that match a certain regex
         on lines that aren't comments """
@@ -62,6 +72,7 @@ class CMakeFileEditor(object):
                     filenames.append(word)
         return filenames
 
+    @profile_phase('edit')
     def disable_file(self, fname):
         """ Comment out a file """
         starts_line = False
@@ -81,12 +92,14 @@ class CMakeFileEditor(object):
         elif nsubs > 1:
             print "Warning: Replaced %s %d times (instead of once). Check the CMakeFile.txt manually." % (fname, nsubs)
 
+    @profile_phase('edit')
     def comment_out_lines(self, pattern, comment_str='#'):
         """ Comments out all lines that match with pattern """
         for line in self.cfile.splitlines():
             if re.search(pattern, line):
                 self.cfile = self.cfile.replace(line, comment_str+line)
 
+    @profile_phase('edit')
     def check_for_glob(self, globstr):
         """ Returns true if a glob as in globstr is found in the cmake file """
         glob_re = r'GLOB\s[a-z_]+\s"%s"' % globstr.replace('*', '\*')
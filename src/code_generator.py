@@ -6,6 +6,8 @@ from util_functions import str_to_fancyc_comment
 from util_functions import str_to_python_comment
 from util_functions import strip_default_values
 from util_functions import strip_arg_types
+from util_functions import get_python_arg_values
+from profiler import profile_phase
 
 ### Code generator class #####################################################
 class GRMTemplate(Cheetah.Template.Template):
@@ -18,15 +20,37 @@ class GRMTemplate(Cheetah.Template.Template):
                 'decimator': 'gr_sync_decimator',
                 'interpolator': 'gr_sync_interpolator',
                 'general': 'gr_block',
+                'tagged_stream': 'gr_tagged_stream_block',
+                'message': 'gr_block',
                 'hier': 'gr_hier_block2',
                 'noblock': ''}
+        self.numpytypes = {
+                'float': 'numpy.float32',
+                'complex': 'numpy.complex64',
+                'int': 'numpy.int32',
+                'short': 'numpy.int16',
+                'byte': 'numpy.int8'}
+        self.ctypes = {
+                'float': 'float',
+                'complex': 'gr_complex',
+                'int': 'int',
+                'short': 'short',
+                'byte': 'unsigned char'}
+        self.grsizeof = {
+                'float': 'gr.sizeof_float',
+                'complex': 'gr.sizeof_gr_complex',
+                'int': 'gr.sizeof_int',
+                'short': 'gr.sizeof_short',
+                'byte': 'gr.sizeof_char'}
         searchList['str_to_fancyc_comment'] = str_to_fancyc_comment
         searchList['str_to_python_comment'] = str_to_python_comment
         searchList['strip_default_values'] = strip_default_values
         searchList['strip_arg_types'] = strip_arg_types
+        searchList['get_python_arg_values'] = get_python_arg_values
         Cheetah.Template.Template.__init__(self, src, searchList=searchList)
         self.grblocktype = self.grtypelist[searchList['blocktype']]
 
+@profile_phase('render')
 def get_template(tpl_id, **kwargs):
     """ Return the template given by tpl_id, parsed through Cheetah """
     return str(GRMTemplate(Templates[tpl_id], searchList=kwargs))
@@ -0,0 +1,174 @@
+""" Include and symbol dependencies between the blocks of a module """
+
+import os
+import re
+import json
+
+from profiler import profile_phase
+
+### Dependency graph class ###################################################
+class DependencyGraph(object):
+    """ Include and symbol-usage graph over the files in lib/, include/,
+    swig/, python/ and pybind/ of a module.
+
+    Every file is scanned once for the headers it includes and the blocks
+    it uses. The results are kept in the module index (index_file) and
+    only files that changed since are scanned again. Files are owned by
+    a block if their name is the block name, optionally with a qa_/bm_ and
+    a MODNAME_ prefix and an _impl/_python/_swig suffix.
+    """
+    _index_version = 2
+    _extensions = ('.h', '.cc', '.cpp', '.i', '.py')
+    _include_re = re.compile(r'^\s*[#%]\s*include\s*[<"]([^>"]+)[>"]', re.MULTILINE)
+
+    def __init__(self, modname, includedir, blocks=None, index_file='.gr_modtool_index.json'):
+        self.modname = modname
+        self.index_file = index_file
+        self.includedir = includedir
+        self.subdirs = ('lib', includedir, 'swig', 'python', 'pybind')
+        self._symbol_res = (
+                re.compile(r'\b(\w+)::(?:make|sptr)\b'),                # foo::make, foo::sptr
+                re.compile(r'\b(\w+)_impl\b'),                          # foo_impl
+                re.compile(r'\b%s_make_(\w+)\b' % modname),             # 3.6: MODNAME_make_foo
+                re.compile(r'\b%s_(\w+)_sptr\b' % modname),             # 3.6: MODNAME_foo_sptr
+                re.compile(r'\b%s\.(\w+)\s*\(' % modname),              # Python: MODNAME.foo(...)
+                re.compile(r'^\s*from\s+(\w+)\s+import\b', re.MULTILINE),
+                re.compile(r'^\s*import\s+(\w+)', re.MULTILINE),
+        )
+        self._files = {}
+        self._index = {'version': self._index_version, 'modname': modname, 'files': {}}
+        self.nscanned = 0
+        self.blocks = blocks
+        self.update()
+        if not self.blocks:
+            self.blocks = self._find_blocks()
+        self._owner_res = [(blockname,
+                            re.compile(r'^(qa_|bm_)?(%s_)?%s(_impl|_python|_swig)?\.\w+$' % (
+                                       modname, blockname)))
+                           for blockname in self.blocks]
+
+    @profile_phase('parse')
+    def update(self):
+        """ Scan all files that aren't in the module index or that changed
+        since. Writes the index back if anything changed. """
+        try:
+            index = json.load(open(self.index_file, 'r'))
+            if index.get('version') == self._index_version and index.get('modname') == self.modname:
+                self._index = index
+        except (IOError, ValueError):
+            pass
+        cached = self._index['files']
+        files = {}
+        for subdir in self.subdirs:
+            if not os.path.isdir(subdir):
+                continue
+            for fname in sorted(os.listdir(subdir)):
+                if os.path.splitext(fname)[1] not in self._extensions:
+                    continue
+                path = os.path.join(subdir, fname)
+                stat = os.stat(path)
+                key = [stat.st_mtime, stat.st_size, stat.st_ino]
+                if path in cached and cached[path]['stat'] == key:
+                    files[path] = cached[path]
+                    continue
+                files[path] = self._scan_file(path)
+                files[path]['stat'] = key
+                self.nscanned += 1
+        if self.nscanned or len(files) != len(cached):
+            self._index['files'] = files
+            try:
+                json.dump(self._index, open(self.index_file, 'w'), sort_keys=True)
+            except IOError:
+                pass
+        self._files = files
+
+    def _scan_file(self, path):
+        """ Return the headers a file includes and the names it uses """
+        content = open(path, 'r').read()
+        if path.endswith('.py'):
+            # Python files have comments, but no #include
+            content = re.sub(r'#.*', '', content)
+            includes = []
+        else:
+            includes = self._include_re.findall(content)
+            content = re.sub(r'//.*|/\*.*?\*/', '', content, flags=re.DOTALL)
+        symbols = set()
+        for symbol_re in self._symbol_res:
+            symbols.update(symbol_re.findall(content))
+        return {'includes': sorted(set(includes)), 'symbols': sorted(symbols)}
+
+    def _find_blocks(self):
+        """ The blocks of a module without a block list: every public
+        header, and every Python file with QA code of its own. """
+        blocks = set()
+        for path in self._files.keys():
+            (dirname, fname) = os.path.split(path)
+            (base, ext) = os.path.splitext(fname)
+            if dirname == self.includedir and ext == '.h' and base != 'api':
+                if self.includedir == 'include' and base.startswith(self.modname + '_'):
+                    base = base[len(self.modname)+1:]
+                if base != 'api':
+                    blocks.add(base)
+            elif dirname == 'python' and ext == '.py' and \
+                    os.path.join('python', 'qa_%s.py' % base) in self._files:
+                blocks.add(base)
+        return sorted(blocks)
+
+    def owner(self, path):
+        """ Return the block a file belongs to, or None """
+        fname = os.path.basename(path)
+        for (blockname, owner_re) in self._owner_res:
+            if owner_re.match(fname) is not None:
+                return blockname
+        return None
+
+    def files_of(self, blockname):
+        """ Return all files of a block """
+        return sorted([path for path in self._files.keys() if self.owner(path) == blockname])
+
+    def _uses(self, path, files, blocks):
+        """ Check if the file at path includes one of files or uses one of
+        blocks. Returns a description of the first such use, or None. """
+        basenames = dict([(os.path.basename(f), f) for f in files])
+        for include in self._files[path]['includes']:
+            if os.path.basename(include) in basenames:
+                return '%s includes %s' % (path, include)
+        for symbol in self._files[path]['symbols']:
+            if symbol.startswith(self.modname + '_') and symbol[len(self.modname)+1:] in blocks:
+                symbol = symbol[len(self.modname)+1:]
+            if symbol in blocks:
+                return '%s uses %s' % (path, symbol)
+        return None
+
+    def dependents(self, blocks, ignore=()):
+        """ Return everything that breaks if blocks are removed or disabled,
+        as a tuple (dependent blocks, dependent files). The dependent
+        blocks are the full closure: blocks using blocks that use blocks
+        etc. Dependent files are files that don't belong to a block, apart
+        from files matching one of the regexes in ignore (typically the
+        files gr_modtool edits anyway). Both are dicts that map the block or
+        file to the reason. """
+        removed = set(blocks)
+        dependent_blocks = {}
+        dependent_files = {}
+        ignore_res = [re.compile(pattern) for pattern in ignore]
+        changed = True
+        while changed:
+            changed = False
+            removed_files = [path for path in self._files.keys() if self.owner(path) in removed]
+            for path in sorted(self._files.keys()):
+                owner = self.owner(path)
+                if owner in removed or path in dependent_files:
+                    continue
+                if owner is None and len([r for r in ignore_res if r.search(path) is not None]):
+                    continue
+                reason = self._uses(path, removed_files, removed)
+                if reason is None:
+                    continue
+                if owner is None:
+                    dependent_files[path] = reason
+                else:
+                    dependent_blocks[owner] = reason
+                    removed.add(owner)
+                    changed = True
+        return (dependent_blocks, dependent_files)
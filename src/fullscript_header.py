@@ -21,9 +21,19 @@
 import sys
 import os
 import re
+import time
+import json
+import pstats
+import cProfile
+import __builtin__
 import glob
+import shutil
 import base64
 import tarfile
+import subprocess
+import threading
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
 from datetime import datetime
 from optparse import OptionParser, OptionGroup
 import Cheetah.Template
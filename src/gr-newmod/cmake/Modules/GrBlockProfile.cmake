@@ -0,0 +1,183 @@
+# Copyright 2013 Free Software Foundation, Inc.
+#
+# This file is part of GNU Radio
+#
+# GNU Radio is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# GNU Radio is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GNU Radio; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+
+if(DEFINED __INCLUDED_GR_BLOCK_PROFILE_CMAKE)
+    return()
+endif()
+set(__INCLUDED_GR_BLOCK_PROFILE_CMAKE TRUE)
+
+########################################################################
+# Block build profiles: build only some of the blocks of a module.
+#  block_list.txt    all blocks of the module, one per line (gr_modtool
+#                    add/rm keep it up to date)
+#  build_profile.txt the blocks to build, one per line. If it lists no
+#                    blocks, all are built (see 'gr_modtool profile')
+# Every block also gets an option ENABLE_BLOCK_<name>, which is used
+# while build_profile.txt lists no blocks.
+# The sources aren't changed: the files of disabled blocks are left out
+# of the build, and files shared by all blocks (the SWIG file, the C++
+# QA suite) are compiled from a copy without the lines of those blocks.
+#
+# Usage (top-level CMakeLists.txt): GR_BLOCK_PROFILE(modname)
+########################################################################
+macro(GR_BLOCK_PROFILE modname)
+    set(GR_BLOCK_PROFILE_MODNAME ${modname})
+    set(GR_BLOCKS)
+    set(GR_DISABLED_BLOCKS)
+    set(_profile_blocks)
+    if(EXISTS ${CMAKE_SOURCE_DIR}/block_list.txt)
+        #re-run cmake when the lists change
+        configure_file(${CMAKE_SOURCE_DIR}/block_list.txt
+                       ${CMAKE_BINARY_DIR}/block_profile/block_list.txt COPYONLY)
+        file(STRINGS ${CMAKE_SOURCE_DIR}/block_list.txt GR_BLOCKS REGEX "^[A-Za-z0-9_]+$")
+    endif()
+    if(EXISTS ${CMAKE_SOURCE_DIR}/build_profile.txt)
+        configure_file(${CMAKE_SOURCE_DIR}/build_profile.txt
+                       ${CMAKE_BINARY_DIR}/block_profile/build_profile.txt COPYONLY)
+        file(STRINGS ${CMAKE_SOURCE_DIR}/build_profile.txt _profile_blocks REGEX "^[A-Za-z0-9_]+$")
+    endif()
+    foreach(_block ${GR_BLOCKS})
+        option(ENABLE_BLOCK_${_block} "Build the block ${_block}" ON)
+        if(_profile_blocks)
+            list(FIND _profile_blocks ${_block} _block_index)
+            if(_block_index EQUAL -1)
+                list(APPEND GR_DISABLED_BLOCKS ${_block})
+            endif()
+        elseif(NOT ENABLE_BLOCK_${_block})
+            list(APPEND GR_DISABLED_BLOCKS ${_block})
+        endif()
+    endforeach(_block)
+    if(GR_DISABLED_BLOCKS)
+        list(LENGTH GR_BLOCKS _nblocks)
+        list(LENGTH GR_DISABLED_BLOCKS _ndisabled)
+        math(EXPR _nenabled "${_nblocks} - ${_ndisabled}")
+        message(STATUS "Build profile: ${_nenabled} of ${_nblocks} blocks enabled")
+        message(STATUS "  Disabled: ${GR_DISABLED_BLOCKS}")
+    endif(GR_DISABLED_BLOCKS)
+endmacro(GR_BLOCK_PROFILE)
+
+########################################################################
+# Check if a file or target belongs to a disabled block, i.e. its name
+# (without directory and extension) is the block name, optionally
+# prefixed with qa_ and/or MODNAME_ and suffixed with _impl or _python.
+#  - name the file or target name
+#  - var set to TRUE or FALSE
+########################################################################
+function(GR_BLOCK_IS_DISABLED name var)
+    get_filename_component(_name ${name} NAME_WE)
+    set(${var} FALSE PARENT_SCOPE)
+    foreach(_block ${GR_DISABLED_BLOCKS})
+        if(_name MATCHES "^(qa_)?(${GR_BLOCK_PROFILE_MODNAME}_)?${_block}(_impl|_python)?$")
+            set(${var} TRUE PARENT_SCOPE)
+        endif()
+    endforeach(_block)
+endfunction(GR_BLOCK_IS_DISABLED)
+
+########################################################################
+# Return a file without the lines that refer to disabled blocks.
+#  - file the file (relative to the current source directory)
+#  - var set to the file itself if nothing needs to change, or to a
+#    copy in the build directory with these lines commented out
+########################################################################
+function(GR_BLOCK_PROFILE_FILE file var)
+    set(${var} ${file} PARENT_SCOPE)
+    if(NOT GR_DISABLED_BLOCKS)
+        return()
+    endif()
+    get_filename_component(_path ${file} ABSOLUTE)
+    get_filename_component(_name ${file} NAME)
+    file(READ ${_path} _content)
+    #one newline before and after every line, so the regex can match whole lines
+    set(_filtered "\n${_content}\n")
+    string(REPLACE "\n" "\n\n" _filtered "${_filtered}")
+    foreach(_block ${GR_DISABLED_BLOCKS})
+        string(REGEX REPLACE
+            "\n(([^\n]*[^A-Za-z0-9_\n])?(qa_)?(${GR_BLOCK_PROFILE_MODNAME}_)?${_block}([^A-Za-z0-9_\n][^\n]*)?)\n"
+            "\n//\\1\n" _filtered "${_filtered}")
+    endforeach(_block)
+    string(REPLACE "\n\n" "\n" _filtered "${_filtered}")
+    if(_filtered STREQUAL "\n${_content}\n")
+        return()
+    endif()
+    string(REGEX REPLACE "^\n" "" _filtered "${_filtered}")
+    string(REGEX REPLACE "\n$" "" _filtered "${_filtered}")
+    set(_copy ${CMAKE_CURRENT_BINARY_DIR}/block_profile/${_name})
+    if(EXISTS ${_copy})
+        file(READ ${_copy} _old_copy)
+    endif()
+    if(NOT "${_old_copy}" STREQUAL "${_filtered}")
+        file(WRITE ${_copy} "${_filtered}")
+    endif()
+    #re-run cmake when the original changes
+    configure_file(${_path} ${CMAKE_CURRENT_BINARY_DIR}/block_profile/${_name}.stamp COPYONLY)
+    set(${var} ${_copy} PARENT_SCOPE)
+endfunction(GR_BLOCK_PROFILE_FILE)
+
+########################################################################
+# Filter a list of sources before it is used: files of disabled blocks
+# are removed, the other files are replaced by GR_BLOCK_PROFILE_FILE().
+#  - list_var the name of the list
+########################################################################
+macro(GR_BLOCK_PROFILE_SOURCES list_var)
+    if(GR_DISABLED_BLOCKS)
+        set(_profile_sources)
+        foreach(_src ${${list_var}})
+            GR_BLOCK_IS_DISABLED(${_src} _src_disabled)
+            if(NOT _src_disabled)
+                GR_BLOCK_PROFILE_FILE(${_src} _src_filtered)
+                if(NOT _src_filtered STREQUAL _src)
+                    #the copy still includes headers from next to the original
+                    get_filename_component(_src_dir ${_src} ABSOLUTE)
+                    get_filename_component(_src_dir ${_src_dir} PATH)
+                    include_directories(${_src_dir})
+                endif()
+                list(APPEND _profile_sources ${_src_filtered})
+            endif()
+        endforeach(_src)
+        set(${list_var} ${_profile_sources})
+    endif(GR_DISABLED_BLOCKS)
+endmacro(GR_BLOCK_PROFILE_SOURCES)
+
+########################################################################
+# Leave the sources of disabled blocks out of an existing target.
+#  - target the target
+########################################################################
+macro(GR_BLOCK_PROFILE_TARGET target)
+    if(GR_DISABLED_BLOCKS)
+        get_target_property(_profile_sources ${target} SOURCES)
+        foreach(_src ${_profile_sources})
+            GR_BLOCK_IS_DISABLED(${_src} _src_disabled)
+            if(_src_disabled)
+                set_source_files_properties(${_src} PROPERTIES
+                    HEADER_FILE_ONLY TRUE GR_BLOCK_DISABLED TRUE)
+            endif()
+        endforeach(_src)
+    endif(GR_DISABLED_BLOCKS)
+endmacro(GR_BLOCK_PROFILE_TARGET)
+
+########################################################################
+# Don't install the GRC files of disabled blocks (MODNAME_BLOCK.xml).
+# Call after the install() of the GRC files.
+#  - destination the destination of the GRC files
+########################################################################
+macro(GR_BLOCK_PROFILE_INSTALL destination)
+    foreach(_block ${GR_DISABLED_BLOCKS})
+        install(CODE "file(REMOVE \"\$ENV{DESTDIR}\${CMAKE_INSTALL_PREFIX}/${destination}/${GR_BLOCK_PROFILE_MODNAME}_${_block}.xml\")")
+    endforeach(_block)
+endmacro(GR_BLOCK_PROFILE_INSTALL)
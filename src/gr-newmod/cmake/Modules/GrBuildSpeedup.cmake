@@ -0,0 +1,136 @@
+# Copyright 2013 Free Software Foundation, Inc.
+#
+# This file is part of GNU Radio
+#
+# GNU Radio is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# GNU Radio is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GNU Radio; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+
+if(DEFINED __INCLUDED_GR_BUILD_SPEEDUP_CMAKE)
+    return()
+endif()
+set(__INCLUDED_GR_BUILD_SPEEDUP_CMAKE TRUE)
+
+########################################################################
+# Build speed-ups, all of them can be switched on and off at configure
+# time, the sources stay the same:
+#  ENABLE_CCACHE      use ccache as compiler launcher, if it is found
+#  ENABLE_UNITY_BUILD compile the blocks of a library as one source
+#  ENABLE_PCH         precompile the headers the blocks have in common
+########################################################################
+option(ENABLE_CCACHE "Use ccache as compiler launcher if it is found" ON)
+option(ENABLE_UNITY_BUILD "Compile all blocks of the library as one translation unit" OFF)
+option(ENABLE_PCH "Precompile the GNU Radio headers common to all blocks (GCC only)" OFF)
+
+if(ENABLE_CCACHE)
+    find_program(CCACHE_EXECUTABLE ccache)
+    if(CCACHE_EXECUTABLE)
+        message(STATUS "Using ccache: ${CCACHE_EXECUTABLE}")
+        set_property(GLOBAL PROPERTY RULE_LAUNCH_COMPILE ${CCACHE_EXECUTABLE})
+    endif(CCACHE_EXECUTABLE)
+endif(ENABLE_CCACHE)
+
+########################################################################
+# Unity build of a library.
+#  - target the library target
+#  - unity_file a source of the target that #includes the sources of
+#    the blocks (MODNAME_unity.cc, kept up to date by gr_modtool)
+# With ENABLE_UNITY_BUILD, the sources included by the unity file aren't
+# compiled on their own. Otherwise the unity file isn't compiled.
+# Sources that can't be compiled together with the others can simply
+# be commented out in the unity file. While a build profile leaves out
+# blocks (GR_BLOCK_PROFILE_TARGET), the sources are compiled one by one.
+########################################################################
+macro(GR_UNITY_BUILD target unity_file)
+    get_filename_component(_unity_path ${unity_file} ABSOLUTE)
+    get_filename_component(_unity_name ${unity_file} NAME)
+    get_filename_component(_unity_dir ${_unity_path} PATH)
+    #re-run cmake when the list of included sources changes
+    configure_file(${_unity_path} ${CMAKE_CURRENT_BINARY_DIR}/unity/${_unity_name}.stamp COPYONLY)
+    set(_unity_srcs)
+    if(ENABLE_UNITY_BUILD)
+        file(STRINGS ${_unity_path} _unity_includes REGEX "^[ \t]*#[ \t]*include[ \t]+\"[^\"]+\"")
+        foreach(_unity_include ${_unity_includes})
+            string(REGEX REPLACE "^[ \t]*#[ \t]*include[ \t]+\"([^\"]+)\".*$" "${_unity_dir}/\\1" _unity_src "${_unity_include}")
+            get_source_file_property(_unity_src_disabled ${_unity_src} GR_BLOCK_DISABLED)
+            if(_unity_src_disabled)
+                message(STATUS "Unity build of ${target} is off while the build profile leaves out blocks")
+                set(_unity_srcs)
+                break()
+            endif(_unity_src_disabled)
+            list(APPEND _unity_srcs ${_unity_src})
+        endforeach(_unity_include)
+    endif(ENABLE_UNITY_BUILD)
+    if(_unity_srcs)
+        list(LENGTH _unity_srcs _unity_count)
+        set_source_files_properties(${_unity_srcs} PROPERTIES HEADER_FILE_ONLY TRUE)
+        message(STATUS "Unity build of ${target}: ${_unity_count} sources in ${_unity_name}")
+    else(_unity_srcs)
+        set_source_files_properties(${_unity_path} PROPERTIES HEADER_FILE_ONLY TRUE)
+    endif(_unity_srcs)
+endmacro(GR_UNITY_BUILD)
+
+########################################################################
+# Precompiled header of a target (GCC only).
+#  - target the target whose sources use the header
+#  - header the header to precompile (MODNAME_pch.h, kept up to date by
+#    gr_modtool), it is implicitly included by every source
+# The header is compiled with the include directories and definitions
+# of the current directory. Does nothing unless ENABLE_PCH is set.
+########################################################################
+macro(GR_PRECOMPILE_HEADER target header)
+    if(ENABLE_PCH AND CMAKE_COMPILER_IS_GNUCXX)
+        get_filename_component(_pch_path ${header} ABSOLUTE)
+        get_filename_component(_pch_name ${header} NAME)
+        set(_pch_dir ${CMAKE_CURRENT_BINARY_DIR}/pch)
+        configure_file(${_pch_path} ${_pch_dir}/${_pch_name} COPYONLY)
+
+        string(TOUPPER "CMAKE_CXX_FLAGS_${CMAKE_BUILD_TYPE}" _pch_flags_var)
+        set(_pch_flags "${CMAKE_CXX_FLAGS} ${${_pch_flags_var}}")
+        separate_arguments(_pch_flags)
+        get_directory_property(_pch_incdirs INCLUDE_DIRECTORIES)
+        foreach(_pch_incdir ${_pch_incdirs})
+            list(APPEND _pch_flags -I${_pch_incdir})
+        endforeach(_pch_incdir)
+        get_directory_property(_pch_defs DEFINITIONS)
+        separate_arguments(_pch_defs)
+        list(APPEND _pch_flags ${_pch_defs})
+        if(CMAKE_SHARED_LIBRARY_CXX_FLAGS)
+            list(APPEND _pch_flags ${CMAKE_SHARED_LIBRARY_CXX_FLAGS})
+        endif(CMAKE_SHARED_LIBRARY_CXX_FLAGS)
+
+        add_custom_command(
+            OUTPUT ${_pch_dir}/${_pch_name}.gch
+            COMMAND ${CMAKE_CXX_COMPILER} ${_pch_flags} -x c++-header
+                    -o ${_pch_dir}/${_pch_name}.gch ${_pch_dir}/${_pch_name}
+            DEPENDS ${_pch_dir}/${_pch_name}
+            IMPLICIT_DEPENDS CXX ${_pch_dir}/${_pch_name}
+            COMMENT "Precompiling ${_pch_name}"
+        )
+        add_custom_target(${target}_pch DEPENDS ${_pch_dir}/${_pch_name}.gch)
+        add_dependencies(${target} ${target}_pch)
+
+        set(_pch_compile_flags "-include ${_pch_dir}/${_pch_name} -Winvalid-pch")
+        if(CCACHE_EXECUTABLE)
+            #ccache also needs sloppiness = pch_defines,time_macros
+            set(_pch_compile_flags "${_pch_compile_flags} -fpch-preprocess")
+        endif(CCACHE_EXECUTABLE)
+        get_target_property(_pch_target_flags ${target} COMPILE_FLAGS)
+        if(_pch_target_flags)
+            set(_pch_compile_flags "${_pch_target_flags} ${_pch_compile_flags}")
+        endif(_pch_target_flags)
+        set_target_properties(${target} PROPERTIES COMPILE_FLAGS "${_pch_compile_flags}")
+        message(STATUS "Precompiled header of ${target}: ${_pch_name}")
+    endif(ENABLE_PCH AND CMAKE_COMPILER_IS_GNUCXX)
+endmacro(GR_PRECOMPILE_HEADER)
@@ -30,9 +30,17 @@ set(__INCLUDED_GR_TEST_CMAKE TRUE)
 # GR_TEST_TARGET_DEPS  - built targets for the library path
 # GR_TEST_LIBRARY_DIRS - directories for the library path
 # GR_TEST_PYTHON_DIRS  - directories for the python path
+# Tests of blocks left out by the build profile are skipped.
 ########################################################################
 function(GR_ADD_TEST test_name)
 
+    if(COMMAND GR_BLOCK_IS_DISABLED)
+        GR_BLOCK_IS_DISABLED(${test_name} test_disabled)
+        if(test_disabled)
+            return()
+        endif(test_disabled)
+    endif(COMMAND GR_BLOCK_IS_DISABLED)
+
     if(WIN32)
         #Ensure that the build exe also appears in the PATH.
         list(APPEND GR_TEST_TARGET_DEPS ${ARGN})
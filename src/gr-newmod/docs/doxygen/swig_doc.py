@@ -28,6 +28,8 @@ python docstrings.
 """
 
 import sys
+import os
+import hashlib
 
 try:
     from doxyxml import DoxyIndex, DoxyClass, DoxyFriend, DoxyFunction, DoxyFile, base
@@ -181,18 +183,79 @@ def make_block_entry(di, block):
     return "\n\n".join(output)
 
 
+class SwigDocWriter(object):
+    """
+    Streams docstring entries into a swig interface file.
+
+    Entries are written to a temporary file as soon as they are produced,
+    so only one entry is held in memory at a time. An md5 digest of every
+    entry is kept and stored in a sidecar file next to the output file.
+    If the digests match those of the previous run, the existing output
+    file is left untouched, so its timestamp doesn't change and nothing
+    that depends on it (SWIG, the C++ compiler) gets triggered.
+    """
+
+    entry_sep = "\n\n"
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.digest_filename = filename + '.md5'
+        self.tmp_filename = filename + '.tmp'
+        self.digests = []
+        self._fid = open(self.tmp_filename, 'w')
+
+    def write(self, entry):
+        """
+        Write a single entry, preceded by a separator if it's not the first.
+        """
+        if self.digests:
+            self._fid.write(self.entry_sep)
+        self._fid.write(entry)
+        self.digests.append(hashlib.md5(entry).hexdigest())
+
+    def old_digests(self):
+        """
+        Return the digests stored by the previous run, or None if there are
+        none (or if the output file itself has gone missing).
+        """
+        if not os.path.isfile(self.filename):
+            return None
+        try:
+            return open(self.digest_filename, 'r').read().split()
+        except IOError:
+            return None
+
+    def close(self):
+        """
+        Finish the output. Returns True if the output file was (re)written,
+        False if it was unchanged and kept as it was.
+        """
+        self._fid.close()
+        if self.old_digests() == self.digests:
+            os.unlink(self.tmp_filename)
+            return False
+        if os.path.isfile(self.filename):
+            os.unlink(self.filename)
+        os.rename(self.tmp_filename, self.filename)
+        digest_file = open(self.digest_filename, 'w')
+        digest_file.write("\n".join(self.digests) + "\n")
+        digest_file.close()
+        return True
+
+
 def make_swig_interface_file(di, swigdocfilename, custom_output=None):
 
-    output = ["""
+    swig_doc = SwigDocWriter(swigdocfilename)
+    swig_doc.write("""
 /*
  * This file was automatically generated using swig_doc.py.
  *
  * Any changes to it will be lost next time it is regenerated.
  */
-"""]
+""")
 
     if custom_output is not None:
-        output.append(custom_output)
+        swig_doc.write(custom_output)
 
     # Create docstrings for the blocks.
     blocks = di.in_category(Block)
@@ -201,7 +264,7 @@ def make_swig_interface_file(di, swigdocfilename, custom_output=None):
         try:
             make_func = di.get_member(make_name(block.name()), DoxyFunction)
             make_funcs.add(make_func.name())
-            output.append(make_block_entry(di, block))
+            swig_doc.write(make_block_entry(di, block))
         except block.ParsingError:
             print('Parsing error for block %s' % block.name())
 
@@ -210,7 +273,7 @@ def make_swig_interface_file(di, swigdocfilename, custom_output=None):
     funcs = [f for f in di.in_category(DoxyFunction) if f.name() not in make_funcs]
     for f in funcs:
         try:
-            output.append(make_func_entry(f))
+            swig_doc.write(make_func_entry(f))
         except f.ParsingError:
             print('Parsing error for function %s' % f.name())
 
@@ -219,18 +282,15 @@ def make_swig_interface_file(di, swigdocfilename, custom_output=None):
     klasses = [k for k in di.in_category(DoxyClass) if k.name() not in block_names]
     for k in klasses:
         try:
-            output.append(make_class_entry(k))
+            swig_doc.write(make_class_entry(k))
         except k.ParsingError:
             print('Parsing error for class %s' % k.name())
 
     # Docstrings are not created for anything that is not a function or a class.
     # If this excludes anything important please add it here.
 
-    output = "\n\n".join(output)
-
-    swig_doc = file(swigdocfilename, 'w')
-    swig_doc.write(output)
-    swig_doc.close()
+    if not swig_doc.close():
+        print('%s is up to date.' % swigdocfilename)
 
 if __name__ == "__main__":
     # Parse command line options and set up doxyxml.
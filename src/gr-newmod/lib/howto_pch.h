@@ -0,0 +1,35 @@
+/* -*- c++ -*- */
+/*
+ * Copyright 2013 Free Software Foundation, Inc.
+ *
+ * This file is part of GNU Radio
+ *
+ * GNU Radio is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3, or (at your option)
+ * any later version.
+ *
+ * GNU Radio is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with GNU Radio; see the file COPYING.  If not, write to
+ * the Free Software Foundation, Inc., 51 Franklin Street,
+ * Boston, MA 02110-1301, USA.
+ */
+
+/*
+ * Precompiled header of the howto library (cmake -DENABLE_PCH=ON):
+ * the GNU Radio and Boost headers the blocks have in common.
+ * gr_modtool add adds the headers used by new blocks.
+ */
+
+#ifndef INCLUDED_HOWTO_PCH_H
+#define INCLUDED_HOWTO_PCH_H
+
+#include <gr_io_signature.h>
+#include <boost/shared_ptr.hpp>
+
+#endif /* INCLUDED_HOWTO_PCH_H */
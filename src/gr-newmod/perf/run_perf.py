@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+#
+# Copyright 2013 Free Software Foundation, Inc.
+#
+# This file is part of GNU Radio
+#
+# GNU Radio is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# GNU Radio is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GNU Radio; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+""" Runs the benchmarks of all blocks in gr-howto (python/bm_*.py, as
+created by 'gr_modtool add --add-benchmark'), writes the results as CSV
+and JSON and compares them against a baseline. """
+
+import os
+import re
+import sys
+import csv
+import glob
+import json
+import subprocess
+from optparse import OptionParser
+
+CSV_FIELDS = ('block', 'nitems', 'runs', 'max_noutput_items', 'cpu',
+              'best', 'mean', 'ns_per_item', 'baseline', 'ratio', 'error', 'skipped')
+
+# Exit code of a benchmark that can't run yet (e.g. constructor arguments
+# without a value), see EXIT_SKIPPED in the bm_*.py scripts
+EXIT_SKIPPED = 77
+
+def find_executable(name):
+    """ Return the full path of an executable in $PATH, or None. """
+    for path in os.environ.get('PATH', '').split(os.pathsep):
+        full_path = os.path.join(path, name)
+        if os.path.isfile(full_path) and os.access(full_path, os.X_OK):
+            return full_path
+    return None
+
+def find_benchmarks(bm_dir, pattern):
+    """ Return a sorted list of all benchmark scripts in bm_dir whose
+    block name matches pattern. """
+    scripts = []
+    for script in glob.glob(os.path.join(bm_dir, 'bm_*.py')):
+        blockname = os.path.basename(script)[3:-3]
+        if re.search(pattern, blockname) is not None:
+            scripts.append(script)
+    return sorted(scripts)
+
+def run_benchmark(script, options, taskset):
+    """ Run a single benchmark, return its results as a dict. """
+    blockname = os.path.basename(script)[3:-3]
+    cmd = [sys.executable, script, '--json',
+           '--nitems', str(options.nitems), '--runs', str(options.runs)]
+    if options.max_noutput_items is not None:
+        cmd += ['--max-noutput-items', str(options.max_noutput_items)]
+    if taskset is not None:
+        cmd = [taskset, '-c', options.cpu] + cmd
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    (stdout, stderr) = proc.communicate()
+    result = {'block': blockname, 'cpu': options.cpu}
+    if proc.returncode == EXIT_SKIPPED:
+        message = (stderr.strip().splitlines() or ['not set up yet'])[-1]
+        result['skipped'] = re.sub(r'^Skipped:\s*', '', message)
+        return result
+    json_lines = [line for line in stdout.splitlines() if line.startswith('{')]
+    if proc.returncode != 0 or len(json_lines) == 0:
+        result['error'] = (stderr.strip().splitlines() or ['exit code %d' % proc.returncode])[-1]
+        return result
+    result.update(json.loads(json_lines[-1]))
+    result['block'] = blockname
+    return result
+
+def compare(results, baseline, threshold):
+    """ Add the baseline throughput and the ratio to the baseline to every
+    result. Returns the list of blocks that are more than threshold
+    (relative) slower than their baseline. """
+    regressions = []
+    for result in results:
+        if 'error' in result or 'skipped' in result or result['block'] not in baseline:
+            continue
+        result['baseline'] = baseline[result['block']]['best']
+        result['ratio'] = result['best'] / result['baseline']
+        if result['ratio'] < 1.0 - threshold:
+            regressions.append(result['block'])
+    return regressions
+
+def write_results(results, prefix):
+    """ Write the results to prefix.json and prefix.csv """
+    json.dump(results, open(prefix + '.json', 'w'), indent=2, sort_keys=True)
+    writer = csv.DictWriter(open(prefix + '.csv', 'wb'), CSV_FIELDS, extrasaction='ignore')
+    writer.writerow(dict([(field, field) for field in CSV_FIELDS]))
+    for result in results:
+        writer.writerow(result)
+    print "Results written to %s.{json,csv}." % prefix
+
+def print_results(results):
+    """ Print a table with the results. """
+    print '%-24s %14s %10s %14s %7s' % ('Block', 'Items/s', 'ns/item', 'Baseline', 'Ratio')
+    for result in results:
+        if 'error' in result:
+            print '%-24s FAILED: %s' % (result['block'], result['error'])
+        elif 'skipped' in result:
+            print '%-24s SKIPPED: %s' % (result['block'], result['skipped'])
+        elif 'baseline' in result:
+            print '%-24s %14.1f %10.3f %14.1f %7.3f' % (result['block'], result['best'],
+                                                        result['ns_per_item'],
+                                                        result['baseline'], result['ratio'])
+        else:
+            print '%-24s %14.1f %10.3f %14s %7s' % (result['block'], result['best'],
+                                                    result['ns_per_item'], '-', '-')
+
+def main():
+    """ Parse options, run benchmarks, write and compare the results. """
+    perf_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = OptionParser(usage='%prog [options]')
+    parser.add_option("-d", "--bm-dir", type="string",
+            default=os.path.join(perf_dir, '..', 'python'),
+            help="Directory with the benchmark scripts (bm_*.py).")
+    parser.add_option("-p", "--pattern", type="string", default='.',
+            help="Only run the benchmarks of blocks matching this regular expression.")
+    parser.add_option("-n", "--nitems", type="int", default=10000000,
+            help="Number of items per run.")
+    parser.add_option("-r", "--runs", type="int", default=5,
+            help="Number of runs per benchmark.")
+    parser.add_option("-m", "--max-noutput-items", type="int", default=None,
+            help="Maximum number of items per call of work().")
+    parser.add_option("-c", "--cpu", type="string", default=None,
+            help="Pin the benchmarks to these CPUs (taskset list, e.g. '2' or '0-3').")
+    parser.add_option("-o", "--output", type="string", default='perf_results',
+            help="Write the results to OUTPUT.json and OUTPUT.csv.")
+    parser.add_option("-b", "--baseline", type="string",
+            default=os.path.join(perf_dir, 'baseline.json'),
+            help="Baseline to compare against.")
+    parser.add_option("-t", "--threshold", type="float", default=0.1,
+            help="Fail if a block is slower than its baseline by more than this fraction (default: 0.1).")
+    parser.add_option("--save-baseline", action="store_true", default=False,
+            help="Store the results as the new baseline.")
+    (options, args) = parser.parse_args()
+    taskset = None
+    if options.cpu is not None:
+        taskset = find_executable('taskset')
+        if taskset is None:
+            print "Warning: taskset not found, can't set the CPU affinity."
+    scripts = find_benchmarks(options.bm_dir, options.pattern)
+    if len(scripts) == 0:
+        print "No benchmarks found in %s (use 'gr_modtool add --add-benchmark')." % options.bm_dir
+        sys.exit(1)
+    results = []
+    for script in scripts:
+        print "Running %s..." % os.path.basename(script)
+        results.append(run_benchmark(script, options, taskset))
+    regressions = []
+    if options.save_baseline:
+        json.dump(dict([(r['block'], r) for r in results if 'error' not in r and 'skipped' not in r]),
+                  open(options.baseline, 'w'), indent=2, sort_keys=True)
+        print "Baseline written to %s." % options.baseline
+    elif os.path.isfile(options.baseline):
+        regressions = compare(results, json.load(open(options.baseline)), options.threshold)
+    else:
+        print "No baseline found (%s), run with --save-baseline to create one." % options.baseline
+    print_results(results)
+    write_results(results, options.output)
+    failed = [r['block'] for r in results if 'error' in r]
+    for block in regressions:
+        print "Regression: %s is more than %d%% slower than its baseline." % (block, options.threshold * 100)
+    if len(failed) or len(regressions):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+#
+# Copyright 2013 Free Software Foundation, Inc.
+#
+# This file is part of GNU Radio
+#
+# GNU Radio is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# GNU Radio is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GNU Radio; see the file COPYING.  If not, write to
+# the Free Software Foundation, Inc., 51 Franklin Street,
+# Boston, MA 02110-1301, USA.
+#
+""" Measures the per-call overhead of the SWIG bindings of gr-howto: Every
+block that can be constructed is called through its bindings (e.g.
+history()) and compared with the same call on a pure Python object.
+Run this with ENABLE_FAST_SWIG=ON and OFF to see what the profile buys. """
+
+import os
+import re
+import glob
+import json
+import timeit
+from optparse import OptionParser
+
+MODNAME = 'howto'
+CALLS = ('history', 'output_multiple', 'unique_id')
+
+class PythonBlock(object):
+    """ Pure Python object with the same calls, as a reference """
+    def history(self):
+        return 1
+    def output_multiple(self):
+        return 1
+    def unique_id(self):
+        return 0
+
+def find_swig_modules(swig_dir):
+    """ Return the names of all SWIG modules: The main one plus all
+    per-block modules (MODNAME_*_swig, see gr_modtool add --swig-split). """
+    names = ['%s_swig' % MODNAME]
+    for fname in sorted(glob.glob(os.path.join(swig_dir, '%s_*_swig.i' % MODNAME))):
+        names.append(os.path.splitext(os.path.basename(fname))[0])
+    return names
+
+def find_blocks(module):
+    """ Return the names of all blocks in a SWIG module. Every block has
+    a shared pointer type BLOCKNAME_sptr. """
+    return [name[:-5] for name in sorted(dir(module))
+            if name.endswith('_sptr') and hasattr(module, name[:-5])]
+
+def time_call(func, ncalls):
+    """ Return the time per call of func() in ns (best of 3 runs). """
+    return min(timeit.repeat(func, number=ncalls, repeat=3)) * 1e9 / ncalls
+
+def main():
+    """ Import the bindings, time the calls, print the results. """
+    parser = OptionParser(usage='%prog [options]')
+    parser.add_option("-s", "--swig-dir", type="string",
+            default=os.path.dirname(os.path.abspath(__file__)),
+            help="Directory with the SWIG files (*.i), to find all SWIG modules.")
+    parser.add_option("-n", "--ncalls", type="int", default=1000000,
+            help="Number of calls per measurement.")
+    parser.add_option("-p", "--pattern", type="string", default='.',
+            help="Only time blocks matching this regular expression.")
+    parser.add_option("-a", "--args", type="string", action="append", default=[],
+            help="Constructor arguments of a block, e.g. 'myblock=1.0, 64'. Blocks "
+                 "which can't be constructed without arguments are skipped otherwise.")
+    parser.add_option("--json", action="store_true", default=False,
+            help="Print the results as one line of JSON.")
+    (options, args) = parser.parse_args()
+    block_args = {}
+    for arg in options.args:
+        (blockname, value) = arg.split('=', 1)
+        block_args[blockname.strip()] = eval('(%s,)' % value)
+    reference = PythonBlock()
+    results = {'python': dict([(call, time_call(getattr(reference, call), options.ncalls))
+                               for call in CALLS])}
+    for modulename in find_swig_modules(options.swig_dir):
+        try:
+            module = __import__(modulename)
+        except ImportError, e:
+            print "Can't import %s: %s" % (modulename, e)
+            continue
+        for blockname in find_blocks(module):
+            if re.search(options.pattern, blockname) is None:
+                continue
+            try:
+                block = getattr(module, blockname)(*block_args.get(blockname, ()))
+            except Exception, e:
+                print "Skipping %s (%s), use --args %s=..." % (blockname, e, blockname)
+                continue
+            results[blockname] = dict([(call, time_call(getattr(block, call), options.ncalls))
+                                       for call in CALLS if hasattr(block, call)])
+    if options.json:
+        print json.dumps(results)
+        return
+    print '%-24s %-16s %10s %12s' % ('Block', 'Call', 'ns/call', 'Overhead')
+    for blockname in sorted(results.keys()):
+        for call in CALLS:
+            if call not in results[blockname]:
+                continue
+            t = results[blockname][call]
+            print '%-24s %-16s %10.1f %12.1f' % (blockname, call + '()', t, t - results['python'][call])
+
+if __name__ == '__main__':
+    main()
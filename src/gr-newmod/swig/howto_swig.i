@@ -2,6 +2,10 @@
 
 #define HOWTO_API
 
+// Don't release the GIL, unless a call is marked with %thread
+// (only has an effect with ENABLE_FAST_SWIG, see CMakeLists.txt)
+%nothread;
+
 %include "gnuradio.i"			// the common stuff
 
 //load generated python docstrings
@@ -11,7 +11,14 @@ from modtool_rm import ModToolRemove
 from modtool_newmod import ModToolNewModule
 from modtool_disable import ModToolDisable
 from modtool_makexml import ModToolMakeXML
+from modtool_workspace import ModToolWorkspace
+from modtool_swigsplit import ModToolSwigSplit
+from modtool_pgo import ModToolPGO
+from modtool_profile import ModToolProfile
+from modtool_includecost import ModToolIncludeCost
+from modtool_buildtime import ModToolBuildTime
 from util_functions import get_command_from_argv
+from profiler import PROFILER
 
 def get_class_dict():
     " Return a dictionary of the available commands in the form command->class "
@@ -36,8 +43,29 @@ def main():
         print 'Usage:' + Templates['usage']
         sys.exit(2)
     modtool = cmd_dict[command]()
-    modtool.setup()
-    modtool.run()
+    (options, args) = modtool.parser.parse_args()
+    if options.profile or options.profile_dump or options.trace_json or options.io_report:
+        PROFILER.start(use_cprofile=(options.profile_dump is not None))
+    try:
+        PROFILER.enter('setup')
+        modtool.setup()
+        PROFILER.leave()
+        PROFILER.enter('run')
+        modtool.run()
+        PROFILER.leave()
+    finally:
+        if PROFILER.enabled:
+            PROFILER.stop()
+            if options.profile or options.profile_dump or options.trace_json:
+                PROFILER.print_summary()
+            if options.io_report:
+                PROFILER.print_io_report()
+            if options.profile_dump is not None:
+                PROFILER.dump_stats(options.profile_dump)
+                print "cProfile statistics written to %s." % options.profile_dump
+            if options.trace_json is not None:
+                PROFILER.write_trace_json(options.trace_json)
+                print "Trace written to %s." % options.trace_json
 
 if __name__ == '__main__':
     if not ((sys.version_info[0] > 2) or
@@ -1,5 +1,6 @@
 import xml.etree.ElementTree as ET
 from util_functions import is_number, xml_indent
+from profiler import profile_phase
 
 ### GRC XML Generator ########################################################
 try:
@@ -41,6 +42,7 @@ class GRCXMLGenerator(object):
         xml_indent(self.root)
         return ET.tostring(self.root, encoding="UTF-8")
 
+    @profile_phase('render')
     def make_xml(self):
         """ Create the actual tag tree """
         root = ET.Element("block")
@@ -78,6 +80,7 @@ class GRCXMLGenerator(object):
             ET.SubElement(root, 'doc').text = self.doc
         self.root = root
 
+    @profile_phase('write')
     def save(self, filename):
         """ Write the XML file """
         self.make_xml()
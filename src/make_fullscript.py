@@ -21,10 +21,12 @@
 import os
 
 LIST_OF_FILES = (
+        'profiler.py',
         'util_functions.py',
         'templates.py',
         'code_generator.py',
         'cmakefile_editor.py',
+        'dependency_graph.py',
         'modtool_base.py',
         'modtool_info.py',
         'modtool_add.py',
@@ -35,6 +37,13 @@ LIST_OF_FILES = (
         'parser_cc_block.py',
         'grc_xml_generator.py',
         'modtool_makexml.py',
+        'modtool_workspace.py',
+        'modtool_swigsplit.py',
+        'modtool_pgo.py',
+        'modtool_profile.py',
+        'modtool_includecost.py',
+        'modtool_buildtime.py',
+        'modtool_api.py',
         'modtool_help.py',
         'gr_modtool.py')
 
@@ -3,6 +3,7 @@
 import os
 import sys
 import re
+import json
 from optparse import OptionGroup
 
 from util_functions import append_re_line_sequence, ask_yes_no
@@ -10,6 +11,8 @@ from cmakefile_editor import CMakeFileEditor
 from modtool_base import ModTool
 from templates import Templates
 from code_generator import get_template
+from parser_cc_block import ParserCCBlock
+from profiler import profile_phase
 import Cheetah.Template
 
 ### Add new block module #####################################################
@@ -18,11 +21,21 @@ class ModToolAdd(ModTool):
     name = 'add'
     aliases = ('insert',)
     _block_types = ('sink', 'source', 'sync', 'decimator', 'interpolator',
-                    'general', 'hier', 'noblock')
+                    'general', 'tagged_stream', 'message', 'hier', 'noblock')
+    _io_types = ('float', 'complex', 'int', 'short', 'byte')
+    _type_codes = {'f': 'float', 'c': 'complex', 'i': 'int', 's': 'short', 'b': 'byte'}
+    _tuning_hooks = (('output_multiple', 'output_multiple'),
+                     ('history', 'history'),
+                     ('min_buffer', 'min_output_buffer'),
+                     ('max_buffer', 'max_output_buffer'),
+                     ('relative_rate', 'relative_rate'))
+    _graph_tuning_hints = ('max_noutput_items', 'min_output_buffer', 'max_output_buffer', 'output_multiple')
     def __init__(self):
         ModTool.__init__(self)
         self._add_cc_qa = False
         self._add_py_qa = False
+        self._add_benchmark = False
+        self._blocks = []
 
     def setup_parser(self):
         parser = ModTool.setup_parser(self)
@@ -38,6 +51,55 @@ class ModToolAdd(ModTool):
                 help="If given, Python QA code is automatically added if possible.")
         ogroup.add_option("--add-cpp-qa", action="store_true", default=None,
                 help="If given, C++ QA code is automatically added if possible.")
+        ogroup.add_option("--perf-qa", action="store_true", default=False,
+                help="If given, the Python QA code gets a functional test with vector source and sink and "
+                     "a throughput test, which fails below the minimum throughput set in python/perf.cfg.")
+        ogroup.add_option("--perf-cpp-qa", action="store_true", default=False,
+                help="If given, the C++ QA code gets a test which times work() on aligned buffers "
+                     "(sync, decimator, interpolator, source and sink blocks).")
+        ogroup.add_option("--add-benchmark", action="store_true", default=False,
+                help="If given, a throughput benchmark (python/bm_*.py) is added, which is run with 'make benchmark'.")
+        ogroup.add_option("--in-type", type="choice", choices=self._io_types, default=None,
+                help="Input item type, one of %s." % ', '.join(self._io_types))
+        ogroup.add_option("--out-type", type="choice", choices=self._io_types, default=None,
+                help="Output item type (default: same as --in-type).")
+        ogroup.add_option("--vlen", type="int", default=1,
+                help="Vector length of the inputs and outputs.")
+        ogroup.add_option("--types", type="string", default=None,
+                help="Comma-separated list of type suffixes, e.g. 'ff,cc,fc'. One block is added for every suffix, "
+                     "named BLOCKNAME_SUFFIX. Letters: %s. Sources and sinks use a single letter." % \
+                        ', '.join(['%s=%s' % (k, v) for (k, v) in sorted(self._type_codes.items())]))
+        ogroup.add_option("--volk", action="store_true", default=False,
+                help="Generate aligned/unaligned VOLK dispatch code and add VOLK to the CMake files (sync, decimator and interpolator blocks).")
+        ogroup.add_option("--output-multiple", type="int", default=None, metavar="N",
+                help="Call set_output_multiple(N) in the constructor.")
+        ogroup.add_option("--history", type="int", default=None, metavar="N",
+                help="Call set_history(N) in the constructor.")
+        ogroup.add_option("--min-buffer", type="int", default=None, metavar="N",
+                help="Call set_min_output_buffer(N) in the constructor.")
+        ogroup.add_option("--max-buffer", type="int", default=None, metavar="N",
+                help="Call set_max_output_buffer(N) in the constructor.")
+        ogroup.add_option("--relative-rate", type="float", default=None, metavar="R",
+                help="Call set_relative_rate(R) in the constructor (general and tagged stream blocks). "
+                     "All tuning values also become optional GRC parameters.")
+        ogroup.add_option("--from-graph", type="string", default=None, metavar="FILE",
+                help="JSON description of the blocks and connections of a hier block (-t hier only).")
+        ogroup.add_option("--len-tag-key", type="string", default="packet_len",
+                help="Key of the length tags of tagged stream blocks (default: packet_len).")
+        ogroup.add_option("--bindings", type="choice", choices=('swig', 'pybind11'), default=None,
+                help="Generate SWIG or pybind11 bindings for C++ blocks. Default: pybind11 if the module has "
+                     "a pybind/ subdirectory, but no SWIG file, else SWIG.")
+        ogroup.add_option("--swig-split", action="store_true", default=False,
+                help="Put the block into its own SWIG module (swig/MODNAME_BLOCKNAME_swig.i), which is compiled "
+                     "separately from the main SWIG file. This is the default if the main SWIG file has no blocks, "
+                     "but other SWIG modules exist (see 'gr_modtool swigsplit').")
+        ogroup.add_option("--swig-group", type="string", default=None, metavar="GROUP",
+                help="Put the block into the SWIG module MODNAME_GROUP_swig, together with other blocks "
+                     "of that group (implies --swig-split).")
+        ogroup.add_option("--release-gil", type="string", default=None, metavar="METHODS",
+                help="Comma-separated list of long-running methods of the block (e.g. 'set_taps'), "
+                     "which release the GIL when called from Python (%thread in the SWIG file). "
+                     "Needs ENABLE_FAST_SWIG (see 'gr_modtool newmod --fast-bindings').")
         ogroup.add_option("--skip-cmakefiles", action="store_true", default=False,
                 help="If given, only source files are written, but CMakeLists.txt files are left unchanged.")
         ogroup.add_option("-l", "--lang", type="choice", choices=('cpp', 'c++', 'python'),
@@ -59,6 +121,9 @@ class ModToolAdd(ModTool):
             self._info['lang'] = 'cpp'
         print "Language: %s" % {'cpp': 'C++', 'python': 'Python'}[self._info['lang']]
 
+        if self._info['blocktype'] == 'tagged_stream' and self._info['lang'] != 'cpp':
+            print "Tagged stream blocks can only be written in C++."
+            sys.exit(2)
         if ((self._skip_subdirs['lib'] and self._info['lang'] == 'cpp')
              or (self._skip_subdirs['python'] and self._info['lang'] == 'python')):
             print "Missing or skipping relevant subdir."
@@ -75,16 +140,62 @@ class ModToolAdd(ModTool):
         print "Block/code identifier: " + self._info['blockname']
         self._info['fullblockname'] = self._info['modname'] + '_' + self._info['blockname']
         self._info['license'] = self.setup_choose_license()
+        self._info['in_type'] = options.in_type
+        self._info['out_type'] = options.out_type
+        if self._info['out_type'] is None:
+            self._info['out_type'] = self._info['in_type']
+        elif self._info['in_type'] is None:
+            self._info['in_type'] = self._info['out_type']
+        self._info['vlen'] = options.vlen
+        self._info['len_tag_key'] = options.len_tag_key
+        if self._info['vlen'] < 1:
+            print 'Invalid vector length.'
+            sys.exit(2)
+        self._info['volk'] = False
+        if options.volk:
+            if self._info['lang'] == 'cpp' and self._info['blocktype'] in ('sync', 'decimator', 'interpolator'):
+                self._info['volk'] = True
+            else:
+                print "Warning: VOLK code is only generated for C++ sync, decimator and interpolator blocks."
+
+        self._info['tuning'] = self.setup_tuning()
+        self._info['graph'] = None
+        if options.from_graph is not None:
+            if self._info['blocktype'] != 'hier':
+                print "--from-graph can only be used for hier blocks."
+                sys.exit(2)
+            self._info['graph'] = self.setup_load_graph(options.from_graph)
 
         if options.argument_list is not None:
             self._info['arglist'] = options.argument_list
         else:
             self._info['arglist'] = raw_input('Enter valid argument list, including default arguments: ')
 
+        self._info['perf_qa'] = False
         if not (self._info['blocktype'] in ('noblock') or self._skip_subdirs['python']):
             self._add_py_qa = options.add_python_qa
+            if options.perf_qa:
+                if self._info['blocktype'] in ('tagged_stream', 'message'):
+                    print "Warning: Can't add a throughput test for this block."
+                else:
+                    self._info['perf_qa'] = True
+                    self._add_py_qa = True
             if self._add_py_qa is None:
                 self._add_py_qa = ask_yes_no('Add Python QA code?', True)
+        if options.add_benchmark:
+            if self._info['blocktype'] in ('noblock', 'tagged_stream', 'message') \
+                    or self._skip_subdirs['python']:
+                print "Warning: Can't add a benchmark for this block."
+            else:
+                self._add_benchmark = True
+        self._info['perf_cpp_qa'] = False
+        if options.perf_cpp_qa:
+            if self._info['lang'] == 'cpp' and self._info['blocktype'] in \
+                    ('sync', 'decimator', 'interpolator', 'source', 'sink'):
+                self._info['perf_cpp_qa'] = True
+                options.add_cpp_qa = True
+            else:
+                print "Warning: work() can only be timed for C++ sync, decimator, interpolator, source and sink blocks."
         if self._info['lang'] == 'cpp':
             self._add_cc_qa = options.add_cpp_qa
             if self._add_cc_qa is None:
@@ -93,7 +204,188 @@ class ModToolAdd(ModTool):
             print "Warning: Autotools modules are not supported. ",
             print "Files will be created, but Makefiles will not be edited."
             self.options.skip_cmakefiles = True
+        self._info['bindings'] = self.setup_bindings()
+        if self._info['bindings'] == 'pybind11':
+            self._info['bindings_module'] = '%s_%s_python' % (self._info['modname'], self._info['blockname'])
+        else:
+            self._info['bindings_module'] = self.setup_swig_module()
+        self._info['release_gil'] = []
+        if options.release_gil is not None:
+            if self._info['lang'] != 'cpp' or self._info['blocktype'] == 'noblock':
+                print "Warning: --release-gil only applies to C++ blocks."
+            else:
+                self._info['release_gil'] = [m.strip() for m in options.release_gil.split(',') if len(m.strip())]
+            for method in self._info['release_gil']:
+                if not re.match('^[a-zA-Z_][a-zA-Z0-9_]*$', method):
+                    print "Invalid method name '%s'." % method
+                    sys.exit(2)
+        self._blocks = [self._info]
+        if options.types is not None:
+            self._blocks = self.setup_typed_variants(options.types)
+
+    def setup_tuning(self):
+        """ Return a list of (hook, value) tuples for the tuning options given,
+        e.g. [('output_multiple', 64)]. set_<hook>(value) is called in the
+        constructor of the block. """
+        tuning = []
+        for (option, hook) in self._tuning_hooks:
+            value = getattr(self.options, option)
+            if value is None:
+                continue
+            if value < 0 or (option == 'history' and value < 1) or (option == 'relative_rate' and value == 0):
+                print "Invalid value for --%s: %s" % (option.replace('_', '-'), value)
+                sys.exit(2)
+            tuning.append((hook, value))
+        if len(tuning) and self._info['blocktype'] in ('hier', 'noblock', 'message'):
+            print "Warning: Tuning options are ignored for blocks of type '%s'." % self._info['blocktype']
+            return []
+        if self.options.relative_rate is not None and \
+                self._info['blocktype'] in ('sync', 'sink', 'source', 'decimator', 'interpolator'):
+            print "Warning: The relative rate of %s blocks is set by the base class, ignoring --relative-rate." % \
+                    self._info['blocktype']
+            tuning = [(hook, value) for (hook, value) in tuning if hook != 'relative_rate']
+        return tuning
 
+    def setup_load_graph(self, filename):
+        """ Read the flow graph of a hier block from a JSON file like this:
+        {"blocks": [{"id": "mult", "make": "gr_make_multiply_const_ff(k)",
+                     "include": "gr_multiply_const_ff.h", "max_noutput_items": 4096}],
+         "connections": [["self", 0, "mult", 0], ["mult", 0, "self", 0]]}
+        'make' may also be a dict with one entry per language ('cpp', 'python').
+        Optional entries of a block are 'type' (the C++ sptr type,
+        default: gr_block_sptr), 'include' (C++), 'import' (Python) and the
+        tuning hints in _graph_tuning_hints. A connection may leave out
+        the ports, they default to 0.
+        Returns a dict with the blocks, connections, includes, imports and
+        the number of inputs and outputs of the hier block. """
+        try:
+            graph = json.load(open(filename))
+        except (IOError, ValueError), e:
+            print "Can't read flow graph from %s: %s" % (filename, e)
+            sys.exit(2)
+        lang = self._info['lang']
+        blocks = []
+        for blk in graph.get('blocks', []):
+            if 'id' not in blk or 'make' not in blk:
+                print "Every block in %s needs an 'id' and a 'make' entry." % filename
+                sys.exit(2)
+            make = blk['make']
+            if isinstance(make, dict):
+                if lang not in make:
+                    print "Block '%s' has no 'make' entry for %s." % (blk['id'], lang)
+                    sys.exit(2)
+                make = make[lang]
+            blocks.append({'id': str(blk['id']),
+                           'make': str(make),
+                           'type': str(blk.get('type', 'gr_block_sptr')),
+                           'tuning': [(hint, blk[hint]) for hint in self._graph_tuning_hints if hint in blk]})
+        block_ids = [blk['id'] for blk in blocks]
+        connections = []
+        (ninputs, noutputs) = (0, 0)
+        for conn in graph.get('connections', []):
+            if len(conn) == 2:
+                conn = [conn[0], 0, conn[1], 0]
+            if len(conn) != 4:
+                print "Invalid connection in %s: %s" % (filename, conn)
+                sys.exit(2)
+            (src, src_port, dst, dst_port) = (str(conn[0]), int(conn[1]), str(conn[2]), int(conn[3]))
+            for endpoint in (src, dst):
+                if endpoint != 'self' and endpoint not in block_ids:
+                    print "Connection to unknown block '%s' in %s." % (endpoint, filename)
+                    sys.exit(2)
+            if src == 'self':
+                ninputs = max(ninputs, src_port + 1)
+            if dst == 'self':
+                noutputs = max(noutputs, dst_port + 1)
+            connections.append((src, src_port, dst, dst_port))
+        includes = []
+        imports = []
+        for blk in graph.get('blocks', []):
+            if 'include' in blk and blk['include'] not in includes:
+                includes.append(str(blk['include']))
+            if 'import' in blk and blk['import'] not in imports:
+                imports.append(str(blk['import']))
+        return {'blocks': blocks,
+                'connections': connections,
+                'includes': includes,
+                'imports': imports,
+                'ninputs': ninputs,
+                'noutputs': noutputs}
+
+    def setup_typed_variants(self, types):
+        """ Return one copy of self._info per type suffix in types, with the
+        block name and the item types set accordingly. """
+        if self._info['blocktype'] in ('noblock', 'hier', 'message'):
+            print "Typed variants can't be generated for blocks of type '%s'." % self._info['blocktype']
+            sys.exit(2)
+        ncodes = 2
+        if self._info['blocktype'] in ('source', 'sink'):
+            ncodes = 1
+        variants = []
+        for suffix in [t.strip() for t in types.split(',') if len(t.strip())]:
+            if len(suffix) != ncodes or len([c for c in suffix if c not in self._type_codes]):
+                print "Invalid type suffix '%s' (expected %d of the letters %s)." % (
+                        suffix, ncodes, ''.join(sorted(self._type_codes.keys())))
+                sys.exit(2)
+            info = dict(self._info)
+            info['blockname'] = '%s_%s' % (self._info['blockname'], suffix)
+            info['fullblockname'] = self._info['modname'] + '_' + info['blockname']
+            if info['bindings'] == 'pybind11':
+                info['bindings_module'] = '%s_%s_python' % (info['modname'], info['blockname'])
+            info['in_type'] = self._type_codes[suffix[0]]
+            info['out_type'] = self._type_codes[suffix[-1]]
+            variants.append(info)
+        if len(variants) == 0:
+            print "No type suffixes given."
+            sys.exit(2)
+        print "Typed variants: " + ', '.join([info['blockname'] for info in variants])
+        return variants
+
+
+    def setup_bindings(self):
+        """ Return which kind of bindings a C++ block gets, 'swig' or
+        'pybind11'. Unless given by --bindings, this is pybind11 if the
+        module has a pybind/ subdirectory, but no SWIG file. """
+        bindings = self.options.bindings
+        if bindings is None:
+            bindings = 'swig'
+            if self._skip_subdirs['swig'] and not self._skip_subdirs['pybind']:
+                bindings = 'pybind11'
+        if bindings == 'pybind11' and self._info['lang'] == 'cpp':
+            if self._skip_subdirs['pybind']:
+                print "No pybind/ subdirectory found (see 'gr_modtool newmod --bindings pybind11')."
+                sys.exit(2)
+            if self._info['blocktype'] == 'noblock':
+                print "Warning: pybind11 bindings are only generated for blocks."
+        return bindings
+
+    def setup_swig_module(self):
+        """ Return the name of the SWIG module the block is added to:
+        Either the main one (MODNAME_swig) or, with --swig-split or
+        --swig-group, one of its own (MODNAME_GROUP_swig). Typed variants
+        all go into the same SWIG module. """
+        modname = self._info['modname']
+        main_swig_module = '%s_swig' % modname
+        if self._info['lang'] != 'cpp' or self._skip_subdirs['swig']:
+            return main_swig_module
+        group = self.options.swig_group
+        if group is None and not self.options.swig_split \
+                and len(self._get_swig_module_files()) \
+                and not re.search('GR_SWIG_BLOCK_MAGIC', open(self._file['swig']).read()):
+            print "Main SWIG file has no blocks, adding the block to a SWIG module of its own."
+            self.options.swig_split = True
+        if group is None and self.options.swig_split:
+            group = self._info['blockname']
+        if group is None:
+            return main_swig_module
+        if not re.match('^[a-zA-Z0-9_]+$', group):
+            print 'Invalid SWIG group name.'
+            sys.exit(2)
+        swig_module = '%s_%s_swig' % (modname, group)
+        if self.options.skip_cmakefiles and not os.path.isfile(os.path.join('swig', '%s.i' % swig_module)):
+            print "Warning: A new SWIG module needs CMakeLists.txt changes, using the main SWIG file."
+            return main_swig_module
+        return swig_module
 
     def setup_choose_license(self):
         """ Select a license by the following rules, in this order:
@@ -111,22 +403,32 @@ class ModToolAdd(ModTool):
         else:
             return Templates['defaultlicense']
 
-    def _write_tpl(self, tpl, path, fname):
+    @profile_phase('write')
+    def _write_tpl(self, tpl, path, fname, info=None):
         """ Shorthand for writing a substituted template to a file"""
+        if info is None:
+            info = self._info
         print "Adding file '%s'..." % fname
-        open(os.path.join(path, fname), 'w').write(get_template(tpl, **self._info))
+        open(os.path.join(path, fname), 'w').write(get_template(tpl, **info))
 
     def run(self):
         """ Go, go, go. """
         has_swig = (
                 self._info['lang'] == 'cpp'
+                and self._info['bindings'] == 'swig'
                 and not self._skip_subdirs['swig']
         )
+        has_pybind = (
+                self._info['lang'] == 'cpp'
+                and self._info['bindings'] == 'pybind11'
+                and self._info['blocktype'] != 'noblock'
+                and not self._skip_subdirs['pybind']
+        )
         has_grc = False
         if self._info['lang'] == 'cpp':
             print "Traversing lib..."
             self._run_lib()
-            has_grc = has_swig
+            has_grc = has_swig or has_pybind
         else: # Python
             print "Traversing python..."
             self._run_python()
@@ -135,12 +437,20 @@ class ModToolAdd(ModTool):
         if has_swig:
             print "Traversing swig..."
             self._run_swig()
+        if has_pybind:
+            print "Traversing pybind..."
+            self._run_pybind()
         if self._add_py_qa:
             print "Adding Python QA..."
             self._run_python_qa()
+        if self._add_benchmark:
+            print "Adding benchmark..."
+            self._run_benchmark()
         if has_grc and not self._skip_subdirs['grc']:
             print "Traversing grc..."
             self._run_grc()
+        if not self.options.skip_cmakefiles:
+            self._update_block_list(add=[info['blockname'] for info in self._blocks])
 
     def _run_lib(self):
         """ Do everything that needs doing in the subdir 'lib' and 'include'.
@@ -148,69 +458,93 @@ class ModToolAdd(ModTool):
         - include them into CMakeLists.txt
         - check if C++ QA code is req'd
         - if yes, create qa_*.{cc,h} and add them to CMakeLists.txt
+        All typed variants are written first, then every CMakeLists.txt
+        is edited once.
         """
         def _add_qa():
             " Add C++ QA files for 3.7 API "
-            fname_qa_h  = 'qa_%s.h'  % self._info['blockname']
-            fname_qa_cc = 'qa_%s.cc' % self._info['blockname']
-            self._write_tpl('qa_cpp', 'lib', fname_qa_cc)
-            self._write_tpl('qa_h',   'lib', fname_qa_h)
+            for info in self._blocks:
+                self._write_tpl('qa_cpp', 'lib', 'qa_%s.cc' % info['blockname'], info)
+                self._write_tpl('qa_h',   'lib', 'qa_%s.h'  % info['blockname'], info)
             if not self.options.skip_cmakefiles:
                 try:
                     append_re_line_sequence(self._file['cmlib'],
                                             '\$\{CMAKE_CURRENT_SOURCE_DIR\}/qa_%s.cc.*\n' % self._info['modname'],
-                                            '  ${CMAKE_CURRENT_SOURCE_DIR}/qa_%s.cc' % self._info['blockname'])
+                                            '\n'.join(['  ${CMAKE_CURRENT_SOURCE_DIR}/qa_%s.cc' % info['blockname']
+                                                       for info in self._blocks]))
                     append_re_line_sequence(self._file['qalib'],
                                             '#include.*\n',
-                                            '#include "%s"' % fname_qa_h)
+                                            '\n'.join(['#include "qa_%s.h"' % info['blockname']
+                                                       for info in self._blocks]))
                     append_re_line_sequence(self._file['qalib'],
                                             '(addTest.*suite.*\n|new CppUnit.*TestSuite.*\n)',
-                                            '  s->addTest(gr::%s::qa_%s::suite());' % (self._info['modname'],
-                                                                                       self._info['blockname'])
+                                            '\n'.join(['  s->addTest(gr::%s::qa_%s::suite());' % (info['modname'],
+                                                                                                  info['blockname'])
+                                                       for info in self._blocks])
                                             )
+                    if self._info['perf_cpp_qa']:
+                        _add_cxx11_flags(['qa_%s.cc' % info['blockname'] for info in self._blocks])
                 except IOError:
                     print "Can't add C++ QA files."
         def _add_qa36():
             " Add C++ QA files for pre-3.7 API (not autotools) "
-            fname_qa_cc = 'qa_%s.cc' % self._info['fullblockname']
-            self._write_tpl('qa_cpp36', 'lib', fname_qa_cc)
-            if not self.options.skip_cmakefiles:
-                open(self._file['cmlib'], 'a').write(
+            cmake_entries = []
+            for info in self._blocks:
+                fname_qa_cc = 'qa_%s.cc' % info['fullblockname']
+                self._write_tpl('qa_cpp36', 'lib', fname_qa_cc, info)
+                cmake_entries.append(
                         str(
                             Cheetah.Template.Template(
                                 Templates['qa_cmakeentry36'],
                                 searchList={'basename': os.path.splitext(fname_qa_cc)[0],
                                             'filename': fname_qa_cc,
-                                            'modname': self._info['modname']
+                                            'modname': info['modname']
                                            }
                             )
                          )
                 )
+            if not self.options.skip_cmakefiles:
                 ed = CMakeFileEditor(self._file['cmlib'])
+                ed.cfile += ''.join(cmake_entries)
                 ed.remove_double_newlines()
                 ed.write()
-        fname_cc = None
-        fname_h  = None
-        if self._info['version']  == '37':
-            fname_h  = self._info['blockname'] + '.h'
-            fname_cc = self._info['blockname'] + '.cc'
-            if self._info['blocktype'] in ('source', 'sink', 'sync', 'decimator',
-                                           'interpolator', 'general', 'hier'):
-                fname_cc = self._info['blockname'] + '_impl.cc'
-                self._write_tpl('block_impl_h',   'lib', self._info['blockname'] + '_impl.h')
-            self._write_tpl('block_impl_cpp', 'lib', fname_cc)
-            self._write_tpl('block_def_h',    self._info['includedir'], fname_h)
-        else: # Pre-3.7 or autotools
-            fname_h  = self._info['fullblockname'] + '.h'
-            fname_cc = self._info['fullblockname'] + '.cc'
-            self._write_tpl('block_h36',   self._info['includedir'], fname_h)
-            self._write_tpl('block_cpp36', 'lib',                    fname_cc)
+                if self._info['perf_cpp_qa']:
+                    _add_cxx11_flags(['qa_%s.cc' % info['fullblockname'] for info in self._blocks])
+        def _add_cxx11_flags(qa_files):
+            " Compile the timed QA files (std::chrono) as C++11 "
+            open(self._file['cmlib'], 'a').write(
+                    get_template('qa_cxx11_cmakeentry', qa_files=qa_files, **self._info))
+        fnames_cc = []
+        fnames_h  = []
+        for info in self._blocks:
+            if info['version']  == '37':
+                fname_h  = info['blockname'] + '.h'
+                fname_cc = info['blockname'] + '.cc'
+                if info['blocktype'] in ('source', 'sink', 'sync', 'decimator',
+                                         'interpolator', 'general', 'tagged_stream',
+                                         'message', 'hier'):
+                    fname_cc = info['blockname'] + '_impl.cc'
+                    self._write_tpl('block_impl_h',   'lib', info['blockname'] + '_impl.h', info)
+                self._write_tpl('block_impl_cpp', 'lib', fname_cc, info)
+                self._write_tpl('block_def_h',    info['includedir'], fname_h, info)
+            else: # Pre-3.7 or autotools
+                fname_h  = info['fullblockname'] + '.h'
+                fname_cc = info['fullblockname'] + '.cc'
+                self._write_tpl('block_h36',   info['includedir'], fname_h,  info)
+                self._write_tpl('block_cpp36', 'lib',              fname_cc, info)
+            fnames_cc.append(fname_cc)
+            fnames_h.append(fname_h)
         if not self.options.skip_cmakefiles:
             ed = CMakeFileEditor(self._file['cmlib'])
-            ed.append_value('add_library', fname_cc)
+            for fname_cc in fnames_cc:
+                ed.append_value('add_library', fname_cc)
             ed.write()
+            self._update_build_speedup_lists(fnames_cc, fnames_h)
+            if self._info['volk']:
+                self._add_volk_to_cmake()
             ed = CMakeFileEditor(self._file['cminclude'])
-            ed.append_value('install', fname_h, 'DESTINATION[^()]+')
+            for fname_h in fnames_h:
+                ed.append_value('install', fname_h, 'DESTINATION[^()]+')
             ed.write()
         if self._add_cc_qa:
             if self._info['version'] == '37':
@@ -220,30 +554,105 @@ class ModToolAdd(ModTool):
             elif self._info['version'] == 'autofoo':
                 print "Warning: C++ QA files not supported for autotools."
 
+    @profile_phase('edit')
+    def _update_build_speedup_lists(self, fnames_cc, fnames_h):
+        """ Keep the unity build file and the precompiled header in lib/
+        (see GrBuildSpeedup.cmake) consistent with the library:
+        - include the new sources into MODNAME_unity.cc
+        - add the system headers the new blocks use to MODNAME_pch.h
+        Modules without these files are left alone. """
+        if os.path.isfile(self._file['unity']):
+            unityfile = open(self._file['unity'], 'r').read()
+            include_str = ''.join(['#include "%s"\n' % fname_cc for fname_cc in fnames_cc
+                                   if re.search(r'^\s*(//)?\s*#include\s+"%s"' % re.escape(fname_cc),
+                                                unityfile, flags=re.MULTILINE) is None])
+            if len(include_str):
+                print "Editing %s..." % self._file['unity']
+                open(self._file['unity'], 'a').write(include_str)
+        if os.path.isfile(self._file['pch']):
+            pchfile = open(self._file['pch'], 'r').read()
+            headers = []
+            for fname in [os.path.join('lib', f) for f in fnames_cc] \
+                         + [os.path.join('lib', os.path.splitext(f)[0] + '.h') for f in fnames_cc] \
+                         + [os.path.join(self._info['includedir'], f) for f in fnames_h]:
+                if not os.path.isfile(fname):
+                    continue
+                for header in re.findall(r'^\s*#\s*include\s+<([^>]+)>', open(fname, 'r').read(),
+                                         flags=re.MULTILINE):
+                    if re.match(r'%s[/_]' % self._info['modname'], header) is None \
+                            and header not in headers \
+                            and re.search(r'#include\s+<%s>' % re.escape(header), pchfile) is None:
+                        headers.append(header)
+            if len(headers):
+                print "Editing %s..." % self._file['pch']
+                append_re_line_sequence(self._file['pch'], r'#include\s+<.*\n',
+                                        '\n'.join(['#include <%s>' % header for header in headers]))
+
+    @profile_phase('edit')
+    def _add_volk_to_cmake(self):
+        """ Make sure VOLK is found and linked against:
+        - add cmake/Modules/FindVolk.cmake, if it doesn't exist
+        - add find_package(Volk) and the include dirs to the top-level CMakeLists.txt
+        - link the block library against VOLK
+        Does nothing if VOLK is already being searched for. """
+        if self._info.has_key('is_component'):
+            print "Warning: Not adding VOLK to the CMake files of a GNU Radio component."
+            return
+        ed = CMakeFileEditor('CMakeLists.txt')
+        if re.search(r'find_package\(Volk\)', ed.cfile, flags=re.IGNORECASE) is not None:
+            return
+        print "Adding VOLK to the CMake files..."
+        fname_findvolk = os.path.join('cmake', 'Modules', 'FindVolk.cmake')
+        if os.path.isdir(os.path.dirname(fname_findvolk)) and not os.path.isfile(fname_findvolk):
+            self._write_tpl('find_volk_cmake', os.path.dirname(fname_findvolk), 'FindVolk.cmake')
+        ed.append_value('include_directories', '${VOLK_INCLUDE_DIRS}')
+        ed.write()
+        append_re_line_sequence('CMakeLists.txt',
+                                r'^find_package\(.*\)\n',
+                                get_template('volk_cmakeentry', **self._info).strip())
+        ed = CMakeFileEditor(self._file['cmlib'], ' ')
+        ed.append_value('target_link_libraries', '${VOLK_LIBRARIES}', '')
+        ed.write()
+
+    @profile_phase('edit')
     def _run_swig(self):
         """ Do everything that needs doing in the subdir 'swig'.
-        - Edit main *.i file
+        - Edit main *.i file, or
+        - create or edit the block's own SWIG module (--swig-split)
         """
         if self._get_mainswigfile() is None:
             print 'Warning: No main swig file found.'
             return
+        if self._info['bindings_module'] != '%s_swig' % self._info['modname']:
+            self._add_swig_module(self._info['bindings_module'], self._blocks)
+            return
         print "Editing %s..." % self._file['swig']
-        mod_block_sep = '/'
-        if self._info['version'] == '36':
-            mod_block_sep = '_'
-        swig_block_magic_str = get_template('swig_block_magic', **self._info)
-        open(self._file['swig'], 'a').write(swig_block_magic_str)
-        include_str = '#include "%s%s%s.h"' % (
-                self._info['modname'],
-                mod_block_sep,
-                self._info['blockname'])
-        if re.search('#include', open(self._file['swig'], 'r').read()):
-            append_re_line_sequence(self._file['swig'], '^#include.*\n', include_str)
-        else: # I.e., if the swig file is empty
-            oldfile = open(self._file['swig'], 'r').read()
-            regexp = re.compile('^%\{\n', re.MULTILINE)
-            oldfile = regexp.sub('%%{\n%s\n' % include_str, oldfile, count=1)
-            open(self._file['swig'], 'w').write(oldfile)
+        self._add_blocks_to_swigfile(self._file['swig'], self._blocks)
+
+    @profile_phase('edit')
+    def _run_pybind(self):
+        """ Do everything that needs doing in the subdir 'pybind'.
+        - read the arguments of make() from the block's header
+        - write a binding file (BLOCKNAME_python.cc) per block
+        - add a target per binding to the CMakeLists.txt
+        - import the bindings in __init__.py
+        """
+        for info in self._blocks:
+            if info['version'] == '37':
+                fname_cc = os.path.join('lib', info['blockname'] + '_impl.cc')
+                fname_h = os.path.join(info['includedir'], info['blockname'] + '.h')
+            else:
+                fname_cc = os.path.join('lib', info['fullblockname'] + '.cc')
+                fname_h = os.path.join(info['includedir'], info['fullblockname'] + '.h')
+            params = ParserCCBlock(fname_cc, fname_h, info['blockname'], info['version']).read_params()
+            self._write_tpl('pybind_block', 'pybind', '%s_python.cc' % info['blockname'],
+                            dict(info, params=params))
+        if not self.options.skip_cmakefiles:
+            print "Editing %s..." % self._file['cmpybind']
+            open(self._file['cmpybind'], 'a').write(
+                    ''.join([get_template('pybind_cmakeentry', **info) for info in self._blocks]))
+        if not self._skip_subdirs['python']:
+            self._add_bindings_imports([info['bindings_module'] for info in self._blocks])
 
     def _run_python_qa(self):
         """ Do everything that needs doing in the subdir 'python' to add
@@ -251,15 +660,54 @@ class ModToolAdd(ModTool):
         - add .py files
         - include in CMakeLists.txt
         """
-        fname_py_qa = 'qa_' + self._info['blockname'] + '.py'
-        self._write_tpl('qa_python', 'python', fname_py_qa)
-        os.chmod(os.path.join('python', fname_py_qa), 0755)
+        for info in self._blocks:
+            fname_py_qa = 'qa_' + info['blockname'] + '.py'
+            self._write_tpl('qa_python', 'python', fname_py_qa, info)
+            os.chmod(os.path.join('python', fname_py_qa), 0755)
+        if self._info['perf_qa']:
+            self._add_perf_config()
         if self.options.skip_cmakefiles or CMakeFileEditor(self._file['cmpython']).check_for_glob('qa_*.py'):
             return
         print "Editing python/CMakeLists.txt..."
-        open(self._file['cmpython'], 'a').write(
-                'GR_ADD_TEST(qa_%s ${PYTHON_EXECUTABLE} ${CMAKE_CURRENT_SOURCE_DIR}/%s)\n' % \
-                  (self._info['blockname'], fname_py_qa))
+        open(self._file['cmpython'], 'a').write(''.join(
+                ['GR_ADD_TEST(qa_%s ${PYTHON_EXECUTABLE} ${CMAKE_CURRENT_SOURCE_DIR}/qa_%s.py)\n' % \
+                  (info['blockname'], info['blockname']) for info in self._blocks]))
+
+    def _add_perf_config(self):
+        """ Add a section for every block to python/perf.cfg, which holds
+        the thresholds of the throughput tests. The file is created if
+        it doesn't exist yet. """
+        fname_cfg = os.path.join('python', 'perf.cfg')
+        if os.path.isfile(fname_cfg):
+            cfg = open(fname_cfg, 'r').read()
+        else:
+            print "Adding file '%s'..." % fname_cfg
+            cfg = get_template('perf_cfg', **self._info)
+        for info in self._blocks:
+            if re.search(r'^\[%s\]' % info['blockname'], cfg, flags=re.MULTILINE) is None:
+                cfg += get_template('perf_cfg_section', **info)
+        open(fname_cfg, 'w').write(cfg)
+
+    def _run_benchmark(self):
+        """ Do everything that needs doing in the subdir 'python' to add
+        a throughput benchmark.
+        - add .py file
+        - add a target to CMakeLists.txt
+        """
+        for info in self._blocks:
+            fname_bm = 'bm_' + info['blockname'] + '.py'
+            self._write_tpl('bm_python', 'python', fname_bm, info)
+            os.chmod(os.path.join('python', fname_bm), 0755)
+        if self.options.skip_cmakefiles:
+            return
+        print "Editing python/CMakeLists.txt..."
+        ed = CMakeFileEditor(self._file['cmpython'])
+        has_benchmark_target = re.search(r'add_custom_target\(benchmark\)', ed.cfile) is not None
+        for info in self._blocks:
+            ed.cfile += get_template('bm_cmakeentry', has_benchmark_target=has_benchmark_target, **info)
+            has_benchmark_target = True
+        ed.remove_double_newlines()
+        ed.write()
 
     def _run_python(self):
         """ Do everything that needs doing in the subdir 'python' to add
@@ -268,15 +716,20 @@ class ModToolAdd(ModTool):
         - include in CMakeLists.txt
         - include in __init__.py
         """
-        fname_py = self._info['blockname'] + '.py'
-        self._write_tpl('block_python', 'python', fname_py)
+        fnames_py = []
+        for info in self._blocks:
+            fname_py = info['blockname'] + '.py'
+            self._write_tpl('block_python', 'python', fname_py, info)
+            fnames_py.append(fname_py)
         append_re_line_sequence(self._file['pyinit'],
                                 '(^from.*import.*\n|# import any pure.*\n)',
-                                'from %s import %s' % (self._info['blockname'], self._info['blockname']))
+                                '\n'.join(['from %s import %s' % (info['blockname'], info['blockname'])
+                                           for info in self._blocks]))
         if self.options.skip_cmakefiles:
             return
         ed = CMakeFileEditor(self._file['cmpython'])
-        ed.append_value('GR_PYTHON_INSTALL', fname_py, 'DESTINATION[^()]+')
+        for fname_py in fnames_py:
+            ed.append_value('GR_PYTHON_INSTALL', fname_py, 'DESTINATION[^()]+')
         ed.write()
 
     def _run_grc(self):
@@ -285,12 +738,15 @@ class ModToolAdd(ModTool):
         - add .xml file
         - include in CMakeLists.txt
         """
-        fname_grc = self._info['fullblockname'] + '.xml'
-        self._write_tpl('grc_xml', 'grc', fname_grc)
+        fnames_grc = []
+        for info in self._blocks:
+            fname_grc = info['fullblockname'] + '.xml'
+            self._write_tpl('grc_xml', 'grc', fname_grc, info)
+            fnames_grc.append(fname_grc)
         ed = CMakeFileEditor(self._file['cmgrc'], '\n    ')
         if self.options.skip_cmakefiles or ed.check_for_glob('*.xml'):
             return
         print "Editing grc/CMakeLists.txt..."
-        ed.append_value('install', fname_grc, 'DESTINATION[^()]+')
+        for fname_grc in fnames_grc:
+            ed.append_value('install', fname_grc, 'DESTINATION[^()]+')
         ed.write()
-
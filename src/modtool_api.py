@@ -0,0 +1,208 @@
+""" Use gr_modtool from Python, without the command line
+
+    import modtool_api
+    result = modtool_api.add_block('/path/to/gr-howto',
+                                   {'block_name': 'square_ff', 'block_type': 'sync',
+                                    'lang': 'cpp', 'argument_list': ''})
+    print result['files_created']
+
+The functions take the module directory and the options (the names of the
+command line options, e.g. 'block_name' or 'argument-list'), never read
+sys.argv and never ask questions: if a command would ask for something,
+ModToolException is raised instead, as it is if the command fails. The
+output of the command is returned in the result, together with the files
+the command created, changed and deleted.
+
+The commands themselves work relative to the current directory, so calls
+are serialised by a lock and run in the module directory. This is a
+chdir() of the whole process: while a command runs, relative paths used
+by other threads resolve against the module directory, so use absolute
+paths there. The current directory is restored afterwards, and the paths
+given to these functions are resolved while no command runs. Output and
+questions are redirected per thread, so other threads can keep printing
+while a command runs.
+"""
+
+import os
+import re
+import sys
+import threading
+import __builtin__
+
+from modtool_base import ModTool
+from modtool_add import ModToolAdd
+from modtool_rm import ModToolRemove
+from modtool_disable import ModToolDisable
+from modtool_makexml import ModToolMakeXML
+from modtool_newmod import ModToolNewModule
+
+### Library interface ########################################################
+class ModToolException(Exception):
+    """ A command failed or needed an answer. The output of the command
+    is in log. """
+    def __init__(self, message, log=''):
+        Exception.__init__(self, message)
+        self.log = log
+
+class _ThreadOutput(object):
+    """ Stand-in for sys.stdout: writes go to the buffer of the current
+    thread while it runs a command, and to the real stdout otherwise. """
+    def __init__(self, stdout, local):
+        self._stdout = stdout
+        self._local = local
+
+    def write(self, text):
+        buf = getattr(self._local, 'output', None)
+        if buf is None:
+            self._stdout.write(text)
+        else:
+            buf.append(text)
+
+    def flush(self):
+        if getattr(self._local, 'output', None) is None:
+            self._stdout.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stdout, name)
+
+_LOCK = threading.RLock()
+_LOCAL = threading.local()
+_ORIG_RAW_INPUT = __builtin__.raw_input
+
+def _raw_input(prompt=''):
+    """ raw_input() for commands run through this module: there's nobody
+    to answer, so the missing option is an error. """
+    if getattr(_LOCAL, 'output', None) is None:
+        return _ORIG_RAW_INPUT(prompt)
+    raise ModToolException("The command needs input ('%s'), set the option instead." % prompt.strip(),
+                           ''.join(_LOCAL.output))
+
+def _snapshot(module_dir):
+    """ Return a dict path -> (mtime, size) of the files of a module,
+    without hidden files and build directories. """
+    snapshot = {}
+    for (dirpath, dirnames, filenames) in os.walk(module_dir):
+        if dirpath != module_dir and 'CMakeCache.txt' in filenames:
+            dirnames[:] = []
+            continue
+        dirnames[:] = [d for d in dirnames if d[0] != '.']
+        for fname in filenames:
+            if fname[0] == '.':
+                continue
+            path = os.path.join(dirpath, fname)
+            stat = os.stat(path)
+            snapshot[os.path.relpath(path, module_dir)] = (stat.st_mtime, stat.st_size)
+    return snapshot
+
+def _make_options(modtool, command, module_dir, options):
+    """ Return the parsed options of a command: the defaults, overridden
+    by options. Unknown options raise ValueError. """
+    (parsed, args) = modtool.parser.parse_args([command])
+    for (key, value) in options.items():
+        dest = key.lstrip('-').replace('-', '_')
+        if not hasattr(parsed, dest) or dest in ('directory', 'help'):
+            raise ValueError("'%s' has no option '%s'." % (command, key))
+        setattr(parsed, dest, value)
+    parsed.directory = module_dir
+    return (parsed, args)
+
+def run_command(module_path, command_class, options=None):
+    """ Run a gr_modtool command on the module in module_path.
+    - command_class: the ModTool class of the command, e.g. ModToolAdd
+    - options: dict of options, see above
+    Returns a dict with the module directory and name, the output of the
+    command ('log') and the lists of files (relative to the module) the
+    command created, changed and deleted. Raises ModToolException if the
+    command fails, or if it would ask something. 'newmod' can't be run
+    like this, as module_path has to be an existing module. """
+    if issubclass(command_class, ModToolNewModule):
+        raise ValueError("'%s' creates a module, it can't be run on one." % command_class.name)
+    with _LOCK:
+        # Only resolve module_path while no other command is in its module
+        module_dir = os.path.abspath(module_path)
+        if not os.path.isdir(module_dir):
+            raise ModToolException("No such directory: %s" % module_dir)
+        modtool = command_class()
+        (modtool.options, modtool.args) = _make_options(modtool, command_class.name,
+                                                        module_dir, options or {})
+        if not isinstance(sys.stdout, _ThreadOutput):
+            sys.stdout = _ThreadOutput(sys.stdout, _LOCAL)
+        __builtin__.raw_input = _raw_input
+        cwd = os.getcwd()
+        before = _snapshot(module_dir)
+        _LOCAL.output = []
+        try:
+            modtool.setup()
+            modtool.run()
+        except SystemExit, e:
+            if e.code not in (None, 0):
+                lines = ''.join(_LOCAL.output).strip().splitlines() or ['exit code %s' % e.code]
+                raise ModToolException(lines[-1], ''.join(_LOCAL.output))
+        finally:
+            log = ''.join(_LOCAL.output)
+            _LOCAL.output = None
+            os.chdir(cwd)
+        after = _snapshot(module_dir)
+    return {'module_dir': module_dir,
+            'modname': modtool._info.get('modname'),
+            'log': log,
+            'files_created': sorted([f for f in after.keys() if f not in before]),
+            'files_modified': sorted([f for f in after.keys() if f in before and before[f] != after[f]]),
+            'files_deleted': sorted([f for f in before.keys() if f not in after])}
+
+def add_block(module_path, spec):
+    """ Add a block to a module ('gr_modtool add'). spec holds the options
+    of 'gr_modtool add', at least block_name, block_type, lang and
+    argument_list. No QA code is added unless add_python_qa or add_cpp_qa
+    are set. The result (see run_command()) also has 'blocks', the name
+    of the new block. """
+    spec = dict(spec)
+    spec.setdefault('add_python_qa', False)
+    spec.setdefault('add_cpp_qa', False)
+    result = run_command(module_path, ModToolAdd, spec)
+    result['blocks'] = [spec.get('block_name') or spec.get('block-name')]
+    return result
+
+def remove_blocks(module_path, pattern, options=None):
+    """ Delete the files of all blocks matching pattern (a regular
+    expression) and remove them from the CMake files ('gr_modtool rm').
+    The result (see run_command()) also has 'blocks', the names of the
+    blocks whose files were deleted. """
+    options = dict(options or {})
+    options.update({'pattern': pattern, 'yes': True})
+    result = run_command(module_path, ModToolRemove, options)
+    result['blocks'] = _get_blocks_of_files(result, result['files_deleted'])
+    return result
+
+def disable_blocks(module_path, pattern, options=None):
+    """ Disable all blocks matching pattern ('gr_modtool disable'),
+    see remove_blocks() """
+    options = dict(options or {})
+    options.update({'pattern': pattern, 'yes': True})
+    return run_command(module_path, ModToolDisable, options)
+
+def make_xml(module_path, pattern, options=None):
+    """ Create the GRC XML files of all blocks matching pattern
+    ('gr_modtool makexml'). Existing files are overwritten unless
+    options has 'yes': False, in which case that raises
+    ModToolException. The result (see run_command()) also has 'blocks',
+    the names of the blocks whose XML files were written. """
+    options = dict(options or {})
+    options.setdefault('yes', True)
+    options['pattern'] = pattern
+    result = run_command(module_path, ModToolMakeXML, options)
+    result['blocks'] = _get_blocks_of_files(result, [f for f in result['files_created'] + result['files_modified']
+                                                     if f.startswith('grc' + os.sep) and f.endswith('.xml')])
+    return result
+
+def _get_blocks_of_files(result, files):
+    """ Return the block names of the files (public headers, GRC XML
+    files and block sources), sorted. """
+    modname = result['modname']
+    blocks = set()
+    for path in files:
+        fname = os.path.basename(path)
+        match = re.match(r'^(?!qa_|bm_)(%s_)?(\w+?)(_impl|_python)?\.(h|cc|py|xml)$' % modname, fname)
+        if match is not None and match.group(2) not in ('api', modname):
+            blocks.add(match.group(2))
+    return sorted(blocks)
@@ -3,16 +3,21 @@
 import os
 import re
 import sys
+import glob
+import subprocess
 from optparse import OptionParser, OptionGroup
 
 from util_functions import get_modname
+from profiler import profile_phase
+from dependency_graph import DependencyGraph
 from templates import Templates
+import Cheetah.Template
 
 ### ModTool base class #######################################################
 class ModTool(object):
     """ Base class for all modtool command classes. """
     def __init__(self):
-        self._subdirs = ['lib', 'include', 'python', 'swig', 'grc'] # List subdirs where stuff happens
+        self._subdirs = ['lib', 'include', 'python', 'swig', 'grc', 'pybind'] # List subdirs where stuff happens
         self._has_subdirs = {}
         self._skip_subdirs = {}
         self._info = {}
@@ -45,12 +50,22 @@ class ModTool(object):
                 help="Don't do anything in the python/ subdirectory.")
         ogroup.add_option("--skip-grc", action="store_true", default=False,
                 help="Don't do anything in the grc/ subdirectory.")
+        ogroup.add_option("--skip-pybind", action="store_true", default=False,
+                help="Don't do anything in the pybind/ subdirectory.")
+        ogroup.add_option("--profile", action="store_true", default=False,
+                help="Print timings per phase and counts of file and regex operations on exit.")
+        ogroup.add_option("--profile-dump", type="string", default=None,
+                help="Run with cProfile and write the statistics to this file (implies --profile).")
+        ogroup.add_option("--trace-json", type="string", default=None,
+                help="Write the profile to this file in Chrome trace format (implies --profile).")
+        ogroup.add_option("--io-report", action="store_true", default=False,
+                help="Print the number of reads, writes and bytes per file on exit.")
         parser.add_option_group(ogroup)
         return parser
 
     def setup(self):
         """ Initialise all internal variables, such as the module name etc. """
-        (options, self.args) = self.parser.parse_args()
+        (options, self.args) = self._parse_args()
         self._dir = options.directory
         if not self._check_directory(self._dir):
             print "No GNU Radio module found in the given directory. Quitting."
@@ -74,10 +89,19 @@ class ModTool(object):
             self._skip_subdirs['swig'] = True
         if options.skip_grc or not self._has_subdirs['grc']:
             self._skip_subdirs['grc'] = True
+        if options.skip_pybind or not self._has_subdirs['pybind']:
+            self._skip_subdirs['pybind'] = True
         self._info['blockname'] = options.block_name
         self.options = options
         self._setup_files()
 
+    def _parse_args(self):
+        """ Parse the command line, unless the options were set before
+        setup() was called (see modtool_api) """
+        if self.options is not None:
+            return (self.options, self.args)
+        return self.parser.parse_args()
+
     def _setup_files(self):
         """ Initialise the self._file[] dictionary """
         if not self._skip_subdirs['swig']:
@@ -85,6 +109,8 @@ class ModTool(object):
         self._file['qalib']    = os.path.join('lib',    'qa_%s.cc' % self._info['modname'])
         self._file['pyinit']   = os.path.join('python', '__init__.py')
         self._file['cmlib']    = os.path.join('lib',    'CMakeLists.txt')
+        self._file['unity']    = os.path.join('lib',    '%s_unity.cc' % self._info['modname'])
+        self._file['pch']      = os.path.join('lib',    '%s_pch.h' % self._info['modname'])
         self._file['cmgrc']    = os.path.join('grc',    'CMakeLists.txt')
         self._file['cmpython'] = os.path.join('python', 'CMakeLists.txt')
         if self._info['version'] in ('37', 'component'):
@@ -93,35 +119,56 @@ class ModTool(object):
             self._info['includedir'] = 'include'
         self._file['cminclude'] = os.path.join(self._info['includedir'], 'CMakeLists.txt')
         self._file['cmswig'] = os.path.join('swig', 'CMakeLists.txt')
+        self._file['cmpybind'] = os.path.join('pybind', 'CMakeLists.txt')
+        self._file['blocklist'] = 'block_list.txt'
+        self._file['buildprofile'] = 'build_profile.txt'
+        self._file['index'] = '.gr_modtool_index.json'
+        self._file['buildtimes'] = '.gr_modtool_buildtimes.json'
 
+    @profile_phase('discovery')
     def _check_directory(self, directory):
+        """ Guesses if dir is a valid GNU Radio module directory (see
+        _is_module_dir()). Changes the directory, if valid. """
+        if not self._is_module_dir(directory):
+            return False
+        try:
+            os.chdir(directory)
+        except OSError:
+            print "Can't chdir to directory %s." % directory
+            return False
+        return True
+
+    @profile_phase('discovery')
+    def _is_module_dir(self, directory):
         """ Guesses if dir is a valid GNU Radio module directory by looking for
         CMakeLists.txt and at least one of the subdirs lib/, python/ and swig/.
-        Changes the directory, if valid. """
+        Unlike _check_directory(), this doesn't change the current directory. """
         has_makefile = False
         try:
             files = os.listdir(directory)
-            os.chdir(directory)
         except OSError:
-            print "Can't read or chdir to directory %s." % directory
+            print "Can't read directory %s." % directory
             return False
         for f in files:
-            if os.path.isfile(f) and f == 'CMakeLists.txt':
-                if re.search('find_package\(GnuradioCore\)', open(f).read()) is not None:
+            path = os.path.join(directory, f)
+            if os.path.isfile(path) and f == 'CMakeLists.txt':
+                cmfile = open(path).read()
+                if re.search('find_package\(GnuradioCore\)', cmfile) is not None:
                     self._info['version'] = '36' # Might be 37, check that later
                     has_makefile = True
-                elif re.search('GR_REGISTER_COMPONENT', open(f).read()) is not None:
+                elif re.search('GR_REGISTER_COMPONENT', cmfile) is not None:
                     self._info['version'] = '36' # Might be 37, check that later
                     self._info['is_component'] = True
                     has_makefile = True
             # TODO search for autofoo
-            elif os.path.isdir(f):
+            elif os.path.isdir(path):
                 if (f in self._has_subdirs.keys()):
                     self._has_subdirs[f] = True
                 else:
                     self._skip_subdirs[f] = True
         return bool(has_makefile and (self._has_subdirs.values()))
 
+    @profile_phase('discovery')
     def _get_mainswigfile(self):
         """ Find out which name the main SWIG file has. In particular, is it
             a MODNAME.i or a MODNAME_swig.i? Returns None if none is found. """
@@ -133,6 +180,159 @@ class ModTool(object):
                 return fname
         return None
 
+    def _get_swig_module_files(self):
+        """ Return the names of the SWIG files of all per-block SWIG modules
+        (swig/MODNAME_*_swig.i, see _add_swig_module()), sorted. """
+        return sorted([os.path.basename(f) for f in
+                       glob.glob(os.path.join('swig', '%s_*_swig.i' % self._info['modname']))])
+
+    def _get_block_list(self):
+        """ Return the names of the blocks in block_list.txt (see
+        GrBlockProfile.cmake), or None if the module has no block list. """
+        try:
+            blocklist = open(self._file['blocklist'], 'r').read()
+        except IOError:
+            return None
+        return re.findall('^([a-zA-Z0-9_]+)\s*$', blocklist, flags=re.MULTILINE)
+
+    def _update_block_list(self, add=(), remove=()):
+        """ Add blocks to and remove blocks from block_list.txt, which
+        registers them for the build profiles. Modules without a block
+        list are left alone. """
+        blocks = self._get_block_list()
+        if blocks is None:
+            return
+        add = [blockname for blockname in add if blockname not in blocks]
+        remove = [blockname for blockname in remove if blockname in blocks]
+        if len(add) == 0 and len(remove) == 0:
+            return
+        print "Editing %s..." % self._file['blocklist']
+        blocklist = open(self._file['blocklist'], 'r').read()
+        for blockname in remove:
+            blocklist = re.sub('^%s\s*\n' % blockname, '', blocklist, flags=re.MULTILINE)
+        if len(blocklist) and blocklist[-1] != '\n':
+            blocklist += '\n'
+        blocklist += ''.join(['%s\n' % blockname for blockname in add])
+        open(self._file['blocklist'], 'w').write(blocklist)
+
+    def _get_dependency_graph(self):
+        """ Return the dependencies between the blocks (see DependencyGraph).
+        Only files that changed since the last call are scanned. """
+        return DependencyGraph(self._info['modname'], self._info['includedir'],
+                               self._get_block_list(), self._file['index'])
+
+    def _find_dependents(self, graph, blocks):
+        """ Find and print everything that depends on blocks, and that
+        gr_modtool doesn't edit by itself when the blocks are removed or
+        disabled. Returns the tuple from DependencyGraph.dependents(). """
+        ignore = (r'^swig/', r'^python/__init__\.py$',
+                  r'^lib/qa_%s\.(cc|h)$' % self._info['modname'],
+                  '^%s$' % re.escape(self._file['unity']), '^%s$' % re.escape(self._file['pch']))
+        (dependent_blocks, dependent_files) = graph.dependents(blocks, ignore)
+        if len(dependent_blocks) or len(dependent_files):
+            print "These depend on %s:" % ', '.join(sorted(blocks))
+            for blockname in sorted(dependent_blocks.keys()):
+                print "  block %s (%s)" % (blockname, dependent_blocks[blockname])
+            for path in sorted(dependent_files.keys()):
+                print "  %s" % dependent_files[path]
+        return (dependent_blocks, dependent_files)
+
+    def _add_bindings_imports(self, module_names):
+        """ Import the binding modules (SWIG or pybind11) in module_names
+        into the namespace of the module (python/__init__.py). The imports
+        go after the last import of a binding module. """
+        try:
+            initfile = open(self._file['pyinit'], 'r').read()
+        except IOError:
+            print "Can't read %s, import %s manually." % (self._file['pyinit'], ', '.join(module_names))
+            return
+        import_str = ''.join(['from %s import *\n' % name for name in module_names])
+        import_lines = re.findall('^#?from\s+\w+_(?:swig|python)\s+import\s+\*.*\n', initfile, flags=re.MULTILINE)
+        comment_lines = re.findall('^# import .* into the \w+ namespace\n', initfile, flags=re.MULTILINE)
+        if len(import_lines):
+            initfile = initfile.replace(import_lines[-1], import_lines[-1] + import_str, 1)
+        elif len(comment_lines):
+            initfile = initfile.replace(comment_lines[0], comment_lines[0] + import_str, 1)
+        elif initfile.find('# import any pure python here') != -1:
+            initfile = initfile.replace('# import any pure python here',
+                                        import_str + '\n# import any pure python here', 1)
+        else:
+            initfile += '\n' + import_str
+        print "Editing %s..." % self._file['pyinit']
+        open(self._file['pyinit'], 'w').write(initfile)
+
+    def _add_blocks_to_swigfile(self, filename, blocks):
+        """ Add the headers and the block magic of blocks (a list of info
+        dicts) to the SWIG file filename. The file is read and written once. """
+        mod_block_sep = '/'
+        if self._info['version'] == '36':
+            mod_block_sep = '_'
+        swigfile = open(filename, 'r').read()
+        if len([info for info in blocks if len(info.get('release_gil', []))]) \
+                and re.search('^%nothread;', swigfile, flags=re.MULTILINE) is None:
+            swigfile = re.sub('(%include\s+"gnuradio.i")', '%nothread;\n\n\\1', swigfile, count=1)
+        swigfile += ''.join([str(Cheetah.Template.Template(Templates['swig_block_magic'], searchList=info))
+                             for info in blocks])
+        include_str = '\n'.join(['#include "%s%s%s.h"' % (
+                                        info['modname'],
+                                        mod_block_sep,
+                                        info['blockname']) for info in blocks])
+        if re.search('#include', swigfile):
+            last_line = re.findall('^#include.*\n', swigfile, flags=re.MULTILINE)[-1]
+            swigfile = swigfile.replace(last_line, last_line + include_str + '\n', 1)
+        else: # I.e., if the swig file is empty
+            regexp = re.compile('^%\{\n', re.MULTILINE)
+            swigfile = regexp.sub('%%{\n%s\n' % include_str, swigfile, count=1)
+        open(filename, 'w').write(swigfile)
+
+    def _add_swig_module(self, swigname, blocks):
+        """ Add blocks to the SWIG module swigname (swig/SWIGNAME.i). If the
+        module doesn't exist yet, it is created, gets its own GR_SWIG_MAKE
+        target in swig/CMakeLists.txt and is imported in python/__init__.py.
+        Every SWIG module is compiled separately, so a module with many
+        blocks doesn't end up with one huge wrapper file. """
+        filename = os.path.join('swig', '%s.i' % swigname)
+        searchlist = {'modname': self._info['modname'], 'swigname': swigname,
+                      'has_block_profile': self._get_block_list() is not None}
+        if not os.path.isfile(filename):
+            print "Adding file '%s'..." % filename
+            open(filename, 'w').write(str(Cheetah.Template.Template(Templates['swig_group_file'],
+                                                                    searchList=searchlist)))
+            print "Editing %s..." % self._file['cmswig']
+            open(self._file['cmswig'], 'a').write(str(Cheetah.Template.Template(Templates['swig_group_cmakeentry'],
+                                                                                searchList=searchlist)))
+            self._add_bindings_imports([swigname])
+        else:
+            print "Editing %s..." % filename
+        self._add_blocks_to_swigfile(filename, blocks)
+
+    def _detect_compiler(self):
+        """ Guess the compiler family from $CXX (or c++) --version """
+        cxx = os.environ.get('CXX', 'c++')
+        try:
+            version = subprocess.Popen([cxx, '--version'], stdout=subprocess.PIPE,
+                                       stderr=subprocess.STDOUT).communicate()[0]
+        except OSError:
+            print "Can't run %s to detect the compiler, assuming GCC." % cxx
+            return 'gcc'
+        if re.search('clang', version) is not None:
+            return 'clang'
+        return 'gcc'
+
+    def _call(self, cmd, cwd=None, env=None, fail_ok=False):
+        """ Run a command, quit if it fails (unless fail_ok).
+        Returns True on success. """
+        print ' '.join(cmd)
+        try:
+            retcode = subprocess.call(cmd, cwd=cwd, env=env)
+        except OSError, e:
+            print "Can't run %s: %s" % (cmd[0], e)
+            sys.exit(1)
+        if retcode != 0 and not fail_ok:
+            print "'%s' failed (exit code %d). Quitting." % (' '.join(cmd), retcode)
+            sys.exit(1)
+        return retcode == 0
+
     def run(self):
         """ Override this. """
         pass
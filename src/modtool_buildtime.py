@@ -0,0 +1,222 @@
+""" Attribute the build time of a module to its blocks """
+
+import os
+import re
+import sys
+import json
+import time
+import subprocess
+from datetime import datetime
+from multiprocessing import cpu_count
+from optparse import OptionGroup
+
+from modtool_base import ModTool
+from cmakefile_editor import CMakeFileEditor
+from templates import Templates
+import Cheetah.Template
+
+### Build time module ########################################################
+class ModToolBuildTime(ModTool):
+    """ Build the module, time every source and sum up the times per block """
+    name = 'buildtime'
+    aliases = ('bt',)
+    def __init__(self):
+        ModTool.__init__(self)
+        self._build_dir = None
+        self._compiler = None
+
+    def setup_parser(self):
+        " Initialise the option parser for 'gr_modtool.py buildtime' "
+        parser = ModTool.setup_parser(self)
+        parser.usage = '%prog buildtime [options]\n' \
+                       ' Rebuilds the module, times every compiler call (wall time, and\n' \
+                       ' frontend/backend from the compiler\'s time report) and sums up the\n' \
+                       ' times per block. Every run is stored, so it can be compared to the\n' \
+                       ' runs of other commits.'
+        ogroup = OptionGroup(parser, "Build time options")
+        ogroup.add_option("-b", "--build-dir", type="string", default="build-buildtime",
+                help="Build directory, relative to the module (default: build-buildtime).")
+        ogroup.add_option("-j", "--jobs", type="int", default=cpu_count(),
+                help="Number of parallel make jobs (default: number of CPUs, use 1 for the most stable times).")
+        ogroup.add_option("--compiler", type="choice", choices=('auto', 'gcc', 'clang'), default='auto',
+                help="Compiler family, selects -ftime-report (gcc) or -ftime-trace (clang) (default: detect from $CXX).")
+        ogroup.add_option("--cmake-args", type="string", default='',
+                help="Additional arguments for cmake, e.g. '-DENABLE_PCH=ON'.")
+        ogroup.add_option("--compare", type="string", default=None,
+                help="Compare to the stored run of this commit (default: the last stored run).")
+        ogroup.add_option("--threshold", type="float", default=10.0,
+                help="Flag blocks that build this many percent slower than in the run compared to (default: 10).")
+        ogroup.add_option("--no-save", action="store_true", default=False,
+                help="Don't store the results of this run.")
+        parser.add_option_group(ogroup)
+        return parser
+
+    def setup(self):
+        ModTool.setup(self)
+        self._build_dir = os.path.abspath(self.options.build_dir)
+        self._compiler = self.options.compiler
+        if self._compiler == 'auto':
+            self._compiler = self._detect_compiler()
+        print "Compiler family: %s" % self._compiler
+
+    def run(self):
+        """ Go, go, go!
+        - configure the build dir with the timing launcher
+        - rebuild everything
+        - sum up the times per block, compare to an earlier run and store
+        """
+        if not os.path.isdir(self._build_dir):
+            os.makedirs(self._build_dir)
+        logfile = os.path.join(self._build_dir, 'buildtime.log')
+        launcher = os.path.join(self._build_dir, 'buildtime_launcher.py')
+        open(launcher, 'w').write(str(Cheetah.Template.Template(Templates['buildtime_launcher'],
+                                                                searchList={})))
+        flags = {'gcc': '-ftime-report', 'clang': '-ftime-trace'}[self._compiler]
+        launcher_cmd = ';'.join((sys.executable, launcher, logfile))
+        self._call(['cmake', os.getcwd(),
+                    '-DCMAKE_C_FLAGS=%s' % flags,
+                    '-DCMAKE_CXX_FLAGS=%s' % flags,
+                    '-DCMAKE_C_COMPILER_LAUNCHER=%s' % launcher_cmd,
+                    '-DCMAKE_CXX_COMPILER_LAUNCHER=%s' % launcher_cmd,
+                    '-DENABLE_CCACHE=OFF',
+                    '-DENABLE_UNITY_BUILD=OFF'] + self.options.cmake_args.split(),
+                   cwd=self._build_dir)
+        self._call(['make', 'clean'], cwd=self._build_dir)
+        if os.path.isfile(logfile):
+            os.unlink(logfile)
+        start = time.time()
+        self._call(['make', '-j%d' % max(self.options.jobs, 1)], cwd=self._build_dir)
+        make_wall = time.time() - start
+        try:
+            entries = [json.loads(line) for line in open(logfile, 'r') if line.strip()]
+        except IOError:
+            entries = []
+        if len(entries) == 0:
+            print "No compiler calls were timed (the compiler launcher needs CMake 3.4 or newer)."
+            sys.exit(1)
+        result = self._summarize(entries, make_wall)
+        self._print_report(result)
+        runs = self._load_runs()
+        previous = self._find_run(runs, self.options.compare)
+        if previous is not None:
+            self._print_comparison(previous, result)
+        elif self.options.compare is not None:
+            print "No stored run for '%s'." % self.options.compare
+        if not self.options.no_save:
+            runs.append(result)
+            json.dump(runs, open(self._file['buildtimes'], 'w'), indent=2, sort_keys=True)
+            print "Results stored in %s." % self._file['buildtimes']
+
+    def _get_library_sources(self):
+        """ Return the sources of the library (add_library() in lib/CMakeLists.txt) """
+        try:
+            value = CMakeFileEditor(self._file['cmlib']).get_entry_value('add_library')
+        except IOError:
+            return []
+        if value is None:
+            return []
+        return [os.path.join('lib', f) for f in value.split()
+                if os.path.splitext(f)[1] in ('.c', '.cc', '.cpp', '.cxx')]
+
+    def _summarize(self, entries, make_wall):
+        """ Sum up the timed sources per block. Sources that don't belong
+        to a block (SWIG wrappers, the QA runner, ...) are summed up per
+        directory, e.g. '(swig)'. """
+        graph = self._get_dependency_graph()
+        sources = {}
+        blocks = {}
+        for entry in entries:
+            source = os.path.relpath(entry['source'], os.getcwd())
+            if source.startswith('..'):
+                source = entry['source']
+            elif source.startswith(os.path.relpath(self._build_dir, os.getcwd()) + os.sep):
+                source = os.path.relpath(entry['source'], self._build_dir)
+            sources[source] = {'wall': entry['wall'],
+                               'frontend': entry['frontend'],
+                               'backend': entry['backend']}
+            owner = graph.owner(source)
+            if owner is None:
+                owner = '(%s)' % source.split(os.sep)[0]
+            block_times = blocks.setdefault(owner, {'sources': 0, 'wall': 0.0,
+                                                    'frontend': 0.0, 'backend': 0.0})
+            block_times['sources'] += 1
+            for key in ('wall', 'frontend', 'backend'):
+                block_times[key] += entry[key] or 0.0
+        missing = [f for f in self._get_library_sources()
+                   if f not in sources and f != self._file['unity']]
+        if len(missing):
+            print "Warning: These library sources weren't compiled: %s" % ', '.join(missing)
+        return {'commit': self._get_commit(),
+                'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'compiler': self._compiler,
+                'jobs': self.options.jobs,
+                'make_wall': make_wall,
+                'blocks': blocks,
+                'sources': sources}
+
+    def _get_commit(self):
+        """ Return the current git commit of the module, with a '+' if
+        there are uncommitted changes, or None outside of git """
+        try:
+            proc = subprocess.Popen(['git', 'rev-parse', '--short', 'HEAD'],
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            commit = proc.communicate()[0].strip()
+            if proc.returncode != 0:
+                return None
+            if subprocess.call(['git', 'diff', '--quiet', 'HEAD']) != 0:
+                commit += '+'
+        except OSError:
+            return None
+        return commit
+
+    def _load_runs(self):
+        """ Return the stored runs, oldest first """
+        try:
+            return json.load(open(self._file['buildtimes'], 'r'))
+        except (IOError, ValueError):
+            return []
+
+    def _find_run(self, runs, rev):
+        """ Return the last stored run of commit rev (any git revision),
+        or the last stored run if rev is None """
+        if rev is None:
+            return (runs or [None])[-1]
+        try:
+            proc = subprocess.Popen(['git', 'rev-parse', '--short', rev],
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            commit = proc.communicate()[0].strip() or rev
+        except OSError:
+            commit = rev
+        for run in reversed(runs):
+            if run['commit'] is not None and re.match(r'%s\+?$' % re.escape(commit), run['commit']):
+                return run
+        return None
+
+    def _print_report(self, result):
+        """ Print the times per block, slowest first """
+        total = sum([b['wall'] for b in result['blocks'].values()]) or 1.0
+        print '%-24s %8s %10s %10s %10s %7s' % ('Block', 'Sources', 'Wall (s)', 'Front (s)', 'Back (s)', 'Share')
+        for blockname in sorted(result['blocks'].keys(), key=lambda b: -result['blocks'][b]['wall']):
+            block_times = result['blocks'][blockname]
+            print '%-24s %8d %10.2f %10.2f %10.2f %6.1f%%' % (blockname, block_times['sources'],
+                                                              block_times['wall'], block_times['frontend'],
+                                                              block_times['backend'],
+                                                              100 * block_times['wall'] / total)
+        print "Compiling: %.2f s (summed over all sources), make: %.2f s (wall, -j%d)" % (
+                total, result['make_wall'], result['jobs'])
+
+    def _print_comparison(self, previous, result):
+        """ Print the change per block since an earlier run """
+        print "\nCompared to %s (%s):" % (previous['commit'] or 'unknown commit', previous['date'])
+        print '%-24s %10s %10s %8s' % ('Block', 'Before (s)', 'After (s)', 'Change')
+        for blockname in sorted(set(previous['blocks'].keys() + result['blocks'].keys())):
+            before = previous['blocks'].get(blockname, {}).get('wall')
+            after = result['blocks'].get(blockname, {}).get('wall')
+            if before is None or after is None:
+                print '%-24s %10s %10s %8s' % (blockname, {True: '-', False: '%.2f' % (before or 0)}[before is None],
+                                               {True: '-', False: '%.2f' % (after or 0)}[after is None],
+                                               {True: 'new', False: 'gone'}[before is None])
+                continue
+            change = 100 * (after - before) / (before or 1.0)
+            flag = {True: '  <-- slower', False: ''}[change > self.options.threshold]
+            print '%-24s %10.2f %10.2f %7.1f%%%s' % (blockname, before, after, change, flag)
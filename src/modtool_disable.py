@@ -25,6 +25,8 @@ class ModToolDisable(ModTool):
                 help="Filter possible choices for blocks to be disabled.")
         ogroup.add_option("-y", "--yes", action="store_true", default=False,
                 help="Answer all questions with 'yes'.")
+        ogroup.add_option("--with-dependents", action="store_true", default=False,
+                help="Also disable all blocks that depend on the disabled blocks.")
         parser.add_option_group(ogroup)
         return parser
 
@@ -49,6 +51,10 @@ class ModToolDisable(ModTool):
             """ Do stuff for py qa """
             cmake.comment_out_lines('GR_ADD_TEST.*'+fname)
             return True
+        def _handle_py_bm(cmake, fname):
+            """ Do stuff for py benchmarks """
+            cmake.comment_out_lines(r'benchmark_%s\b' % os.path.splitext(fname)[0][3:])
+            return True
         def _handle_py_mod(cmake, fname):
             """ Do stuff for py extra files """
             try:
@@ -74,27 +80,49 @@ class ModToolDisable(ModTool):
                 cmake.comment_out_lines('target_link_libraries.*'+os.path.splitext(fname)[0])
                 cmake.comment_out_lines('GR_ADD_TEST.*'+os.path.splitext(fname)[0])
             return True
+        def _handle_cc_unity(cmake, fname):
+            """ Comment out the source in the unity build file, too """
+            if fname == os.path.basename(self._file['unity']) or not os.path.isfile(self._file['unity']):
+                return False
+            ed = CMakeFileEditor(self._file['unity']) # Abusing the CMakeFileEditor...
+            ed.comment_out_lines(r'^\s*#include\s+"%s"' % re.escape(fname), comment_str='//')
+            ed.write()
+            return False
         def _handle_h_swig(cmake, fname):
-            """ Comment out include files from the SWIG file,
+            """ Comment out include files from the SWIG files,
             as well as the block magic """
-            swigfile = open(self._file['swig']).read()
-            (swigfile, nsubs) = re.subn('(.include\s+"(%s/)?%s")' % (
-                                        self._info['modname'], fname),
-                                        r'//\1', swigfile)
-            if nsubs > 0:
-                print "Changing %s..." % self._file['swig']
-            if nsubs > 1: # Need to find a single BLOCK_MAGIC
-                blockname = os.path.splitext(fname[len(self._info['modname'])+1:])[0]
-                if self._info['version'] == '37':
-                    blockname = os.path.splitext(fname)[0]
-                (swigfile, nsubs) = re.subn('(GR_SWIG_BLOCK_MAGIC2?.+%s.+;)' % blockname, r'//\1', swigfile)
-                if nsubs > 1:
-                    print "Hm, changed more then expected while editing %s." % self._file['swig']
-            open(self._file['swig'], 'w').write(swigfile)
+            if self._skip_subdirs['swig']:
+                return False
+            swig_files = [self._file['swig']] + [os.path.join('swig', f) for f in self._get_swig_module_files()]
+            for swig_file in swig_files:
+                swigfile = open(swig_file).read()
+                (swigfile, nsubs) = re.subn('(.include\s+"(%s/)?%s")' % (
+                                            self._info['modname'], fname),
+                                            r'//\1', swigfile)
+                if nsubs == 0:
+                    continue
+                print "Changing %s..." % swig_file
+                if nsubs > 1: # Need to find a single BLOCK_MAGIC
+                    blockname = os.path.splitext(fname[len(self._info['modname'])+1:])[0]
+                    if self._info['version'] == '37':
+                        blockname = os.path.splitext(fname)[0]
+                    (swigfile, nsubs) = re.subn('(GR_SWIG_BLOCK_MAGIC2?.+%s.+;)' % blockname, r'//\1', swigfile)
+                    if nsubs > 1:
+                        print "Hm, changed more then expected while editing %s." % swig_file
+                open(swig_file, 'w').write(swigfile)
             return False
         def _handle_i_swig(cmake, fname):
             """ Comment out include files from the SWIG file,
-            as well as the block magic """
+            as well as the block magic. Per-block SWIG modules
+            are disabled by commenting out their CMake target
+            and their import in __init__.py. """
+            swigname = re.sub('_doc$', '', os.path.splitext(fname)[0])
+            if re.match(r'%s_\w+_swig$' % self._info['modname'], swigname):
+                cmake.comment_out_lines(r'^(?!#).*\b%s(\b|_doc\.i)' % swigname)
+                initfile = open(self._file['pyinit']).read()
+                initfile = re.sub(r'^(from\s+%s\s+import)' % swigname, r'#\1', initfile, flags=re.MULTILINE)
+                open(self._file['pyinit'], 'w').write(initfile)
+                return True
             swigfile = open(self._file['swig']).read()
             blockname = os.path.splitext(fname[len(self._info['modname'])+1:])[0]
             if self._info['version'] == '37':
@@ -104,15 +132,38 @@ class ModToolDisable(ModTool):
             swigfile = re.sub('(GR_SWIG_BLOCK_MAGIC2?.+'+blockname+'.+;)', r'//\1', swigfile)
             open(self._file['swig'], 'w').write(swigfile)
             return False
+        def _handle_pybind(cmake, fname):
+            """ Comment out the target of a pybind11 binding,
+            as well as its import in __init__.py """
+            cmake.comment_out_lines(r'^\s*GR_PYBIND_MAKE.*\b%s\b' % fname)
+            initfile = open(self._file['pyinit']).read()
+            initfile = re.sub(r'^(from\s+%s_%s\s+import)' % (self._info['modname'], fname[:-3]),
+                              r'#\1', initfile, flags=re.MULTILINE)
+            open(self._file['pyinit'], 'w').write(initfile)
+            return True
         # List of special rules: 0: subdir, 1: filename re match, 2: function
         special_treatments = (
                 ('python', 'qa.+py$', _handle_py_qa),
-                ('python', '^(?!qa).+py$', _handle_py_mod),
+                ('python', 'bm_.+py$', _handle_py_bm),
+                ('python', '^(?!qa|bm_).+py$', _handle_py_mod),
                 ('lib', 'qa.+\.cc$', _handle_cc_qa),
+                ('lib', '^(?!qa).+\.cc$', _handle_cc_unity),
                 ('include/%s' % self._info['modname'], '.+\.h$', _handle_h_swig),
                 ('include', '.+\.h$', _handle_h_swig),
-                ('swig', '.+\.i$', _handle_i_swig)
+                ('swig', '.+\.i$', _handle_i_swig),
+                ('pybind', '.+_python\.cc$', _handle_pybind)
         )
+        graph = self._get_dependency_graph()
+        blocks = [blockname for blockname in graph.blocks
+                  if re.search(self._info['pattern'], blockname) is not None]
+        (dependent_blocks, dependent_files) = ({}, {})
+        if len(blocks):
+            (dependent_blocks, dependent_files) = self._find_dependents(graph, blocks)
+        if len(dependent_blocks) and self.options.with_dependents:
+            print "Disabling the dependent blocks, too."
+            self._info['pattern'] = r'(%s)|^(qa_|bm_)?(%s_)?(%s)(_impl|_python|_swig)?\.' % (
+                    self._info['pattern'], self._info['modname'], '|'.join(sorted(dependent_blocks.keys())))
+            dependent_blocks = {}
         for subdir in self._subdirs:
             if self._skip_subdirs[subdir]: continue
             if self._info['version'] == '37' and subdir == 'include':
@@ -122,7 +173,10 @@ class ModToolDisable(ModTool):
             except IOError:
                 continue
             print "Traversing %s..." % subdir
-            filenames = cmake.find_filenames_match(self._info['pattern'])
+            filenames = []
+            for fname in cmake.find_filenames_match(self._info['pattern']):
+                if fname not in filenames:
+                    filenames.append(fname)
             yes = self._info['yes']
             for fname in filenames:
                 file_disabled = False
@@ -140,5 +194,9 @@ class ModToolDisable(ModTool):
                 if not file_disabled:
                     cmake.disable_file(fname)
             cmake.write()
-        print "Careful: 'gr_modtool disable' does not resolve dependencies."
+        if len(dependent_blocks):
+            print "Careful: The blocks listed above still use the disabled blocks " \
+                  "(use --with-dependents to disable them, too)."
+        if len(dependent_files):
+            print "Careful: The files listed above still use the disabled blocks, edit them manually."
 
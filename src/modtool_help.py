@@ -7,6 +7,12 @@ from modtool_rm import ModToolRemove
 from modtool_newmod import ModToolNewModule
 from modtool_disable import ModToolDisable
 from modtool_makexml import ModToolMakeXML
+from modtool_workspace import ModToolWorkspace
+from modtool_swigsplit import ModToolSwigSplit
+from modtool_pgo import ModToolPGO
+from modtool_profile import ModToolProfile
+from modtool_includecost import ModToolIncludeCost
+from modtool_buildtime import ModToolBuildTime
 from util_functions import get_command_from_argv
 from templates import Templates
 
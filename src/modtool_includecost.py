@@ -0,0 +1,320 @@
+""" Find the headers that cost the most build time """
+
+import os
+import re
+import sys
+import json
+import time
+import subprocess
+from optparse import OptionGroup
+
+from modtool_base import ModTool
+from modtool_info import ModToolInfo
+from profiler import profile_phase
+
+### Include cost module ######################################################
+class ModToolIncludeCost(ModTool):
+    """ Rank the headers by the amount of code they pull into the build,
+    and find includes that public headers don't need """
+    name = 'includecost'
+    aliases = ('ic',)
+    _include_re = re.compile(r'^\s*#\s*include\s*([<"])([^>"]+)[>"]', re.MULTILINE)
+    _decl_res = (
+            re.compile(r'\b(?:class|struct|union|enum|namespace)\s+(?:[A-Z][A-Z0-9_]*\s+)*(\w+)'),
+            re.compile(r'\btypedef\b[^;{}]*?(\w+)\s*;'),
+            re.compile(r'^\s*#\s*define\s+(\w+)', re.MULTILINE),
+    )
+    def __init__(self):
+        ModTool.__init__(self)
+        self._cxx = None
+        self._incdirs = []
+        self._sysdirs = []
+        self._includes = {}
+        self._sizes = {}
+        self._closures = {}
+        self._decls = {}
+        self._resolved = {}
+        self._unresolved = set()
+
+    def setup_parser(self):
+        " Initialise the option parser for 'gr_modtool.py includecost' "
+        parser = ModTool.setup_parser(self)
+        parser.usage = '%prog includecost [options] [PATTERN]\n' \
+                       ' Ranks the headers included by the blocks matching PATTERN by the\n' \
+                       ' amount of code they add to every source that includes them, and\n' \
+                       ' suggests includes that can move from public headers to the sources.'
+        ogroup = OptionGroup(parser, "Include cost options")
+        ogroup.add_option("-p", "--pattern", type="string", default=None,
+                help="Only analyse the blocks whose names match this regular expression.")
+        ogroup.add_option("--measure", action="store_true", default=False,
+                help="Run the preprocessor ($CXX -E) instead of estimating the preprocessed sizes.")
+        ogroup.add_option("--top", type="int", default=20,
+                help="Number of headers to show (default: 20).")
+        ogroup.add_option("--suggested-dirs", default=None, type="string",
+                help="Include dirs to use if none can be found in the CMake cache (colon-separated).")
+        ogroup.add_option("--json", type="string", default=None,
+                help="Also write the results to this file.")
+        parser.add_option_group(ogroup)
+        return parser
+
+    def setup(self):
+        ModTool.setup(self)
+        options = self.options
+        if options.pattern is not None:
+            self._info['pattern'] = options.pattern
+        elif options.block_name is not None:
+            self._info['pattern'] = options.block_name
+        elif len(self.args) >= 2:
+            self._info['pattern'] = self.args[1]
+        else:
+            self._info['pattern'] = '.'
+        self._cxx = os.environ.get('CXX', 'c++')
+        self._incdirs = self._find_include_dirs()
+
+    def run(self):
+        """ Go, go, go!
+        - follow the includes of every source of the selected blocks
+        - rank the headers by (preprocessed size) x (sources including them)
+        - check the includes of the public headers
+        """
+        graph = self._get_dependency_graph()
+        blocks = [blockname for blockname in graph.blocks
+                  if re.search(self._info['pattern'], blockname) is not None]
+        if len(blocks) == 0:
+            print "No blocks match '%s'." % self._info['pattern']
+            sys.exit(1)
+        sources = {}
+        for blockname in blocks:
+            for path in graph.files_of(blockname):
+                if os.path.splitext(path)[1] in ('.cc', '.cpp'):
+                    sources[path] = blockname
+        if self.options.measure:
+            print "Preprocessing %d sources with %s..." % (len(sources), self._cxx)
+        else:
+            print "Estimating the preprocessed size of %d sources..." % len(sources)
+        results = {'measured': self.options.measure, 'blocks': {}, 'headers': {}, 'suggestions': []}
+        for path in sorted(sources.keys()):
+            (size, seconds) = self._get_size(path)
+            block_results = results['blocks'].setdefault(sources[path],
+                    {'sources': 0, 'lines': 0, 'seconds': 0.0, 'estimated': False})
+            block_results['sources'] += 1
+            block_results['lines'] += size
+            block_results['seconds'] += seconds or 0.0
+            block_results['estimated'] |= seconds is None
+        # The headers worth looking at are the ones the module includes itself
+        for path in sorted(sources.keys()):
+            for included in self._closure(path):
+                if os.path.isabs(included):
+                    continue
+                for header in self._scan(included):
+                    if header in results['headers']:
+                        continue
+                    users = [src for src in sources.keys() if header in self._closure(src)]
+                    (size, seconds) = self._get_size(header)
+                    results['headers'][header] = {'lines': size, 'sources': len(users),
+                                                  'cost': size * len(users),
+                                                  'estimated': seconds is None}
+        for blockname in blocks:
+            results['suggestions'] += self._check_public_headers(graph, blockname, sources)
+        self._print_report(results)
+        if self.options.json is not None:
+            json.dump(results, open(self.options.json, 'w'), indent=2, sort_keys=True)
+            print "Results written to %s." % self.options.json
+
+    def _find_include_dirs(self):
+        """ Return the include dirs: the ones of the module, the ones
+        'gr_modtool info' finds, and the ones the compiler searches
+        anyway. """
+        info = ModToolInfo()
+        info.options = self.options
+        mod_info = {'base_dir': os.getcwd()}
+        if 'is_component' in self._info.keys():
+            mod_info['is_component'] = True
+        # Without a build dir, there's no CMake cache and only the suggested dirs are used
+        mod_info['build_dir'] = info._get_build_dir(mod_info) or mod_info['base_dir']
+        incdirs = ['include', 'lib'] + info._get_include_dirs(mod_info)
+        self._sysdirs = self._get_system_include_dirs()
+        incdirs += self._sysdirs
+        return [d for (i, d) in enumerate(incdirs) if d not in incdirs[:i] and os.path.isdir(d)]
+
+    def _get_system_include_dirs(self):
+        """ Ask the compiler where it looks for <...> includes """
+        try:
+            proc = subprocess.Popen([self._cxx, '-x', 'c++', '-E', '-v', '-'], stdin=subprocess.PIPE,
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            stderr = proc.communicate('')[1]
+        except OSError:
+            print "Can't run %s, assuming the default include dirs." % self._cxx
+            return ['/usr/local/include', '/usr/include']
+        search_list = re.search(r'#include <\.\.\.> search starts here:\n(.*?)\nEnd of search list',
+                                stderr, flags=re.DOTALL)
+        if search_list is None:
+            return ['/usr/local/include', '/usr/include']
+        return [os.path.normpath(line.replace('(framework directory)', '').strip())
+                for line in search_list.group(1).splitlines()]
+
+    def _resolve(self, name, including_file=None):
+        """ Find the file an #include refers to. "..." includes are looked
+        up next to the including file first. Returns None if it can't be
+        found. """
+        dirs = self._incdirs
+        if including_file is not None:
+            dirs = [os.path.dirname(including_file)] + dirs
+        key = (dirs[0], name)
+        if key not in self._resolved:
+            self._resolved[key] = None
+            for incdir in dirs:
+                path = os.path.normpath(os.path.join(incdir, name))
+                if os.path.isfile(path):
+                    self._resolved[key] = path
+                    break
+        return self._resolved[key]
+
+    @profile_phase('parse')
+    def _scan(self, path):
+        """ Return the files path includes directly. Every #include
+        counts, even if it's inside an #if. """
+        if path not in self._includes:
+            try:
+                content = open(path, 'r').read()
+            except IOError:
+                content = ''
+            self._sizes[path] = content.count('\n')
+            includes = []
+            for (delim, name) in self._include_re.findall(content):
+                included = self._resolve(name, {'"': path, '<': None}[delim])
+                if included is None:
+                    self._unresolved.add(name)
+                elif included not in includes:
+                    includes.append(included)
+            self._includes[path] = includes
+        return self._includes[path]
+
+    def _closure(self, path):
+        """ Return path and all files it includes, directly or not """
+        if path not in self._closures:
+            closure = set([path])
+            todo = [path]
+            while len(todo):
+                for included in self._scan(todo.pop()):
+                    if included not in closure:
+                        closure.add(included)
+                        todo.append(included)
+            self._closures[path] = closure
+        return self._closures[path]
+
+    def _get_size(self, path):
+        """ Return the preprocessed size of a file in lines, and the time
+        the preprocessor took (None if it's an estimate). The estimate is
+        the sum of the lines of all included files, which is an upper
+        bound, and is used if the preprocessor fails. """
+        if self.options.measure:
+            cmd = [self._cxx, '-E', '-P', '-x', 'c++'] + \
+                  ['-I%s' % incdir for incdir in self._incdirs if incdir not in self._sysdirs] + [path]
+            start = time.time()
+            try:
+                proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                stdout = proc.communicate()[0]
+                if proc.returncode == 0:
+                    return (stdout.count('\n'), time.time() - start)
+            except OSError:
+                pass
+        return (sum([self._sizes[f] for f in self._closure(path)]), None)
+
+    def _get_display_name(self, path):
+        """ Return a header from outside the module as it's included
+        (<vector>, <gnuradio/sync_block.h>), and module files as they are """
+        if not os.path.isabs(path):
+            return path
+        for incdir in self._incdirs:
+            if os.path.isabs(incdir) and path.startswith(incdir + os.sep):
+                return '<%s>' % path[len(incdir)+1:]
+        return path
+
+    def _get_declarations(self, path):
+        """ Return the names of the types, namespaces and macros declared in
+        a header or the files it includes. For the standard library headers
+        (<vector>, <complex>, ...) this includes the name of the header. """
+        names = set()
+        for included in self._closure(path):
+            if included not in self._decls:
+                try:
+                    content = open(included, 'r').read()
+                except IOError:
+                    content = ''
+                content = re.sub(r'//.*|/\*.*?\*/', '', content, flags=re.DOTALL)
+                decls = set()
+                for decl_re in self._decl_res:
+                    decls.update(decl_re.findall(content))
+                if os.path.splitext(included)[1] == '':
+                    decls.add(os.path.basename(included))
+                self._decls[included] = decls
+            names.update(self._decls[included])
+        return names
+
+    def _check_public_headers(self, graph, blockname, sources):
+        """ Find the includes of the public headers of a block that don't
+        declare anything the header uses. If only the implementation needs
+        them, they can move to the _impl.cc file, and the other sources
+        including the public header don't pay for them. """
+        suggestions = []
+        impl_sources = [path for path in graph.files_of(blockname)
+                        if path.startswith('lib') and os.path.splitext(path)[1] in ('.cc', '.cpp')
+                        and not os.path.basename(path).startswith('qa_')]
+        for header in graph.files_of(blockname):
+            if not header.startswith(self._info['includedir']) or not header.endswith('.h'):
+                continue
+            content = open(header, 'r').read()
+            content = re.sub(r'//.*|/\*.*?\*/', '', content, flags=re.DOTALL)
+            used_names = set(re.findall(r'\w+', re.sub(r'^\s*#.*$', '', content, flags=re.MULTILINE)))
+            # Guards and macros the header defines itself don't count
+            used_names -= set(re.findall(r'^\s*#\s*(?:define|ifndef)\s+(\w+)', content, flags=re.MULTILINE))
+            includes = self._scan(header)
+            for included in includes:
+                if os.path.basename(included) == 'api.h' or \
+                        len(self._get_declarations(included) & used_names):
+                    continue
+                others = set()
+                for other in includes:
+                    if other != included:
+                        others.update(self._closure(other))
+                saved = sum([self._sizes[f] for f in self._closure(included) - others])
+                users = [src for src in sources.keys()
+                         if header in self._closure(src) and src not in impl_sources]
+                suggestions.append({'header': header,
+                                    'include': self._get_display_name(included),
+                                    'target': (impl_sources or ['lib/%s_impl.cc' % blockname])[0],
+                                    'lines': saved,
+                                    'sources': len(users)})
+        return suggestions
+
+    def _print_report(self, results):
+        """ Print the cost per block, the most expensive headers and the
+        suggestions. Sizes marked with ~ are estimates (with --measure,
+        that means the preprocessor failed). """
+        def _lines(entry):
+            return {True: '~%d', False: '%d'}[entry['estimated']] % entry['lines']
+        measured = results['measured']
+        unit = {True: 'Preprocessed lines', False: 'Estimated lines'}[measured]
+        print '\n%-24s %8s %20s %10s' % ('Block', 'Sources', unit, {True: 'Seconds', False: ''}[measured])
+        for blockname in sorted(results['blocks'].keys(), key=lambda b: -results['blocks'][b]['lines']):
+            block_results = results['blocks'][blockname]
+            print '%-24s %8d %20s %10s' % (blockname, block_results['sources'], _lines(block_results),
+                                           {True: '%.2f' % block_results['seconds'], False: ''}[measured])
+        headers = sorted(results['headers'].keys(), key=lambda h: (-results['headers'][h]['cost'], h))
+        print '\n%-50s %10s %8s %12s' % ('Header', 'Lines', 'Sources', 'Total lines')
+        for header in headers[:self.options.top]:
+            print '%-50s %10s %8d %12d' % (self._get_display_name(header), _lines(results['headers'][header]),
+                                           results['headers'][header]['sources'],
+                                           results['headers'][header]['cost'])
+        if len(self._unresolved):
+            print "\n%d includes weren't found (use --suggested-dirs or run cmake), e.g. %s." % (
+                    len(self._unresolved), ', '.join(sorted(self._unresolved)[:3]))
+        if len(results['suggestions']) == 0:
+            print "\nThe public headers only include what they use."
+            return
+        print "\nPublic headers with includes only the implementation might need:"
+        for suggestion in results['suggestions']:
+            print "  %s: move the include of %s to %s (~%d lines less in %d other sources)" % (
+                    suggestion['header'], suggestion['include'], suggestion['target'],
+                    suggestion['lines'], suggestion['sources'])
@@ -28,7 +28,7 @@ class ModToolInfo(ModTool):
 
     def setup(self):
         # Won't call parent's setup(), because that's too chatty
-        (self.options, self.args) = self.parser.parse_args()
+        (self.options, self.args) = self._parse_args()
 
     def run(self):
         """ Go, go, go! """
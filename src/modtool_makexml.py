@@ -10,6 +10,7 @@ from modtool_base import ModTool
 from parser_cc_block import ParserCCBlock
 from grc_xml_generator import GRCXMLGenerator
 from cmakefile_editor import CMakeFileEditor
+from profiler import profile_phase
 
 ### Remove module ###########################################################
 class ModToolMakeXML(ModTool):
@@ -63,6 +64,7 @@ class ModToolMakeXML(ModTool):
         # 2) Go through python/
 
 
+    @profile_phase('discovery')
     def _search_files(self, path, path_glob):
         """ Search for files matching pattern in the given path. """
         files = glob.glob("%s/%s"% (path, path_glob))
@@ -106,6 +108,7 @@ class ModToolMakeXML(ModTool):
                 ed.append_value('install', fname_xml, 'DESTINATION[^()]+')
                 ed.write()
 
+    @profile_phase('parse')
     def _parse_cc_h(self, fname_cc):
         """ Go through a .cc and .h-file defining a block and return info """
         def _type_translate(p_type, default_v=None):
@@ -3,6 +3,7 @@
 import os
 import re
 import sys
+import shutil
 import base64
 import tarfile
 from optparse import OptionGroup
@@ -23,11 +24,22 @@ class ModToolNewModule(ModTool):
         parser = ModTool.setup_parser(self)
         parser.usage = '%prog rm [options]. \n Call %prog without any options to run it interactively.'
         ogroup = OptionGroup(parser, "New out-of-tree module options")
+        ogroup.add_option("--add-perf", action="store_true", default=False,
+                help="Add a perf/ subdirectory with a runner for all block benchmarks ('make perf').")
+        ogroup.add_option("--fast-bindings", action="store_true", default=False,
+                help="Build the SWIG bindings with -O -builtin -threads by default (ENABLE_FAST_SWIG).")
+        ogroup.add_option("--unity-build", action="store_true", default=False,
+                help="Compile the blocks as one translation unit by default (ENABLE_UNITY_BUILD).")
+        ogroup.add_option("--pch", action="store_true", default=False,
+                help="Precompile the headers common to all blocks by default (ENABLE_PCH).")
+        ogroup.add_option("--bindings", type="choice", choices=('swig', 'pybind11'), default='swig',
+                help="Generate the Python bindings of the blocks with SWIG (default) or pybind11 "
+                     "(one binding file and target per block, in pybind/).")
         parser.add_option_group(ogroup)
         return parser
 
     def setup(self):
-        (options, self.args) = self.parser.parse_args()
+        (options, self.args) = self._parse_args()
         self._info['modname'] = options.module_name
         if self._info['modname'] is None:
             if len(self.args) >= 2:
@@ -37,6 +49,14 @@ class ModToolNewModule(ModTool):
         if not re.match('[a-zA-Z0-9_]+', self._info['modname']):
             print 'Invalid module name.'
             sys.exit(2)
+        self._add_perf = options.add_perf
+        self._fast_bindings = options.fast_bindings
+        self._bindings = options.bindings
+        self._build_speedups = [option for (option, enabled) in (('ENABLE_UNITY_BUILD', options.unity_build),
+                                                                 ('ENABLE_PCH', options.pch)) if enabled]
+        if self._bindings != 'swig' and self._fast_bindings:
+            print "Warning: --fast-bindings only applies to SWIG bindings."
+            self._fast_bindings = False
         self._dir = options.directory
         if self._dir == '.':
             self._dir = './gr-%s' % self._info['modname']
@@ -70,6 +90,28 @@ class ModToolNewModule(ModTool):
         tar.extractall()
         tar.close()
         os.unlink('tmp.tar.bz2')
+        if not self._add_perf:
+            self._remove_subdir('perf')
+        if self._bindings == 'pybind11':
+            self._remove_subdir('swig')
+            s = open(os.path.join('python', '__init__.py'), 'r').read()
+            s = s.replace('# import swig generated symbols into the howto namespace\nfrom howto_swig import *\n',
+                          '# import the pybind11 bindings of the blocks into the howto namespace\n')
+            open(os.path.join('python', '__init__.py'), 'w').write(s)
+            s = open(os.path.join('python', 'CMakeLists.txt'), 'r').read()
+            s = s.replace('${CMAKE_BINARY_DIR}/swig', '${CMAKE_BINARY_DIR}/pybind')
+            open(os.path.join('python', 'CMakeLists.txt'), 'w').write(s)
+        else:
+            self._remove_subdir('pybind')
+        if self._fast_bindings:
+            s = open(os.path.join('swig', 'CMakeLists.txt'), 'r').read()
+            s = re.sub(r'(option\(ENABLE_FAST_SWIG\s+"[^"]*"\s+)OFF\)', r'\1ON)', s)
+            open(os.path.join('swig', 'CMakeLists.txt'), 'w').write(s)
+        if len(self._build_speedups):
+            s = open(os.path.join('cmake', 'Modules', 'GrBuildSpeedup.cmake'), 'r').read()
+            for option in self._build_speedups:
+                s = re.sub(r'(option\(%s\s+"[^"]*"\s+)OFF\)' % option, r'\1ON)', s)
+            open(os.path.join('cmake', 'Modules', 'GrBuildSpeedup.cmake'), 'w').write(s)
         print "Replacing occurences of 'howto' to '%s'..." % self._info['modname'],
         for root, dirs, files in os.walk('.'):
             for filename in files:
@@ -84,5 +126,14 @@ class ModToolNewModule(ModTool):
                 os.rename(root, os.path.join(os.path.dirname(root), self._info['modname']))
         print "Done."
         print "Use 'gr_modtool add' to add a new block to this currently empty module."
+        if self._add_perf:
+            print "Add benchmarks with 'gr_modtool add --add-benchmark', run them with 'make perf'."
 
+    def _remove_subdir(self, subdir):
+        """ Remove an optional subdirectory of the module skeleton, as well
+        as its add_subdirectory() in the top-level CMakeLists.txt """
+        shutil.rmtree(subdir)
+        s = open('CMakeLists.txt', 'r').read()
+        s = re.sub(r'add_subdirectory\(%s\)\n' % subdir, '', s)
+        open('CMakeLists.txt', 'w').write(s)
 
@@ -0,0 +1,222 @@
+""" Build a module with profile-guided optimization """
+
+import os
+import re
+import sys
+import glob
+import json
+import shutil
+import subprocess
+from multiprocessing import cpu_count
+from optparse import OptionGroup
+
+from modtool_base import ModTool
+
+### PGO module ###############################################################
+class ModToolPGO(ModTool):
+    """ Build the module with profile-guided optimization (PGO) """
+    name = 'pgo'
+    aliases = ()
+    # Exit code of a benchmark whose BLOCK_ARGS aren't set yet (bm_*.py)
+    _exit_skipped = 77
+    def __init__(self):
+        ModTool.__init__(self)
+        self._build_dir = None
+        self._profile_dir = None
+        self._compiler = None
+
+    def setup_parser(self):
+        " Initialise the option parser for 'gr_modtool.py pgo' "
+        parser = ModTool.setup_parser(self)
+        parser.usage = '%prog pgo [options]\n' \
+                       ' Builds the module instrumented, runs the QA code and the benchmarks\n' \
+                       ' as training workload and rebuilds it with the collected profiles.'
+        ogroup = OptionGroup(parser, "PGO options")
+        ogroup.add_option("-b", "--build-dir", type="string", default="build-pgo",
+                help="Build directory, relative to the module (default: build-pgo).")
+        ogroup.add_option("-j", "--jobs", type="int", default=cpu_count(),
+                help="Number of parallel make jobs (default: number of CPUs).")
+        ogroup.add_option("-p", "--pattern", type="string", default='.',
+                help="Only run the benchmarks of blocks matching this regular expression.")
+        ogroup.add_option("--nitems", type="int", default=10000000,
+                help="Number of items per benchmark run.")
+        ogroup.add_option("--runs", type="int", default=5,
+                help="Number of runs per benchmark.")
+        ogroup.add_option("--compiler", type="choice", choices=('auto', 'gcc', 'clang'), default='auto',
+                help="Compiler family, selects the PGO flags (default: detect from $CXX).")
+        ogroup.add_option("--cmake-args", type="string", default='',
+                help="Additional arguments for cmake, e.g. '-DCMAKE_INSTALL_PREFIX=/opt/gr'.")
+        ogroup.add_option("--skip-qa", action="store_true", default=False,
+                help="Don't run the QA code as part of the training workload.")
+        ogroup.add_option("--skip-reference", action="store_true", default=False,
+                help="Don't build and time the module without PGO first.")
+        parser.add_option_group(ogroup)
+        return parser
+
+    def setup(self):
+        ModTool.setup(self)
+        options = self.options
+        self._build_dir = os.path.abspath(options.build_dir)
+        self._profile_dir = os.path.join(self._build_dir, 'pgo-profiles')
+        self._compiler = options.compiler
+        if self._compiler == 'auto':
+            self._compiler = self._detect_compiler()
+        print "Compiler family: %s" % self._compiler
+        if self._compiler == 'clang' and self._find_llvm_profdata() is None:
+            print "llvm-profdata not found (set $LLVM_PROFDATA), can't merge the profiles."
+            sys.exit(1)
+
+    def run(self):
+        """ Go, go, go!
+        - build the module without PGO and run the benchmarks (before)
+        - build it instrumented, run the QA code and the benchmarks
+        - merge the profiles
+        - rebuild it with the profiles and run the benchmarks (after)
+        All builds happen in the same build directory, so the profiles
+        match the object files.
+        """
+        if not os.path.isdir(self._build_dir):
+            os.makedirs(self._build_dir)
+        results = {}
+        if not self.options.skip_reference:
+            print "Building the reference (without PGO)..."
+            self._configure('')
+            self._build()
+            results['before'] = self._run_benchmarks()
+        print "Building the instrumented module..."
+        if os.path.isdir(self._profile_dir):
+            shutil.rmtree(self._profile_dir)
+        os.makedirs(self._profile_dir)
+        self._configure(self._pgo_flags('generate'))
+        self._build()
+        print "Running the training workload..."
+        if not self.options.skip_qa:
+            self._run_qa()
+        training = self._run_benchmarks()
+        if len(training) == 0 and self.options.skip_qa:
+            print "No training workload (no benchmarks and --skip-qa), can't optimize."
+            sys.exit(1)
+        elif len(training) == 0:
+            print "Warning: No benchmark ran, the profile only comes from the QA code."
+        self._merge_profiles()
+        print "Building the optimized module..."
+        self._configure(self._pgo_flags('use'))
+        self._build()
+        results['after'] = self._run_benchmarks()
+        self._print_report(results)
+        results_file = os.path.join(self._build_dir, 'pgo_results.json')
+        json.dump(results, open(results_file, 'w'), indent=2, sort_keys=True)
+        print "Results written to %s." % results_file
+        print "The optimized module is in %s, run 'make install' there to install it." % self._build_dir
+
+    def _find_llvm_profdata(self):
+        """ Return the path of llvm-profdata, or None """
+        if os.environ.get('LLVM_PROFDATA'):
+            return os.environ['LLVM_PROFDATA']
+        for path in os.environ.get('PATH', '').split(os.pathsep):
+            for name in ['llvm-profdata'] + sorted(
+                    [os.path.basename(f) for f in glob.glob(os.path.join(path, 'llvm-profdata-*'))]):
+                if os.access(os.path.join(path, name), os.X_OK):
+                    return os.path.join(path, name)
+        return None
+
+    def _pgo_flags(self, stage):
+        """ Compiler and linker flags for the stage ('generate' or 'use') """
+        if self._compiler == 'clang':
+            if stage == 'generate':
+                return '-fprofile-instr-generate=%s' % os.path.join(self._profile_dir, '%p-%m.profraw')
+            return '-fprofile-instr-use=%s -Wno-profile-instr-unprofiled' % \
+                    os.path.join(self._profile_dir, 'merged.profdata')
+        if stage == 'generate':
+            return '-fprofile-generate=%s' % self._profile_dir
+        return '-fprofile-use=%s -fprofile-correction -Wno-missing-profile' % self._profile_dir
+
+    def _configure(self, flags):
+        """ (Re-)configure the build directory with flags. The flags are
+        passed to the compiler and the linker, on top of the ones the
+        module's CMake files (GrPlatform, GrMiscUtils) set. """
+        cmd = ['cmake', os.getcwd(),
+               '-DCMAKE_BUILD_TYPE=Release',
+               '-DCMAKE_C_FLAGS=%s' % flags,
+               '-DCMAKE_CXX_FLAGS=%s' % flags,
+               '-DCMAKE_SHARED_LINKER_FLAGS=%s' % flags,
+               '-DCMAKE_MODULE_LINKER_FLAGS=%s' % flags,
+               '-DCMAKE_EXE_LINKER_FLAGS=%s' % flags,
+               '-DENABLE_CCACHE=OFF'] + self.options.cmake_args.split()
+        self._call(cmd, cwd=self._build_dir)
+
+    def _build(self):
+        """ Build everything """
+        self._call(['make', '-j%d' % max(self.options.jobs, 1)], cwd=self._build_dir)
+
+    def _run_qa(self):
+        """ Run the QA code (ctest). Failing tests don't stop the PGO
+        build, their profiles are just as good. """
+        if not self._call(['ctest', '--output-on-failure'], cwd=self._build_dir, fail_ok=True):
+            print "Warning: Some QA tests failed."
+
+    def _run_benchmarks(self):
+        """ Run the benchmarks of all blocks (python/bm_*.py) against the
+        build directory, return the results as a dict block -> result. """
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join([os.path.join(self._build_dir, 'swig'),
+                                             os.path.join(self._build_dir, 'pybind'),
+                                             os.path.abspath('python'),
+                                             env.get('PYTHONPATH', '')])
+        env['LD_LIBRARY_PATH'] = os.pathsep.join([os.path.join(self._build_dir, 'lib'),
+                                                  env.get('LD_LIBRARY_PATH', '')])
+        results = {}
+        skipped = []
+        for script in sorted(glob.glob(os.path.join('python', 'bm_*.py'))):
+            blockname = os.path.basename(script)[3:-3]
+            if re.search(self.options.pattern, blockname) is None:
+                continue
+            print "Running %s..." % os.path.basename(script)
+            proc = subprocess.Popen([sys.executable, script, '--json',
+                                     '--nitems', str(self.options.nitems),
+                                     '--runs', str(self.options.runs)],
+                                    env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            (stdout, stderr) = proc.communicate()
+            if proc.returncode == self._exit_skipped:
+                message = (stderr.strip().splitlines() or ['not set up yet'])[-1]
+                print "  skipped: %s" % re.sub(r'^Skipped:\s*', '', message)
+                skipped.append(blockname)
+                continue
+            json_lines = [line for line in stdout.splitlines() if line.startswith('{')]
+            if proc.returncode != 0 or len(json_lines) == 0:
+                print "  failed: %s" % (stderr.strip().splitlines() or ['exit code %d' % proc.returncode])[-1]
+                continue
+            results[blockname] = json.loads(json_lines[-1])
+        if len(results) == 0 and len(skipped):
+            print "All benchmarks were skipped, set the values in their BLOCK_ARGS."
+        elif len(results) == 0:
+            print "No benchmark results (use 'gr_modtool add --add-benchmark')."
+        return results
+
+    def _merge_profiles(self):
+        """ Merge the raw profiles (clang only, GCC accumulates them in
+        its .gcda files) """
+        if self._compiler != 'clang':
+            return
+        profiles = glob.glob(os.path.join(self._profile_dir, '*.profraw'))
+        if len(profiles) == 0:
+            print "No profiles were written by the training workload. Quitting."
+            sys.exit(1)
+        print "Merging %d profiles..." % len(profiles)
+        self._call([self._find_llvm_profdata(), 'merge',
+                    '-output=%s' % os.path.join(self._profile_dir, 'merged.profdata')] + profiles)
+
+    def _print_report(self, results):
+        """ Print the throughput of every block before and after PGO """
+        before = results.get('before', {})
+        after = results.get('after', {})
+        if len(after) == 0:
+            return
+        print '%-24s %16s %16s %8s' % ('Block', 'Before (items/s)', 'After (items/s)', 'Speedup')
+        for blockname in sorted(after.keys()):
+            if blockname in before:
+                print '%-24s %16.1f %16.1f %8.3f' % (blockname, before[blockname]['best'],
+                                                     after[blockname]['best'],
+                                                     after[blockname]['best'] / before[blockname]['best'])
+            else:
+                print '%-24s %16s %16.1f %8s' % (blockname, '-', after[blockname]['best'], '-')
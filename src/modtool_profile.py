@@ -0,0 +1,154 @@
+""" Select the blocks that are built (build profiles) """
+
+import os
+import re
+import sys
+import glob
+from optparse import OptionGroup
+
+from modtool_base import ModTool
+
+### Build profile module #####################################################
+class ModToolProfile(ModTool):
+    """ Select the blocks that are built, without touching the sources """
+    name = 'profile'
+    aliases = ('bp',)
+    def __init__(self):
+        ModTool.__init__(self)
+
+    def setup_parser(self):
+        " Initialise the option parser for 'gr_modtool.py profile' "
+        parser = ModTool.setup_parser(self)
+        parser.usage = '%prog profile [options] [PATTERN]\n' \
+                       ' Only build the blocks matching PATTERN (a regular expression).\n' \
+                       ' Without a pattern, the current build profile is shown.'
+        ogroup = OptionGroup(parser, "Build profile options")
+        ogroup.add_option("-p", "--pattern", type="string", default=None,
+                help="Only build the blocks whose names match this regular expression.")
+        ogroup.add_option("-a", "--add", action="store_true", default=False,
+                help="Add the matching blocks to the current build profile instead of replacing it.")
+        ogroup.add_option("-r", "--remove", action="store_true", default=False,
+                help="Remove the matching blocks from the current build profile.")
+        ogroup.add_option("--all", action="store_true", default=False,
+                help="Build all blocks again.")
+        parser.add_option_group(ogroup)
+        return parser
+
+    def setup(self):
+        ModTool.setup(self)
+        options = self.options
+        if options.pattern is not None:
+            self._info['pattern'] = options.pattern
+        elif options.block_name is not None:
+            self._info['pattern'] = options.block_name
+        elif len(self.args) >= 2:
+            self._info['pattern'] = self.args[1]
+        else:
+            self._info['pattern'] = None
+        if options.add and options.remove:
+            print "Can't add and remove blocks at the same time."
+            sys.exit(2)
+        if (options.add or options.remove) and self._info['pattern'] is None:
+            print "No pattern given."
+            sys.exit(2)
+
+    def run(self):
+        """ Go, go, go!
+        - create the block list, if the module has none
+        - select the blocks and write them to build_profile.txt
+        """
+        blocks = self._get_block_list()
+        if blocks is None or len(blocks) == 0:
+            blocks = self._find_blocks()
+            if len(blocks) == 0:
+                print "No blocks found."
+                sys.exit(1)
+            print "Writing %s with %d blocks..." % (self._file['blocklist'], len(blocks))
+            open(self._file['blocklist'], 'w').write(
+                    '# All blocks of the module, one per line (see build_profile.txt).\n' +
+                    ''.join(['%s\n' % blockname for blockname in blocks]))
+        enabled = self._get_profile()
+        if enabled is None:
+            enabled = list(blocks)
+        if self.options.all:
+            enabled = list(blocks)
+        elif self._info['pattern'] is not None:
+            matches = [blockname for blockname in blocks
+                       if re.search(self._info['pattern'], blockname) is not None]
+            if len(matches) == 0:
+                print "No blocks match '%s'." % self._info['pattern']
+                sys.exit(1)
+            if self.options.add:
+                enabled = [blockname for blockname in blocks if blockname in enabled or blockname in matches]
+            elif self.options.remove:
+                enabled = [blockname for blockname in enabled if blockname not in matches]
+            else:
+                enabled = matches
+        else:
+            self._print_profile(blocks, enabled)
+            return
+        if len(enabled) == 0:
+            print "A build profile needs at least one block (use --all to build all blocks)."
+            sys.exit(1)
+        self._write_profile(blocks, enabled)
+        self._print_profile(blocks, enabled)
+        if not self._has_block_profile_support():
+            print "Warning: The CMake files of this module don't use build profiles " \
+                  "(see GrBlockProfile.cmake in a module created by 'gr_modtool newmod')."
+        else:
+            print "Run 'make' to rebuild, CMake picks up the new profile automatically."
+
+    def _find_blocks(self):
+        """ Find the blocks of a module without a block list: every public
+        header is a block, as is every Python block. """
+        if self._info['version'] == '37':
+            headers = glob.glob(os.path.join(self._info['includedir'], '*.h'))
+            blocks = [os.path.basename(h)[:-2] for h in headers]
+        else:
+            headers = glob.glob(os.path.join(self._info['includedir'], '%s_*.h' % self._info['modname']))
+            blocks = [os.path.basename(h)[len(self._info['modname'])+1:-2] for h in headers]
+        for qa_file in glob.glob(os.path.join('python', 'qa_*.py')):
+            blockname = os.path.basename(qa_file)[3:-3]
+            if os.path.isfile(os.path.join('python', blockname + '.py')):
+                blocks.append(blockname)
+        return sorted(set([b for b in blocks if b != 'api']))
+
+    def _get_profile(self):
+        """ Return the blocks listed in build_profile.txt, or None if all
+        blocks are built. """
+        try:
+            profile = open(self._file['buildprofile'], 'r').read()
+        except IOError:
+            return None
+        enabled = re.findall('^([a-zA-Z0-9_]+)\s*$', profile, flags=re.MULTILINE)
+        if len(enabled) == 0:
+            return None
+        return enabled
+
+    def _write_profile(self, blocks, enabled):
+        """ Write build_profile.txt. If all blocks are enabled, no block
+        is listed, so blocks added later are built, too. """
+        header = '# Build profile: the blocks to build, one per line.\n' \
+                 '# If no blocks are listed, all blocks are built.\n' \
+                 "# Set with 'gr_modtool profile <pattern>', reset with 'gr_modtool profile --all'.\n"
+        if os.path.isfile(self._file['buildprofile']):
+            header = ''.join(re.findall('^#.*\n', open(self._file['buildprofile'], 'r').read(),
+                                        flags=re.MULTILINE)) or header
+        enabled = [blockname for blockname in blocks if blockname in enabled]
+        if len(enabled) == len(blocks):
+            enabled = []
+        print "Editing %s..." % self._file['buildprofile']
+        open(self._file['buildprofile'], 'w').write(header + ''.join(['%s\n' % b for b in enabled]))
+
+    def _print_profile(self, blocks, enabled):
+        """ Show which blocks are built """
+        print "%d of %d blocks are built:" % (len([b for b in blocks if b in enabled]), len(blocks))
+        for blockname in blocks:
+            if blockname in enabled:
+                print "  [x] %s" % blockname
+            else:
+                print "  [ ] %s" % blockname
+
+    def _has_block_profile_support(self):
+        """ Check if the top-level CMakeLists.txt reads the build profile """
+        return re.search(r'GR_BLOCK_PROFILE\(', open('CMakeLists.txt', 'r').read()) is not None
@@ -52,6 +52,8 @@ class ModToolRemove(ModTool):
             from the CMakeLists.txt. """
             if filename[:2] != 'qa':
                 return
+            if os.path.splitext(filename)[1] == '.cc':
+                _remove_cxx11_flags(filename, ed)
             if self._info['version'] == '37':
                 (base, ext) = os.path.splitext(filename)
                 if ext == '.h':
@@ -72,32 +74,89 @@ class ModToolRemove(ModTool):
                 ed.delete_entry('GR_ADD_TEST', filebase)
                 ed.remove_double_newlines()
 
+        def _remove_cxx11_flags(filename=None, ed=None):
+            """ Special function that removes a timed QA file from the
+            C++11 files (set_source_files_properties()), and the whole
+            entry if it was the last file in it. """
+            def _remove_file(mobj):
+                files = [f for f in mobj.group(3).split() if f != filename]
+                if len(files) == 0:
+                    return ''
+                return mobj.group(1) + mobj.group(2) + ' '.join(files) + mobj.group(4)
+            ed.cfile = re.sub(r'(\nif\([^\n]*\n(?:\s*#[^\n]*\n)*)(\s*set_source_files_properties\()'
+                              r'([^()]*?)(\s+PROPERTIES\s+COMPILE_FLAGS\s+"-std=c\+\+11"\)\s*endif\(\)\n)',
+                              _remove_file, ed.cfile)
+
+        def _remove_cc_file(filename=None, ed=None):
+            """ Special function that removes a source from the unity
+            build file (MODNAME_unity.cc), and C++ QA code from the
+            CMakeLists.txt. """
+            if os.path.isfile(self._file['unity']):
+                remove_pattern_from_file(self._file['unity'],
+                                         r'^\s*(//)?\s*#include\s+"%s".*\n' % re.escape(filename))
+            _remove_cc_test_case(filename, ed)
+
         def _remove_py_test_case(filename=None, ed=None):
-            """ Special function that removes the occurrences of a qa*.{cc,h} file
-            from the CMakeLists.txt and the qa_$modname.cc. """
-            if filename[:2] != 'qa':
-                return
+            """ Special function that removes the occurrences of a qa*.py or
+            bm_*.py file from the CMakeLists.txt. """
             filebase = os.path.splitext(filename)[0]
-            ed.delete_entry('GR_ADD_TEST', filebase)
+            if filename[:2] == 'qa':
+                ed.delete_entry('GR_ADD_TEST', filebase)
+            elif filename[:3] == 'bm_':
+                ed.delete_entry('add_custom_target', r'benchmark_%s\b' % filebase[3:])
+                ed.delete_entry('add_dependencies', r'benchmark_%s\b' % filebase[3:])
+            else:
+                return
             ed.remove_double_newlines()
 
+        def _remove_swig_module(filename=None, ed=None):
+            """ Special function that removes the target of a per-block
+            SWIG module (MODNAME_*_swig.i) from the CMakeLists.txt. """
+            swigname = os.path.splitext(filename)[0]
+            if not re.match(r'%s_\w+_swig$' % self._info['modname'], swigname):
+                return
+            ed.cfile = re.sub(r'^.*\b%s(\b|_doc\.i).*\n' % swigname, '', ed.cfile, flags=re.MULTILINE)
+            ed.remove_double_newlines()
+            remove_pattern_from_file(self._file['pyinit'], r'^from\s+%s\s+import.*\n' % swigname)
+
+        def _remove_pybind_module(filename=None, ed=None):
+            """ Special function that removes the target of a pybind11
+            binding from the CMakeLists.txt, and its import from __init__.py """
+            ed.delete_entry('GR_PYBIND_MAKE', r'\b%s\b' % filename)
+            remove_pattern_from_file(self._file['pyinit'],
+                                     r'^from\s+%s_%s\s+import.*\n' % (self._info['modname'], filename[:-3]))
+
         def _make_swig_regex(filename):
             filebase = os.path.splitext(filename)[0]
             pyblockname = filebase.replace(self._info['modname'] + '_', '')
-            regexp = r'(^\s*GR_SWIG_BLOCK_MAGIC2?\(%s,\s*%s\);|^\s*.include\s*"(%s/)?%s"\s*)' % \
-                    (self._info['modname'], pyblockname, self._info['modname'], filename)
+            regexp = r'(^\s*GR_SWIG_BLOCK_MAGIC2?\(%s,\s*%s\);|^\s*.include\s*"(%s/)?%s"\s*|' \
+                     r'^\s*%%thread\s+(gr::%s::|%s_)%s::\w+;\s*)' % \
+                    (self._info['modname'], pyblockname, self._info['modname'], filename,
+                     self._info['modname'], self._info['modname'], pyblockname)
             return regexp
         # Go, go, go!
+        graph = self._get_dependency_graph()
+        blocks = [blockname for blockname in graph.blocks
+                  if re.search(self._info['pattern'], blockname) is not None]
+        if len(blocks):
+            (dependent_blocks, dependent_files) = self._find_dependents(graph, blocks)
+            if (len(dependent_blocks) or len(dependent_files)) and not self._info['yes']:
+                if raw_input("These won't build any more. Delete anyway? [y/N]: ").lower().strip() != 'y':
+                    sys.exit(0)
         if not self._skip_subdirs['lib']:
             self._run_subdir('lib', ('*.cc', '*.h'), ('add_library',),
-                             cmakeedit_func=_remove_cc_test_case)
+                             cmakeedit_func=_remove_cc_file)
         if not self._skip_subdirs['include']:
             incl_files_deleted = self._run_subdir(self._info['includedir'], ('*.h',), ('install',))
         if not self._skip_subdirs['swig']:
-            swig_files_deleted = self._run_subdir('swig', ('*.i',), ('install',))
+            swig_files_deleted = self._run_subdir('swig', ('*.i',), ('install',),
+                                                  cmakeedit_func=_remove_swig_module)
+            swig_files = [self._file['swig']] + [os.path.join('swig', f) for f in self._get_swig_module_files()]
             for f in incl_files_deleted + swig_files_deleted:
-                # TODO do this on all *.i files
-                remove_pattern_from_file(self._file['swig'], _make_swig_regex(f))
+                for swig_file in swig_files:
+                    remove_pattern_from_file(swig_file, _make_swig_regex(f))
+        if not self._skip_subdirs['pybind']:
+            self._run_subdir('pybind', ('*_python.cc',), (), cmakeedit_func=_remove_pybind_module)
         if not self._skip_subdirs['python']:
             py_files_deleted = self._run_subdir('python', ('*.py',), ('GR_PYTHON_INSTALL',),
                                                 cmakeedit_func=_remove_py_test_case)
@@ -106,7 +165,29 @@ class ModToolRemove(ModTool):
                 remove_pattern_from_file(self._file['pyinit'], '.*from\s+%s\s+import.*\n' % f[:-3])
         if not self._skip_subdirs['grc']:
             self._run_subdir('grc', ('*.xml',), ('install',))
+        self._update_block_list(remove=[blockname for blockname in (self._get_block_list() or [])
+                                         if re.search(self._info['pattern'], blockname) is not None
+                                         and not self._has_block_files(blockname)])
+        self._remove_perf_config([blockname for blockname in blocks
+                                  if not self._has_block_files(blockname)])
+
+    def _has_block_files(self, blockname):
+        """ Check if any source, header, Python or GRC file of the block
+        is left. """
+        name_re = re.compile(r'^(qa_)?(%s_)?%s(_impl|_python)?\.' % (self._info['modname'], blockname))
+        for subdir in ('lib', self._info['includedir'], 'python', 'grc', 'pybind'):
+            if os.path.isdir(subdir) and \
+                    len([f for f in os.listdir(subdir) if name_re.match(f) is not None]):
+                return True
+        return False
 
+    def _remove_perf_config(self, blocknames):
+        """ Remove the sections of the deleted blocks from python/perf.cfg """
+        fname_cfg = os.path.join('python', 'perf.cfg')
+        if self._skip_subdirs['python'] or not os.path.isfile(fname_cfg):
+            return
+        for blockname in blocknames:
+            remove_pattern_from_file(fname_cfg, r'^\n?\[%s\][^\n]*\n(?:[^\[\n][^\n]*\n)*' % re.escape(blockname))
 
     def _run_subdir(self, path, globs, makefile_vars, cmakeedit_func=None):
         """ Delete all files that match a certain pattern in path.
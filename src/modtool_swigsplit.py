@@ -0,0 +1,100 @@
+""" Move blocks from the main SWIG file into SWIG modules of their own """
+
+import os
+import re
+import sys
+from optparse import OptionGroup
+
+from modtool_base import ModTool
+
+### SWIG split module ########################################################
+class ModToolSwigSplit(ModTool):
+    """ Move blocks into SWIG modules of their own, which are compiled in parallel """
+    name = 'swigsplit'
+    aliases = ('split',)
+    def __init__(self):
+        ModTool.__init__(self)
+
+    def setup_parser(self):
+        " Initialise the option parser for 'gr_modtool.py swigsplit' "
+        parser = ModTool.setup_parser(self)
+        parser.usage = '%prog swigsplit [options] [PATTERN]\n' \
+                       ' Moves the blocks from the main SWIG file into one SWIG module per block.'
+        ogroup = OptionGroup(parser, "SWIG split options")
+        ogroup.add_option("-p", "--pattern", type="string", default=None,
+                help="Only move blocks whose names match this regular expression.")
+        ogroup.add_option("-g", "--group", type="string", default=None,
+                help="Move all matching blocks into the single SWIG module MODNAME_GROUP_swig.")
+        parser.add_option_group(ogroup)
+        return parser
+
+    def setup(self):
+        ModTool.setup(self)
+        options = self.options
+        if self._skip_subdirs['swig']:
+            print "No SWIG file found."
+            sys.exit(1)
+        if options.pattern is not None:
+            self._info['pattern'] = options.pattern
+        elif options.block_name is not None:
+            self._info['pattern'] = options.block_name
+        elif len(self.args) >= 2:
+            self._info['pattern'] = self.args[1]
+        else:
+            self._info['pattern'] = '.'
+        self._info['group'] = options.group
+        if options.group is not None and not re.match('^[a-zA-Z0-9_]+$', options.group):
+            print 'Invalid SWIG group name.'
+            sys.exit(2)
+
+    def run(self):
+        """ Go, go, go!
+        - Remove the headers and the block magic from the main SWIG file
+        - Add them to the new SWIG modules (and those to CMakeLists.txt
+          and __init__.py)
+        - Let the Python QA code and benchmarks import the new modules
+        """
+        modname = self._info['modname']
+        swigfile = open(self._file['swig'], 'r').read()
+        magic_re = r'^[ \t]*GR_SWIG_BLOCK_MAGIC2?\(\s*%s\s*,\s*(\w+)\s*\);' % modname
+        blocknames = [blockname for blockname in re.findall(magic_re, swigfile, flags=re.MULTILINE)
+                      if re.search(self._info['pattern'], blockname) is not None]
+        if len(blocknames) == 0:
+            print "No matching blocks found in %s." % self._file['swig']
+            return
+        modules = {}
+        for blockname in blocknames:
+            swigfile = re.sub(r'^[ \t]*GR_SWIG_BLOCK_MAGIC2?\(\s*%s\s*,\s*%s\s*\);[^\n]*\n' % (modname, blockname),
+                              '', swigfile, flags=re.MULTILINE)
+            swigfile = re.sub(r'^[ \t]*[#%%]include\s*"(%s/|%s_)?%s\.h"[^\n]*\n' % (modname, modname, blockname),
+                              '', swigfile, flags=re.MULTILINE)
+            thread_re = r'^[ \t]*%%thread\s+(?:gr::%s::|%s_)%s::(\w+);[^\n]*\n' % (modname, modname, blockname)
+            release_gil = re.findall(thread_re, swigfile, flags=re.MULTILINE)
+            swigfile = re.sub(thread_re, '', swigfile, flags=re.MULTILINE)
+            swigname = '%s_%s_swig' % (modname, self._info['group'] or blockname)
+            modules.setdefault(swigname, []).append({'modname': modname,
+                                                     'blockname': blockname,
+                                                     'version': self._info['version'],
+                                                     'release_gil': release_gil})
+            print "Moving %s to %s..." % (blockname, swigname)
+        print "Editing %s..." % self._file['swig']
+        open(self._file['swig'], 'w').write(swigfile)
+        for swigname in sorted(modules.keys()):
+            self._add_swig_module(swigname, modules[swigname])
+            for info in modules[swigname]:
+                self._update_python_imports(info['blockname'], swigname)
+        print "Done. Every SWIG module is now a target of its own, run 'make -jN' to build them in parallel."
+
+    def _update_python_imports(self, blockname, swigname):
+        """ Let the QA code and the benchmark of a block import its new SWIG
+        module instead of the main one. """
+        for fname in ('qa_%s.py' % blockname, 'bm_%s.py' % blockname):
+            path = os.path.join('python', fname)
+            if not os.path.isfile(path):
+                continue
+            pyfile = open(path, 'r').read()
+            (pyfile, nsubs) = re.subn(r'^import\s+%s_swig\s+as\b' % self._info['modname'],
+                                      'import %s as' % swigname, pyfile, flags=re.MULTILINE)
+            if nsubs:
+                print "Editing %s..." % path
+                open(path, 'w').write(pyfile)
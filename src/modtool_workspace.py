@@ -0,0 +1,150 @@
+""" Run a command on many modules at once """
+
+import os
+import sys
+import subprocess
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+from optparse import OptionGroup
+
+from modtool_base import ModTool
+from modtool_add import ModToolAdd
+from modtool_rm import ModToolRemove
+from modtool_disable import ModToolDisable
+from modtool_makexml import ModToolMakeXML
+
+### Workspace module #########################################################
+class ModToolWorkspace(ModTool):
+    """ Run a command on all modules below a directory """
+    name = 'workspace'
+    aliases = ('ws',)
+    _skip_dirnames = ('build',)
+    _no_workspace_cmds = ('workspace', 'ws', 'newmod', 'nm', 'create', 'help', 'h', '?')
+    def __init__(self):
+        ModTool.__init__(self)
+        self._modules = []
+
+    def setup_parser(self):
+        " Initialise the option parser for 'gr_modtool.py workspace' "
+        parser = ModTool.setup_parser(self)
+        parser.usage = '%prog workspace [options] <command> [command options]\n' \
+                       ' Runs <command> on every module found below the base directory.'
+        parser.disable_interspersed_args()
+        ogroup = OptionGroup(parser, "Workspace options")
+        ogroup.add_option("-j", "--jobs", type="int", default=cpu_count(),
+                help="Number of modules to process in parallel (default: number of CPUs).")
+        ogroup.add_option("--list", action="store_true", default=False,
+                help="Only list the modules found, don't run anything.")
+        parser.add_option_group(ogroup)
+        return parser
+
+    def setup(self):
+        # Won't call parent's setup(), there's no single module to look at.
+        # Everything after the command is passed on unchanged.
+        argv = sys.argv[1:]
+        for (idx, arg) in enumerate(argv):
+            if arg == self.name or arg in self.aliases:
+                del argv[idx]
+                break
+        (self.options, self.args) = self.parser.parse_args(argv)
+        if not self.options.list:
+            if len(self.args) == 0:
+                print 'No command given.'
+                sys.exit(2)
+            if self.args[0] in self._no_workspace_cmds:
+                print "Can't run '%s' on a workspace." % self.args[0]
+                sys.exit(2)
+            missing = self._get_missing_answers()
+            if len(missing):
+                print "'%s' would ask questions, which doesn't work on a workspace. " \
+                      "Give these options: %s" % (self.args[0], ', '.join(missing))
+                sys.exit(2)
+        self._dir = os.path.abspath(self.options.directory)
+        self._modules = self._find_modules(self._dir)
+        if len(self._modules) == 0:
+            print "No GNU Radio modules found below %s." % self._dir
+            sys.exit(1)
+
+    def _get_missing_answers(self):
+        """ Return the options the command would otherwise ask for. The
+        commands run without a terminal (stdin is /dev/null), so every
+        question would end the command with an EOFError. """
+        commands = {}
+        for cls in (ModToolAdd, ModToolRemove, ModToolDisable, ModToolMakeXML):
+            for name in (cls.name,) + cls.aliases:
+                commands[name] = cls
+        if self.args[0] not in commands:
+            return []
+        (options, args) = commands[self.args[0]]().parser.parse_args(self.args)
+        missing = []
+        if self.args[0] in (ModToolAdd.name,) + ModToolAdd.aliases:
+            if options.block_type is None:
+                missing.append('-t/--block-type')
+            if options.block_name is None and len(args) < 2:
+                missing.append('-b/--block-name')
+            if options.argument_list is None:
+                missing.append('--argument-list')
+            if options.block_type != 'noblock' and options.add_python_qa is None and not options.perf_qa:
+                missing.append('--add-python-qa')
+            if options.lang in ('cpp', 'c++') and options.add_cpp_qa is None and not options.perf_cpp_qa:
+                missing.append('--add-cpp-qa')
+        else:
+            if options.pattern is None and options.block_name is None and len(args) < 2:
+                missing.append('-p/--pattern')
+            if not options.yes:
+                missing.append('-y/--yes')
+        return missing
+
+    def _find_modules(self, root_dir):
+        """ Return a sorted list of all module directories below root_dir.
+        The directories are checked with ModTool._is_module_dir(), so
+        the current directory doesn't change. Modules aren't searched
+        for further modules. """
+        modules = []
+        for (dirpath, dirnames, filenames) in os.walk(root_dir):
+            if 'CMakeLists.txt' in filenames and ModTool()._is_module_dir(dirpath):
+                modules.append(dirpath)
+                dirnames[:] = []
+                continue
+            dirnames[:] = [d for d in dirnames
+                           if d[0] != '.' and d not in self._skip_dirnames]
+        return sorted(modules)
+
+    def _run_on_module(self, module_dir):
+        """ Run the command on a single module, in its own process.
+        Returns a tuple (module_dir, return code, output). """
+        cmd = [sys.executable, os.path.abspath(sys.argv[0]), self.args[0],
+               '-d', module_dir] + self.args[1:]
+        devnull = open(os.devnull, 'r')
+        try:
+            proc = subprocess.Popen(cmd, stdin=devnull,
+                                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            output = proc.communicate()[0]
+        finally:
+            devnull.close()
+        return (module_dir, proc.returncode, output)
+
+    def run(self):
+        """ Go, go, go! """
+        if self.options.list:
+            for module_dir in self._modules:
+                print os.path.relpath(module_dir, self._dir)
+            return
+        print "Running '%s' on %d modules (%d in parallel)..." % (
+                ' '.join(self.args), len(self._modules), self.options.jobs)
+        pool = ThreadPool(max(self.options.jobs, 1))
+        results = pool.map(self._run_on_module, self._modules)
+        pool.close()
+        failed = []
+        for (module_dir, retcode, output) in results:
+            print '\n=== %s ===' % os.path.relpath(module_dir, self._dir)
+            print output.rstrip()
+            if retcode != 0:
+                failed.append(module_dir)
+        print '\n%d modules, %d OK, %d failed.' % (len(results),
+                                                   len(results) - len(failed),
+                                                   len(failed))
+        for module_dir in failed:
+            print '  Failed: %s' % os.path.relpath(module_dir, self._dir)
+        if len(failed):
+            sys.exit(1)
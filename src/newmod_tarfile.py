@@ -1,1034 +1,1182 @@
 ### The entire new module zipfile as base64 encoded tar.bz2  ###
-NEWMOD_TARFILE = """QlpoOTFBWSZTWYfc42YBX8V////9VoP///////////////8QAQgAEUoEgAgBBAABgig4YWs3lV6H
-Zu59vbde3G5cvNnc2Ach6z3TvazG689d5vNy8+Sca9vq5QqnxgN1g8OQ27tzrkA6d3ne8Mle2nQL
-3ZzTyda4LZoN3ddqAPQN2XiDVDRrbvPcHsworSbNmkmkoCwpK21MlG2stvruA0yRlmaxrTRWLRlt
-NRWiLabYow1JltlaNrNVrgen1p9eyT7GtMURCSULFakraTWNjIEKgzKVYyaWy+fQzzNIusrzbPHW
-NE75QFXLvg+6vY1mzT3Xte9EnfB9y+vr7wL17jUXrZh06vOcvPebVyz0ZpDstbo0+A+qyu32775v
-dcc3qy2hRbRsjNl5l3dHNDTJTDk3ZdBXu9bx12wG8VeGGq9h7jYWd08vdem1ls7BRRVACumigAD2
-94eAAAAH3sAfR57eQegBRmwDQGtB9NKRCVFABQAACu3zrTegC9jXIAAd7wAAHQ2UK9Ad1ltR3Ydd
-Mubvbe9ZUoAG7ydXk1UGsldimqgbYrrCidaQoUCla0JJFLZqXsaReY1T2wFPrgLilPe3JV7avRpS
-qbBtvdkkr2ZXvO7ozBmvsyfFF3GjxrEDYMQJUqFQAIJdOVysFVsYqy84auwYZ2NAHFR877n3Q9a4
-yVCARfRkGSFqqrACRG23ALa0VRVWsiEpKF2+7u1VVXq+46qgj3tyADaEG2axnR0CEdlNI21piibZ
-InDbto7uOMqxarWmnvcdUklKezTrFOho91udunbadj7t8Wr0yzaTpqUdRtSlJBtqpdgH2w8Nno6U
-VWrvoHdUVEB6mtlKBKaaKUUVbaqjTZGiBTZlBQFGUZllrtlSqXFgqr21cPsHr1Xq2sb0SOKoJJJf
-ZlUkqRBRC9uL6qxrZlIATZgNtK2z1TG0SzZSXrs64Vkl106qVKlX3bklwvSDpS+wDCObAqQnzlfO
-GCEnp7sGwYetLjSwEUoIqIqKVKUlFCtaqhVNs9UGy3sxUfeC3CUEAQAhAINAg0EwNEaaJk1PBNTa
-k2ptJ6NJ6YU9RiA9QeoaGgeoEppoghCBJiE09EVP2TVMxMmmRPVHqAyDR6T1GgDCAyNDRkAAAaCU
-3qqSU0UBoZAAARkYAjAmAACZMAAjAENMAAATBJ6pSSBTQp+kYU8oMm9KD0mg9QNMgAAAAAYgGmgN
-DQAAAIUkIQE0yAENJgTQAAU2gRiEnqfoamKDzQUNGZCMQxNAAAqJIQECaAgAIAAjRMQnlNGmMpim
-ZDSnpojE08pkNAABoBwf4Y/4SIIkJ/vSv66Gm6f95Jn31JS/5pUjbpf76MtX+v/0f+zNccHVIfkA
-T9IujtCpKDrFGwokKWVLuAEQ/BKLufn/Th+kOh+n9eXDZjEmP2TjOMzYy8XZUS85uFJ98QREfs4J
-Eg6Ao9AE3F5aqipCCmhiClSIv6oK1xlVmncqZzxJjEoGVzrEDzOSbwq35bGdEhRg6hWSWaYUgkoI
-akqRoyzLTRK0qVlkZFDtlQFSgQQyBFaFaQEoARlBZ0SrqExSRDUJiJKCyQCKLkCqI4LIAAjr8N8U
-0KYd4Ef5cDKL/r9Po1/C6XEe/fOVm38ah/oPxkU/shJ2B5sn9JAkf7T+ox7o4n9bNT/c4qhSEPuX
-q/C9X53twG+HfnPICAAAAMPr/4+vAAAgCICuM+y1VVVFX+/DP+FlBdOfX6CHbA30mylEeyiIHmvj
-S9wEjUx6Dy2/8oME6/uTr5TJDOS9TVhndkTp4UjBCK4CZLpQjE/cqBZRArD/a4y0HYdRD+JRUU2r
-2GBZiI5E1PzN6D+PxA+P0if4x1f9av3tNlbNmn8z1c9tjdXDTMmmZVfbUjVCEfUUMEDKECfFUDKU
-CEDJOUx11+LdeVeIZS66XXaXqWxpmWXFf7FaNZ/BXrpjyVipu0waHuEVDn/RZPZe3yWLomUkkfqP
-tKEP0ZJZ4GOcDDRYc6yBkQGFiwTHNTvi4clsdL1HgMEiNiNFGq6EfH7T3DPvFG+5oZyeCzoo6NsM
-PR7+07EfhLVFDqDCTl5eY5nR3LrdEncRRxJ+3v8n73Bf5f9lw/5Nu61KWdCIoiTPFdm8sANlH43i
-pI976mQ9ixPg5e5pMSpHRUKw6eWNkT/BX/bTUsJVNLJlKskjjfGXSxJMf14Ta/wrzWHCjajBoK/B
-B9HPHtNsX6oUfyyiFBy+vOrWR5YkqA/GEmyimAlOOJNW7FPUDIl84P0rlcGdf25tP55iNiOBJTQf
-vwCI+Xw5IvGD940FURl656cerfzRub5fRrTTUUWs5XnNgMu//Ly9R/B0+rVUNVJ/S7/1akcZrgiP
-ihM+4mdp5S6Jl34fKtg0EUxhiuy+eJ5loJS+gjNWJ9x7T5jvODg4OCtsdkDg+Ha+Vvse2N/dyQuA
-zpv/EZjFVVRQTmJ4und2AAYABIDnEBIAJJFaEgwHvOeDdeEOprnph4Kelyj+5ESCNS8StVX/r5Jz
-Oidc+7s7PEQE6sCmJhmKazHKgiaMsKlhoIk7PBk0Z85fiYqfGftjU2RKJLabTgyxrapJ/xOJhJys
-SRKa4gi178pQxSxpBYECGYShl5qtNq1xMimgwiiqmKQJQn0b9u/D1+Wc5dR6J3kk6k5maXuQXclp
-KUWoFzM4makjhYXiDowZEHaGoS25fPZkpzJKmpJfCcVPMhLvtWlXieX9mJjV5Edhdk+Y6zFV2rSo
-+ZYSvuGpoqHMJQdIgSjpHPBhrOonS/imb7vLK7qMPTiRCQkIQhBzOM3aKUyk6Eq2rVzH4ptfsrKc
-QYUq1IhAPU+Kle2HxNMgIOwySIiJDsEA67d90Vz1B5vpdvLOqWpg0u9PsgdcrWaBpcs2EZ41qcDz
-Tn3I2RjURyOVXn6ntxfRcrQRhTheSIlCSvmuzCbZQsmuMBEZqxu7RXrTrOtOu0eS9eRpaCI3UnGZ
-JI9FHXs7Du8gweDOJAO9Usj3P3H8aKj9ipQLtIcppI3/apiUEEFo/kxy65nsqG3dQLa/FUeyGv1Y
-wsnkrlOX9ZNRlJLxy/w+JuN+sy8JonwuqA6sDukrWEsmma1JEkz3kl9uBvc1oJSho542/ks8TAeo
-gDACSdEsHRZvbWNQR16wR9vHDv+py1OEUc7zdln5T4kmTomI0ZjpeX1cYrXZwZiummlCAYUFFRVT
-/NW/q9t1+GUmM8WCRbR1RYPfRiEYn867UY7Y0QolTUQENVxFIcAMiZ3BA8pFVQkNWMJqKTaDVbfY
-pvNSKEe6In0ApHfRO9j5rOFfRTtvn2nyfckbMqEaYgrTau7258u544d+J3k8AAOtlavpeeeXw8vP
-G5TUCiVIpmUkvslpJJJ5l3MqksHJTW/nz7ON0FODYxsMIKSiQoZjMwigtHdji5xpE687W17mtamK
-pCKSCftnyjzgBPySCeeO65IaN3x+P2mlfdRCmTlaSTn8HtURboGpX1pueU4ELPifNUiOd9xunLCR
-fDqWHaSJiBCCVKZSbSlGNrVF9Z1SJRpUllFmmlJSWANFBkrEyxmSTLSKRNVCJRMSTr5M57Bz449G
-++/rwyQTlBFJHFapdZ9lZ89+cppVgSLYeIUXpcoyi6iCjcvDMdGdtvGxtAYuYrtKkc2mSaejI0N8
-LKgCHvQQkvSFKEDwUkmPIY7BW66Ehts0ARO1AEMyOFc1ZXRJqqtWyy1rwyLzEmfInSX2WbVR3qjJ
-7X7tevWb41KGsU11isWSB1N6tkaKMUVuFn4LIduj2waJQEBhOanhtkPp6Ztm3ETnZqzK78QRj3KV
-LQ0yaltNZrsNSGlDTSkSpABoppM1qN8e3rxUFQQBtVTVyIV19Z6AmnRdGlyDtp5/DPvjNAEOP7fw
-bHpt57dZ0N8Oy00XZ4HKKUCECqgpOeYwlUAcb+0+gE25RyvK51VEX1/j28QAA+097at5ZEkbEEf2
-pJJYgwhUhYQsIKiFFSCwSoiKkLEKqWLIC0AatWLYrWo1AamUL63PSKT+CUibloFDjtAEDbUTMx3l
-uUOVM22MQACCAHSSQ2iZUzMTLd69J4vTG3VdrruvXp28V3rBoRhGoQhCEa4G6qqSlSHLcqREiCWx
-jmYgAoKpCcTUkEgxJCQhwMG2JyhySTMkzU1Vbu9ePTJ6QqhCvHp49Ld61yyqm9PC8hvPLnloTxeW
-+Ykq6tiFG+7Nq2200ohYiwSm6kIwsjxUhghVbY5+Hp3TXtr7og7fXzH49O2oqnSUjLMKnz6Mheey
-SXwcehzxU/DX98/VojSEq/LqtItYmUuz8fCDkFAL9viU9pR8So7/zb7ncw+Pc6FOfVPTlg7oL9bE
-ft2Ovd7SU8ds+knNi5n67ZQ7VDCJokyOAjsmL50EFFwKD8XvUoHNzTbJOXhPTEjnA3XvwhcPE8p9
-lCwSMLnmOTVl8UG13PvhiaOT6F6IpM+r8kWYPcHSisRAI/lF1BWcKSgtEbdUHCY1jQ6x0jSypEVJ
-AqcMRJMSIhwU4bJG6Q8H5l56Wu3mcNtfrdGy9hSe1T7lNKkskSKVHRRzka7vYb9faXKFQQ0tgHZ3
-h1CjnWXzBNGYIDDB0K4h6PJvPLfGCebWpdFTm2bK/uy5N0kaVInCwmD1Vili17e/DabMkKyZXtZk
-XSMTsrbfGyt3m4e9uNrvHhjDWKR4ub3Pcw8Hi7tRHgcn7D0cbPJ6uDfg5kSZeYIMFj+wgWFCYxEk
-YnXKQKKOCtPk4Ohu7kcn6HJh1f/Q4dnk6upyd2GMjke8TJm5MSB6SpidwiEwcLmY5QsGpmaPJ1c3
-vV4uH7noObsYPbu8G7xK/krsrSnDdw2d3R7lOStz627HJydk8Hm+F+i/GS++/X7zjnO3dxOcd3A8
-eAADycEucAA6c5zu7u4OJwOePHncdAHd3d3wvwK+obmQwwo5UsOJG577ugRGChMY6zcY3IGhwTES
-4pYmRFNyYxkKiZKRJjJ5CgQFJnApudCBQ1LSCgRLEjAbsIn1kSoUJHebEDzkSxI5kTuIjGoIRsKZ
-ECI4c1IihyNRjmcxxzyFS5kcyImIRFIBPEiQFMQcYc+4YOWYx6CQxmZkh0oMMCaGIyEKmY5j8NTx
-KhgSPZccwGMBTpIyNi5/QeIwkTmd5IgPg3Ozmx/S7vc03cMc3i2aNMeD0kPcQkosOx5lBQcGzRwc
-FlGwyhQcFkkjOivR+tPe5MdeHidlOjoxs5N1VpXdAyMgvMoJBRhSJ71TzljQvYVQoQKiMKFRxExP
-YRHO4ULkzGhIgXkWCJ4noPbi6CIZ4XVO7DxhGIYPnLySLLza1avPnAZRVFmsJ9x0NyZIROBgyUNE
-ALKfk9ncOJ6BVVOSh2rRfkq3dxHH5siIov0nwYfBL1vf2ispj8oDMvwwbCDHa2bQIxRAYqBDRChv
-C4zQUgnnq2IVTTAUD4kDjDqEAyEr5IX42+2IbsqZ1XVz2DRlT5fz7CAn97fKB6oU7fh9Bnw6nepi
-BKL5ccflN/u9R18BO2GVXms6483GeSZ+6J6hGiBZQSKBKPRSjk+CbpIUCQ5k43Y7UyoklShCtNDg
-4/Adrxn9a1Q7QH4o1RfzQnLQY0IUK01W/7dOv/P7Pm0fP+V+ZBU95IsqMUKqgofLIKr6hRhFQRQ6
-lB0EovwJH6z1n4CP/UaPI++Z+XNo/3m22tvuOiqoAfrJVRLDfQSRP4S+BCCDtIgSAmcQGPKSkf7P
-7S5gQMBYPAzwawcnJCUQo0bPLRDJ6HAZ2SEo0x4nQQ20vZzZTzrJsWuTbU3VOIH3kICq/NKKimjt
-3Lz9mxojUeY2w7hHY/0MxsIeizo/LIyVHIrxDMGSSTIxliTVIH4iBTgobg8go5TYugAlS4QIBMkW
-kUPhNCEywAggCbkz+oUbYW5gTE8siAQMVitn/radIcmN2ghuVIfR+v5Q3TSYuJwZFjYwGNSgWQDF
-V97LuRXTNUOViCBz5lO/3jTtM/8hgYRPcQ4QkT/dPzcmm1mAPPDS6EZmM0QGUEtJ2HiWvr+H6BvU
-0jzL8Z+0ZMGOefKXc6faSIN3t4EZjepO5ZkjDUciEpv+EC6AIKH3DHnCxI+PuyT+qrDCnlyPGvnU
-RESKm4L53MKMoxBMkWDcbkiN+Ir2fI5EoTKo+F5Vv85I+M84xWrC1S5zFI+RiQKKWl4kNVQMW83m
-oeSB9BqMfSeEjywL7kyKD5YIoqnuZPSJQ+8ZCLDcBA8oomZ1GJWWFl61HV8k8YdPU1O/w4O8t7Zv
-h5ULYR+mkN2pFzzKQ+KP2OSnXF7WY0VVgknlriaQsy+l4sCotFGFMxY8LdaSIpKESSy9MvkhjM2y
-eoDz6oouZj8nYzlFeXWXgR2jRvF7xeQ7mC6U0ta7F3pWmJhO85ThN40weZgsalaOPVfUUTk98Eb7
-M6OWanlf8o8DS3Zh9SIICIoKKKggh5RNII6fXDn67ffBPKkNlVX4Oek1Xv0THQi4gEH3yTHK1pz5
-zB2IGKg+9dMRV7K4VNKpNm01YZpIyZJmMGaWmm9+q18aJuYYH3kTAYmWP2kSQhPBgLBAYkMn4+8B
-KjByZH+rMUM9GTGUYhFjPoMF8GSzwaPAmn/Mbv0uGHJ7DDlNHJpp+/eyRI8nD47+TwY/9xeUSOjJ
-+ZzcJs/F4tnJCRW7lw8H79fpfaqkWFVUqpUUr7OHm3T536j2Nnsd3g+k+vf8dJCOP50O1InNSem8
-IIiTOw+UmHeKdQ57DtcWBcJncVHGHPE+Q/OMYH5BjE8DE6yo5l+by8f2KIpDrOhz5HT51ObHv/wa
-pCM45/TrPIhuiSUh7FI/k6/uh7v8OOW301fxx9userGr5Pmn9s/g2P8SfEdoR06dJYqmYqfYuMYk
-vfY/6SjfuOoYxTLuDIuRO4U94mWT5ib8zdvwrFPoPZ+k+PZ9UE6vcf8gjB87/XTmF7VqPEY/nAeH
-ylQT9h8ign4XyNg5H4RSY/ef2jHWoQNyjfd0+0+1WASfYcDBQgOb9BNxXD3pNHaVvJG2OZ5+mk+T
-6X+Xh2cwgOh5FGFT3xgcHgzZNg7KTI84WQxPp7/xGGvz8YL6zL6VmiakH+2QlHlRmX2t8aCBCSRP
-IetIQPDQnAda2se7u7hVcEN/Z+6SoIzN8/l7g+QIjBwSLuZhYSYPYPVIGJGxE6giXJH7zIwxxPrT
-5RHOuGFicVADBA/P0o6AU8ZiAIdYm8LyCqle4YTbAEBbIuinXuXkAD6d0ZNQxh7lPc5R9kII1KUV
-fDspOcTxUpiMI65EQ7UujuY9t7arqElVpglHZEkL3ygmkxKvIRKsy9TZ0iTSXetzSiRyYiOTQMjQ
-kXQBCQr4kykSMbimKWkPvIbEmdQzZyFgBRHZRuFHcyMrgxEG93BWuTvz/d7XtV3vY0AJE2wkmCWr
-VqywsfQ7NnmrfedW42dfsN9l7bmQc940FVYEfMdFFeZ0SZZqKNljJPeIOM2+V8nLiNmCI9AqoYiT
-B8wdaRCS+AiV+AmZhAhyzB3wGbcBgAxpighFFDqG0tAnAQEHmNAsaNPoCGYVJ5DkiRKbp1kgZQ5Z
-wT5OvabPOcd0tX3K3STTNK6OHk08/eRIJQVGDc+1PgwM8bdXLRXlgNymggDJiUU5myAIQ7CSMnNZ
-Kc8giPYe5MmgQLvMTcyREkKqn6zYUfSHUO5yJNEevv7eLtOaoHEqv7B7J5A7Ciu7t+kPwJ/VdRPp
-P8mf3UH+lP2n5D5D15QtBwIHw/Gh51ZAT5ypod5TawH4POwZgKp+HgsQzVH7iwff1DC790xj8j+P
-GEhExBUGFQyBQeDPmeDsZ93TuEdxQrMjkoye/urQiGIgyNzXKqsRHy7hwKhtz9sERBb2GLed4lz2
-uMSQeczDz+q+GebWruOFPUSnrhJ6+ufZ9f3YXCBQ/Y2Sb/J8zJyY6Q/hY7nz299+/hqdSYnAnmUT
-rFNRXglMKYrycpybuD7mmp2V46j5ZMMzC0W5lnumNKvXdZw5jOj1N9XcrT8qVSlOFa+OyY5jg4ac
-MaSfP0dWyu6Y2aaWc3Pq7C9vePhbsbqVT6TTu0r2ONO6VGyvGU5pivB+h4v7Xlvw9id5ir1cuqk1
-LmAfAZgwUQE3QE8yQ7iIdBEEO88DC7zYPh7u53C7o3Pow8pmIiKPbjg8HVz2chD90J+af13JbbJ+
-Va2Cebh87m/Buj2FQ+uo+Cok/E5keR+ayG38buIogKCogevmiISPHuPZQ86kIEOuHveefoE1ExZY
-/l1tbstuv/aIaPxfUz4qnmzO75KqqTGJsp7FdN8+9eeZNPixhzY+1VflwbO7BusjSdT500k22bj8
-rs3ePGnh7tzdfL5saVIqpye+Y6vqbHd7H4PwNu9GKk64hihSqpVKqtSRhMWVEoSIpDBBCxBEHNI2
-AGfkDg2MD8mTEexIUzAg8CYzo+0YV/MT8HEqSEmKKp07PI43hEzIBQY7R0TYcuQIkiR4yR0sEz2+
-Dh0YJsYo/XZ9iunzHIjmQBRsWKKilQ4IpuWInd4L2ti7rMwNjGICJucziOHxPfcKoHrHYlDgLj3D
-o0qRHOhSzZHr7tl7fn6OceHG87IiT2PPJCLKiaRBPF7eDUyClEgjIC3BsqOawVFX6+r5Ucdc/o8f
-2eO30Pax70V6+f18nl81npLVzHJ04t/ywmtFPmU81PT29Whx7rPGE/Ia2+f83J0+luOr6Fed4twq
-pY+z+IycNCHlnP24nOp778FnZU4dDlXDTRsPlww6K9fmxs+Z3adlHRU+Z+RBNm70VulK91YqTyrr
-Y+OseKtnt8vo3bp8PnSsH9XLf5t/dw9Xp6FV9ImYehjFiSlVZKlTZ/l2mtpOBDNXD3dhNzZuxjde
-a473VfZfd38C32ZfL4fHxd0I8FRKstlqUnzN1pZJFJskUxZT78ilkLWFaxiixS/mYwxcWRYtStX4
-K2bT2nnzIi+rk8HpHR6ofrscNn5q5le5v0x9Lo8FVRVcPnctNQ6wxz0fjTgro/fCe/jmJ4Ozqqir
-VK81x6Lo6k3MYOrk8iE+QRrYYVUkjFkgpXQ5qslT3GAnyHLkHpMRV85PqjtI/ivDkHP5/OKr/QMm
-4eOYS993QR1Ce/y+N0zTv8HKdREcH5mQp0GPBun0v/Jjoro9inka+nvpj/DL90akSHwS5sv+P8u0
-mtn46/YSq9PRPJjwRycGH21jZhTcmSHCgO/wFCYUF2YLFYEDtKESBLxJARLPYwScoyOP0DjQ/4Bx
-oeSxDM3ApOV1g+IwwQM/GIYzeYo2UIRJUrdElDKMGiyhHZFAsFBhjnB2JNG8dTwYDRgggDDDE7UD
-FgB7yyIEzUpkXCxnAqYHllALECMqFjGbJlMKGgqETIuTFKlSFY3LHtBgkP6LjlS/gejmQJlPFUoU
-FRjkOyvtHzDhqaAxqVGxSxUjBntY8mJE/MxqiIiUJilDdizkgcwUeCDm8BiBMcjyN4hYiVNTkOfO
-bmJbVcK7smNzmmPqOr0acuXJrxd/F4uJhGRcrEYVyMOuGI5gTOCxYxLpwEEQGKijHNwxdWWNpj+P
-Vu0b9HHveb31u8Ve5VG2gMQGFqmZclyKFDFTuUxFKjC9eAwpgMZlA8p8XqJmYZHA6HM/URSp+Q9E
-RT4D0lD9JEURT4iGpQ9gp1YE0CX7nGLmRGBgRQADknYdRiTIAMKJq3mqMnUvYXIHzLCpzOwgQue/
-gfaEE6MFBilzMgg/1T6CTXmIv5Emj3lFyMHjgf3cEAUPCBQgkCaZF5DlhjIUmCgJAuKcDSHPUKnq
-CAIe3CkRaFepTETmSzHQYeDk6RDOIOTN6kz1EkEYVExIjI4TPWN05knJGDBWFWXGObGVYxdNfQ0J
-sulBRVFDFRnPTnDExbmNsxCSXSQs7aOBCRVqE7krgvsJfA7HgZ9w+jk6EbNtJEnqRJok2E4mKpss
-5FI+LTJ7vJ6fq77tmGycH3mj8h1HYdxHahOjxQE8euiiqKqgUoAVlYGzZIoBIWWBrNYCCAEmZVVV
-XOJcoZtkqOKUGLRR5Gg3uc7pmOJXGgN2nNo5PFy5ejzV4qhjy7rqtG0q1oxSzMVTn5uGya2cKqtO
-FTGVNNmNmlZDF3pipVGywqpsxjSq3YkrZgxWpo3aVU02bMVNBTbZl0wKpBuVSwaaTSpXAUDIIwcF
-FnUi68jRwaK2GJZR4KChYKDhIgHnTTQ9fkibFm0G2YgPkIJqKAKKBZT2qbuYFCZCNPmhopA+BySw
-O1gmUPaowoysVldn83t83fHNPjjHsV5ruqMT2Olad5O0k8nB5Nxlfdtk8CJJnW6/vPm/bpz7q5NO
-35DcjPtVPB5sX3snshGlj6F6VJzWPpY7NT/GVu2cNcXZRWzk09zhWmpCAoXPGBolDUU1GGMXGNFH
-KTsQJCwVVqDZ34X3dW7hycnLHwVjLww2dT6XNMTYuKqQclJ9SuFG/Nu6Orntdaclm6wN1bUX4zjz
-fJ7jUmnM5q5TZOU4tjkVCTkdxyZEkKSsdZrKp5ihMO5UiG4qFM1Ofjt4TxgjnIRiR1gjdESUhqAE
-U2Hi1c02rsgDJ+j8fqcHzGewDO5JoUJG9j2s37bMVpXDUyKlTy/ewaeXq7G2LI9yk03ZXSLrFevp
-z07P0vtNnN59zkyGCxgyRHRJs0WcEkx7ij3FjbHcleWZX0akNnpMWfcSB/GKkQzZ1z0GNK5ptXMs
-WFCJQPpxElAgbqWPhIA0emIwnlgGBsQj0e44NNq3Zicz5Psm616KeqvyvmYdH3q6p5TTY03WK3ct
-mntK5uMxibve8v01J6nB54PX3FiN+EyabVyWDtObbSKBQvNSiVrZDXtGLucObGBWUggIhjAiWAmZ
-DGRiZKTISxGKFi45IUcRhhzEjYKhMhVjSuU2Smnu2cA8AbQkYp4NHrUPgXQOBioopLAKDSW1SgCb
-HyWIGdzMYfwNgYlt4sVJgUXKBIVA4TTJ7abi6gwK1dB2cnyZw3zkzljb6n8O/hHU7MMD7VJpXi2x
-usQYfDwfobvFwbWq5tmPT3Vv4tnsJTGGKS0ID6uU6jgqUgTaQ02IIoXhNZHdBzBDC+uQ5AqsFydG
-JkDrIntMimeYNz6u/AxoUGKDx5VD4EepzYwYiKA9fNZiCabTbyZZ7Zj7F0aVSA9EJIh3kpugoMoI
-VIm18CJiIaFLnxVEUWgVoMKVGMesiQHPUSGJDCYiNHf5I7FX5nqMSRRIj4fMdjnGAZgQIeSKAoRV
-eOzoozgJGWIM/vUfzIssJEILqeFANhCoWJp5yPcSEqLNASRWJTmRNokvL2PggMaS9paGpluUploa
-TloaTloaTmU5baGk5aGk5aGk5aGk5aGpltoamW2hqZbaGpltoakltoaTloamW2hpOWhpOZTiIlto
-amW2hpOWhqZblOW2hIamJbaGpltoamJbaGpJbaGpJbaGpJbaGk5aGk5aGpAluU5baGk5aGk5aGk5
-aGk5lKZab319x6TzkD6J4ILxbJxoAw63PgMCI4oSFPOcDInZh9z067vcrdT8arqw5q3bseLGNK+1
-u2dPobntU8qYUxuxiz1aYlVphs0xzbPNh3c2zgxsd3I96tzd6vc7tp2fr5OFbFWebdjop7PjjyaY
-8laUkdpAcCwKURJGh5SohgYbjFIC2WwULDG1VXCbzZXg+hzMdkrg0b43bTZXJk96uqtlk2YroVpz
-9t8b4c/E7nz9YxZn0dRgNcv2VHSp1Y0FzRRXMCowBIRUIjmJMgGZyzHlCFhnYhQ/OMYifQAkPG5Y
-iALiKG9T2vLZwVw6OR/ubsNwhZj8x5vH8a9iYnMwMRwRzsFIlyp1Egz4uDclHFJCtALtXNNq8xZ+
-g8j9AqjiOjiexJ3u12iD0Ecm4E7mKre48KeLg83VXI6K5dcXpvwcOqS0ifAfMgXRDMqTJArgpiXC
-BI3UxMEhoEiSc/LzyOl7M+juOrZuro7J3KNvDhnopiYV+1jOGmbIAg9C7+qJqETU8CA4pieUXL2H
-G3SMCDayY0DuJnlLyXEyKHWOyIhNTYUpcueZzZdnJoooXoZoURAw/jGepgoBjNHgoyyhH7UUI4+4
-YaOwVZJwbwJnc+07lkbFN+hUgTGicFixvMYijcDOEgYsH4TuwMOzXn39XfiajmJuC8u2R7LxIEyQ
-+OFAj10InYTMRTj5idlSZZJGDzLhlCEcMkYixz0hFCYuMRJEjsCZE94U521PZS5wYCiUBmOoc942
-LlzqU0LJHYotkOENcSIiKZU+0+k9J8naHyWYWRnl5O3QzxDNk1FBGVNMA1PMRIgTKjB1HaVfjThX
-i9DvFf0sdZ6clcj6G+mnSnfH4tzzN7yFKjnDihpihlrqX6nAiKCRGSTEhSIaGBTajfcKSHL3KhMc
-ycZPDEBLi2FgR0MMP7NEnOb8/FqsMLR6HRMdyQRJ1ejHN3e9+k0xT1buGpHoi7Oj2vJu3jZOPljm
-2Kru0Jp0xXDTGp4G7G6uGakMRJYViEI8yzBgwUbNBGoGYPgYHs/Ycvq082uGG4W0BTFsBurUc4iT
-KfTQqblhqlAU5V8n2uvtclcHr7ubl5nDm9W5WIxjCrdytyUkkSWvVRatXru+N+CualFTwSmTm5q0
-+hXbZidJZx41r2OCwi5PVgdZJCizGiP5UBZrzUxF+R5DGSiaIiCIk1RBOUBSR4qTLm42Q3DX0BiJ
-aJN8PJ5l6lN+euOBiWIfF4VyAJAokhJ4ruDVd16EhTAJAxA0NSxY2KlxxigwQSQpQgMlcOpZ0iaO
-Es9RxwxLmKIghU41zJOfWaKQNjYBIeBAmdUcfbK5hmJI7jtoQOh7Bg1FJgxXLzFhyHepWSiGgKdZ
-gl9zCbnPowhyEOsLgxQkKWMherII4rFoO6x1TWXtxARiRm6J26dfQIB3U8puuFjY6NPJtiuBNB7i
-UT2HBqYhuZmp6GF7zxdNjwwJaPqYD/NIY2I5qSFoWJCkCBMhmd5IfXUyOZiMYjiFZ4Lg7JFTIooR
-k4JMCGICL+f0rXxx0TrkYvhH7XzrC3GA/hvtS3o1IMRoYOQQoRfJIIyfYOMCgpKzEReBiZ+YRCUy
-PhQwqIdhCQV8KjZea8kjW9CBwHxRyQBCRE6GA5yPAoUIYrXNaKq4iiAh+cnxVrWZpdkl5rC8lKSx
-dsRuUrUHygRgSTW1taUqV+ZfwblanS4zo2WdigQhlDPkUUe8o+PGsbJMEuAwUIhggYhGjDB0YY4V
-wqvaxjZ9Lmwk2lcFdmzF2jDMYxjGzGNpw5q3ccOX3OZ+8PDPrD5ZyqJttaMMQaPoOxvroTPfg6Mi
-LIJIgS98zPNQyKgooIimJlnmDOWkPG+DEzhSMhPIOULaBIyAuUJGgxMfsHKCnykhGPhjHZJJjmcP
-Pp1ebZTzVy6JjzY0sNPnc2nR2MbvN7GjeU3krGPqrG7GqdyiuqCWJsJYmwlibCWJsJYmwzo5vV1d
-W7djFn9quqfr540+Q06o/fQQhf9u5wZiIiWHKlN5EILUgMxoo8GDSOiHlVEi5YgWKETwCwUIBbdA
-sgRLQDmDfHbtLEiqIoYIgXLFVIU863LJJM0mY9xArcwFDAMmRGhHBo1HsZKGaKMjEIFB1OX/SXtR
-fzgA984yahrDRTvcpUAId6EUataqvPxrOeNEnnfY2ZimaPR6q2ejq/Bs2fFR4zpPlJEakD0mHpNT
-0HwhoCYJgYIiGDDhcYwIDECW77G0zStDMUSwolOlrP0S8mqqOqKp0VI/l+wh0U+GDtPWq+PAZzRl
-JSljLhT3c6mbki1hfOeLxHFcq9Pe5XKYypZMWaFovJKSaK5muv6NqaW4WqqyiY8SfjGa8QsgTk7Q
-ZmGVWz7J6wrJsQZVagJg7ISFi/Vyd050Eu8wSzXdjyt0rRI6rrrtrWJgu1mQgoJJcV37+laxOglK
-dBG3MRgVv09G49NEcvJEcNd2Nm2rIoktlzHYqRGYUpoRHREKB1kyEjljzXTXzL7OHJ1dZpj6KWUi
-P44yJzfzsHFRipJ+Ko3cc3qcng4cNPNTs3eE/YXGOjG1N6xpWObTGB/kf2vsVOHQSQxwMcDswzHF
-wEudiSMCKkSR6SIDpZNFXB4O4UEG4wFGTZxs2BHI7OWaCSBqE3dxARxEgd52y6yncpLGgzoYFgWn
-vYh2k0rkfF3X4N+rq+b3hE2ET4kRREYFGFC7qb/SZwINEbdiGhkMOVUc4I/WXGFDcuKAlQgXJnM+
-SuFd05qkUVDHZu1McPc66cGMkI31gAnhX5Xvbcjqfb+lb2+HDz/Jm3ox0jm54bN2YhqnmGLgqKJV
-jgdCaPBPAsMULHuk2IlHRsoPXzPpMBlB15rM7bQ1JEttdvyNzyd2Zi03HgZKUqqV8tJs7pKELsbt
-kngZ4HjRgCUB+GeV2nu2vQRJmvIJZIVhObbVmvgMoPca9UdHcsNB4NGw5qTKARyWg2TutCyUNSw5
-2DER0qSJkYiLENGx+Tj79zvaMiYSZ4ixVH8KnsIlCMyZRUVTI5FjIJwFLjjDApoKMpSyTi9yaXJn
-QiajkUd2cRQoeB3lgmKLI+U+AbEz5ImabFIAwYkUbYFOA21DIUwuGxgwXZcG4bXRTJK1glGMLE02
-sesn4BBwcn0ljBmCLmZGDgMegs5ImPhgTKjDGRQ+dSpc0B2/Pc3Y2fBWnsY2bGPQd1B4AwEQ06rJ
-KpYBMIZG4qBI9evJ0NCYG9kBDMUC4pATCcIAalg8hENhQzDzcHoKpE7hesyZKnQ8FM4YW66URAih
-85qa8aETfqGKi8lQTmKnJZKV9lcdOXL0/RZwsTZzaaFYex7zznTpfa5kbq3LAIc41592ni9zHZXF
-j5MxjNng2Nujxe+bN1NnRW6ySQjxxUcUsS8bMdQTUsQxIlTMGTFVFc0Uhjwapodo0M9BgzBrRwZP
-PUlgQQayszbaxcARqCN4I3dXVh1c9MO7QkkdOrxbBecHcWTH05o0fZCMM4ODhnJLQKzks7hMxSJJ
-sCJDOKPB6CJKEMQeDyWuAuqEppa3uNCJfjKkcRzQ0ARhyhYmSIGooVVxyfS+TZNLedbyJTTrUdWm
-zoYabY4MEsEUEwehk1yUaNF9hCLNvBMkks2SSImEUZLDmSgowT7zZZRoMGDZ3yZLiBCCyTIboJNl
-WUScPg4MElHJpalo2dROaJ1bI/SVxOTdTl4t5t5erTW4wMZI0IZIzAkdijVEnJgkqpLKGOJFEoMm
-yR0EgySWIU4Z48FnoijZ5kgxGihnijeTrzMEUdpDsugoZjmTBD2MTwICCOQITYhCDGJysEAmeQ0H
-NCZ1kC5kZSOhU2Ll07hRMAUDqQoWcPkOs7xwD2EhkRNgE0J+Nzz9JmAwk5jEqDjgJBwVAELzKCic
-ASOhyOQCfefKMef+BARqKYmhkMQdtSV7DOFeDFUzGuH1a3f6FceLZybNkEYcJocjQj4EjE8pZzIg
-fgwMxO4U6hS6dqLZzTS15Ozh97HJNdVmzq3fLb2TmnTmSJJ/W6nV1cn7H9bc4aZSleSuFdn7nk5O
-QhEIkig56yIMQJgwR0G0xJkzE672cqMakDxjEUpcqeYtIodQKFAmJcUcOsUYjYPcEHaBwe4gImD8
-ncsGWWBztWTTas0aoyCKwwlibCWJsJjno95zgxzx7woDgikBMQXbg7B8bGauZXxDREEgDCmoS/K5
-CZDm2dLIVsw0pNJ3UxOfsxPo1joVw0HqMo1HsM4PQkJMljDaNlkI6HGBGHE3OZA05EypsDmsAknr
-Oq5nALFAYGFRUFFzNA0zJgv4AmZFTJLwyRmTZZKbLIaZgKZO8yWGA8zaGMyZ6OwdGjRk0EMYZ5LC
-JcJuQIyPssiDESpxAEugfCIoJUxLFzozovRp5PDx/5+BPX0buTqTGO6k3FV4Wfp1ev2QgOKq/cEe
-r4CXHHTjGIjr2alCfq/Pyz1Y5hgcGRkfmhyPrUVEBShM17ZHcKOaEjDreLUOwekkUjN+ZEe7EkiM
-XUuSPUVLQQRNKCmhhQBOx1HMBmku00hqSJba7nE2qJttQjh5CXq8Pe2204cMVtpwSc3DtwR4eUTE
-ThUo5ODe5CRrBO20jh5CWJsJybMRBGCJVTAyC4mAIvpKDH8C6SgaXPhGLChEuYKYmpYFLiSDIqSM
-AUjZwkw6DLrqHaWFgbcmJbxTdnzfxqQH7ejTty5uzd3ew3HYJHr4J47gzjHCjEyZQ4RSJcxIBI3k
-OOQe08+t7+r0V8XMqPMVySajtI4P536HfhEk+g1WIxKFtUtgjJImbKZ1X0qxuKXK0SYLBPTIJZJC
-hQCUdw7ncRbLJMYO1SXhNou6ycgHVYS2+H5ERBnMSoUL4IiqUrALhFuhl3p5Xy3qEAWtsEISlLhL
-VYi1tkWtshFu22WBCS1dcq9671eu69WtvQAi1tk5yhFrbItba1tkJSlQhfD6vbrr283t7eV1UBFr
-au1c6uRCLW2tbZLrru67uu6QkJCQkJF2uQnc7lckoCEISSi1tkJJTlbrW1u3nXVGjFMQwDYXWtGY
-RSsKwkrEGrWyLW2tba1tgly5XCO7uu3bEhI1vO1vKt53XdIS2yEWtsgIOXa3a127dW3bW7bI7ZCS
-UITudyhV1kyaTMxjRKQ0Q3ENiGmpOcuEIQEWt8LrvftfHXwXl4GZMyTmSap68yi/R75flCgiUFLY
-DEA3MQ+yKNIqi1KtV0VMmRTyVIOjZitNk0KSoU0yJFKkY5ac/mntnPEhies0RAAgQHJHB1KWMgyF
-JkyxzsOddJdmskBzUYmObj/FciDmIwOKMeQcxORQE4dFYc5zeH0HvKnudjh6q4WTSvi+Vck2jZpw
-7NtR+jo2cFUqk+p2eaerw7u5mGdR3flYTSAjzExB2OeeIjZZkZswcCHIolCJM9BMj1ChxrMcz6DH
-0lhGCjGOvbVtmzYoIxQgTLnMgczicyxWgowkAUTnyEVUOhYwEECpwMAjFS/v6iZEkI3MA1Ne5SA7
-6fB8m7it4I/Zx/Q2dnUyz3O7w+iXFV4ORMyBzIjFCRUU7yImhQ4cY2KjkyB8A588izn5tmI3sttM
-ySdUFye8sMqPdszkcCKDQsbHWRoSDcuYiRGG1W2FHp2s8ElozQMzDQcTYUnAzGHosCGgYIlNQGLE
-iZcU1YYLGPNu2fUrdj2fkPtMfnfrPvFf2Mcmm7knRTDhHD9b9bdyOabP4NNnNXZzbuSscN2zRpux
-jh3Pep3adVY6SnD3q6ED8Z6zEiVJH1n7jYiB9goTHKlBipUiOSDq6sdVcn+x9zkbPcp69GJMc3Vs
-2f3NNkaVWyjzcnI8HVw0j/a9j1OjfnbcTZXsU3ejq+D2OzdSuCqObDqe9jd2MnUSIimZc3MSoMKI
-QOxTmTCwpXsl14RPRDw1Wa9qy8RqeR1ehc8/m85BgYDOauN6ndXGIA9xBK0VvoqaOnvNHflEfFsa
-DHIXX0sknDE02EQUj3sOL6FUdlO7Y2ac2jyagxYOiXLTu7TfYbG8wxu7qwcTGe514dmyvufFuneu
-bhjHg0Jjn4e9jjdMf2KVyNbK5OWDwcmKp0VPFzYR4OTHIuMOdC5YmIkzMkMRKkXOsqdRIgYEyxIW
-R8AOb2MiqYXxIjIw5mSIl6mFixBRLQMzRmttJsV5q0rFTiq7pjg6dHTZDkpVTSvJ4f2m8hSkbO6h
-G3fDkuXJEBC1pFypYJGQ5IiMEgiTUGIDCSJDBkKFRS5MqUSI8RFIFwPhvNJCSJGzTs4dI0aKjhw2
-aacsTu6sVLE9WiBAvETMUSoopQY1KBoGgwxlYmfBUqYFwzV0lZi4pAraQMQIZmA44ZkevqpiYGUj
-ciWiZTDEKESEMnMgomIXJFzUuPX+HHEsYJIvAheFiTnMwGHkalDEYQsROhJyAxBjAO6c3Zzadnsd
-HldieErqrwd2N1cykOWSR5COxUiKPAjlDLsk4g2I9pebso7ehJuIg5OgZkJDJZosYjuIsvA5ESSU
-JmTYUFC6JPI8FQytmhh4KOSgsxjteOGmlK8WHJux2xjucMda2TXR2KKEGCzG5ChiAi6zySUaMGRk
-EeMGpQqYCmQRMCxYMC5fAocEhihIsQFMCdclFlhWawPjkyWOzZoZsLNHftZ56xng3iTIhYwCJYxD
-EzPAuFihg9h0UxLmBqyJ85oVIDFksZkwqXWgxEUyLimApUdhTc2ElmDz4LULoxyYESZOTJoo8yiz
-MnRZk0cM9TsZLNllLGE6MiLNSVvcp+LR7yifCsGQopiYVLGBgdRjItpTg3KAxEYkTJHYVAiREkeT
-NkmCOTHnutaku/J8WdxEI7MaVoTZv7l9Dd3Nno5Hk6OGzyY8u7usKREIiMKZ5im+tYESgWKOFSxY
-n3Fz41PBs8XOeTpt226+Kq9qehVVSvRTHWsFV3UqynoyKesK5sY0bqbtGDkkCJE9JuT+hip6YFDQ
-UNhTMyNcMiCa3GNjEvFaPRGd3JjTVRSA2/MYlEgFyRkZDJe/o7GjJJ0CECBkmd9pKN8M0cnQjYcD
-HLOlSgWKiwKFEOh+Gh1kTO2VCFxgqgYokd9G6V8HJj+L5zJDTforqsk9FklWPNKVUbMVk3sTFBoq
-JVRUlBVSMVjGJiWIPtVjbq1yafMdFHuo5DF3wWXk8yRmBIJ4jQZIsK2Mk9e0QgciZQIk3AnAGEc3
-J+geBIxEYZCpoORUYqalTQlgTQcao5nI/IQsKTKBMX0ClxdSI8pJMbwJTlY2NDylCxPJyZCpFT5X
-ctt+NsqGV5ytlQ7VNqkqp0FHwVJN3iYer3tvDt2cOzs00wrSp4q5cmFjIyHI4MLcYdbCgxcXsHSZ
-MYiZp8MyAEDBchRShBywMKSDtJX7QaJHinpPmGNBQ3FJkwgblTDDFYGEgjiifOecuHhoTYqQICmw
-wMJlcsomdAOsk4pmaDHp0EqiFiBcxGE7WK5kCYnU44pEj4nIyEEsT0KGBUMyJPCLsJRGPowK0iRc
-nj2FimZuamOykTocjDY7wUm6nizZKrKxqY8nZyY2L68mIrGExVVKo8jdjRxhyVpUVSrJwqJMVJVF
-JSeV5qY+ls0qoopvhjmpWMVUk9grP6FzoObRSY9zAUinA/rGNDAIlUkPZKy9w5bEOAActjDt567u
-7m05vexHsWJwr2pJJjHJkXEQSIgiENxUQsKm2kTWG1jIxMVccWNmgM46OVeRqozXm4mQ5UyDUBMS
-QYCmQQARjEORAIEfAUmGxCgaFhKIVRRMzIoZFJkiammAR5gWKnBALChIUyQEXAiqaLaYpMgZTVXw
-iiMVPWdoyUJgwpI5lqKYEjIc5DR3GOCgGCJrYxaJFUdzJIgLngoR6FUH9MUjLyzZcZLDk6LLgZJg
-EHq8W/rWzwUe9yPB8zY7ibKf4mPcp0WdHm4NOrT+dGmOGRhTyY4PF2dDgwswbdBYIBFmRQMo9ihk
-QihhR9Q26nmk6vuburk4e9jm0JTs7O7GJit3owNlSpaqcL4U0rr7ejQ5rzf4vUyYNGA6GM5EUclH
-DCTwSWIiiST2LNNNlY0x3UxY0qMoe29XDZXk8oiBHQiiaJKwx9DNjNft1uzUmREJQe8xIOVFJO04
-Dm3kQEgjnge00JBkbWlGGtD3y3zxPPmc+87juU3c0HATnBhs2I8wiZlhhhhiBMIKm0gPiyGrMUFO
-l3BtfFTBS/Fh+oBPWerh1SufZNNGFYY+9sw2d2HpWz2dkThsi9PKPpY4erzX9795sn8Y/6CHyJE/
-z+KdqAptrPYlA8ZARX9P6FVVbhUTZYqZ0ZCMWSynx/cyN/l8/ZTQoYZwztkohE93o+fIP8p9R+9f
-iX+BfwKH+Jf1L/noysrKygysrKMrKysoMrKyjKysrP3np5HWaow3BEU+QU7hQzoU9VVXvgvmE/ZA
-huZh+43iH6rge7E/Y9Tz7+Xv0OD6o0T6RXdk2PYaCIlxSyiIsQLy/nP9smAkAph/Wo/90FCrwfQP
-QXsSj7G00lNLJP+/Wmg2ck/jDUSR5bOkk3bJCiTR0Sp91A09XtbzVPh6zJKB9y/G9P+jDuV/s/ex
-n3GQ5W5HT6j1QK2/DjkvpvtRl+8IbGfQ+w7Q887y5qsQ5fR/Lw8d5CNzm/F5tdYsj7CvxsLYWwtg
-UhSFIfYfvw5ydDL/SafvQn0Si9ujEdHUOK4WBH1SO07SO0fSC/WMKm/JiWtXlJJLW+oPgqr2W5EG
-gl0LGMrGtGhdDIah+yBQ1MEiAESqmpzfB0yl12AhvI5CgO8oOEgIciFU0ECqmuMUNiN4UN5XlBQo
-GxACbxvIplhCb0iR27cjRNiokckCdn9+iDRt/817aRIrLVLe2MdqfM5NLtlzbmSgp1dgy4RRMAiQ
-TGJ0VF3NEWJqVCTRI2Oyn/Q+r9PiIKBfBeTJEMREkJ7IHzE9eYZmO3bi/uk3l7IpconYjeXjbE4C
-NrVv/u0cW1BTEX9p/t9OwnTjWkmV0zCYq/7Ms/oZbte17U7lD/fRv9T0NDdfu1smzg/18P16fwb4
-FeIm5klBrEJ5sYFoyr8p1DdQZG+2+aztk2P9WYNZi8Kd7OVjLMsnVjJNYYOM6b1tE2Xzi5NLPp1/
-4URBn8XN/9fVunJP72ivmzH2vxgjmSJ/ngjwgjpBHlERSc0tkUOrEBzQhdFTgDgDmgJmVVVQApQA
-B8b2r95K3yvl7/1f3vyfv/w74fs4xRf9IIT1dR0QE6kBJEkUlCEUHkLERiHJ+10a2I5QYIfR+X29
-UI3Ukn8T9aubq02hDgh4OpzNCbLhmMv2BGAIaDc1oYHJFaPa4bvhEkm8CwiFP0uz973Pv+d7f7+J
-CINy2x+trR/b9w35k5wHtSMHxSLdZuxyCIwigfsY7Nc7aNf3aNBaIIC5uZ65msLUTJbrYULqwfbh
-u4bSHddsvZUhvHzRwcpy/nuueqelq5WoSOJI9KPrBokdrEYQsHxsENYNquavC7mijLirYF87W3qp
-rKUYvF2WW0obV2lPJpWV1oxZ9lMcmW6/8YIHSUl83MkFON1wV3e7/iWsIjbm1lQJQmSSvJAxHNOB
-5mPHlb9yjC+REAUcfnytmQOlE67uAlZ1KSXZbdjFdjfvRQjtRhOlMhuYmkf6dleJm1fNUvJzxf4G
-C56sQHv8/d17HdC73ZU7SeuATaROnTCN7y9qNia2oMYp4REZ1MGklBa0o+YIIhsbZbUstQkqtMEu
-7IkhcZQTOYjEREozLsw0oEUfZYvd5Ls7S6AgdyAIcw+wEC6dR0/3B4B74QT+WXZz6ve0OO+c1Icu
-Y52oIFW/R+37vP42QYC0pD79+4c8OpVQOYfP8e3ScSp3R5pT4z1QUISUTzqWQJSPA8kZcHlp5QQP
-EEDKnl8h5pkfSMeyKdXPnxQ5IREOidR2HYnb0Q7lKrV1YLOxVIiF5d2CCy7vTlCAq9wRp077NjM2
-fEhlG5GD96loKsrht5p4j2ICemoP8YISqgf5QkPuV2MNYaTS6k01J3HWRyCMzB9hsiht/YCYQ6EK
-5T8ynSaOtaYlzEzKuMxcTdt2166XeXecikOjkO4mtDuFxN01dWXby8eXYuMZm2mtYxmRtFNRpbME
-J4qmtMrRljuKnbqHTW9nbzu828mtDorldqu0O4QjLE53IQhCEeeXndeIruXE3bdt23btM6oQ63ak
-nXkleSdw61d1muW7WXK25DprrXXOlJO4RliPbvPPPV5eed1bcuK1zqsRdzrtdctzuEd20mMrq8Z9
-tf73i2T/ytphTSvVzTp0MzMZDVyx1uOtG6e9XeUvJ3FKVOzTTWYViyrlZSGq1Q0uWKjMwzMzZ0F/
-R0+n+RV5w/6iQPPJWKKSWyAILJ3MVNyJhRO76ZFmsRX9f7m7ssD/P0i9FiKf54EKVjJAWJjaz4J4
-XlBDzIUhVj0f+TzENAnhzBEylQHRIichNWDY4fycw/Jpq29REsiJpEpKRNbSSUlKiJkk1lWbIm2W
-yUkRESkvjNrXSU0laWzJtlrEyJSSUiJSZKS2pTLERN7u7613juTbaiPxXe6DRU1NewGbvUqL+0pt
-KSHeEG6whnHht0FhsbbGF9LkzdiUEG1tdUKT8UARagCCdHMQXLFXbrd7UR2XV8KQ6fhkR+NnaCOk
-Ebsfs/1e82bP/pHO7f9DlkmKipFURDkLjy/HlOKSFNxWdDFMPHxyjGcwe5Ne7nsSub9yqkXEyjxP
-dQ7NHy+pMgIJUI5PsXaGR7TkmTHp5OZ6PtEFQhRIqTJRIMbMlSIM1Y0USIzEQE95iI+Pz+fnWVHc
-ur7KJ0jv6V0a8XesVdnE9e3zxBtE6HIgQiLyeUdpDjjEQo9K6+yoY4MMtQke49xuBXQMbA2rIMg4
-JZIFWTTqnMk27ybQwhupZyb96EEalKKvw/DSQgmyhTgrFUKGgMKJbzganm6txOUEckbXea5eXJdc
-pLtvykRLBBUUYjxVbwODhnEMsjbMJMras2ZJtZkM49aisBPLziAIPpN6fBwqk3qI1GLsRgrCjITb
-kyIhKTCTEqKHnGLDhsDTMgwoFXFag8GkKyGSSRUdlEDHKIFZQZcxHiPSksrz0Y44SOJybxBERBrC
-XPVwdVxpZXZfPzYzqLpmNO0JZ1RpN42jUJ0qRDsuq6pN7C3xzBa59v6nTqvijfo5wRtIiQ0YgJ1I
-CbCI7GDUlUVBNE1pAGsMiIQ2NKRrVVbFujb29deM449PDOy1VUeffF81VSk1m0kmprKgo+atXYQY
-dStwGiKIHi23cgCEXExsMhQlCMLS3ornxBt6XacZpZwOMrztwS9rWaBpZZoIzulGkPODtyUqJKiJ
-Ydlh38ja0cC5Wgh1roiJQkr5rowjYrRNMICIzUjZ2ivWnyHyJ8lo8L2YmdoIjKm3MEDMkkOajrCb
-bbaoAhjEjWaUQnNw4VIIgQYmkSjh63a3ocGlzbDEZJ2XiY4RN7sKipW6NBFhBrje+NmZ4utzg4ru
-jszT9oiKhqQKUVeOE4OE4nje+mRhskMYNNRhTI2NzYS26JYQMSDujKU58xwzUykxceD4illBEqIO
-Me26rtBG/Rs8XSdaCrViRSQ2lXWeJIAAAAADGMYxgYGAAAAAAABjAAGMDGMYAAAxjGAMYxjGBgAY
-AA93xFZHrI3zOUbzxanv2HA11XU6PDlujpCd6wSWEHR5LyTkck5XjyXnkW0UuqRRFR1GRU2Uo5Fo
-aQm2RvC6lnKPuiJBGpApRV11TU1TWeN76IiPnIe1k16cMNrtDD2eys8arx1tZf0DrK09vb14eeB5
-56cUoNWj1688VlYqWWI1rWtqqyqtgw2DQmWtaHQpNtqCFBCSSVKqptt0pSTmUsiCAkiZqq32jq0H
-ZekIOFV8s5/Tz6dCnu+Fn0cvxz5nWRD592POTl9Wk4SSbkO7Raj7JN44/dT8f2e5cIZ+PX/m0qPJ
-o0fX49PqG/T8ZbvwN+KDavRvSQt2L9/m6E1Xu6vyZ0ZxeTH8024XrWePBydMVPTBdaruc1t7Fwrn
-L5/ibPSX4Kvdl7l/ydMCIqfNeRCCj9cNua90vJ+xjSvlZpZ+U8ynHR4xZvnjz7v5vJDsxiz1pzke
-jeXs9TVUymztRHG6IPdN6O9IdvedInpF+QY3H5LHDnln1QUbzbT08mr99g+NTayxy4bSkV7LeWTu
-Jz+I24Ja76F7erHl5fR7U3DDn/ra/lt58/h+jweXhxJNUWpLYpD3wR+lqLxTImNMkCkhQkaUsUka
-gioj4PKCNjVS7ZLVShR+ZsczLUwIYQDsiIhvIf2fMvqSjy8UqYs7+D8n69YShmgCEpLe2Mr5C/T7
-a9nxZ05Q1hBsZaQNhQ86/FXHxCtNImzbCi7NJQNqHJDriqoSAkJyBQMkZcAi3fGURi9MMyUrrV/j
-XLBcd/JQ1F7vdrtP1+nzyEd2QkpDII5saeWo8f2dOjec03OXPxi3SWaCIMiIh0cYPIrKeMb+CJob
-CBc1rkr33pI0ipVipUlgnEEYMFUpKlFKiKpVF5/n/xfX09XEE5VC2Jy0975Vr0+lydoI7g6AwCCY
-8kUI/UMyAIRABhKggWMDw9EdOI8vr09fQ3OPb1+cEO876QaEqIpiLXxteZw5+/2RNRAFHWFudaQC
-JRAYNDwYyUivXjPNvj81OfQej8u3jt4U6kOIQ+dEkNEPb7cSfP64+bwM6QRVrEQgAzJiEGiIhmmU
-oKVCSjkXn7cFA9JugOxts4ICggSMY5ejB8+Sxty6x0kQPNdrhhnD6PbT3m9Hkt3dsdeofwPDmagh
-mHI6hBCx2nQoUP9Knbb9HvcddO0yRX5pT2JFoSPNCH4Jd3/Ex3nZfu8kK5SWKKN9iiMseZ+DxRe7
-0+y+383frh0xjlo5yVl89+man0TLok+f1Nt5POnN2+FUwUEnt3TpfhQXc2lM2jCnKMq6jH4fr7/2
-fj/JHxH79Gvu62X1lnU+CBULlOQgd4Q2O0Ukewshwd6VEkVI/Ge7AdOowDJ749xgJ+4ihiOEQ3GD
-wA+BT2N30ur3HLZphSvYqT/SqNn73Y/53m+oifefYbVPlU5dhp5PyW66kVTt8M1qn6AQPSAHpESC
-otD6WyI2Ec+W3b121DeCV/Z/Xdda69Tt5weDy+keeMwAzAl6c9evPHl3FKO7lvXajh53eOeevPAJ
-jGZUAQTEGrO3LDDbDpR9zfAkR+BH41CcwSg+5EE7kXzeTS+NTRJ+NnOfPGHIcTNo5RITu0lMzNc/
-Hg3QREqghgT6wcRAKieJ5z4ByBoMc+Ow28wcGx1EzmWLBA7yRM9ZTqJImW2I8Yw0ulB7l0kpw2bV
-r45idfNkIpe+4iSIUPl8+ufLtfb/FiqngcHZ1kRnKdnt1ytntvaSrokL1YrtJ3yeB36OfK58yOrs
-VE6YXX3oC/T5Nc8jvSTUEbpyRFkI5UJa623Im0Pf7eXibdb3d5XcDpwLTUKWQBjJSgQBVAhERTli
-AmvDtNB1vRUMVDhkOWdN/DJ0bqW74uMbYwT9ym1FkkkgJyBQ56dQ0NAWsRMmJDrvjBP59hxrb/HB
-G0jUEVIjr35+u3udPLrb0/zr08iIADD9t0yhZ9YOzj6VG+cs0lrI40urkcDmOFBrNA0ssk0EZ3qj
-SHkp0hqPoo6Jxzk6tZdvD4PPTrv3dmx0pPts+MkqLzIOMxO+fDB8O7boweEdsbC6w1HS641b30MP
-9wg/Ew/ojqn0T8e483VsuR7nygQ7zhh0UdUfyMeQbt5naCAyCKgCC/zxcMIBXHH2fCUEBQUsyJQs
-HYeHZ3/AvhhrpnhrOh0gWPx4KK/8Y/Ng+iB/4Q5HEAmM/rkdliD/xHy9NjYPLJQV9eiRFZ0SSP74
-WQiwq1V9pD1fpfRH9aH5+SinKRIn+J9JD/Kvw2+Wd/sPmgfmQafb9mx7/sDow6IDkPCWnyw5xtVK
-AhuZjngsQ8uKYqfhPgJPc9TqmM6NJqJkCm+fsa1rHlibe7bSNrNt9tDfMitsyO0RH2wR1WQkn5Nz
-EReaIh9zBI07yXefZ9U+1jsBzuGITOC5r7xM6Qobse9N1U6ieA0/oAunauPiZkoAvkmHyHhAASSK
-FzfwgZxBEoKaIpTYZMOdi5A/EH3jB1mkaHyoiCx+fn/cfVq4UPwHnZIB2m0JROwkaDDnP0hA8eLE
-jc+9tSpgCD6ySUNhsqqX0jmF1JI/LTxuh9mt1dXVu8P5+elV3uPisJHhA+ObNIM6q4seW7NsdtYz
-MXvjKtlcmHma/IEQwiIs+RJJgVMmZJTU1LZIvHHlUVfHJiaYkRGAVuDoYjIkDYnhpWIoHiw5Q9Pe
-ZNFmnkUQTllOIkjyUowfO/dRR5IpkLljKzMKTnctVShjzbNZs669dM5YwjDFV30YR4xiTTd2GcsM
-m4wyYj7Ue863txicUj4Z92kjatVM6Pp6puTmztpp8V7OfZJ73OJ50nNVLxjDs4aCRHWtqCJMxnK5
-0xm+MZc8sTzuljhsMHJYxAsTaZxYwiHagUKFCBAkFsVLSqtpm2l5spqRrHPab7sZvvp6WPy8NNkE
-fMCkKgKgiyrr/hdvf80tLUzTNM0Y05222TGTG2TGTM0zTNG22NJZMzTTNM0zNNM0zTNMzTNM0zTN
-M00zNM0zTNM00zTM00zNNM0zTNM0zTM00zNNMzTNNMzRtkxjRkxkxtgAAA7l3Ouc5c5dw7tFpMlk
-xkzNGTOnWtbuToA7ly5y5y53DrncA0bZMzSWNZa21rGs91KpPZEeyCNQgm0EbwRu6unjqYbkIsEe
-bZnjP6X84ni/JydHsT2O7xbPV3ruu7vVvN3d8TOtr4ScQhQ74mvLzzHGYot879LWR0xiXfjDSrV4
-NNarJnSmpJBAqUi6kmCKc4i7IYhAiEq18onienu86+F5PZKWdtW9HfKrloVFEVRasd/f66QhhvPQ
-ToghIRNJsCXVKkyZI0WYQkLxJ7GdD5PkNmTtpgw+B7ECEYthur5m7/zq+DZPBYx36mkeDWebvMO7
-hezPRmpaYNegi102CjA3HScjZ2L0VAAAAAEgbZtkgEgAZkmYAFaulklKUk3YT3U0vPJ+gu7k/s+/
-xafm9HxJ9sQka4p+UcbvxNgEfS0OpYKLBiwlDkOTAQ8QQ24KvLEfTc+R7urZ7baMC7bVXFms3H8V
-SAuMR5tg8XYMGSLpDXwZI75tOB3Hgf6vHxT1bkkhhNZtNJNTWYjGtRR9ml1a/U1eKIiNYJk0JQGr
-S2k0UkT437Pft776TJZD+wpP3oGxIMT+h5+Amh+JD/CCNH9w5G5I8u8+Zp0dcm6uECje+31r9ApV
-Pafy+n0/N8XXRCAU86MB+c2CAp6AIDgo/CexJr2zk2kK5JRoJg8HJqPlYaLCiRSVD6iSesqEfsJn
-rHE9+ZDHb3fvilmExrCDKHsFPBRIhh/CeDBYxHsDPcYoZgyUfkLLP4BP6W7H63Dh6q8GnBzcmzdd
-lUppdG7Y2bNKYqtlYwp064x8WPoVzOCNDPIOjyMFnPBooyINAgZJ+oswbP1s+cUuQJmYxUc6wsOT
-gxgXMCJiQIERiHX7xsnNTZzdmNHN/zvF5N1c27h2YriqkZmxIuQFPmKjnClS0CRMkKRIEDEkMdaJ
-M5LOvukMpX7WPp2E7sYd9MyvWrxft7h81XOnJSNOF4ncLhYJcE1K3ipQiR+8iEB0Pc+dwQaorXBB
-h1BCFUZjCMvURsOyfCekt1ldhUE7SYxXo6HVoxizH0N2NKteXNX0PTu+t+HSf0MChY7L1MiI0XT+
-EYcxIuqYH0PEXHYaK8GJQc6DMtGNp6uVkNSHlREJx3ATbV5JcbwLG5UY2IjEJExggZGIkiRAoORg
-SJfb7DEsEiZRisdTwaPinDhXvVOGngrg5qnNuYR7xGJMhZgkRkk4NGTRZgk9SjJRg+R8xcckHapq
-TKBjJRS8hhuCIORJm5kKRPgM0M2cGRHcoJ8iTAhmRmCiRHyKCijo6MEmTBYzQmMRQgR9JycCMAUR
-gvJooEYJ+GKMHmSf0SjBzIihmRH0FwekWWqrJWK/Dwzf9DWuZyn2p+tRMg+z/hP30C1W3UPUfYHe
-WEsfq+f/l/F9U6fn+/6q1rWta1rWta1rWta1rWta0CoqRSSOWnCZcPR9+YWRDVQQsZsiObDIi98e
-Lq5RD7oI+2R+DUAy2fg01X5V+iNRBxBHm5n0/bvJDnUfPtkjpIN0sH6osLUfQrreSjUn/FXeoqem
-wSgR82PtU9eLquxyqTg9FBjc2I/eRHeokANejdqBHJPG5CqmkLNzzdks1PbFbnkrC6lnKPdESCNS
-BSirjinI705TxvcxIAWAUP870gjItjxoPT23+fUibyImDEEdP3nHTZE+s2mSPpc5ITItOkuk/Fge
-nne2OnV1v63DrLIZKGSKgHpRLgyEFSikUU7ZiYjbTgoeUKKUA/y+I8zHB0IcoO6Bfqk6SMh0DppR
-6zyNneBClUqyT+rT2jzk9fLxvsnse/eHk/rDyR7fjBGDpY86i085fWj3eb17zYcknNfeVvdvPmzH
-Fm+F7cHfXx1xwYpT4y9529enf1B2CBBRQQE0DOPFdK4+OOua1dT3lY+lG78d87NHNOxCRFXw0xqq
-9PLaRSgupbYkCAhVQA7OwoiQc66URuHV1IVMe3z9Wkg7e280/SoMCIiHVE6zmo1W/pVb586zA5Cd
-fdsFEs/DWrnASJ8ntdEwlnNhnEAClRgDWZ8Y6GKhii7xDqDx+BjuO1E7CR0OZI5s6wLiAIoNwHYN
-snK4Q4OnmdI+EJduABuQuoShKUoShKTqlXQ+kfV8skYHXuC/AlEzrYJX24Dr3liy2ZGWJcmCYydX
-B9x+r0HcvNTmSHNnwg1Jpo8MRAOo9+Ae8gfjIPmkbp8vfcNvlhtvbaY2ELrFwAyVyCUVDrZVXOo7
-T4nLuP7FuFR5JKp2wGEB0ZXIGhKTr7rbsH5VO7QTM9QoVRACpS1RcOzB9Ktf0RayRPtJzkTb8/I2
-weXtPsI7xfpJE8wxMnSEpQe6WkQ+bvxGPZgHDJxCUieAIfWc4XCHlsN7Ez6H976G0g3pItTpLxZB
-2UbuuPWPJkdkI/UrA5Qebm2JPmukp8JB+j192k5SpyjlKcp98FCcQ+iHp020nSVOkdJTpPSChOIe
-kfGPN3AHscTB0sSNVHzSecTYq6E5KPxh6ATCRSPXGIQCo/PCm6ijwenFVTAlRN4VQwhBCIEDpCIR
-PAgV8XgIGGOt8qcXVXOePZ3ohwKdgbuhgckIKgn8giIJgcH+n9YqipLIj5ngUzFMdRTE/pvRD9gI
-yohx5OR2kkAT8RfQ1M+nTWHvbYlDrJAyqPID/vM0QbQ6JbFv6b9l8V7A1gFhNTErA0Byw2RL4DUR
-cmRKyCM6OYiP3w1RGRGoNLmtJoUC8I2jKVk/rTfaRbDgeMGBikJJg2FyIegyMi4lwRFdRMCyaJyZ
-fSiSiJY0kmVSpWEKlj+cOs/0fQqKpyRnFUcc6Ge6IXMuBigCH2n7z9n4v2/r/cijigWt+IFHDkcj
-d/fttf3DA+QjVU5MNSdajlUf1VJsOFf8GoYNIiIpKUom6yHjjUQRBIHJfz/1/p/bg/7Iw/S98P4f
-e/k/XObf0Y/r/qh/W1J9f6Xl8lNs3f/N/k/u/m+6u0pH8ext2oAIdwIgneH3iVGlCx+a60mQfX+O
-SRwSJfp1gfiAhYjGdZqqmIB/X+4ZEEVxg4xYVgRGTg8W6q5tua3m2XP5PwU5n6kxGIkmWEf7n9D9
-HacI4oU6CaieH6mz9Kzq8eX179nBH+l4HNWLqdZIu0Edp6Hbt2/UcSySWkWkf6nOPITfjg6x6L2E
-po/Q+O02bOKwPcJY2r/w6ZtU5JEzP+6lutfD2CKwgwiM+cm0akm1SOfjnGJuIajX9g9w4jda3z6/
-9LjlEibeXz09XkxTFe1SHwTbUnzL/zX0cGYQhgAK9vdqtOvsfP8+nDZsqtz3i2QVDIFJTEq5ENqw
-7QiCTQUjHf9Bybc32UDr+Xj+uDJXwpjUM956bmodwiCN2J3BsOAmc9HllSND+e1SkpddMYwImE4O
-iku3fV+fX2QZhCEABvs+PlX4F+jO/PXoxdV0328zgOxCP5iYkUI3vFEBguYQEXd1CoyBHHlOb9Ea
-/MRjrPi5UQAjurVzVcdo5zjmYyWSYWogDXNmsxAWMOuOxD9JSSiaioqKqqqg6+vt46+rNtAJtnRO
-RtBiTEuBkJfzk1U2XPPIvoRvBxvBu/CZvqIB2YcyOV5QKNC04kubF50W3ytdX2RAmXKxHDp5nzlT
-NRUVFVRFR508BduDu7zrmSImnYbKOavx2f7szd3qLzsIgjFDo9eTW1gCLNf1LOKMxnd0TXUQBcKI
-BetlQizp6Hqys8Syj2eUUG9ZqeF0MxHscErrrmjBvGMY1GaRfckb1xL+2zoIDFXRiuOTHIEH+OHW
-pj7WO9JbY6KZ2AgRPMQBIXzyq0nQQPEJXo7mtZvptuuwb4swcW6cudJzEAtW6siEEQRjNYiAKoVY
-zzER9QdCDer3mqquQsYTGKjIUpSlCMYxj+0vhMqcXP8X5/1Ih4CnkVBHe3Td+LrtwkhscZP9dqkk
-b6wtkI2rHHV+RsQ/t7skQOVIcNMREmVKxgknLXt11unLMsSrEJO+YgZaxsaqyiAVa7xGVkjdpSby
-SvNpKPLNU9ggJT806LyZ23OiEc8IP64F9lmoQfof8jHo9IAjAgaGJ6EM0hCrZhNXniq5wTMTgoCl
-AO9yXt2q15POtWu4AAAAAAAAAAAAAAAAAA67gA+PcAAAHu7cY+jr318p8fb5e97uir5Fxa/6a5aY
-B51vNYnPEIxRVJrjRfDZonG2pH+jZy1yaSDChlT00MKkpVWleTzzUr2r7RCjls7UWxOSyaK7Xwrf
-aY7WIzd4ab6xJ4SaRNjNs3s0i0OSmbk34QgjUpRV43pOYYbsgidG2HqsN9Z7IcyHtO0NtriXyhjT
-z66I5IDIO8TnrORwZjIs2CA2woPLIZ5KFRVhpj5Y2annU714cu2z+/dvXVTm+bnCIPJSVUTZ9h2H
-9Gj6z0ICT6FT6z6Dzfe0fL+HmlS5NE5IxyRP1CnQyQIHcedQdDxwZEOA34Y7cmpZvgzATs0REIH4
-kBNgEuh9pc/LY5Dh2AoMafKfyEsfD2hNEQETynlO45AJqp2fSTD+LwER1ERFVxRu//SfQH9oqfR7
-hz/YUgfvIGB7j+gcZxxyYjG6ZwGj+6aME8RsX9XgyUbLLJNGygQohHJdq/bZ/cpLUJhCiGRVFqFK
-QtgLHJv22T/a2dHqry5xu4w6IknyhHZ1eXDgypyrnXRVVPFz4z/2V1yjKM0uoJmKkBQQHARq3hoS
-NomxcchQ5k0JGyjKO+SxCieCu5wSaLMYMmQ3S9Cqio5LJIZJIw+p7tYOZDHIIZJoOjJWjXRgnfJ3
-IIIioIgg5KOzO4hjNGzgWaJs6x0dG0PsyRYGWaJKNmdmaNGyjv3GldWDMvcgWMYGJEgNjCpARADC
-zIiICbkLDzpBlhGLDksEOaxCc3Rz0kN2MkkR+pXV2xEYsgmykOqREYElFIkEMJD2/P7fd+i+bWfc
-H6iPkGP5yPz8LXGlg3+tZiNlP9uCJLzMr9sy6iQzlzW6P7dGI7cfu+zr34N7t5Ym094f55QHKmU4
-gOXLOVuAFzxQVwecWAmVJSlMqxbIaNFbaxRtLNJsrLVFKRasstqMbakZSqChaFoZqG3POfdCiD/q
-PALaaua5G7fHhT6MckQh+GDVaZGiiqiQjSWFoWsa9EUoJ3q5rz3OVqq1zfCGtoBHHCfC5QXcxVWa
-Kot5NCAWlaJckyDFi5MsczmcyJUKDo7gXw6uuuE4eDZ4NODh3VpVbGORQsTHIIlyoxEU+pPr9327
-QhCEKFzETE2TE6xTBR73LYZpEJLKRKUohJiwlNhi1yDgpuKHYoo13LGURKPaxeZIyiSyOqhL6TBX
-vJOUeaHDHz+WOS9mJlTd3a93ernpxNXVZLhDTalJKlrclCwIXWJHNeK1PY4rpHvZp5IQRqUoq9OK
-TnMJKxsnCjVhQpEQxrPYOIXy3MXqYFdBQEFFcYo4ggWS9N7kEifi/Rg51YcjRZv000KBR/Athkpk
-IDr2qzheOVMFKDIP5gf8CFPXWx/jIfI6P5PFJ+5J/Yc4EMdNM8DRbyZCCofnQBP4w1QBOXu3PV9K
-KH6Q+r79j8Xg3w7fCC/jFE/WGB1iYh7u0ZP9f1qxJEkyfAofL+4/uIB0g9JMNHkCj5gHo8H6B2Uf
-9pT/tmTKe9ORRkTR1Yf+g1JZHwf9hMkeBPaTCkpU5G/8DLLfjWkmyF8zU/39jt/6jxj/pd1V4GFN
-GcE805YqrOrDvOUiD/sPSdoMxVWyr6vE6lc56MGIz2G7Gg0UaaNjg/7R3N27kG4cl6hwNA+cztGQ
-IhaVGD/OLZHirwxjtPY7NgouKdp7pomk9I82hzN4Swnc5wnIlf8auDdCck/dIOPZ1hOB0OT6vlho
-fZPDx5CiOz/xDxO4EzzL1Cne/8iA9BE0h5DATMlAVJTcw9XuPE9iHq7zzU7mMYeLgkTeSxIafE7J
-0PZ1SHc7rITVkNKYVIx4wJ7E5ppyPKSYsqiIwMCMKMDgcFx4Ue5eS8x7XQP/YK80T53kh0PYdCHd
-Y0/8s5GxsQ8fuSVP5ACD88H3H+v8pFjmFEYGOfmcXUNo1BH8YI1BGQRkEZBGo8np/V+TTH2NI2PJ
-P+5+KfVOYNJk0fNqE4SR+R2fv2Qm0c5G2jnCT7HZwqilHNwZC8OENE2fh+E02hQ3Mh8IcnE/7Ocm
-k1fcZ+u66pUk1Uda7PJ9bHdTdvN27HtbsVpw4Vskb0/V7sTdPBiq5nJFaadDUjH8Qh5EPSR71VVt
-fjDo00rFY5Q2RiSPE2ZCVO/dbGxsfU3TY0aPB3K0fYUcQ6+MMcxw5FVh/JX6jwRIpVGI9qPQcGP9
-pDp1oNCutYLYT5vwRw7o7bloFLeg/9dzaMfn3TsO7hVdf9a3tcq3/ozrNf3EBjGGGjQhEh80hdo+
-LvQpQAlGCIySMQ82Z1yWvOaa1a06to6Y2ew2o9ojSp9x7h6FRHCpDglVFJQHsQeA2UHYSSVPLlz2
-+T+nHkHsg/E3SqWpMT9JieBsx3PV2fzfd+on5tlfcfQqClSrENg2Pdfi3/RBHKCP0QRkhFgjII3T
-9UfJYrm5aNvvwRhJfYkdhUv8GR61EHn+5QR6zqxO4BxIn+hfPzx06YnN6My2xqp+lX7t0SPg+D4P
-i0r9LGPhRMsLUV8sjKsWc8YlV1fQ20nJuY6MZxLkqLdl7fxeJpPqNBCxSHeJ0n2qgKqpYRPZkR1c
-KpSzpKxk2jE01hX5/wZXuboPI6iqnV1VVUrZPxR49OlmXPz5k3ybV+fMmsv5+7E95TV9iR2O5I3K
-UWRUqKT8RtT0dY5JsOQ8kNRP7LIeth+2kt+dzYTSyFUFvRjJJ8EVA3blfy/Mnitrwjfoe/nw8Nmn
-71VSHUqczcpgUeR0TVVE3YVVUqqrJMYlVVVVVWOk8Z2cnJUfpkrg5u7eR1mp/7Pdwbn1TyToVFPN
-LMPnFibmpow0beg3SdtzcbxxJ2PAqfrd8P7k/S2aqn5A4M9baWrChRGjTMBUMMD1XBBI8iRE0Sfc
-JB9yQzCYZlHeiePpx8IQdDcP6D3G0ByB/zkDwHJkhpCpQc8xUkLNGMGYMo0SsiStLlWfHhi/BlQh
-yT+6BaKMnMAAfli+wuKxrxkwSIMnYRIZMh0I78nRRZZ4LMWccmDYeNRshydjLEuE3KEuO02tOzED
-K/kqeDs1kwVrEVK33L0PJBHXZ6X8njCJxr0nsSWdDoTE7Jy0aN4YSMJFf1kxH8CToebWTlZNKnlN
-bB0KxufU6Jo4TDImx2H8nJ3Sjd+AqqUqpUYFiLDEwqbmpy9D1akPjAOaHq+LeSaPUHSAcngfB+R0
-fOxibyH4Dd7UFXff4s0j0NwTudnod5HZ4HvRimItkmELALIYOrv+KTrIczpyT2oslKKklnCVZVx1
-K/K4Y0qxjTGimjGDPBOwJ6p4QnvDyHmSc5JHskd+53VSnSJXdyHKaJ4jT5zZsUmjiPzJCceUpcHR
-p8uq48j5uTJtdmcPVjZscmnsbtPRvzvURTDELJSVYnNUuWYk5sbaVnJ0dGjGzo0lVjdyYVzc0JyU
-TG0y2SNFkdakm1QtGmbYlTwc0tOsJY5w1G4SyHqaPiqbHOTnXV3Y75WU0xpNG51eaaDqm7Elclmf
-Mcm7ccxo7pVcMMSqr4PaVVVVVVVVe6SO0+L5TZNjdiqmE5GYjXkVpVFKpSqaTGNoQ5qVKk3PGR7m
-jyRXpCmSUxg4L6HqYROfBxJvxi7ym6iqhq3aplha9izeOBzROQ2cFWPM+Bz0ORtOxkhybpTc7Ddh
-uN5LE6/A51wpXQm0jo5uHaTW2bLK02VlVZFVwczoaHI1JhU3Tc+CdjiHE3cGm2hjR7ynQpuqbk1w
-PHY8pP4D+Y/FGkZIRU/dWv7fYBZYDYBwAAL6H6Tg/M/pJNjSE1p5eyb7MOWj3oCd/eQPtIuH+H2j
-2KqntYyVimUUqqoqz7YV9+h9r9HjJ9y+EnKeGzA/X9EPobR9BZFWey46dO1v8Nxu2U3rUPdXifkY
-dFcVTFTJExiVWcpqHhEbQnmxVWlN5PYeBiToqTgk5b6GNmEm0pOWzRo9jlN0w4YVyKxKmjhysSR2
-/XPrsfP/mH0BTiHwnmmR8//HyNE/lYfqsT7gr/HYkO9ESkV+9A90H8T889rSX7m2tW0tkjIfO+J8
-HRVVSlRJK31uukuzpJJXddJJKqpVfYbp+s+iOY/Sc1IdGpDkVHVPuOOSOTudkIfRYTbe/zNZ9+NN
-a222nByDtJ2WlnMk8nJiHPP2mhs0w2WxzxIxuqoloLVwopIS5m/hlhahJJAhQmORmCSUlIhDhw8l
-yMEkkkWezzGCTbu3HsvLvDeeNvY16tr2sZdXFZl41nWeLuxislx5U1B4rf1Sp04OTQm5CmQfhGBN
-n9gdBEO4g6kBJ7yNMOa/BHzRSVRbB7UjfbfwPwP0lVVVKqqqyGYMiHxUxLHqqYm02hPnx+R1eDrh
-H9fM9h+6HN1SpLDrD9Ukweoo/xp3dmjqczZswxiqVVUqsNnkn8piTzSDsWE4hwNJHSToqG7FiqbG
-6q87GybbdLpXbb5XSSSSSSXM1I5nJNEo5Jv+SfiGI/Sp+hTfj8r1Yr8r1e1w14fXJ6Jsffyclgjc
-qTZOZU4LCflPY2QeE9XudCGyWTlVUqpbij8idhy6/f8WTr2R2THDwP1NiD8HYaiTC+pZA8ozU9IT
-TaIbrTqdXVuJqp0TkhMSG5/6m5jhiLKExiqqmSc5UniUZD9jwVWEUi1o8To8cK9r2K2aa42P0SRX
-1H5ZtOh4vFhpI00qqrTGIqqo+19v5sbxDabq5x8k5m48XZVKWpKqWWpSkk0ai2WlRa19W05HiTwN
-zJpHQ3iD5VElSyQnzOsRh/KHY8beTojwnxhNHL2wnSE4NkKngclTykcDdbVVNBwdw9sxwHZ3oqp8
-wBL+iUH+L/EiohgfaH6T6NGmLkAbbVGyH1BsqJibSH5xDVUygEAA+Pyr7d7X7Ct9q62uvwV92/WQ
-/JIg9sPlPgcoN9SmWSnMcfB8zMPi00x2yZZlD79N2q2uT5JhG9km5Vbb6iRrdhjgxuab1VW5clsu
-NtlrVY/a0eEnzyew/J+WE8kNJsqV7XkqqqqqreR5SGmnJ1z8fJPMf06/ZeB42SWTnZg/MuroyzLX
-kUw8jwgHxbHoWByldEujRkclT2MPRtU2kqmhhtNDUtRc9ZJ2e13iT9/yxDwe24ZL6p1JTT9ibGiw
-OQbHX9mBgchYOufMbMVhY6Tn8Pjb7zzaafLTodYTwPRYnwsTkVJOPcmJ4huoePeRQ9Pbg3knCOiq
-plS9mjoyIWSqWLHYkTc9zdh7JHiaTRz95bDWNGwsm21aNJTbRo0U0lSp5aNGzB5GSYVsuD0Y5Xjy
-kk+kKfW/me9+9p/DeRD6egX70n8wf4QdoNSszMuXLcuMRzpwu7ogjnOXCOtvu6wHI9iubxeQ+uPa
-3Er5j6Wk+cfNGwktjYwNCoeTYEKwepR3NyIiNZO40xSq0OZ85ST7ZHgdBQ7KR815A+fvOhViqTpA
-OsJxCL/veWc3VN5PNTTQfQfrLEqWSKoVVWRRVWSPKNzDRQ7FYqopyQep+o6SMJ4Nolc0mSR1piGx
-gTR9zsPpkSJBzGEJFMAsIwMF2BcyQfG/ASj5I/h/rP1/61lnk4++K9i2yPslgaSnsIUsCpP7Ygqe
-2/hIsf+nmviD6whSkPCBMIIg8r7Ms+R9Y47C/KYKS+h9yn0rvbUY8Gsakc0rapFqfWdBIwdpyDRJ
-FHzmGNESlQQkasw060RA2gYdCmoIaalQwVWFOs2mhUqba1JViLJGwJh0hLIaUspE0VK3MF6w2Tgd
-BKltImoWB6AiPiDKvQQVstztDSJqg2DkPCchWebEkRMkREJYdB6ERBBPBgaRNmyRqEponA2JpotU
-MSzaEpDKSQ6RIjgxsaQ3NSTUJg3TTerkjKSrDYo5GpiYLBowyOCkMK0bHCxs/D9yyfiz6jUESAk9
-kCYKKmvrivedQUcJp2qDA9t6gnoAQKL+5UGRVeZ0MWI/pgGSBUJI9ahNEiR5x6SFJ9iqB6PyHz6R
-dBA0GjfFSgU9j+Qm4+cqqrIPfC5EGixPzn01ygGYyCTCbH5G0j9RSeOxzOkkdo4pO6djqbFP3sTe
-cN06OEQ6bD6YoG0js9r+FUxO4f1vzAc9JyQO4Q69CmiWQsI6KmzyO4eOjsdBUfi8VVVVXey/pZtJ
-G8OIT0205m0/k4YoeB2TabEx6RMK6JHkbJDYdJ1q+blCZrPZpsdS1IpbBoskTiSbl4I6JE6Qnij2
-/1u357/HdHq+dsT4fwk3G7ZnDJen72x+g8HzvKHlJD2I90nzobDCe8v3A+3yn1fakSQx/PT1b5Vk
-/H+pzv3PJ+p2rGiWWvZJPbD7XtGH8RPF4NH6zkaPVNpGQlPVUm9iYqGsZt/LM/9uTc1X5dLp9DVK
-kPs+tatcGjux9Kfitt8Ew/GQYjBwcOFVVVXA0/YYTdwF9AkG5IninT0hp6PQepeDCF8fRkke69Bl
-V9UJ+Ox1IdkckTqdR2d0yRNCyez2f3acOGGMkycRzUVT7SxPUTzI4hPkj3rJRUVRKksSlibSR2bH
-y+WfJ3N/lkjbUNSMzGkl6u58x4nvjRMNimw1JU9en6p0/kD7SkHg3ffH/K+P3z9u9lDrL/PKhzU2
-liI/mup8/m1KqU4jMZ7p9PbznJyVTJMYqlsqqr6IOZtsux/gWQ3N6qq+dTCyiskrMkTOcJo0qRpV
-q3mYfQknwQs/e5H7Zkk0PnhMQnNP3wk2MkScFiHJ1Nk0mjUqEyE2I42ZKeX8vJv88fSeJI2ex6MV
-13DOngjhoqqptDZvwGRtl7hseRClknJscRXIc5Ob9rR+16PMjsJHI0D2GjZZKtVGyH8E8RzTebzQ
-9QpFaJkk0WRKRpsD9TmPTQ9CeyPUjwhg5wnWOsJkhMJzipY8FSYVUrFTaDUTZHdjYTEYs8z0Clep
-VVXKE3TaNl3ThNmInMjtB7Pd8eccOtRViWVZApSS8Ac2cCXAZ5mOg0mBGoMhSJVfuUmDcom9NFEK
-U7Cf+F2tXy/Fqv1Fa/T/pYQIEQCSu78vLzEcIH5TA84B2yhSzILCg/f+0/eZ86SSj6Ej0bfzSBLk
-aEsiGJCPnKKIcH9EQUWV+hVQojJUmBGCTZkyUYJODkdXNjFOT4OvRpdmPkYfR4Tr0mG1bJkwawaK
-UCbR89liEUI7zGMXIEF62HFm4UqfkQZOu1CciDgkO6OCE3auiiURGizIwYuyMIxWJcdyiRGTwdGS
-yO4jgwSUGDg2UFCDZs7jNFkmAQwSqnV2MOYzCDtWlT9Dfdz2ZOspiXIKVTSMIzXONpo0EQS4qAiU
-VBLlWMUT7u75hBtsv3eHtE9x7ow97hPYfYb1Jw+74w9kJ9zoqpwhPcnY40bt34Q+Ds+Cp7n11HN9
-feR3TmU5nnO3on5P2PJsqlVVVVVwenkPJ2TvKiqovJyaR4vnKlVs2ernpoqqq2qbDGSZEK8JHNVP
-LIT0WO/gMhUe1L/t1oZjK1jlEOkPSTdH8ypDc7DDd21JsV3lVVVtJqG+J2xwZhNJw4ZDRUe3T6eu
-fRuRlhMsMe5knRY6Nn+5qT3POeJ1jjiaBwJ5pbnNoB0KhwIyidEUIsmeZwJ+gvo1av5PkyIQMCQ9
-aq9hQmxUP1vo/c/ExtP4vzFTlB9WyRH6HeYfXL/YRRNJhTFh/dUP8nXCSZcsjVCarVRqxGz+2No/
-0xEaOn8rh9knxRT32TYfsgyP3tFT41CBJhlh77s/h+Af1kA8wnpIPvbMfobNMHCtn3tnG5Z+HGtD
-OGmFsmzZuoCLDKjjMwFqdpzM/3Th7wciKR+sWuTAGzQxCCRshkFFmRkkRbjBhpRe+fI1vpxwSJqE
-5SR+D3P+o/QaaT4HU6xDpJZx/kfaw/GsXnhcXWBvE4kI/gmIx70p4PEw0eDd6SPeno4xik5TYpT5
-SJkag5zsJyCn5YgwJ2LIR7kTB1TTRK+SvFQ+dRNKiVYe1+og7QmkO7DE2TnJJtHV4DmHCeaI3ZJE
-0OePmVVpYoiwbG45ip8ESTmnKE/enUeh7XvYaOf1B4JI5J8aUXqnESHwSTnPApiKOzrEnwKdwycc
-3sbwyTLbVWLKayDV16IKbJWSbvKEreE4ToOjoydHiT0/znMh2TdOndh8DTR76jzE6HkY0UO3Fs5J
-NG7N1ScymhsODJOJb10nA5zkacq2KbwDziDDc3MTlGYbyFTJo6bnPa0fnDyfrkS/e/o/Cfr/K/1m
-fsfisQ1r9vKrbUoESykpoRERH0W+Vqk90fjkEoyFG/qsGgV7wSPmkxAPeGEEQh+Yx0+XH87fgzkb
-70/xLOnP7Pd/l/V/Jcwng6qtqUplKs3/XC0Kuyr7tG+tv1xbqUYiiCCJxQ3ci1gfCZwrrBS2HGN7
-lLNRYXWO9G333344phOc50xWXCmTthi+6lMsMMKkaRjGOm29s2iOpXZmzgLDXDDDG9q1YUY0w1fD
-iDynwo45AerzzWUs7vw9Xq2F7PeTMM94OY6aaQlhhSyqqw0lnpm5KeajkcyI72pnPfTTS/EuOLvg
-suOM4x34mEDLLLTTG2OOmULrmuutX10Namw7qtoKYWd9ttttpZZbXY2ta1o1KtdR9m44bPjbcpaT
-uzLC2usox3sxSJszRnZ50xwgT4z0rHjTjjh8RdGOFKOyws+9a1helXnk2sN1L3vem+FsBVhq9sMn
-33jvbPfTTS165vuqOQN3u7PxvJygzBk8nRVcbFrZxTWRQUem7LaEpcKbbbbVrtbBV4a2G78aR2rn
-vpppa9cn3VHIG73YkRbXbXeJSYqx3eFm2WVpytZs889dbxjGOk5bri7bxbTeIw8NCebCEMsssspi
-EkiRIkS6FVNpvhB8yAmOrEcEIEnFN8ZZhq0XRVcbRtd4pvIsijrfRzKJcdzSC51d8t999ZY5WU2r
-WtY0o1lfZt92y312KWk7sy7xN4kR3VcIKbWd9dddd5ZZcXY4ta1o1KtdR+G44bPjbcpaTuzLxE4i
-RHdVwgptZ311114lllxdji1rWjUq11H4bjhs+NtylpO7Mv+R/JVVVVVVZA+RjDb15/Dn232vl139
-vSE69OfPnzuUW7LjOc9pyajzWCrDjN+G5y5q8dR97DwIjuZwXXZ311112ltlZTeta1jSjWV9W13b
-LfXYpaTuzLvE3iRHcwgu1nfXXXXeWWVlN61rWNKNZX3bfdst9dilpO7MvMOZ7APUoIgh8IfEgHyC
-e+Ie0N/vgo4RKsbhsh+YMGF/Cg/uP1qfxjw1I/jMdTg7wflebZzP3yTs/mDIp/QR+pyrSeg5nB3R
-QxDsxIn0hzep1IPciuL47CPedgRhURrdOFDmg0jJI08TccnmTlEhyRKVEdzc/b+mJg7Kf2q9lTXl
-OqOx7pZPgfyQrhyPF04R5Rp0ROcjhuWdHRHjsnp9Ak+dRD/bbzQ0IajFjyRMT+PNJ8Op/5qec4Ii
-IiIiJR9Qdo+wRDydolJ9Xv/s2ZZ7wnVwdbIeNhzvu9F4SqL2WP2iP40lQ7gD4FFEQwtpSMkk0yIi
-lBDydEiuzFVVVWiT2hYgfAeKMJynZMJSVOD+l5eE8b/W+x9ixPlCaahNVZJ8LXs1CadZBD3EsSHi
-j7JI+mcJ8Aw9DROws2aNyDoSTgqfUpX3EyPAaTJTmw7RIsnh5ENT/P2If738aW2ltX0sEcp+g5H/
-jMlNs/x5/3hDdIf1wiokc1fw5W6ai/z/zu/8l+X1VZvlX3O/1qN8UZYxd1msFre/14Qu1qta/y4H
-uigOv7u7weI8Dma1Gs/CyqJ6P9i8aX8zf8D/J8mz8Ccfq/x+DD0Ptu+lCKAEIyX5BjqgjQQ/iEQE
-/tBEQPRURkE6aYerd/1EOEiwiyEagm0EsR4HLju/ua69rHk5cPvcYO73OWcFTz9RsflYgebtZEEB
-V/12+3nBCSAIbx3DqMp4/2LfwN+c8Z25r/OKu3+oEPGBC26Wp6FrvxNGYuvTlu36PDf12SQvp1Ia
-EOtIf793ev6PpVDtmapQiYpgnrYEJ8p+r6/r1/RXuq+gMTq6CG/Pjd0vPpcjaxyIfKFIc+e+7neX
-O5G1NP/ldgdyDYiNRgLBGgUSNJ1SJ2ZZQG5EGYAgpk/eQEPfN4nZxX3o0zT++ConWtJe3pSc5gBI
-AIAgOD75HiB9wekaXUTVJIMgL0iDII6ENREikKD142oSN4I1AZYMgioZEQ29UGLGnpUWpGEGoJyI
-anrUhzkTYhsQsgbVCOclgiyQJVJlRdAh5zvLEBNlUA2BUk5kIqRohf9nMgyQjn0kRMggwRAwg2RG
-aKn1eZ2c17I0zL6gqJ1rSXt7c+XJSFYQ7yJpJe8kkR0IsCqQxHklkf1tkJyRykQWQgmCvUCuDTn6
-U/vTw/tD9gn8Aj+Uf4h9yERf42DDmbwfzmERoP6j5/5g2XamUIlhW/U007lRkS2SuiKcp0O6VyeE
-5BUiCkw/KLb8tKO7vDkaZAfLgWCrAkEXBVVQUzRGtkVEDJJB+ZcxUQEpcG2c0iLayKxCYtg4D+W8
-KYshwmvOPMe5DgP/HDz8uniuDDu5HWJUkh/MRydqRO0xBAgyjImvFvf6dqB6dzvHnlvXrr0RHOie
-SY4c+myG0RExrHDNzWm6psXCovASdGSzY2sUUMosuJQHMRSBMJglonP2JjmMMc3ZtJW8kU9g5Pwc
-m6lLFw9R12uXU0FOZuQYYcjC4cHAwKMQHpTZu8FKpSjy9hXCaR7VPJo0ZEIwFgwz7Fr43ea8YlWW
-DCNQdRFCx1GTkNGSzYSWMsLNhsiMgwkNR8Y4If5pvOr4vi6Feqe8w0c57J5ukkcD4zHq7AeAx6HG
-PBB7gLwVeo2oKqpmSfZ0+Lqii+XuPTnp6Hk6urFYaMJ6FcdvdjLZWXFwzKuVVVl8zY9x1/R5DZ7W
-MVjBK6vaqqpwxj71XlNz1i86jMiMrNzNEWCje70tq2ycjl2OcnvaVTY5FMjmU5mvUbHDSlcnuSpw
-c3V3506m/En8zG5pxfZmjTaPNXg0xMaVpie07NHuFQR4kKQ9oxMOrqOG6t3kw0xjTsPbT3HKejod
-jeR7Hmw6K6vBkSri7NmJurs6yuU5WptHRSlqoerBuNMVXGCnCdObmm5zxyk4iwf3+s4k1t8zRydl
-UrHR0/5WnIrof3f3dJ2czkaOSeKdVV7CHvbHNXdVV6lPc8vitt7m1qpUpyMmJ7Vm54nvbp1hp9Du
-81dYOFPhYhkdKi04cqvfbtO8Zprb0jka5pMOxTtNjBs3VYxBwRw5FF+5esODI6y6JWigMGAjZJQY
-O3wF+CRgoj88P4z4NVVV+/QCb/kNbUCaLESWollYoiiVsoisRGKioiIojKRBQ/Q/yxv+Y4dkN05O
-/5MOqNESok/dj2Jo/f+avzZubKGyzupJxH3938aGnrGm9jQ/g5ThG03slqchGm7aRs9KNmi1I6En
-STodAaY6Txr9BqWDO3l/UZlzP3vOm5aUvEzNMzaNon80dsWb8zmo/PkSjskhI9fefd3APb9RKlbg
-8I2dddCjpMmVcYULvH6SEDhiKEByv1b07gUN8nqVEHC8VnJjLatWsxntU2g4Ovw2eXlznKNiyzw+
-OLankxs8cE5dTIcrL4MniSQYHU00002bp6g2U3IA5rCkdjG3m56SWyPhOkfLPQ6Nx62F5MxZMwO1
-NGqMTHbmhy0R2nnP8pbHHeWVO9ijShHKPB2b77pmXGYx8yWd/J1dl3GwmxuimKwxDTTdq6DdeRo4
-JeoJe7nG/Lw0m0VRsazDM1qcHbWapMXo49kAd5sKZ2h/wj+bRvByZKYmm7XAXsGdTeHSiKtBvusM
-Y7xq/v4dp6tld2GJCZpo5eB5yx16Sd7t9aeBo6iPHinEREKQEZIcCjX5WSShejg1z3hgw7eY0Os9
-/LodW54yhx38+5dj2jBBCxMSRUVyjOVY/wtt8NE1X9dMgTT3xqO18CeKRKZOiDMGViOivepMY+M3
-3koEjY3U+QjCQE2JF3kR/0BBpIgTiMDaVA3JANiXopCpvDksN6ThST7m5DkksUpJKpar6DHqhNT/
-XmiBNDJHC4JyJQPoD2tfe2t69CESQVQEh7rCPqlj6MGkPPpfFh9v219rhs6ySH3B2bHrVs9VMzZw
-4+YfAcnKlqVTJLTlZhuVtS1tFKbN0qlcTU2N7FzcoyURYp7rrlpeWvvVOCcpOTEybHFmNLg1YqtS
-Pd/4nSJOSOHqz/tLaeip+sp9hPzFVLOaxUQZgmRTIKQCimGKYKCbGM1UWoqj6oR+hUR8ib9z9fEt
-kUSY9ynQkGlNB6EeoUFOt6l2I+ch+X+iGCYWQait7Av3358mRVkxh7y0UlB/c+T+tP8eaNGWwZrE
-KQd2UMA2MVP6XrOpVfQQJ5j9QDQQSqVKkqQ+R+7Y/h4EMHUaTYxTskPgewJAiFVpGJQQiVShEoSJ
-qlIkcfR9EFJ8fYYkT/5Ai2wdg2NaDQYEEklimywZDolJZjHb1EiQCAB6116uvXq9V6q02TTTU4Hi
-n3Qs6GpEqrKWV99nJ9a4op8JBNQBuQmAkIC8EZJojIQ/I9buj5SpzOAD5WaBYgSEKlUgIeUPV5z6
-U4h9VkpmGFZHCmPTGWcljN2QY1G2pOghx3Vts4Je8IZnR6gsNiiGHqweqTUk8GFBxRWCSzjQVgow
-IqiTBRl6SURSISUzmWYCjmKazFM0iJjkGpTJyTLw2NtW8jcc221s1YxSYsM3IIxER0bOZG+nqfoV
-qTqn1vnbNOingiObZCqvdg7WStYi5gVUxZGjJlUq2rGmNKaSPy4xJ7lbkRRuSGQaVDYHR+w2XoQR
-Lwc+jstNmzlJI8z+qEjq1J+Wk9L5pIn/YQqSKRSCqhJZBZAUhYiJUikEUQpIFVZYLFSMcDxBDaFS
-gVP0e1Tf719WJPpM0U+YP3SqfKQOEIuQRJE9CEXC23jWTFoq0lZNbGlKtSQhqBXRDqCEEmimgBCU
-VIqES1CKIkWCKgi0VESaIdEKZIJSUyQMyAKMELDiKuA4QxKHdGlBPTh/1n9Ac1N0Td+17hybPNkN
-NsmVKtiEbqMG+l022hbimzKTWGKiaVpZSsVVh/Bszhxr4z0VlNlibWYxndp8uRt8wclcmGIjqRio
-wSKDE/OSGQgQSH+ecIQywqWWFFnangshtYfJW8pKKjkzEVJusjCSx7toTmefH+Y7ckmm40mFXtEf
-RmD+CqFfU5Sex/ldG6ROgnR7Hr5j51/O6n6GHOOpX9hv09bVXUObDQ74Eg9y7IByIZg/0jwmjdFE
-/X+/7uRHOvmV9wRLGu66aT57PzZ/9//Z3+n6DziPgSyZPVIlj4/I9q+8Nn5NSN9RpR+UKHBEH8gW
-ExKSZVsi20KQUElWclOSKZE7vRUdj9BKl5rwsj9TZ73KKIWAthJusTjS0yKJppZ6j/JN+w85JJj5
-nPha+Y2MNKCulBXR66T5Vw+g0YGo+wv7P14I4cuQ8H6nxg+KKke170xGLD61WP3ox5pP7VT+b7rk
-J5PC2PWTHm0w1Xqvr64e8+HtaUCSVGIp/KY4MntX3kaSFJVJMV7nVf2SrUqpR9b3rSpJAyCQgB9f
-fNtfBrfW3MYp+xT6yjTpKY3mMRMUhim5Liojok+Y14v63ofOniF+3OQWgwYwmFNGTNa/CyZJJ2Wd
-3EcbM2Tsfsbpp3fJfcPNYiS2pCQVmQhYslCyT2PtcuhJurzVoppuySI6KOemO1MsJVgVu0xNOSwb
-KUsqVPoAdjY5cJvDyINw2GR6pVfIQ/ESIHnNI+iTg5doecfXGQjQywsR7FTHr7ng1NLs1yYm7bPh
-WlNVlh91OVm1cMY2zDptkLdO2JDmsjQsbOgYCak0SRFIcEORso3MLeMhQdlHtJGQUjW4Cm2oeCOI
-8Dcf2qqxPZANp3wHqvOE8JLBHBHm5HsKnZ3b1avDZT/vbNLNJswrJHOxNmsZd7N1TUYmysrRiwpj
-GCsYYm46EIh2JNnCWijRmFyCbNNYWyNlkjemSobFU1NxN9FVI89pI0KVrfjfaSKc3E8lZSUbnWCe
-5Ob8yonrE9qAkHz/hf3ICe9q161rRjRsbVQGtsaNJ3J9KIPAkT0GyP2v9SxMkzPmkR5Fg9ejJPOR
-7E6yfVhVPcqVphpkkox9kBsB7zZ0fKqvsfYB79Krh2EmQFokUC1/Bm6k3PY6rGQcv/S1/32H2Xup
-i+lvgGjD7Iw2zNSOe/8Kf2HnPA8wedQUOfy/k6a9am4riIC4EI8kUJCMkST1qQk5tBsTN06Hru2H
-ERZxPq/n3EdN0U0SYGLeMIoKbKqHCIw44wOp5Bfi9Po9Bsdb/hA9LCShATDIqLTMaFHxRT0kK+VB
-ARIOECYrCGEo4RhKgbDKuICSkA7fxwnm5480zIv+3MmnfO+3tzBlPfe0U++IvtvtyE9R02NiCtsS
-djNFBWsSdG221SelAti5IspCS+AAdYo/9Yo6OD7jD33r/maahOzmd4xqKVZGE7yNSaJRqe1geDwV
-bIanuaOjefRY5yElgiwRYIqEVCOklh7qiPBQchABPihirISCyEqsqsZ9pwTGH9JRQ6DZJ7RVkLEM
-cA4IgKqT/NuYtT1MRaKXgRQiwsF/nfX92s/lPeF7s6J7HiJN/298s8Wzm7m2qJklE1Ds64nfaMic
-zisyjxnNvZpIEYhQ1KiMiWzvruStobkqioY1P8dlsT3FN1dycRPIgVHlHFsByTDYPU+l0aCNWT3k
-qe88WB/1O2Wp9h2nkr0eSzPf4OSO7AwCxYwZx24UIlV0cEG6+l9h8HCq+zh4d0keQrg5NGGpKsKm
-GMVkisTCWZFUmZMSpjRqtXlLwWktVllJqRJLqWjWJ1sOCEqKJsxDG0EUQaEURFiOwm7Skhs/siRn
-NwcqtcMyWMTMVRhi1UxgxatKrGLMZI6hzU+MWDfdxo189sq1706cOzFYZJkm2DS/JWIqamH/MzZp
-NppjJKqqsXGMblxSpSKNqktJu7NO6sk4jd2kelfHIr1aatqTYlGSxydi91TZpZITaCPSRDSAkAiv
-+sEI0EXRugaMPqjDaorFti3UgqCoK5ubYa07+AboxPSNBgkO8lMPFp5om6SVd90rTa7WL4/eUs7u
-WqRcpVLrGTQtGYjpzLJ7zIIsEWk0m2+7eDWSS/C3cbpu0GAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC
-gLBh67cK4cANgAKALYwAHjgGADQGi+r6k9tVF87bG0iz8V2gi6p9IJbALRXN+flrTCUAMB86543V
-g5W52KhrXlHIq3WDxD2EKREQIkQwQLEqFCpwh3Rswf/LT/3/9/4P5vL+r/N93/9+Xjq8Hn3fm07B
-p+/6oIw/3PVjSha0rSEaxHqVetuYaMPVGG1JGFSVrgwlFPmCD2GkN6eHk6NBGoDmWrWJOx7Ntqlk
-WTh/NWCNxUP9hUmnRiQ/I/LkcU8zAw/BCcLLoSHaJguttBrrvuNjv0efQYcqSMIpK2jE08nWiljV
-JEwkiElBIyRjR5C/hx3/FU5cp5bqREkpbZG3nG298G29PbxvDbbbbxJMqqx2jpGwDKZ0xaBfSfdz
-TQJXTIrmzS1IVSmGEn8Va2yZKDCGAbEagapJog0RUJhFmIWCGDc1i9xmAHoBl3I7UtxupFZF8GB3
-F5GdV5PnEwPxxRSvefk/b2T/QslWESP0oTzTlH6vF2YFV+ld9Yi00i+l1HII/CEhrAxEYkZVpKUk
-SZZBUXTDIw/mU3a7L3M0sskqRpLWTZhsjckxyVHFCIIqJE/TAIclk3giwikEosEUVZlhSiTMF4VU
-fgPWh6U+KPI0+MEekDx148sbThI9HjJ7C/Z5Z6/T56lnrG91S0rTBKDchnE4wOqMBCiFagicNZFR
-ENVcn51qy2b1hyzHG2qalTljDlKmFVWMYSmMYpjTGNGFUqy87GSVTZRwxpON8asqjlRxxnCJU1Lb
-s6BxYW1tydGo58bnCDsrGbbY6Bdjc0rNKyuKjFSrBUKVYVKkUq0gVEu7Vw0le7I2rRYBEkWKsRGM
-CvEqmESghCpYdMTFlNjbSZoyVVkbKZNXDhSZekpMKkUVVhamuMNVuB5YcBaNkwSqYIQiEiBYiKc2
-JlilRXELs1lm2ts5bYSxRt9t7fbcGWFt9s4NGbwY0EUMOimJRq4lUqq4ca1waVJxW021hjisVWmF
-VixVmJgw3mRxLGhBIKIbIYyRBgwVUU5AmGoGUSUILnm8mgZN+WjRJRwSAZES6McVViKWJS3cixIi
-TUq4RRBBDBEoagx/0FrfK5iOtYakyySkd8DlG+9VrcHZYW321rM3y1kCPPN22thMzWmLSiNvCboC
-RhBxCpLsN8zTYlkvFiZvrffaNyUXIIqYIduYgAlC4xMR0ou4lFKBiDgoNUuaOSO48bYaBltpHN9a
-seoHYMDbMFqzbkF6Xunnrr3vd571enb2Td23RkLTWG1xSxJsqGKqja5NsOJDRCRJ1BDhBim06ODF
-aAFwzBXbMHRK8tVjsBsCx17dfLd3HpZlk/fDs1vRty4ROuW7NKoqjZZNLpG27SaVCtsZG2re0xII
-4kQm2gjSoMA8bKOCHDtxVSAmpEEKBBHcMlN1klJQxoSBJiR4UnWRwkbITxiPGRZ5WBWKphh1NhD/
-JHVEjsSyJIb85Pr9uP9lBEJ5Q7woPRFOpTmKOjguiyB5N78lSisYrGCrJUlwxcVKiurpKmSpLXS6
-S5Mty4hMMmITKWQEkZShcCQVf6dCYJQgiOhIyVFYDp8P8GKeFbZ42ffDT2NMNV7l/H8Or2Kng9jH
-wYxExtDBXowGN0+LN8q5czLjGPrryKofTKihTEoAh6xIyRFYmJ/bUI4bsgMy8rnZxDdjTU1S2RAQ
-AIZ3JiTGMTMttsmWTMzKSSmxQ871ZbyGfBPJ55teRllsZhmIhlljAgDGBa3rqEzMRE3RPZBQxKAx
-H7fjhBB40flWFTkwe6/cyZFVN5K+DTE1XwX4e+SMQjCUGIiRjJBowLGO4ZrKUZhwxitffHvfPJB4
-78uPPdCeyR5IkkOZyJ+SudJsse1EerHat571nZ548rNx807rO31GEWlrJJPYYxSaaTFVGzG/KzF4
-NzDRh0jDbM108H7z19fVGRbnveCexgwmKLGFiDEBKFIex6iaZ5/QkR7H5alh3mKusYksuvMSqI/B
-oxBg0ZAwaPwKKeECMZsivRFlzhQx1VFJOZUTJVVogwEll1dETUVVQVUVVfQWNkv2YZzGc1lFFWEH
-JUcWXmgqiqrIouy7oKoqqyTIkBQUUSL/t3NxzZjNWfFYgRuIFECUH3rPKx3R28PhfnTlwG7kdI6N
-pZVGQ6DUaFTSm8sg+S2h9qz4JJE/BEC/FVPYR173MMFNG51qacVGMgfZCf0e19D6K+Ld9CV1Y08M
-bO0xwrfTaJIgAKCiIAUSnkMezIiioqZHqY4USUzCNHR484dTrKmx5idg3ourEjkZqkNiE6EEX3iH
-IWo3HFHCWCAopXMDItbs1Jq9+3X464bbOEPhSeqiiUH/k7p5WxPRjJuY9j2uWpPYsR5vP7ZXVsoV
-8yqdDnEvbHGwoOHqHUBmeywCUxaz0JHWw4kZBiRjDiRjDjLst2mml0Ldpdlu0uy3aXZbtLst2l0L
-dpdC3aXQt2l0LdpdkW7S7LdpdC3JGMOJJJGMrQ4kYVDiRgLdpdDdpdDV2l0yW7S6Fu0umLdpdIt2
-l0i3aXSLdpdS3aXZbtLptdpdC3JGMOJGMOJGMOJJJGMm37wxkU86iHU7Z/J++38T+3++Hz/B7P/n
-s/3//tv+H/Brf4K3Pj/CByTkETofLR/ifvz9lh+epyFJ9FkQfaVKolKSfgbSVqjRHufwXNlRGleD
-8Q2HKfcvnxEg8ZYezvkN5/yq4hNb8TGpTa4nELSnznI6Ci9BEV3Na19JmFgblLVYjCs0uFlWU0/I
-2Nk8oiN6U80j7pXI2WEnQc5Js0ycKxA7Kkcr/KGfuL6ZllpC2I+7n12z9u2X9Dmvof72W68l5pSj
-UAQNbes3qrAgk8pIjpcQBBVLG5mwwPIl2xcOy3DJUhKJUREpQ2QxOSkf1dTAMRSSxjV3Qgm7JXPL
-dxHK566dNa4kOqOq0gpZ19NOhRZkUjq6+R4hTrUvgmJEtJwnT55ZUWcpwBAs6FCNep1PDjObk9Zt
-wQ2VMzHg3cSGm6m7q8VbJsKo3ftY5Obhp33acmzsp2krdd1xpk6KlaY7OHdjdsYptObBA40EkSHB
-QcjOAyM2QizMbMxDNlElceTs6b7a4faZZzw8lbOhkjIKiLgQhCUEDMFJHkTwSbMGy41Q8lDs6B8A
-IeS8EOGUMSZfBuO1nBUIQSGOEeSjKaXAoJDE93373ismxTGlQtqDBRUWQiKoCjYwUkmzY4wiiYiD
-BsmPKFUcHEVDMm+IdRB3Ma4FFeaeYgeRRdUI8KlW+aknmqQ2Kh5CFJI5KJPGkc5STssHCmqJuqdF
-SaWRusTtR1eU8GpI3UOlkc0pDSxI4eTCdRDRknn1Y5UbQ3MRPAdXgU46Nw8OrsndYnZUqjSyPBY7
-S6I77MDKg3Au00zkk5Nn8x4MHYjgvJYxHI7CyeCKYfp58jYWLwIpcSDA2eMc2Ly8GUjo7BZvRJqj
-uGSHkoOVGhGTYwI6Dtu81OHTGnYzksdSnRZHJ2NGjfjFem70cN06tlZ0eDh/qmzrN8dlc17WeKnF
-TFdF08lMcG/ZjSXSmOlk3o3dHoxpVm5ZXVrUVXguLGmMcq0qMWETTd1szRzlm9aVtZUToxyUbcSt
-zThSqPRXdym7faO8sQbK2BWSWdtGCKMmSTBICFGoZhxLixmNyGAQGKLuqKC2Sefcuy4SO6wcHDEI
-iR4q4U5KeDxTFd8jku6U0rY8FRMEGeMMIjig6JgIkOHplwQxDzBsGbvCsjtNzDqxiMWJlhSbMTVc
-lmqk2b10dGwxTebHJTSJosnolC57lCclkWHAiCMYOgwKJ6fbq+qjhBJls3adNq7nJKUqpUxwmPBo
-7qxqAYyEIgoUQbdww7lSEb6Dk8hD31ee2LxXRDNjNiq/VY4mVfaTl8c16URO1LW0ITF2TQ4i7T25
-tCFYsJoNckwEcGDkoMbAjkvyLGTJ/W5g8ERQLCwoMvRoojkUDhkehsUctx669mjdXbljZTvZOapw
-IDx2oZBkZ0HYoGIjagSDByI60LPicNllWSUqpzYzkqdmpsrRU8K5KdNHVyHnXdwOryd25vj2K9MY
-jvhxhpTwPDDQ3VXNmjTTHDTEc1eDaOzseDxdlbN1c+VgjwYbeC1rvuic+NTkOHmrJG4rCrM9ebZp
-e5Td5NOzc6k4Fqd1aUaY5ubZOHdyc2zMY7rKWTFZu21s4xHkrhpu3DTYvPDzsO0J4sVw8jHZptVq
-c8kLXRTq7t2onC4bw5OnNtUilOThzSxmlmjNhjYizw6+QnLmcnhzg7LDTMOio81jezol53VOydsn
-JPBhGwrnYk20ydK5a5Oang5R0VqRXiiUxxQjuHBCCDoRZ3NFmLokyZCyS7GMQjuT0C0I1JmycCKs
-QzuS8REFEs2SxB0FMRyGiS+DJySUTg7FaOBGStBNklDNRs3Lsxu2YgQYszgoEGe5GAo6JiARkxsn
-czooNyTFqzyJjub2ywwEnITYrMVh0VXJmnLdrSru3kTOEwTUWSSKoVUGxjvyak52RNOWUi0uDokh
-iCjsE+aI2FcGQ6ODSLMjNmQHICaEsxzMYIlsSRIcUqSFYJmYUw0YxgRr2Ro8awv3D66N3jmZ7wFC
-iIEoM7mIhqIjOk6xrU5FeYUtSe5SjapUqczAkSvXHU7KbwDSCRIFJyhyUWIrIMIUpzqzk725xnK3
-jdrjE0BwSpSEJQGZcCiOcSzGC3xzzazvBKuZNiDzL31tpAQ6kEiCQVIJEWCVHIkhhCm1khDm3c7a
-NXJDLpmHVLcqQykck24kvGuWm0EU1ucWAxFcpDbcG3eWOMO+IbSXTr10436dBZ0Ys4luMRwWs4ax
-tuuldIhu32SmicY1vFCJxZK3pu4DK53XXFPKiHCOVK1WqBE82W2+ebxWFdyNVAXJO+XzxTyohxl8
-VxxfFRykIskICZQ6nhnVSIhGoiIi7KqIdEQExJtOATmIAS0GTms5y3gwUVBeSSESmRp9xFm1a0jp
-VNOEiG06fYW/BrGotIljSR3YY0vVSE72a01UlILsRINQWIiUEoMI7IpAVcBnSQynXbCd66bYRtXL
-JMV2uO2c80QSy0SImIAJYPkKslyDsckScEynFyhesjZhdo5ECuiCgeXMwXeCnhRkoasyrU5U5WRO
-jYIhN2pHNYHaVGzQcNNY6M0RxWVG9SHFd672I34G6cE2nNU9LqnRmBSiIDrqY2gk07VKJUTyhmxx
-o7CGGw9AUZNEqMGh0UMQjKJjoQWM5HGFR3MUTRYjmYY0tyzkoJCzJZsOizjMEgnNjHbkx8Q1vrx1
-vEI5ZkQcwdLIjjPG7x2QsYvF4ozuRKLKyNGNS9YvFGgIGUR8J9Kyu3l4cl7bSY6ZoQ6ER4dSTJUI
-lSkGkOcBhKlINIZzNEqiLy5i4Rw6aGDQnB29Cblhi4zpx4eG2/EEwSN2EOXhkgjZYq2gqpVQB6u4
-AABIVUqoaaSAAAO7imYgFCICLWnrV6wQBYiDJMyW+CRwUUMrohCLrRYqGSWBCxDSwvC6QkbgPNrb
-lBFOhwJwTSgIDPMpNEtUNYokYgQhdEh0clbqAnAzg4YUWIRzzXG3Trvy2qym5DMYIY2U1Jz63Xax
-tI6TpAYEjiCwdREgUQGNMNQgcAYI8Sc1wcSQSbxBySJIbRhv6JwCaNBKJygBpRaRDntRz7Ls6sUg
-iHdtSqurd3dWVVuRq5V06ty0TUsRVW5m5dXKu7dW5Gi7qqty6ctVdUQrqaKiamxXVq6sRdWrqxF1
-aoot1curFVWrqxXVqIiIixEH+1EEalq8ZzNWdbI1KJXZTClAKU8OoipVVsq4AgRCgADOavW9+NuR
-4akEcJNsiIclgjRYJYN9uII2Ikmo2hBMgixHfXDeQR0zlx0358hU2kJJQQYnOunKG0Vza3dZIjBu
-jdseMq0mTtHU46zGOx3uzpA6JsnUscG2GsDHxMMXdF4TNOojMTmHGyqmx4Cv5yV6kQ9MRTZAe1a9
-rzwZNhNCPLrkhJQVSVZFU0/6w1JPAjwxsUryk80N4lbGwqnRkkT+sn+t/1O3V06PZnOPnUT0fS85
-P8OaSQ/3HaE7QTm6FOoUf7BO8g8NhwiFjQw4sSRpc1jG1NKhkkT/kkLAqFJFQsFQumQOu8XiblKl
-d2ZFWLCb1BtJyl2R8lEGm1k25ZrmbvNI3fP1y1TZ4PBormxurSuFRX0mzTxZ7+TY6HNuaWtmZVPG
-sVKqaYw6Kcl5OBM2eL5u2z+tXVKVLSL19z6HZ5G7hhFfdqcdXk3k6RuZTS4rpXJR8GzmqcK4bs00
-2bSF5TFqrInUVycjK0b8nUrbfGV4NI83iyHa8y1yyQxBJIxgMYEMZIiX4RQhHQzqigrqRYJEoDAb
-N5iixEI0gmxaiySMikQHAqNkG+sHJ1s2UVkNjIhCA2UzrKRsqRGmExZFHLJmm7WN3YxARgMiJOTM
-gxjhHoI26MsmM+hLLDvWmjoVhWk4ZzbmbThw7K0wrGxTkqNFZr2NMbOtcFbL3U009GmaeLTTs9Gz
-Z2WOriTHGp5SITpIneTU6+K+O92ZISQGGMwAjYZjbGADSWAB73Xd1G4ruKPM7DuR5CgntfiEXkuH
-2hfPbEKKQoP+X8kZChsbmBwOAkCB8mJ2boCISMRPoVijGEhkYqqyEwTFlkisMpPjHvVwsVVYmmz5
-TunxTY+YWrJe5EygoyZL7c100kETOQALEgqwTDQNJIjrbprVJTJU2umrWrklNRU0kwUYKIiiJsoo
-yaUiJBtJsk2WWpv3Oq4AAJYAHZ02sdYzTjmzdjbiUTs3azsHOHOHHdkOcODE2hIlRNIwiBZBQUhM
-tNCRopNGjGMhabat8989htqBD5+YsmpEj6lKsbEioL/v7ow1Fj6ESWB4kjSJppVnsE8nLlttED1i
-KyNI5nmRpJDubOrZTuAeYD3G59MfJMUqKzTBHKMo15GjUUNCU1rFFELAwYgCiISVlKVliqk2SDqj
-8kiKRH5/agyVK91eQ4iyCSSH70gfJhNID7RXwPI8jF9AQHQ0nc96w/WbkKirJVkMdPk3fm8J9S/s
-/wweckJGz7cTWx28z2nrNGmR8Y75DIyczCwMJnICJg9p8DSv9kG5LQzrHJNGZE1mYUDUFBCCkhue
-TiI7EC1M0hTSDKEoKbiCdCF9RoDchyhD9X1f8ZU0nKfU7KqVTTBN1nh/3G4mlk+LZ5abNUzVZLIN
-VJiKluMVc1hhZXZkxpTJSlY2yTFTBKTTmprGRw2NNDKJCwsT86Xq5wRrGSRCVqXjq0YcjExRI7If
-k/Vb8szSR1dJI9rs+31d7psoJ3CnN+ZCKk1J/mnV0Vhdghjpk1PFYxvvNRlDeokmlgNMWVNeg2Vf
-acPtw8CzWBpT4Oy/C0h799nY2AijWZGWO236Tm8+++7En8B6ttifM9ack29p7wEPEBaFChBggBJE
-SUpYkTZOU20fmSNOqtPrJD3vdI+T3e8fGWVGDkYBoUXEIQsmpZzIpjBXz2FDJ3iNRJELJprZjlph
-immlQxEzapIIwhsqAqoh2DTXBWyc1K3RyV5FF9ZfFDTHurG2Zr2Zzk6KdZMyhFBFDhCYSUqxoeXa
-Zzpi03QNGHSMNqSMKkrX6A9AaQrP5Rzfwfadkkng/ap5nslUk/YqSOGkhP1VNRULIfASixHBqJ39
-8/P2/HD92zplrTSDWt55Kxj9zlH0v1zjdU5LO06PpdmG87TR1vKbaUxiyV9N11nZ0hXSujfs11c3
-UprG8VjIbtMK8WbuDnSSizMKgwIg1KVFYMEnMZgDIgyijZk4MFjgsj9EkkWTEc809m5gwKEaOQwY
-l8aVWO6qolY89zDZz0xXVt1biYJ4rwdWV4q1i5l3eCb6a55UsN7ZhjGORnYkhQCiM5kOGYHGoAgW
-h6GXA3JgroeTgsDIjksZQgOAs0MsRI5GScRAEFBo4JMrF3EKKpkwMbEFiN4vQigsaJFQPQsWRATC
-DMa0CHXnIEwpBG32k9G0kRtSA2YIiNz0BhoJASUeaC7omCvNDwWQqx1NiY84JMg3STlDh3aVe02D
-c5KJCscxXR/oEiCHZ1JGPuYJkQSg1VWSITkklDz+xzQrI7P1e/wfi+KSfNYQQ+PPnjSYRSo88VVr
-u282k3QrTN9MbUM2yBEZBEm0OawR6HceYxVHB2OB1CWWCfBiYo2Epy5kyJ7Pu+L4ufXrbq0GIdK9
-wBBTWDE+tDD22SWQhGzAzRQbGaQ0dKQ0UHEPgURorQ8EhkME8Y0xjKyKP1i1k0anlm4/ObOB5OSg
-fAFDgWWY6JORGChGFhRpDD6CxmzmcmEdzgoN4LMmTQfUHc0XUmTscDiDBZIaEzNMmWOKBCkQbJBz
-wJBRLjxEaKwd8GUOGpQjQGgMCD8CBicVwUbPD7GzAWeRo6GWjgKEYEUKSOiQkZYzZnMbMiOBGDzK
-GJCCgwvUo7kbve5k5cG6OZO4yiXgZZmbFFqDIxiEMwDEYIk8htpsxu5Od5W26kZmoIxpcQRdZBGM
-xBFy8eNqzpZurm3Y4znzbYs05sL0ZLowZiOSihlAMQhBuok72WDJkUVtyIZDKGIooRg2UG5JOLiN
-aSSzFkRUUQEFJIgLQUFyUJOZnCbSmSe745EiR2E7p0U58p4oUr2NISJMkanVi4l3Um0JWyq64J+t
-3k2otk8dTWoyvpK1mh4bJLX1+BwnmbzeNAh2odjLwXXaZ6+YURTHwqrAn5fgMsVeUUO1QM/oMoFg
-uJYiUJFmXQJULs1OxrZULSUsiKWBJtYZGNMLAqkCtBSJPM4AdDz9ry9t9pb2W1K1MAAClNACkBAC
-SQEMipmYAQKUNoAKzWICJIAAJZsNmyQASTIMk1JsG01KDbNsmACFpZAZgazWAAAGZJmAgGzEmDNm
-xmZEmaqqiq7gFcf+nxU+k1udovZJHcwwxOcRSD3xxUrAk+YL8tOJFOap9TdnV/Y3l0SQSCQJIqyu
-tY5ppMTSt1UqlThWFW1iqonpIeB3R9Cc/Hc7zrU61UAXuPwWY2iTc+Dk/B47N0r3LN51KilSVUVV
-OjmdDJFUYqKpVVVWKUYgqCMcoeqv9Nb/s/S/LVz9EMwNG/2U/c/a6NBGpX3Wn5D2aOCegc7poeBY
-5Ur/nYkmUW9cmFVjm1paP67iIkoJIiSAkgJICQKNIRZCLBFgiwRVej0m/3mRNq9t2u0CpTawGEjO
-LJKU5mEwUVkjcZosUon7K3fGJ0T0j51f9kB9J6fug+gkIGcakyzEwXDDFymUqZkMW/T1fR+XQNvz
-GypGlQ4Ap2EYJ8uyrjqh/tHBXDWGmTURlYrDWlSIWLDTFRak0sUMGEYS6VWFNSYRgQSgOK22UVtb
-cWZdrsVV2u6NJIFMYSCZzMMNIZBMRkQKLMZkEbacK29mN44f36aRurFIguViEZJ7GSZK0xMkItpz
-F0ijBUgxhg0mTEaMXJANFkmGgxZUjRBGgwXAMWiXEyAyAUXQgxiCAaMIokwspoGFmhVJKpFVBQlS
-UqKlCqVZIVKUOzWNLJIqk00yaU2aYqjSyqqYxiqlTZpNLrDDCuSzduuzo2aaMOFKKBr+I5GKugAY
-KiJhE/BHacyXJFFJSEBoBWgEKVRAJ57mdFbJ1qEYihEPlSIZUEWECIxICbSKDkgrQrQINCohSA7E
-IHoJUEDUKrQrA8WRMkd2Sb2RPKyQjl/rBDCiRLBFIUpClQsEUhUerZA+VATooLyQE7kBJ7VQn+Mn
-NEHOgmJ2U7QfLEx47pCZE4j8/RGXYdKf4G0k3ayRYEKQ9UHQxJ7EJh9vpmPPWpqszFoXlv9NrT0r
-eFtn1cs51xjTeSTqqdFR+lXZyvG7Ztam5860Iu5ABqROm5aos4PK+o+ir99TCX5JEJFIUYwfPuXM
-zHHlRUOeym8Sf2zxbN/QIhMnLbBPNXorlybrTlJIiTYHqIFSMFHGF8+OJ9oEEY1hos6ImTh5mxld
-ozd6CYqd2Oj27eO+KncRBIrtxwaeRA+AiDNzGMCZMFH7VVNB3UAjsiSfgqCpk2mtZk0mzn2r+5jJ
-Dh9f+s22S34X58iuGaUIQqQV4PoiI8nbbuBiBU7Bw2knrW31rIjCN6seT73Zs/a4Qe1ybTySI+6Q
-Q7C74cUEgmmSJVhk8FNKNVWMzKYpKaimIS6zCJq+EBijEMCUgQHmnQpLDSlV1pSY8GlW8XSuFZdX
-a6tRWB7Eh9wyvnICFAntQI0yD0Uh6+LP9ip/7rDwrfMXwtwxWTMauFRCAuqiF5qe2CIEYIj7yvST
-x2gbSQlfgUeCoOUjt72RXtmTKurxcVr6a+t9SAEIHbWvnvhrPR4CDI1JlQ8X3qYTVtTwlTFePS7a
-6W9SslakrnJbayvvMu13mXSXW7LtalEdW5krEZgcWRBDpZlQSIAhyNEpkGiVCUlIwxVyRGASJiAh
-YkkhGIEHONGjjRsugwlGMb3JuUf0qxVKqyyvXGDEbcTRgRYVSGC/WS5HRkxEkQ4N0qwUpqTomanU
-3erbbw5V/DY4bxusmB2mC4QhBIsSineonxQXnKn3FQkfdUOy6VIPceDhJPuWRJaEXy04PeMgHkPJ
-DDzG6PmGU7le4hO+HCXfdODmRkSUREUW5eQKpUOgUvTiBokDRJ3ED7z4fXDpUdyThZkjMxDGQYIc
-hU+n3+Bo4ldQMW/ocOQNq68SOszRS7I94HqXzEiHsdPZEcl1tMPxWae/dNSFR5Hi6NnVOkHVUmd5
-OU5yWucp9qNZljtECzbfHlL+PV0URUrl73dcq3OCsaVoeR9pIBVF5oEOlUzKSlJEilSpUqV6Hdee
-1O8c5znOJXZzz5aX0rKNqbO//v/5vNu8X1vI0s/NZiP4q76RiyOWNlRA9XuwPE38/gFHMMmTCRJW
-AxKWMYkwFADI/2BoV9RyPUiedOFHJIWFrlTjMj1fcse4/NS0pX3RtoxYKxpps/gw0KkNyxssMMZM
-RSmiimYRZYtLiTJGLKVaXGMJcMMSt8ZJapVk+lhMilS2FKsjKjFbVitmMJpjEsmG8o22mt2xpuiY
-UUylxTdvhphhsWsbabMVVWNtq2aZkqhs3aak1JZgsotFU3TUYJpv80qZJoNmE+94xqB/5gqY4f1N
-GknRAWCLasOUkg/UsSPxshMZ/nbI9SxD9kLieZyabZJJJ/JFUzbWSpJZUlkpZbKiIVYiIVhlUYWC
-ISIaSWVKpSWlss1KSmqWSUlZJKTG1SUsS0srKSVUibWktaktS2Wk2tSattFWkqiqmUQqESLECp1E
-GEoRIEQIkQMShEixIkSNAiYMAmEKRMEKhWEmBIjhAeaKKKCk366YUiPgbGjQGo7i+z68TzdDwGGI
-CjgBkhNudzxJ6Gap6lN3moppD9dnE/7k4Q6Kieh6qZJkyZarpWWFLLpRJVza+rLvAYRDtAvpJRIj
-IbnsFBRolhwixQkzj2Ipiu7GiEoaN1O3FX2JW74qreIOZ+qkf8ahwVfZL5DRh5RhtSRhUlanoAoA
-eQCK9L5rq86NvpyTSSyypsjbSJLSZYszUqaZpklStimUkpSSWi0pTFSJj4Pc9EJobKVJE5zmyETd
-oTYMNNlKYSGSSVssIkKsJxPznyF3UDJQff49bxCLxEYoJIdp++Ztex7xPNXY8ORWlpZKS+cSRos2
-Ypypiyf+9rHdtOq239WS2Hq6MKdXJ6o2NNkjafd9z7JrK8lYd6x9qve4ObFPa7KhNh6yX7DdH9in
-RAdkO4NiilU6frY3Y9z6zeq/Oyrdhxzc4zn0byRi2IioVYc9rCYkn+YpdkBGbSrFRCuuT9OmK/xN
-YnZsxVmq9qpVdFY8pkKqthv4Km08XckLyiDYk90boRsdnY9hT/Om/WJ5Je5x5UZZR7SawNCzMxaW
-rX1k1kTYmYjgDhgLhBA5imA5iP8OR3GqTh3lyJaKLIcmAgcwQ9YOYjgOYjyBzEeYOYj+O1NGsxtl
-wo1jgUBoHWK4QMVFYYjiTMTyDwV91e9+Y76J8Mp7uDhpFVN3Q00s4rG7Oz3JNJGnD+ITuh3Wwlg6
-IklQaU5aJ1H/Mr5mj3FJiynDGtY6XKT4TbetS5y9XXbd6XFRXUQH+2Ug6wfT5z8x9TICX27GnzDR
-+tP47B+c2QB5Wifq8wqZTIREQJVAAkCNIUgpNobGNMoQsKG3TEQsMCvx640AkyTRbb2ZKWZyNsi0
-ENwYnFQAatiZdaZWqa1I0pMuKj9ag5FkKZANoRFORwZYGcaUcYiFPy5rsqrjFXOuhsMsN7DfY2/q
-sNrcnLIxt9ZpnGMazi7K+v9Hyj37ST3zQs8WMjCtWSTwnjb3z+E6P7+QnJIOqiVUn1/V89YrKVKF
-lFsD5U8HL6EiY9y36IS4zSTIKQ3LklW7fDq/D7pD3ifUidaodXxO1ehzVD8+/efoYIH7VPuPyEQP
-SAScEwZJJJCzunKlsaRN4BySliAfJkdELuRgQa9Iq2xjXLelW5XjReMF0lDjmKiIOWQIahAFdRqI
-lDEGB0wPNwhoUDA0REjpH5VyCaWRFVEH+h4OXnVdoiDCyCN7CbzoTaqoKinaJvHOkL7Hhw+16k9h
-4CbQpeJHsZPa0sie5A5BCv5yHCRwlNnSqfEvfhZktmYfO/DWpKn/Mn2fQPc2kqj4vy5r7WFVtY0v
-oJZEnlXFNn0qZW2RGLSlSmWITksmlghpWKRVBH01OyXRA9MA2ULIh4B2EhdJ8/WO2Oj9h7l7JH4n
-RT3bHr6dVP4HrdGgjWOGJGFFvmX3evo89dd12PaF7oek9cBuvWbn4vmPov8Ts5vnaf2MaWTWJ9qo
-0rFHI+Tvn7ZvYlBnL/9Tx3ff/ec//X0elyoBPKmLyb0Bow7Yw2zNWUyUacwtgxw2jDbM1UdlkN38
-8J86iK/MzKksXMjAqSKLKBkMg2PyKSfwp+M0uRQPPtHZ/AVdtQP4x/EdYCdX2Ke6D5pR0sMfExpH
-CTWiwwkdWxChgQKfOmOxGX0kFAxbCmIqOYRsRhs0jH5jsh5/p6VV+5w0mlbMfkbva8sam6uBXEYu
-0YX8jnjRprGlKrkwyEZMkMyMtOT85UWdGR4oUjD5qO3pBeDHA4uv3zgoQ5JJBnJsyaMSCH0iqyyR
-R95LNySaPbJ23kwclxycmhls4MnVFgiFAUckEsqjwM5ZowUdyRssEIEOJNHG3U8zYOAzol3HW8iG
-IAoVaaQ4gixljvXGsmzHLZu2bqbsbWY3db80vV6kXa73BkQQASHjGkc2LRGBLj0zcNOeAB7i+FPt
-fe6NFaqfF7pJUbkkTQ3X3smKryco3hp2CDUesVbVrEjYzRT+rwQaZqiGkomAmQA0arfEww3NaKfe
-dRjopi3bcNGHyRhtmaspi02waMNokqZalKEJwqBklIkqZakShCcKgd16XXru8cZPM9V5del167vH
-GTzNjTG1Y2zNe/6nL6G8g/SLJHp+lgRlttyN0MPzUkl69+/LdKOTH4uc2auvC35bC2da+/d10Vqa
-4v4bNuUYfgck1edk+kQgce0678V8zKboUh1KR+EtEpokfOjH3EYPijsjpdBA6hXpHyntPdrinh5O
-jQRqB+YUA5HeSIRNBS0LS1kGSrSmrSWUqkS1SVpLaStmaqktRJslKlRLHhgqmEgRCJhDkM1SW1jJ
-tdSrpJqpNUikSUYkQYIiRglAQiHFiRlRJ975U8VpNlP3V+DiHZo6vgrBJI/I+LvE8EfPY+9KqluY
-wMsJJ/OpEfvh9qn4Jp7EjuxGo3qTYV/RGwm6/YBEREFCAEStESlMi2bSTUWtka2ltpXyyGIkDCsI
-ANRIQoSgWVSbW2lLFUS2pallqiASEIflMH0/IWxpI4Vf1PcL9iUVlKp1WJ9R432FrkxE8eI+s6mN
-x9p83IFfzkLkkEFIBStKOZgFTamrYoLGiiKJIwRNBQU00yJn2/DSAvAo+q30ecW5RrFNugdvtOyn
-kYP6iNKv3/wGIcawTZedmK2spSQvVpqc0iNHEbN6bsihIHGBUdj5F94SPXKJjIUAFICozKoRLEL4
-HmzlmZmZmZkl7/eeeADGAAAPkb169evTbmZptuqpKiVMqZmZU0QEOX95ENthBsh5yQC7HdB8Ekj9
-lk+sStlkk4eQTq86YHpVsklkiiyx7WkB/SRU8WxG7vPCOzIx5jSN3LrViJ8ETmW67IvqlO8B0K9p
-p2GeD3nzHVUfTIhO8SQfg0/BYnxeTfuSYxzYIngogByPD766YQmUoZJmWaKzUhR8kpx7alqUqWKR
-7CxjOTSNH7NMNlbt5jss23XZqswwTBoNGMSxBqCeXmNamHy+Na1AcY8wzHps45U+Wn0kBokSiCIf
-2EBOH9/QmxKiywpSqsKlTwYxcXMMiSN92nEidE3JlRvqfq/HCYnw/vm51HjwPrsXMaD8K59y7LkL
-EtLWgyEui0toKd1yaDAycXIYhMK2YimxjSql38HOex8XvcnH7segl29jD/pNjoQ204T46NaxgwtY
-YaFv76Irh6z3jhdmjlVbSGTSkWRrWanJ2drGEqpVeKpHxUaVPaps3V9bsrmig+qQTmGTnVrRzNsH
-aMISlkjp1bG2bO8RLEgh1FtocOIxWkUFfKurqWaKbFY3snTrpW90YqaUy7VrTGaw1rYxjDTRYiWm
-KxSVhpp0rOW+pSWrLwxFapGlpK55iVmg5G6bBLDUkRsJxu2raGnGc92J8VxuxC2Riyb8MhyVW2Bz
-WTFKtuxjFq0cyyDLgEFSWIyUZHgcAhBElEyZbdoZjLYySpmbajFiq3m4hYaUqnLRhKo6lIt7JKGI
-ETM0oaIzlIqIaOqdjRjbw5SkWXMIgS0ryMxDnCIC6NZO85hg8bLswYzRyVmxSy8LJqKsazDFbs30
-nGmRJQtGZmTkawMBATYJQTnwmKibKoYOwFhAwGPkR0EPNs1tnbsyfYAAeD7CL0PJgvXdUemrL999
-U6O9epF7gPbKg7e0A/BC6D2KeBud13Yk95migP5IfiKPnDuoT2ibAaDEUA/kIAUaWCk+4zIWwxET
-CVFDCTIWgQwlTtDzqsSScCVR5P8p4NnsnxI5Se2vBSR0cKBsaTtUndxV4IMIF0RhLaIwNIYoLEgJ
-KSKIzIog6UsZEQ2JFFcGT57vzDHBsKnFzC5xi1Zubv+ta+C8l2te/qbqbrqkqa8m6hddd7LqGkly
-t1JJdcu8aevLgryXtXnLvWmxhiQaNYGgiCPhrEeI2JMmpYwtzGFthKrozFqF4YMG7Q1pWfmY5pSv
-ezFTVibjpUynGMLr33Td2s2r2lfEkniUlF1bJ2MDUIGjRhqnS5mYZZY6I0uqwbpunbUW0253B5a7
-zXmmtYERBzMyyII1KYQRG8lDwSbm5jlEiKLhIbmGmNYW+nDYKjZMXDErJMYxbaslUrgZpFL11Xvd
-7evWw2YhGzjZUbBsKrGm4QgdBA749gdQ664YOyhkt7zHJV5GjTStJiaayaMmjUrNGEuGOkAOQq7P
-9AHIBTHR9f9ueByVOfI0dA2IkKiTn2YC4SNNmIGMXS3StTKGUWLmulLrq9lNKVSqmkmNNFnmfdPN
-1N4iubiHjFjQ+VIj8ZBHz6mlffqeLZJIh9Mu9BElqchH/J2gnWQSSQ+93HNhD6UD3/o3wVcD7pDK
-Z50/w/H/v//P66IlQsoMCofkSeshbsx/3+9VD4niYetQPJYV9Sghie96oTE6HtFnzJSPzCcmff9f
-17XPPbe6phM/VWKRRIsUhGgyWGJEYeMNt2xRFmaxabbbqHXpVUqqmPBxWLV3X9QmK3VzMvEGCcXd
-jGMoqICRFYW5gUbN1SSiP4zD08youzdX1umo1+9kw0nWNaLFjVsIxqT+M2M2SNlhoeCHgzB+wPUR
-1BO261uuXJnFaNMUXGELlW3WP+36f1duYN+csj88REbaQ58iiIiOg5YLbvi8iIvOuouytdu1XWNs
-7kjualIIsbvDRh0jDbM1GBp2dGgjVJGNQnuAU957iYoVPOR9uhMUpSqhVMVidn58Y0mLEqiEsbLJ
-ixVUWVUaUxKfJrA0EyqTEQuEmSMwTEMpLFkpKaUvbquUvLttdUl5LczWUqSmvJava66RKJRqY4iT
-UUVVirE2VpUJqIlCCTHAxZB0QselUPyKh8/907H8x/B86T/pV/O/a4VfWz25Fe5mr2GQxT7KwpVG
-6bps0bCmy2Kwq2Ps/4/ijVCNK6fI8nCVPQ4J4esdL6gPY7+mfcf4A9gcomIk87umAukU6wCWg6Dg
-W2WMHTExfdJSgwXJKCS5iMFhhGk3CTTpYxByEmOI0m6Cm6EQiqSHvmCA97vBEqRClCKsMohkWf4F
-6SaQbbshtIjTwOoUVxRVU6HvIHH6n6+zrXQHPbR4kabMWH0sd3JlVsu7GmnJHJsxU1cZFVMVs9rT
-St6WxipVHKzddODXM2MIafj1BrrsI1NmRZYURo7jMjZs0+T3s0pSzZW8i2NMyTs5Mk0/QYqstosq
-KnCnCzVxY1jCtblmKuMmpdKRiw2VhjZjSY2XVPCPS4b152PJDed0rzuTlilXKxU3U1qslqMXLMW3
-s4Y1Iwl6h05vCalTNTyeOlxXcXM7cl3a1XYxiIiIiExERESVrJdNnCRXQGgJTjB829s7m/oFPo81
-VVYydk/2hR1b8n0vxVynV80fY4/0fKJwntLMvzlkn0zEGAnMn72ovrsu369OWopzWt9pmRdv/HRp
-/Uo9Xz+2TH9iMNoj4uGhwRHteJwPGw6CVxAlPRY3WNcSVQwB9qn7g9AB2EJEpEQsiMUSJK1EcD+m
-DTo8l9PXx7b9JInip1VA6FiYoNXJrTVLJNKTSmRUiQFToQgCjwsmwdpEaNCt0/qyTyntMWW6mVme
-HQZFHhgYsT5JyzTBM4tpo5syKbrYrFtiq0sxILTbhow2zGNqSMKkrWyfO2qCNaM0GQvKRMd3YzVj
-ODiYUZIsZD1ewfa++tJPOaayU9KUwm6HsMBiySVZEFSSlcisXkljCXK+9iZNLGKmmVo5NhkWX2I5
-Uc1giSc3pF8WYk1IDZ8ZPdBGyRraEfe6ukjXvSK4SedbOQwHsBKqa1Sra834lfwYxFJksghISgMw
-DH+5zCEPanRQTDkZzEk9I7PDs6akCY0r4n7LYlUsLJTIkV+jSjeWCHmQn8cnrCQE8QIeL0GiHi0e
-RI1CHq0lWVLKTIFAKQzoUZBkdYgv1JOkiSVqR9aNOONlPTEyYJS0Zcsfg6n4vE/DTJ78OSRY820f
-bn+qbQ8pKjlffiRyM0U9yqeL6T+TZLc+s7zkKPUwo+KegmIIgR6+aYRKSRDi7LHZZQFDKCqYmNMY
-mP52NOG6YaVVSMYtXhMMrAzTTZrNijZjGZi7Npoku2RwshK3Y0hiJGMNk0VMWRKwiNNk2NlStKyY
-oxTWmy42scP1sbHDE2uN3Ct5NqaKZTdkCMNSt6rGN4qK+DYzdtNJG7FwrTaYazY1itlK0yM2NDZr
-YIxqMxsqKonNu2it25mWN7u1eW9ep2RFeVq51SpaqPa1HIUyYoqRkkoSJjJNDLFMg5CyUEirHCmN
-aw21s3mKzDDMTGS5drWpmpKZS4zLppkEaZitmoG00mNmxkgwpiprIxSY1s1s0otxpWbtNm7dEqbq
-2aYSsMNiz1S6688vEYk0mskmZstWakskiVkrGRLIiIiVZKJoy2TbLSUkRNsibZEybJsyqTWshlFD
-YSTJIKQRRJQSOiZIRJdlFDVTKTJVWMWb0k0pJqUxkVhpWlNKklVRMY5XUpu/6GG5DsTtAagoa0RM
-xwaFwh2MMlVVWTZyZuNYyFkmpo2mmtH4U0DZFVYkKWSSuGM3Ym10pspqfFczkzI3zIqxlQDSxJGL
-JNGkyRQattlZprFY22yo2StMY2qfcvGyuHIVorZEyZMyCMMyUyxMQRkYJkhFk4l1qtNeS1Lm7cMR
-sW2OE1UkopaEqaYJkkoyoWybqaUrWNlTJZIquyptKYqE0UYphTcoxSlSyxJWyskoX8B2ZNr3U6zX
-TdvUq3Kkclg2J0YbKmhMZKstWyqqyaSktklpbJJkySRWpFN9oyLIo6saN2zZka2YPnMJHQxEwgOa
-m0FCXIMyWgIpMTlgyUrWMkqMpcYqWGUtAUJSFLQ60ZqCkpUiURNhkiI8/ze33GMWVKLuYj8yVjqY
-i7G5KRaBOvvUUVvWew7y1SiVSyeeCIhhIiz4XRPrFFIycFaWqmNoUtkWdlAR+MmYjQo4k3rXTREu
-eES5mZmZiZkbbCkziANoib3MzixCic3dQF1VOoBCOcf9JyTCKtxs+SA43wxy2RrgWQxjDgNakwgp
-GWY1UIiEgjGmMEEaJUxepmZGIuq5CjggclKLqICRRARiRXbiLRSjul+Eq8fQDbYZl5LQpf7Qetfr
-OOJEiFqQg6x4oyNJJTVQF9v17O0wzJ94g137AaIhhIEXziIqRCxGYQR5lEjSnM/LaiJiikpCcNz2
-vthc2i20qfBpX3hLGSFlVLFUJ9aHkqsUxYxiVYMiJYiklWSfgFI0RN7VJFqAwiPsVLBFHDUAiIQH
-FsuLG1iWYhkukCMMNLLTFFWGhlk1RjFyDUQ0QoJhOodEak0oDEAwSJKuiQ1BhkGBDKxZGRa0NAan
-ONAuNMETqVpApKIMMbRiZrroaskVutXYWi5oaJGtVFsMVJJMwZmS0XJAuDSZGl0MmXNM1pGWNGlk
-qKSUutDTGBmjIYkKyySwmwmpIk2jSq2bJ6qbrIit5IxTnEkQ3cbkMaWRVkS2pKSFCgVNiTFRJuwW
-Fbt1m0SYgytCyrKZSkspsiWRNk0klFlVFWUpKuE0aumlMxsRG1ZVtKVrTUpazZZMibZLMbbWZRer
-rpTLbCZqAIDbAQKDCChVYlQmRRja1LM0sWtVGtpapLQ6Mh9imljvYl2ScmkjaJZIfWpMKiSRRyRR
-HBRTEHYiIj9ByfefZ0cvLHBiDDwNaKD13/5JO1Qe1JKneQxf2rJJlAYsIxYKoQMMVMBQcJRTzEdy
-gbtu6R8hxUxV0KwqRhGHJ4DBeNk8AP7xtsb+b2NmLhheTWipRtJxUjZurNJIIJdxVEww5Gl2CAhS
-hJIGUYoIECAZA2ZegSBKH2yi7kuiMI3NG6wopDOJ0XqA9shh7GR84/JsR41EYGVZmF5VVq2iK2wt
-YV5WVrKN9ICbICfLAiUg0gbggm9sIi5vRUVotVGWWWqtuAMYRJLtiOo8UZC/lZICexUWohVNuyd9
-fFfKQR6T05Mh9xL6CTpGHBhMphLgw0sbmIrSmNNOFmw0qRvd1kKWRTEkNIhuawmzGyrDElY01FUs
-UgSmV9uZkhrVdd3Utal2+GjIm67VpZjTBmYS6XJbGK1ZFxnDAxstlmFbXVpkppqGqGkYUFCwMEiE
-QUlRAgI/VIpEcm0KobQiI0YpLByUiNokioq8NpVOScMFVDSVshlNJNSSOIJUhstWEJB71/di8Gy9
-gpH/bKpwq8EbvMHYKEyIxIpOT66iNhS7VbPvnscZmfi1kUshUw97B6LIn+JjG9k4LnLGMAIm0p9x
-Bzg3hwlDcmsl/0ZgP9Lbkm3NuxQ30ml0lSyJsYye6xI3U1d7HUqcaYnJJG7U12sirDFjbcxraSmf
-w/I31a6LJE7rGujEI5IQ/xQnSdNQCRARCOZjQ514689ZId7HWppzx00xiw1LvpGmn91jF1cZdka0
-3MNLKisVllkjtvMaN/KO2m6bskfq/vUyVOS0sGfF/C/XFWoYD8l+3X3l7CUkiEgJopSRpgmRCYgs
-IqDIQ2k0WOiU2PIhCCReoCFVfOgSAUVVAAAkFba3lNVq82rb0bxDR6R3STeRJqEOLCIqpFSIfH1L
-PiRiIkoA+L4j+0YMAjCqaqYqqKWZjCpUIqNCsidMmhEXSiiBpUDSqf8TjsbEskJrQm0kJ+R2OSHh
-BvA4kf5EKZ1qd4Aq/DmqH5x0nyJ/f8R0fIAhis9rlF83ikj+nxf9pH2PJ/CcEk+CfuVzRROZWxZo
-jxe5/cfhlMxunJ/qY8Yh0OUSWTG6yYyY2aaKrSNLHojq8OBm+dWaVElbtnF12q3Xe0qsMSaizT/g
-yTaT/DkxYtT5RjHu8xoSTcpC1akoiiVRalLIEgSqhEfV5glF2IEyOszAoUkq28vuS3axVXmVuu6Q
-ubiWr4qunkukzSbWndbhtVxKhDji6MMFijIw0QQxKeWC6GEfKMJEIkQ7n5YLFHURKDKEzJ0MxRoi
-RSgB7gGRH1lEjpbUPkobqtEqlVWknAVZkBID9BgeAyr2d4DiIxhIfMiq8uZgYT2gYmICQjhI4qA5
-IgjhCqh8/7dfteh0R6IeTKkpVWWR1nmqJW8R2czzkqFUFFFm0Nn/CWGSiWxJJySHMqs1PnRUlJtA
-2pQUqVKQipFqISyEShBXNkgywewcTheHNfqdkaE+iv87FYmtaRyRJwbzFjx9zIGv1u6Gwlkh/j/9
-HI9ndOamN4NAPARsw9DZ9EolKvoPWGKazFD3mzmSe2ItRObnxER5WpVUKKYyYxifFmGhMpszq2TY
-kq19xuyVEo28ldSrxcspbWiw+iQw5ODGH1BGkWIgh3IcnMeboxqI1i4QRWsHCVNJgbmjCkTksbKq
-yTdwJgm42TJhGUxYrlzYaVIsUUqqk2ZiqGI5GsVwkTAtiHZ5mjRo5qmEHz2yxNbtNWUnqHyevwiT
-kf2yf7VHaCwen2N5ZBVkO1eyxNJ9GI322uYg+k3fEWSzwfodpYnWQ+qyE1O4dJJ9bpDAHuCneTfk
-epVWPZJJPbJZEAqq9pnMVPyOzjwWrJVgixLLB4kLEpEig4lQzCCQENjGJJHi6rLCx8L1eyjzrO3E
-iydifB2Tesh9gny6OaHuYVhN6TQCYqNJZVqhWiaainJs0VZFVUVGwmFklYJiYbf0NIfcGgm5t6SG
-KRhITd3bmo5Pnh5Bzo+hKfevWbv/nP0xVVaolUtFWFVKVKJUjwdCve6vGlfL5nvMUOEDkRAhQngu
-0nuMMyISIhKYyQnzCFiRiySJ8GJId496yQr54QsNkqvZ9zq9j4/vaROg4ZvMlpjN/VP9G+I4fSBI
-0lSCURFNBCmJq0gDWGREIbGlIxJFjVtTatt++fvhIqkVUiqEWCLElBdVlVNtZrakpUEE21ChNQWy
-Us2ixTLWlFRSoS2SBmopWpUqEQ73QD2diYg5ClwU4IHHG9e3NZrg44+lJ7DvV7uswcgKcjRt6ZfP
-DuLuqejh8KxqawmsVoVWZGDUSRD9UGTUT3NmIqLCuSxNp6qVTYwjFyLMglDSC6fUdmMPtFEwYlSS
-zbNSLGxtKSS1lkpZWS1Kikks1SsoiVKiUSESAT7nt+br+bVRgfcYdgrSdmTji7j5zYwtWm7PDmzZ
-wyuWZIRDyJPAtW4YR0NcRJXAWVtZUknOv6RhRGYJMmTCcxwWjQzAiiEYRg1pyc26w+uSOpznDec2
-jY0jUTbJtC6MS0IAr4PqEh4DvOPLsdyZZhn+OwkihY5EhgnvvZ3Dh+wfxmg7E2P4yU/RJLYSosk7
-ELHYkmiMI6xSYK7JiuJpIcaGCNDGwGgwNlMNlsVirYqtLGGptNNFarCrkujTG1Y2zNZq6Uq5LsaY
-2rG2ZqymLTbBow2jDbM1AekVdfIfNbcPbu0//u8h6O7Hq2n214Sd1nSNKrMsn+fTSmiIbrYsTAlJ
-HUAPacN/pxUXR6TjJ9f4fDGTaZ130Ki0KpFitttDSReqUYjXFabmMj8FnnxJHiqf6lclR88hQRFF
-FB63AwZlRWC5day1RaplqsbVRtYNtsUWNVsatEYozNbYkixtq1FVRpJZVWoyoQPcCew8hVDzEhsb
-PHvNI8l5npOGiyREqC6Tc2UqzH18mhI3bMbSsWOeSbNQRxDofpYdT7W8kE0nITaU/k6pjuiO8RDQ
-U9yUjkrlJ6EnR4FXmsx3cpuN0ExZFeD3/0t4DZ5vM0tKqrHVZKsibSWSEOpNHMFjSDPACmnDveDu
-JeXDyR8djHOpJzLBlhiYSIpSCMiQQAjGhtIQgrH2L9B1mOH8MD86lesRupJE7ni00cLI2hPbJkcJ
-wdHzpD+lg9qMB4kDsRD3Hea+lGXneSqh4ncMOOpzF/N6fEX2yHcIhBUDt/D6HELoi3lHm9JRkSbS
-m1s7TU00Vqon1rOqPBZHgJWhyXgYeBwVgdgcHUKlI9jfJH9K9Hs+WHtuHxpk5VhZlvBv7h2YORiB
-hNVL/1GHNIDZ2DUoUbbm10q3Wyk5a6yUzVOVFrGtFjaKuKs3NRa6UaLSauajaNRaI22N23dACRjW
-Kgq7X8KS9crxJaoXXadut2u0cvLdeTo9cbr2InRV6hvwisOGK/YBEgRDBaExchcGCJXAZHAZBwEi
-CSUU2MXQPegdCE2wRxglLmeJrQBv7M85p9fuYjKzBlyMR8syJ0ZjiQbiOa0GKemXeD98nIUuOs//
-n9n+EIp7EZrlA5RSCpcwnmERFIojB3ChiIdA5OPWm2wv9Zj0REhT+cEMRDCBJNj1q8sPlYtmU+Kg
-ytbJEZasimAYiIiSISiTBRzNJiLgtXStFmq1WmY1qsRpSq0WpqkcJafhaDRhhgYjBDFTEESmxk3b
-rbqtZKJKk1+y9roTpiYYhgIpViAZTcJMYKkjby627TJUkiva3l1uyl1VhikmmzGaku2XUBil0wbS
-ujWGBKCSxtrNSGQYUiRFNhMcFkaVNMI2amKqmiVm/brSliMbM2KSZbTZLKTZkRsmlkpe50lrLJV5
-dspXTXUrqSJGrZV2O8FfLo1oaE2AKOVglrAyDSUy9OvWm5q2u2rraOtvVPPKPUdkmwyAmOZqTaNW
-0YE40po5Gg0TvK/wYo1BERCfMWTG5gIpxFDQ77YJvB6BmUIjWETW8YBLdb3OuTs7rVZVfeVzurdZ
-6GzLOywRjWAYwHrV8EQzDnOnOZBq3UDiQdyQZkFaVV+0wMGepQP7p+0dn/AfV9sSH2ngeo8u2fdb
-YOV5gREOpfMEMQyksyBEJVBO7+yskSRqIsValJ5iuvJ8FOQm8nP1hOciI9z/j2J/KQ8rOU0O6wkV
-U9ypJOakI7So5Lti0wYi7hhjpE0umgiHkCj1CB/KaHn7GKxRzBzVVkhic5E2CTGxpEQQxEQBMppB
-cVkSIVx+XTJRbJ1u2jFw4WMQi1lVWFNS1LFhKpRjSsLNJkapGQ1NNZMKaaKqqjQ1NaKsxrWokxcV
-UVc0MVpjEsuCrGNKKrMbap+ib7Uutr55wQ2mINj1taPJYw8SML807R2F6vVnFviRyNGopT8qeJg+
-R1h+UTEk/MRBEk0UDR5FescQn319gfEsQjHRh72moe5dE2MXGTTb8aid30CH2GfUJUaT6mIvznBU
-vkypMEwH1ynqGD1MkyREERAbshuQ+4JTQwW6Rsw5FYqWxWk/jEe1sbxW6rY/KphV1LzNMfPWNszV
-ypZVpqZsaMbVhtma3MV0jK2yMj96BdBANpBOEXSOgSVolQ/MZzAdZb4kbmaKnue9snaBsTiK4Val
-tlXJdjTHaklTLUpQhOFQMkpElTLogkAGqmCNGaKV+JAn3y7Y+Qg3uWODEOHI1ope8RFew9pCqegk
-9hpMGMjAhCvNP5nJOvSEjA9zdGDtT5598mwc9o6qWfW2Pht61GHtyJ3v6amz+/8HNJxN/GTRzR+o
-gebnr0OrUiJhUApkc5HOWMoRatFrYpMzJtUyawl1phNtk0kWCxAUkSokSIMSqYtNZMYyxXJK5FfB
-mPR7USfo961pDIjJJDUCmFsshAqpFiUkJEd/kVE+ggEBOR5PQRX4vtGetQ6Q3WYgZJQUDQHNT8oj
-juY7CcG59aiqjFSIaQ5IxJ3Ekj/iI3khYn6aEkkxBTdjEfznJNCvWG8EtRBMxC4fBCAKWTosyRsr
-dcLJWZmYYWV1TzPgbGykSKsio7wDmQpwhohSWRFOZhixCIrAIpyIQTCdCKxSyu8R0zEPzuZ2UssF
-sJvaqEyUpQslRMiPKBOh4FDEle3xF9w+gaGJ9ih9rrEn/Ep8UA80rEoeYU0qL9XQ8X4nBKv1yVEN
-CMRt7jkgZ81MXc3mDRh8kYbZmrLWPQjHc8NzYnmAdO6lEiTsUX2B7EXyMdg/wSUSMMRK0BCbG5to
-d4WGD1oCZjpkKB2jCiViBszKLUTWyCM0WQwkkawG1VUSIUiFlUdyHQJGsaad9SY6mYcVwlLGnRpS
-NIhijkNjpptIiWNigmME4TEU4YVclVMQiJoQt0sYWUqYuHQ/2OIbSbbxFSVwYxqDlIj9EJF6+tqn
-U+sonjKm6/wsOcdVSekZuq1O1LmKsCYtqLGNtMKwp66xY2xg2IyDThJBoh1GmEQajJXddRMMtWk2
-punSsBYSLBKswVQmlny8Uftjlu/YuQZ+cva+PjkT2tCVTEQGUREBq/wzTxdTjFPWJtH7Ly+VzwbZ
-a/Ss7LuqVYWH+DvfVQBB23OsDZrJ0cFGReyJBE5NGyySz6TJ4LLNq3eC9FHg2TFdXxYumKdVeCm7
-YMEBSwqeCoaqK93LCiKX0ls6oxG12+IUKWq9VnZZ/3QR440d2E7qw5MV0bvEaezCYAX03wJiICF7
-XZ1carOper3VpFibTvSHScsnJXHbJyU6z/izUEazlZyXThkJ8sJ4YjFmo3oY6dBgiqCGpNIozkVF
-FEq4WOQCI8lOPGqNCEZ0MJ9TRoTyt1AYcKWSIRI0TskbESdqHR3FGIEdhWgEffg4RgowSeroqbZz
-xNBRnBQWoEbgbCpyOV4bJw3rbUaw2UK1Ve5XLdgaNCJKJJGIYHXEkiHKmo29hWT4FRcPMNlbgojq
-QUuVBizBMriOBsSJlFZEObdu44aPaps03ThJOG6JDHuVu0yJ1UmjRiQxU0eTlW7fs7TazTPBzx8S
-9GMDyLKvQxiPMRBCN4MDLCy5JAvZhkPsSYDzGdGqI7nuPMo62cmgt2Jmzk2dK8VHKqs65nfpg5da
-xOGPFHm8ljFBnkZ0UaDsSYhhIhgMYvJTHXbR3rSucDGT24q1euyWYKEQKAwWSnGBkkLI4ZNCilK1
-0w81O7dhZN1md2tGoTaZw2TEu1WcJnPo5G8bOEiSNMjDJZ2aejkylVpOta1z00pjUmeAmMbZXqun
-fDs34Y9HDu5HR4unhJVqtGDIh6MHJXfdhuuK8mujR2NSJ2r0VNq8cZeBNjJwbKSq5s76NSJp8lOp
-Y2VybtGpJJHIwxlNdHfW6tndiOyljlnnpjl5MEczOHqrzU4VHR1ZOymylqaeeRPSaYjvFvs5PDZs
-3ZlVDGzTlMYbFexxjwzYwpEiYIgu3LgiRZPUYVXhWowtF+Qw8LAq7yciyKktTEaongjNEgSymESI
-gQuXHShqRB0Yu6PcKjFRbq5mTHDMsG8aTpXk4Y5t2laTkxh6FVU6ujzdWxUxWSefk5uGNzs7e70b
-O82cOTq3V8hEEcSpIAgtREABLavFJ0q7bqZmZnN4zTzPlDJBQWg+Ed854JMwBBkskLvLTomAILMS
-Lo8mLCvRUxiSAIHt7d26nPUwBA6xJiiliauiAILV4nCdBvi8zrPnWcTovrPvuYIgqOJCAmGLBxE9
-suKN2YEHBJ352WH2CLjCOYAg42+6vFYnnH+S7ERoMnBUUYrMjFRodiDuKK4wizJIfGsE1NSkYqQO
-rXcrMicihkOJaWyCAYdCYTnlZgudBhW7FUx6PBzY2cmMcK8WzHNT23lm8rjD8BiKNzKcEC0jeBll
-GhHAjkQcKPrXV1689Ojux2Y/0tJOTTGKd2dnwbGj1ZDHbpdDTlzisa63Llz2DzfGwxy5W4y5z82b
-sIiIM4MKrJBE/MRkcYiA0GYgzv1vhc1C8lROj6w/F+tX5kqk0Sc3y7uvrwusrtqrMwgIZuAIbC0r
-JVlBZKAOqJwe8psc3kksYI7fPEQatem86o4KMFiNmSdXXLjl7/hqxXULYI8p6SETnG8RHJDHJZ00
-vW6vlOedvTlrkCW3lkQnNISMC6rWCr0nzBPWEHynHM3Nz0rir/i4OSlhWSYk9ZH3vQ05xsaeTsTp
-OXDh2u5wOjZfgeIdD2m9W2YmBVh8cqaMM627ZbpVXbGO7P2/Ph3XtRckhIxT+bsn0b/NCR4lsh6v
-qbGKn0OjfaT2xKe4xYjOJMMYEUViyWCPe2UjAqGDFiAi8WTILASYMFDJhoRJDRRWEQZDM2InEhDG
-MYUIwIFFmLN51MkKBAFbwGxjrXA5o2NJiOhBU5QWxuvOMUjw9b65Fe1mlqHRJKxNmzWl1XiXj49u
-nhpInhbkDoMDeMHbHNRg6DYDRogiZDQ6B06YZp0aDWooWpm02g04bZgRtSRhUlal3Ow6ujAYxWId
-6lsnkru8qySR4qJHJRqiuRiJpYZD2Oqfci1KRCOwKeAfn0h6yXcVURn9M/FPCMJUzMEolR+p/MUN
-OsCiRRDhMQ0xkjcjJkcyMQ2SxDZLFKUIhySxDuRrtdq0rNsaWNWVsjEyCMgjMuMGEBobVqNGOapk
-rI0WqYdY4GbYbFtTDtYyZhmiy1GjEzVkaIZNJAwiY2MkkxV0zZWtM0rWmaI1pxqYcxwDDFxKyNFq
-mHW2GxbUyVMO2ONZGjEBdIDICWQjRSmFGhdXVaXV1WlhRFhNXVaUgZpmly6rS6tlCjA6BkHQDOac
-DMcamSphzHLd1djl5PHi8nhmhmhmhiVMlTKakwCDMcQllxYHREIYhiBgiWSxSmhipNDE00MTeLyX
-peXdeXXYZrx2Y5eSuvLdskstDNKqltUcvJteXlkKMhgaRSosy6rS6tlkLDbNWWtJLLXnbsMru4Zo
-mHMM0acLTgEMODA6BtWo0RmjNFlqNEOmSpkqYQkZHSMA6EbVqNFqmSpkrUaLVqNGOapk2tRsRmxm
-iy1GiM0ZonJkgUtMqMM0q8ptrjl5d55G9Wo2La1GiDDQ4OY41kaIXDS5rHC2ymr/S1ktmpjGzDIt
-1WlYxhNFIUQ0QwhUMIYIaEIUMI0RoJ0zph0Nq1Gi1ajRatRojNGaLVpmoqAPgejCQ80OC8Xm9z5G
-GlZWIrJWzRjj3ohYmVHtpTaMZYqsVVJliaxWEwboeeKfiEmRSJ1SIgaIe09x/kxzRJP8Q1IOSIQi
-PLs3RKqW7CSGE+Y4orxnnx/qem7G5xbj75FJgpKaUoorKirBgtFjbGJLVGKQHU6znsbFEQESNEQd
-kdhavhiR8hmikHvovgjo6/OHxE2fEvQXHLAfH+dP/Pt9jcTzaVT8yyldX5WJJHugQ9gioYD9xI+4
-4I8DqJIlY+o+9weQPN/wf1NPJv4Ovx0MPBntUqny97I+B9jlkPiQ4eIY0RI3Qo0adwzE2TgfYdae
-Q2hHkpVVWKwoWpVEtSXd0YGmiTZNnxaR0k82h4PyDe0tSQggvfOE6ThPrHX7xgH6RJ/nITwTiJkE
-8ivOZgls6T2yY0eTNqXyFwYUAWCIhiIh8DA754lQ9RAo7gcv1+JsdBRN3xOfx9Cj/m+3n6C4O2fD
-5Sfj9Hd6APlZPJZ9lkhFpCGVBVUGIGSGIQKRqSQEmAdFg1ZCNV0UkQySTcpiyxCrEKeS8SGoz2LM
-k/hTIn7UGGqD8YSu/rODMikwjLKPcYc9VG2aM2hidJW2F3LvKpqbRN2I0bTN9N4NodEYZrRazc3K
-MQMmk0kIlmNuk5rcKtvWecu3i68t3lrkduw0cktctWTNKrRe1XVvFRNjzi4BwKPmQ0SMnqvbiT3n
-htsUaXLtkyVWNNaWpEbFTIOSR2g6uZGd1q8G2ItQelST0fTtqSHhC94Drt54E/k24AXYfgG5P24V
-M4SYYh9R919IdSq7E8g/rNMcuZrR2mG00kBssp6lPVVU91ObVpiH1vHaWIqyNX+YYk9mjnqU/XBF
-iSJiHiK+QjxJdEewokPA/Tj2KBXgj+f4bOjPQt68vjfoLdV1718V7vnkvLy88AAAAAAAAAAAEB55
-54B5554AAPPPPAAAAAAAAAABmZmZmZmkXyIPNH3ou/AInnJrnHdm7//v5v8Lg1pTKNmxxVRC0xeX
-yPkHnBHwMQBoRAcpeZR9uhwTQ+ghpfq5mj8pHXA7eNhlqHCNvUh+Dl25h8zHw/ZkfB+zaNrThlrY
-zYYqMXuajkDYp0t7je6kScTFD5+1hs4OUUHJ9ocHBQaNEgSIkKNGiihGA0cmSg7GCTkMEhwUUaL2
-6IjfBe846h75NEmRCLjPFB2gIcYyRiORXkxsOjHCjFxudkbikIN2WF3gwMIxIOiOMnL2a/8iyg7Y
-k7txjaObprVnNCSOWNbujIcCeDqxyNCMHLdFGAqEV3OwxnEmhsOCWM5GbEVoYZOQIxzig0IgjFCg
-wSb5MwoNnZ4ITmcV3rpjk1OrZZP97tjep2S2d2M8hvtFkFwFwg4NYKVRhD0I3AIRFoxhFFhgMCI2
-IRQ0zoQaMlFuAj8hTjw47uExswxUm4sLxe+mzmwueOLy2EpJBXKEyItWriVckYlBxc7TkJObFr5W
-JFBiHwQIPLeCxFl5EbOsM4OSzko3pmBQEzzzURW8mCRFgKAkBEYcc8TdYIoKqqIqMYOPIzgs4BHI
-iMiKRooMMCEd8jMnh9REaL1F0bKskUUNIpFlBJUSVkwCCxllxERkooGYLGIgREYOwyygwMYhjNZN
-scI6LMkYyUF9yR9c6OiDcXHa5OTJseOaL4GcnN2UcldOYWA1qQNHJJok4JEZvBgsoswFmqOTIbgM
-8m7c6nadhu645HNmTZEyanVjnvunDhkN5Tspyfp3b7Q34bGmxsmtUulVhg5KU8cOy9akkjFkQsvb
-Ts75MVsV2rTtYdXZ0E7c28rk2nQwrnWLg2YHG4wblBZqIJKJKKIkghGzJusnbhmikBCOsiKXBJ45
-gSOZ6XEXRacK2FXZFhi8K00LzBGfMEdchGBQwgg1AjAVTXdOggXQE0SJTEm0mE4XTWDpSXiHnAcF
-sY7mjSKiHUiRcpasazWbcmdkrYu20zm2kIzdK2TjKBR2g7KeTeB1tiMYI0iIMHJkOAqCA5Jjjk5T
-izfOzlGZTMk6wTohFRxrUAHMRAmciI8RUM6NEsRsZtklPJzUNCxIjdmKfAWBHKjOkYTjQHcqOYH2
-7kcdo2cEnc0aBiBFSGCRm4oqm4IRksnvWOhjDJBcgxdwsyDi4DOJhkCoXcRpZ1janOTw2052N6YS
-uR1cpInWkS0hEYyYBEzHNT0Y1EPk9QyHFXZDjfPRIqI2buGFVpMN5ezhy77R4Ic0EZ3YgitDQcbR
-egaQaiAbtBExggMGpCZWXO5KQk2ilLCpUqqJTTqinUTEJQnIqZVQTKHVKVKQ4qSYQiqaQ4qWkmUq
-ZMDljiRFSTMqmVUTUiplVE1IqZVUocpunIqlNlVE1Kpm23CIbZu35uFcb6SIbK41kREZmEaVJEwX
-qSRNCN5HOjkqGWQ2Nb5VpquVryXKI1u86LS3UzpKvPfrqq5GsRERVpSBHIGZCJCug8jBTfgATHEn
-eAJWQIhoorRqQxV0REW2Isb6bV2aTTKI0e+CVWXEgAroIQEDIOWkFPh3v+74fbGztmZpaTUZmeVv
-PO2GzMbO2RDtnJWvLqu6+VtEn0WD8XysyB5lN46ySGCwjuTush+ZRJJtXevB8nnJBsLUtUVSxFQ/
-1SPdjpSSc3j3YywyZj9z+rPP8jfJwbKqVi1HKInxfBiInnBHuJRDPFxSF847ErsDpgDwDbZeRJiG
-nGZUIhXdYPxS6IN5TDcBxTIHc0BhsqwmMO1mAOYSWCqo5IoYSG+jA2EkwCcVE3TdcFNmVU4FPBcP
-DZToG4YYEOl9RhHLtMbnTjZtVGSk2KqWCp1ZJi1zwxNzGNYs1jdyE3ampUxwpmlNlc1bKDdZNqm6
-bN1cm1VTkw4pw4XE3cJJkJFEsQK8SJzonl1IcBCQSkk5MExK5JGYmGYJRMrIhKK/KebwuY+siJ9S
-aTRoU0tisKtk5uR4J9SmvoeNkUSEexYPJJJv6+jHP0bGujNpOSklnqUbKC7yDIYoFCECJDOwIsZT
-Js01w+hzbcbncQGRG0klgeDxPKec00Vrdm8RROZNPOUtpUpF1KSSWWk2lZSymzUtJBBEQkNKCSCm
-wK951OncFSZtOzGyt2ysYt0zy9sEeDxeaNWLNLJCSammHPu/nVHsX0L61jf8G1bfG2PHHHtw12SP
-+uakl55HOsVEdTgrxQeLxgBHSPxlmxYMYrErDzskbyqsNpVUtlQ2YxXqysYrJdeq66JrZZeXVes8
-66oxsC5I42S9FFXCEV6oQVD6CVHEQIAEX5IUfyl5r2YkeczRQv+5YVX/D4HeeyJIcIcTVmgh7nXc
-A6NzW+h4UjiN4ig0g8HyhyNKd8oB3yq/JcG4qPCCOh0q9udQmjkGCnvPehWwS6VUTmkpVnecsgj6
-vFyksbckbkf0fFyLksNN4dPhOOTiZOD5PxbHgbtjcqcK+qu+xz43bsrg1gxuwct4YsJpWFbPDq5W
-MqcWVUymrpdps88pt15a1apZry13l5xC5qWTStFRVLhphpUaYwxjEEOxaCF2IdksxMDRiak1Fq1m
-aVTVVpqzTVaKsFpDVkS1psxsStKymyphbljVasLVzWZMzRQamhMITRqVKwDUUhqDVqFvFePIchuO
-tt3XbuXk81yueQ43VW8Xli8ui5LuXXXk2t5PZt3o66U67KVJZJVKoqmzGCqiqsiaumkWoxZPLq7W
-TeSrhhLAWkg2kxEkLt2m1NJJXltb2vURk01Y2WTZszFaYampppppKaUjBSjF20aNicYXYiAtBCFH
-JDOBXgfd2r6lzCPLSGBLXrDIGjyQwljVbrkTgRGC47HLKW5Bz7DsMmClCp8xhjf5tgVDwRNh4Ajc
-2PBR/tI6eP7XupFIKIo6EghmWAquTEhEFAuQihgSuSOSgJlhBQCfTBkqBpHt1iuBIz17HmVfOX0N
-MfyrG2Zr8GO8kObJiPgshqSieZGxPzqSqfevPpkfxZMlqO8v9WRmZfY9yTzWO+IhizuoiJyeMkeK
-Ah9w8tAYJnvwMX7U+EvtA5rjsYv6pJwJXME2kS2JKBCp4SKmywilkCqKpVRVQV/nfInsWHhVEd1E
-5OlYCUfl9wR+rUl6kbMhJ5K72XnjyPYw1s00b25j1lmVWbPY2bF2WOStcsi8GSY3/Xg32xLLtu0r
-FbX27dHGKpzUZU4WcU3amG22aVlTaaybErbRg5RZqY5fpm2xI2PeqTJvRVXRGGnsNmipVKJ9B8yp
-wqqflFBWaVRHY5naew7MO2PYcA4bHhzHBIcHYVFPSMCqESpPfz/VsP0qgw+Av10XCcxjrO5BtHtN
-tErSsZlR1SPqR3KhT7xknJYDRFE9GdsBxJCHCEoTqI5onk7xPae1QHD93LPm01q1VvmP3pJ4vLUy
-fJX6xsbHZp877Ukku+SSTMhIjwHtf50QsSah1kn9zk4bSf2Go3fEVZAdBRWgUYgQhBIVOzMRKeuE
-1A4yARL4yChtBqBRMhKQ1KqIxLrNIYhpKEY7zBxO/q/Mnm8IbOX85yzj/SqqtkIFqTUTmO5qG3RN
-e094g+AhskHWqJ4HfAtSpUbydVOr6ooqLKJVJVhYsIVygpmQ9+jRZ6tk+dka1fY0Jw1E7p86JEoU
-sXtPargJ1JB7U/95AvQ7QXDDBX/DIkDFIkRHnEJP4tkh6NCYj4skiPi/c2j6b9sfb/kaT7qm9fo/
-y591LHNk/3ey0VmODwacz6wRHQdxJX8xm5pyFllYlNCQ/F9J81kZBFKsiQaT/VNnKNibrI3UX4Ee
-9QMPkUDSCHU7pC+EYw7BDz+e9OJPiZqnYFBToi8iPch1IHzCuHqp9bdkTFiqk+n6GET9ipP4qFA+
-cleCT2EibKPuP8f0ASlB/xCj+c8FHl9B4PsEggScQcDIMlYjEJVFkGKhRjLhiS5MVFLjAmRyIYGh
-BkYFXmbyUFFLGHwM3QDuA9OOi0YuIqIclVWQ4eDj4Q2nCef7jv/PdQ3JB/XHXKH1SH1OFk7chOHy
-aWQ/RxJ8nr5CNQVZImYilk4YpkESIdph8sPsFXdghYm4aqSJ+0rK0KYwvAhY+ckTZImxInIhUgmE
-KIVImyGy8n5GfbJvEbq8CyMsnOg++H+N8DvXwX2kaInWGOEYQYwSpAOWKMwysjC4wyWrPQ/zM0JW
-pMSSiQSVFiS492imGFWdGTGPRWqidmkxKrd47RTZsf8TGJDdDhM5FK5usL7GyVdm6TZppT85xyRI
-4ODF42FOHmz1uKw9Y46SZD0/e9GaOax+L8nl2Rt0vbIrszS2bM8eiqlZMpLMRMyNb3LudEUqpR/W
-Ww4/n02qqhJCxqJ1fo9nxkQcRFdhB7SDtk/gQeph8brT7joPUbGyd1Vhh/JkHKySOyxCrJPzrIB/
-3JPjPjiT3map8AXuqoUPr0qoveSTxJgJteWMgeLeSehpUq1SkhIPS6sSORmikqY5mGAOy4gSRMWI
-bKkPBWnrW9dV+z68Q7RJ3WKoR74ni7LD12bpf6T/FWitMH1X/bWyVU1iN6MVvT65X1qcGhjet1Zx
-kG7askhssBipoo1pZhUPJiID+mSmLtlEMJHYRFYK4VzTSTxe145VT3rS//qbNQvzK+MiprcC4JCL
-Q/wNsjycMPLXUq9xUAIGzofGcpporVy2VcaONmxW3xa+Px34bc30wqS0lKtgWUkLSIddq01XwB+H
-fjX4N69CQAH19a0sOkfuU9Meu6s/E1G3z2a1GUazW9bZmH0mxlbRj8XJs8HBH1uTZI5ucrKa1qdJ
-rRpimQJZXNm8Vybqs300qgRlvKKC5BGbIkRUlhyZGQyzhGChs/PNf1Cxs3vCtFWV0MRvyb7tiuvG
-ZEh0M2YKGhAUYMlDiFQI8goZzTSaYreY4VpRVU1Ldq1l1pzcxN27fcxsxhs4hOHg5K8ETje9kTnM
-dHDHIta2RpSuysUqVtjZppXmw2aVyUVMUwqMYxipmTExVc2mG0ZSyxUqmcaaK3SV3cTY09R2FnM1
-GRm00a0wIuQolYyhcQJKBp0hslKGiVCuFAECcvQ6swLGLRQynSYEjFEii0Ik4mBnJkkZviwaOA5n
-M2qeMxwNnRvKbQRMzHGzfW1uq2VqzfZ/1fak3EWMUWiF9q7nd3Xtvf1iluHLQ7HbcO0FNmOZjk00
-PJ5OY06PA0/aZqSdLmDHgiYEKeswTpoqMCcGkwhs0ZNQYhJLYhKtim4Tdjw8OyRyexI2Fn5SnROc
-gPBGQ/2AcwVESVKBZQJaBVSSBCyiwsqCkkIoEovgEJ4O7dE/mYdE5qtBxEcnCd0jYjzdp3m4eEEy
-lERMxBCQpBEkhMBo8gHrUfUfGVe4hU+2O89r4/tf6fxIo/7hIIkiUQP6SSlO0hE4lEQ/vUARkD5f
-7/1dPr6mO0yMvAT8WQzInk/mWgosafWn3XcYjE0YeD7pwtwfWbYPuT9YiK/tClrntMoydm3LTJhR
-engR939PRjqjf8sCSDnk8nhdugu+PsIcH4i7fS7mf7DjNTgWV5epqiuhTDmcx9oJiPyg70YmWusM
-zD9GDrq9EHlYTKTmUyTf9eq1cyrNKF9f78rrv671xuZJBzqOq0sbecXDFiNeypKSrIGaRDF3WhF7
-US/K38M77G4WRFLI3finhJxdI0Q9ku8KVqi93IeUf93s8760bFKn6K+5kEn//i7kinChIQ+5xsw="""
+NEWMOD_TARFILE = """QlpoOTFBWSZTWVkPArcBRLd/////Xsv///////////////8YAQgAEUsEAAoApAABgig4YZe7en03
+06+cey+LPqfV3aPm7ZMAc7D3avd7fey++476ejddNe3wDPvfd3cx2TbSvn29AvWVfCI1cLtuLQAZ
+13296r3ZoaAOo9GVOzTXjrR27h11Jtq7at3nB4HiVRQC2x7zueFjL2y5traaatimir4G4rra21rK
+FG2rJ25wDRkjLM7dKdaBqxmRWrWo0WyqgG2jIpbVUgRSGzhr6UHue2QoFrRENrJbS0VqRDIPs7i2
+AhZZjYVmM7up3MJ92KTzTbVtO2UvLZ6gmha+AHmzvc98Lz1N7muvoehfNeySXeDO++971Afeu4pf
+cO63vcHo9XvvffGLed92C9Dsu7g3TW61e3wGjd9265r75nrHvpwRPUiVLM2E2XxuJxxiaN21XUc7
+dmXEQ52PrTR0Ae1vZvFiOB7cgI2Xq9yl7YyQHoooB0A0oSAHvZnd4PUABQAUfewBRxuRwPoaBobW
+KEgLYAa9ddSAoAAFAoAK7N2d9PVNqOjZptyAAHevAAAdCANUUG1bBnuUNNNHZ333d99ZL7aCgp75
+Odt9OuzGqlW0i9FMUot3dK1jppWwz6ZCQetT1qonbQEFbbWljYW+46R6z6+9vVCwLT7ZR9Yqe2F9
+etOqNm29auvWSck9Gjxb21qCxtW1nqon3A3gGgNgwJtqCoFKlEodu7linYBSpVQtbyBkCo7mNOhJ
+KU+d959yPJnNmr2NXoNVX0yr3BkqclGABQk1s+AWzYVRfQdzct0aiVJ7fdc+7w2aqVptu7KCs7n3
+maruyuDaazZjI9OgEI9b07tvYB69SIqrrUpg12O8Xlzyk0xMbB47UpbGi7N6729Htp23tijqY2Jt
+p7e9r7bwtfZR91ZbPdid2eOPOoro7dwqqTbe3TIwjw3uC61to21r319B96lXW+Z06dRraT1k9vTp
+ruZI9Vqo9tKkVskZUqoUoDpusGsmaM1qXUuLzucvGbsbbFrLg9x0++7r1vjdZHdsthqK7jciWzbY
+9nXVRUqUlHrTubz75VgNJa1QtKwV0A7s0yctfZjjfTPNDS6zFSnSc3ve9Pp3t5J21zdz6d72ffDz
+k+gBQHoZDmwCk8bd33TucaVIJByGtjUpcOhVtHXYxF4MZUpBIKUXe7n2xcxrzaUSL7uboI2ovTin
+s3z5Jd3wlBAIAIEAgEyMIBPRMQATTJoaj1JtTTZRmp6aamT1NDTQ0ANDTTQJEEEIQEEAmhNMieU8
+mmTTUaib1R+qflJpoepnpCeUHqb1T9UD1GTCAAAAAlPJSpEmSZT1NlNAbUNqNAAAAAAAAAAAAAAA
+AAAJPVKSRqJqaegEajaj1G1GnpA0aaaDQAAAAAGgAMgAaAAAAhSRBAJpkAmjTQEwjKegTJiRT9qn
+6TRgpqaeU8p+pPaQGoZBkAGmg9TRoAVEkICBNAmgAQAEyTATRNMTI02piNBPTVNPUHlPJABoZAAA
+H09/+H+73ADKf4p/oPaU/s7/EuPzvo+Pi+cxeZLZ/eyP9+KZH/d/01irIwcvfECH+tIF+4Asltig
+qg4qATjRA0DIl2CKi/a0kkB+lpID+Y1UH825hfzz+9wOcVGMfvkynEYzdmZvF4zFZzkqXcYu1NzZ
++cEg2wEH74Ylp8iHadLJbJChiCc+rVt510eHw5eHy6w7m3LG6YQ8sSzcIOPsShyYbvdbd6MZuo3D
+eKhqWys6iMQ7ZuIwRrGijnvy25JigE9IrASzTK0sElMkVJqYsUspFTYm1REpAygEC9kAIqUKCGSi
+DSANCNKjQiJQILCIWaVEyxqo0FiGrIwEWJIwECiK5KAAuAEqgiOvuvcjiIMZoii/vUGVT/sZN34O
+fiWva0eP8CtOHRmsqND+47J/QfkHT/LAkOyPNk/qIEj+0/yGeEcD+tmp/0OKoUh6+1et9P1fle3A
+b378p5AQAAABh9f8vrwAAIAiAPh34TwAIfl9d/gcU+T3+h9ab2Xt5XniKcMXs0kTmvo9Lj3Agpwv
+UmtVVf1hZG/9MGvEzCOcV5s9VzW5ULKYd7NFhIrETFc5QP3SYCqogXv/a4y0HYdQT+VRUU1r1F5Z
+iI5E0P0t5j+7+FZaP0/wC/2yRn+YZ/ISUMook/YepuqCxmCSuxSJ+S9GfCJ+CeMCGPCDvp94MeeE
+QxEg8sR+dIwGRXkEiEi4TwnRinmE/hiYNfnhPsYj7IkMVkkASHuMpTH+SSOz9vueLoiG22frPyFD
+H1cYiZDjm4w0WHOhAxIDCxYJjmh2xcOC2OV1R4DAwpUUoQKQvFOnoOA56hUriUHdnk3d2zu2xj3f
+R4O6R9NhbatFurGFEVZ75lCqRFuRyTuIo4k/X2/v8FdD/Ay/89wR06685/v6ddo4VJzfffZn2bBs
+o+v8c5VJHwfWyHqsT4ufvaTEqR1VCsjp6Y2RP9Sv99GmQYg0S5BEB1yoceGGWxIrj+zCbX+SvRYc
+KNqMNFv6qfjzyeLbI3n5oUfulEKDXVnf07XP9Pfw3PHfNJQHz3zBK7nvkvNgQ56qDtc2NkeaUJRP
+lgP5H45Izr+xoq/YyBUUsKq3RQ9ggongwJ13CUnA9ZUIQHLyTz4evfyRub5fNrTTUUWsON1m2Etd
+v96fWfghBPvaKhFTSpgrk/pi/+TXvquxTO9c0R70LH2EzsO4xRNb7/kWwX7CMjQwXdfFE5eRqiVv
+0EZrRG+09p8x2nA4HA4Fq4bIEjmYJwWMDsUpCVNqoCzgRL18Pj9y7sgB45TZicund2AAYABIDnEB
+IKqiIigSoirAPxaPbnp69vRnQfLt8MfLJqf3JKlGubN7b/5PdfA+K+ee/XXqIBHEA2mNLMjHduFJ
+i50Nlik183kYdGe4vxsVPln8UanccjDfVrVpOOjVztq1+LTjWsuGDlq6EROLBBU0EJpBYECGYShl
+5qtNq1xMimgyRAyNUyBr3vteFz7RppSz3atog6g5iKfuwu4LbcMtofMRiIqBcPD8I6MGRh2UtN7m
+J57SQ5iCHFQRPDlVHMBE32rTrxHM/fiFq8jOw+znldZVV2rTo+Dw3fcNRRSmE2jpiG10zngxLzpR
+p/siL7zmSu7WJ1KgY2NjGMYcxjN2ynENzQ3W3buF+GLf7ay5SMOHbgYwJ1HioftieIqRAjt9jokS
+ShfQzwCCsePLmiu3dHrPd+PTOqeoRp+VT2YTXL1mglvmTYLPGtRgnNTHxZsWNJckw69fc+HF9HJv
+QoGfB/FJaMK+S6sJrjCyaYQERmrG52iu6dR1J1WjwXqxM7QRG5pvkSSPJR1x59fUd3YMHcziQCKp
+EJqcINQX3sMn55NpLrwHjDqKfTn7PL1f8PHiUiJyqf1cuzVd4/K/NsdlTXnFjGjOEPmRR+OF2ZL/
+XjDyUaiIeK7TZbOPwkTSyxjE2vTtB+B7ZaZx8JicOWR5PtxNgc4QeG3l23oNyb1AEG5nw6rgmdwU
+0k9HyidxRPXUzTPftAt/K5NX2n77hO/LUPisRyFSdkpOFHVU4rKysf7mCKAIZ1QBDyzjr7CbpIRQ
+thdSUiSHxG4xQ7kJaMi7A/b7+MVrvKMqupctpgQMGNsVUzrd8HsuWvXObGWDAsy7OCos4kC/NiMo
+n/Iu1WTtuNLbNog7CBHnMHdj3JI/cCEoXdlAi/PXGpDVjCaik2gtW32CzUEUI90RPqBSO+oO9ifR
+ZwQ+2Tp3z0XRcN/WaKWYCopJoqg02r13nPl7njh33O8ngAB1srg+rbH1sbbTnh6YalX71lVXfO3x
+EOm4DBsiXfpMo+1mJSEjBJCcEDBtRNRZl3dCgtHdji5xpE687W18GteMg1I0pvut9VegANfY0CPR
+nd5ZLN3x93tFO+7ScQcvTblu3eCJF4A6sviV3a5XDouFYDtm2qwU3UMb6DvvrfWxpfm8c0eWJkiq
+KKWUqyO+V1GNrVF9V1SJRpUllFmmlJSWALFBkrEyxmSTLSKJgWtEwaG2V9kcUI3jHF3fzgMzCBEI
+BDBIw3UtavizFvZHsDv2NBEQgKQ8YUVDFxEaalsduDkslKHDY6iE6oju5ZRTFAztB2frjT8VjyvR
+Ua84UV7duWgEfmpGH8qpQgXqSTDgMdQrdKD9uVCOzoAidiAIZkcKNnEuUstuOOXEvXlIryoM+ZGm
+/vs26XiqMnvfw17dZvjUMl4qOXbuFR84/J6KLUGnHu8/a8Ex8PlXPaMGwQQL4sO9Qg+ziKisAHo1
+tqmoYu+UAmHmIIaAkmJCFJGTGpJDShppSJUgA0USJkQpuieO+0kIBtticsw8uPl07hHb4DyhNO3p
+5e2G8K5QVO67yeGto0QBCXo+K+JzWSher3QcMOu1uZjRdflNopQIQKqKae5jnrGFqkDjw+A9gJty
+jjeaOXNXMooUfY+XtvEAAPsvdtW82kSVAUgJ/KKrIgYCEKEghKQVEKKkFglREVIVEWSQFfQVuEF8
+q1bc21otidxwInCqVCP4Wvvk878asO1kHt3y4DjbPVd9m2k018bGEABDgN5VNkpq6Ie96LR6aXgO
+TjuPeudB3mqSopqKQqKioqKik6qng96PPk1tMJCFsY1dwB4PeR3Xo4gwqKJuMG2HSaIqK9e957va
+9MXoqAKioNeteh7ydDABPrUYqdjrCVM1jS/SxghsQo33ZtW22p5XZRCxFglOFIRkVtmMsNlIaBAx
+kweN9/TsKfgzWEIDn7thTbF/BHDkG5IObImTgQ57JMTo567fXnXcAt/hOaK6vm7IqbmeUW66/6T5
+aCUUVYd9IUUismZV1ffqRLiWJf5/FKnwSk+SUO/8d907piba9/R3TqTE/I4oR58QHhg/2pjD+ejm
+10NC3UfAaij3mcz89ug9aDg5sYcjSr2RovXCPz7bnhNBg+G6/svbKXb1qyhVsWg7uMdPFnwsRtAO
+aqqHB6nmynDyPOS5RtpkClDb6sSRipRM8TykWtL2QbLoZ/6t+DZ0fa8Mpyfg/KrMHxDpqkYQJh/q
+DXSKzhkFItLtPq0qDRHJ5H1kqzfLVjTwEGx17UYWYKLD2GGCgSsQLuvmPUjZ15hgrX7HRsvYUndT
+4KaWSWSJFKjooFEQe81CNty4nQqIJm94qnV2hzFHOhdkCZswQKOOMpyG/w4hqZkJJTN3GATQdwVw
+qddXZiv8WX36nCSNlSJzWOVI0Pc6Y0pbS179cm02ZCVkyvezIukYnc1Ul4gwMo9DJ8SwKdh6PckB
+UDELyNnI5DBiZGA6IJiEz3BsSgZmRII8TmRJl0yJh1dP/FuxTkxu4eD5OOCq0K097iFUIl4gkz1k
+xgsf9RIuMixYJl4wxicD4iZM2JiQPgKkcDtEQYHC4yHKFg0MgcMizm96vFw/K9BzdjB7d3g3eJX8
+yuytKJESRAvKnAUJikQ8CIxMmXCYGZQz9qin4r8Tecc527uJzju4HjwAAeTglzgAHTnOd3d3BxGV
+Wc51LCqq1VfQffh9g+/PsEQo5U4XEBJXnxO6BIYKlBjobjG5A0OBMRcjODJvBB7GiDwNLuyzRC+0
+2FDMnuM9jmQKGhaQUCJYkXjdRE95EqFCR2mxA8ZEsSOJE5ERjQQSNhTEgRHDkpEqwcTQY5HEcc7y
+xeUGv4khGOxSApEKYkiApiDjDn3DBxzGPKSGMzMkOZLUcYE0PLkOhG4mOY+ux5SwYEj03DmAxeKd
+JGRsXH9J5RhInM7yRAOhELigx7y8bgKRJDFDEgODjGBogJwEKCiw7HmUFBwbNHBwWUbDLGjgsgxo
+6K9H7E97kx14eJ2c8OjGNnJuqtGdFHc7hzk0KmQMs+O1+E4PI54Gwzos2JhQccRMD4CI52ChcTMF
+oSIF0iwRPKeY9mA4AGVLrlip2X+WM4oLg7d0jvcqvJrVq81/r5xosWNjuIJJh6nL+w+Z4NGhL3ID
+ww80AaZ/SeruHA86KqhxUO1aaN8tm+Pv2y+jMgKL8XvPZlIxXtfrt+gIJf4Gq8ARD/Pcd6g9I5ii
+7QL72kKBtghsQBvCnCF0zQUglV4ZZYbmhVMZCgfEgcYdSAbyAahK90LyuG2IcGVM6LnzNjVFGVJ4
+/837/dwBBP4ccuWKHVCPb8XeZ8PW71JEg03uxCBv8Bf+D5nWENVBDba9HnXHrKz36Uz+ZR2TNgvj
+G2KRgPqFtyyQ+hzNNr/l4ifqHDQ18ozNyu9zoKwOCGohtwxjw5ZILuyT7jzjGf53rlDtAfdGqKP3
+4Dx0GNCFCtNVv+zTr/g6+3R8v4PvQEfbIBAgTSIoAJ74VFRPSoBKCqqB0IAaCEA7xUEPUdD2CnrH
+Nz1jfK0FP7SEHh7CoiCJ2qA/pgVRWlBIgVBoTpM/QcV/nL8CEEHaRAkBM4QGPAlI/t/zlxgQLxZG
+Y5mU4dnZLZLOc6PTmmmd2ocujDK0x+vyOsEb7L3dGU9lZNi1zbam6pxEn1KEgPuqEkkaeO6+vhs0
+rVejbHkrwf8vLnXQ/po36uTwfrxplnNd+DThzYxyaabpNUgfgIFOJQ4A8go5TY3S8EBLF4RIhQmc
+4NnuehWThJCBAvcyf+AZHsPk6Mi+/WSw3MVit3/vtN4cmN2pJIblPNZFVBA7vcroCpFM5i4G5iWN
+S8Y0KBcgGCr24drabtxPHoNkOXJoA30/IbOTP/kMDCJ7CHCEif4H5OL9uYc2zfMADWGl0IEzGtQQ
+GUYRi0nWfZ4mbfht7/0mur6Ncj5LrP6yTo5ill+RUCRznyn3On3EiDZd7+BLq+ayhkvdWS01m6bT
+i9nDp6NNzjlr+0eMEU/Mx+B1cP38QnfkmP5YOMKePI81vKoiIkVOILxcwjR+cGeCxWBJM0m03w3J
+kb+EVuOz5IEipyuuuGSNclMa3yp9BKh8Z5RiSWWLOKLY3V+y7IeTdBakPiRfHAkCimVo+cjxVAub
+y+FTpAyNxj6TwkadIl/EoSQfPBFFU+tk9Ai0PxHSCEnGvDnI8Qomh1mRXe+uUF7FHV9FU8sOr4Gp
+4X9ni5jF3to+HkQuwj9NIbtSLnlUh4190vrcy7WraF+cMMGwo2zM2TcaDAt10ruFCEKsv4+Cp8EZ
+sCotlRhTAWeC4LaRFJQiSWWcvRDKZVyvkhkgb4SIEJv245uUnN2K/2av4SauW9co49kH37b37qEb
+li+D01ljopbnym9hSqWMpRzWVld8p1C84rKled1qLe5J6xpiYTunKcJvGl7zL1jUrRx6r2FE7Xuv
+Rvsyo5ZqeV+o1t1Xdnq6o5+jn5O39JUSioySpBESonJ4kU0RHPf3jx8PNv6TigJHdIa5bfMgLtl6
+rZ3wCDQxjOjrKVCpkShQpEJYoEH1YMnp/Hm2xFEmVvpM+YxOW5kxKW0+m4stW6Mw+fz48GNjpTi2
+hprJvl66w2zVlGaSCTREzT08+jY2pkhISdICdhsczyZr7SQ01uPxjGY7M41jA/aOSVFELp5OBeER
+iZC/1vAAR3TtZNE6PMv+Wlxg/LZ8rpkrlm01KwIHgPIlQmSNyRqKOfpCJ7SQwTOIME0cMkknnbAS
+R5mD67x/T5HcpfsB39fCEiFKgF2LEy6rBM+E8r6EywgIgo5bIoZnzNBfcecqkWFVUqpUUr8dPJvJ
+n1vwPe3d5dZ2HuD5NsFBN/ziPTcfvxVDCRPJwRERJnaesoHgKdQ54zk4sC4JneVHGHPQfKfnGLz8
+YxgdxgdCo5j4fmXc+VUBQh0OZx4HLmouOpB79n6/+HiQi5v0+jWeZDhEk54Q9VI/na7fjQOX7J0h
+3KKvlVJuybisK97umR95k7EPxIekjIMhhT+JfJc330TsAzQEMo0SfWzKOgprk8NWuF9JjJ0+xblm
+1i/4WI/6Cki6EezUUYvTbwDYqRNhT1Ey5Pp+gocCRKYowodYf5vHp7ENsTyIAl5zD86IDj3yew/s
+jmajPatR5hjw/mADgnLrwMJQBD5ifjRAQ/X8icyQXH4TzMWIeM5jGUmD9cjkWb8fX9x9ysAFO45j
+BQgOm9QAiApIz4nUARDBFJoiJJiwPtvBEoeM9UzwwLA8RUPKowoRGBweDNk17spNVjlCyGB7/D8B
+fp8m96/CY/Us0TQg/2yEo8qMy/G3yoIEJJE8R6k98Y9+hRAwrZZccniiwigjv5/uYggk2jd68ge4
+BEkWGF3MwshxXIqEezBD1VBipwJHUETEkfymh+LPTM+xPpEc7YYXE4qAGCB+jqo6AU800AQzVAEO
+0S40becKBcpdzGErgCBcyLqwMdmBdIAHz74yaZhDuU/ok1PoilGtab+76tZzZ9TWuxCUvurYw/f9
+a6VUY9t92q6hJVaYJR2RJC+EoJpMSryESrMvRs6RMrH3Pk8zSvvMllGUHc8zJygEYHPYyasu+RnZ
+cRgftgjsRGlJs5CwAohh2a2mu5kkrgykb3aK1yR/y41gwBOmm0NtttsY02wkmDERM1NfgX0L1fPL
+2vLOTAFn4AaqR0/XqzQVHhYCqsBfE7FFeh2IMyaVGyySD5DDjNz0/vmJS2YEvUKpSMgwdw60xNv5
+jIf8xk8BRXp4CZ6Ij3AYAMKYIIRRQ5jZ2gTgICDzGgyhZMxp8gQyCpTEckSJT6icUbqKA6hBpgnU
+XYYJE0TPcTY/gMsSUkSM4MGePIs8/iJYXA1Aex+BPXiWxt0wzV5XjcZoIAyYFFORqgCCw6ySMnJ4
+Z8O4WTwTyZMoKOZyL1O6SwNJI/xlCQvgHArMjRIyeT5+US+xpAgw0kl8wOmp4gworu62/jD7E/ou
+gnzH+7n8EA/kT+QfuPuPn7YWg4ED8Z6/jQ8isgB94saHcV2uSCofN5GQzQFU+9wLEM1R+0uQ+XqG
+F37ZjCn4VH8uEjfCQgYiKigYiwaPBr0PB2M+8dnauDoYPBkmCyz5YrFd1Y1RQiKIZmpuLncrER/D
+TvhizAezBDjl6oRRESPnJEMsRjHzPQMjddp+ySQFEUOIzEpL4s8utXWcAfUSnrgZIOrpn2fT9eFu
+hyP352Pl+75mTbJz4ecv0MeJX0n638fBqdExOAnmUTqFNRTERQYpivNynJu4PyNPhtO8r3Xz3j5Z
+MMzC0W5lnwmNKvfdZydRnZ7zfV3K0/UlUpThWu+yY5jg4acMaSfR0dWyu5QUSSNaNcHJ851XzHnA
+ol9vmL9LNt4DYwqn1mmd/Fivc5aeSVGyvOKdExXJ4GJ+Q04SmopuykuquA4qvy6pzUvMA85mDBRA
+PdA/CbfU3PmkiPJ7GL5Nj5/D6LNy+NbvyY9tllVVWvoyYeDq57OQJ+MD9D+S3+zNS1bpZP0LWNwP
+RyfS6PyN0epUPthPQQKHzjyEe4fqkHb8INx3QYZBPTyRESR5u09VEPIpCBDxezyTzPN62I177spV
+r6EKqokYd8TTdDbn/iABSHR9xHzGL6PQmexQxjGTHsaTdT1V14z8V6Zk0+ZjDox96q/Pg2eDBusj
+SdT6E0k22bj87s3eXGnh79zdfL58zONNlSKqcnwmOs+tsd3sfkfkNvCjJUnXJDFClVSqWVWpJMDh
+MJKEiKQwQQsQRBfRzJpuBZ9h2dWhxycT2sNtOHHnoq7Nl56Rwh9o3N0ZSQkxRVOXX1ON3RLyAUGO
+sdE9jTs2buHDPwkk6WA17fBu6MBsYofGoeApXrEmIJQ/OYSByGLFlRS4OBFNy8iPy7O9exs3dYmB
+iYxARIlSSkk4IdqkkREA6hNlkOC8fQmmpIqudClmyPd8Nl7fq6OceHG87IiT1eeKqEWyRF0RG9gJ
+4PXrRxSUUiZBGQFjibkJyJAFEFFw1TwvOtxgKXt78/lxh3HAv0gchBThtjV6fK7Pcx7ZbLtjm78/
+jlrP+CBtpKfJXWvaKHDneOE1BU0VDnogB5wh+gll8Nc1vXuJAYHwV63e3Cql+znkfd/KMnNoE26e
+uztrJfmgXPzvdC+h/SNeBi2WG2YJJCgPrwQHIyp39O+BI7xMhzAUC4UTsPm9KCAEU2Q5FBmLjklK
++esUnlXrXhY+vWPP2MbuNvZu3Tr1qTUFZHA0VD7OPQugte4pziVNjYFFPGADYepkxYkpVUVKmz/F
+tNbScAmJcB8uQAsKLOvqooyPgcFuWX8/f5U+/gTe2+rM7vV6+061BOwhGJaVIQgi656Kl+GrpJKT
+ZIpkyvznaWasXUvXXSppT1ddXTptMtStX4q2bT3HL0pEX2e1zeT1jy7PaJ/JZOTd+mupXVv1xz8/
+mZPKVVFVyfS56ah2hjpo/LTgrq+EDy45g8XZ1VRVqlnouT2L9Ox2JwYwdnN6EJ8gjWwwqpJGLJBS
+up0VZKnsTCCd5MvKByHEADYVOamIqfgycdNVoFu7YRERPUIqYB5Mwl8LugjqE9/m5XJinb3eKBXq
+JDg/MyFOgxiRE7j+ViopU2PziMGgQ78HGP2MvlROkBERA26hF4IPzlQ9B8U4e+E0R0ouiyscHsey
+JEXpWL1n83xgkhS3n6hMBzgIXExVGDm83IHjkTgQckx2ClRyAWB5Q9pYcdSYtzBYrAgcSRZRjowA
+H8k0fSZIH1BolYOaWyv1krZOiyYIg1aHB09WfcSGBEn8IySTeVRsoYyyS5e7IKMUWYNGChnZlA8k
+UGKKjB2GKlZXtYkFCQhAGGGGnaiGDAD3TxJRHoaEMS1wLa4ykQhUY804hcQIzqXFZwdMZmKmzyGG
+GVk8HRsZyclc30dH6QgMHFfw9FHB15jw4kCZT0KlCgqMWHZX0j1jhoZgxoXJYfBNByM4M3Fc2fh2
+WT/XJ5pJLRkZo9YOJMBJfBiHyOhA3iO5EuqRIw5w5HCUQwGI3mxyIH0nAYS+k4QeptnKCRkKMKZj
+IxYKCMeQMSw5Ocx8S15kSS+EZFxWQwrkoZwwHLyZTQuGMDle4qQKDYwg0YIHLTRS8SfsrkwUE8Ge
+RmclImQpsKKNtAYgMLUHMy4lwKETBSfaxgKOML1XjCl4xkUDzHy+QmdMwyOJBDmMfqIpY/IeaQp7
+j0HSx6CQoinyEdip6RTqwJoEv239IkBzMlAwIoAB9vQO0qYjUITVEgKJJVttDjcMHUvYVIH3l0eN
+5zOwkQwxPixHCCYEiASzj0ce+Dgof3DsGHtvMZFZ/EQLGhAkMODzvH9lSCOp+Nw8IJUikCiZl8hy
+4YyFOd1QcAJGApyGoOfAKnwCQEE9uNIi0K9amQnQloOgw9SZ1YedhJk99mMn5DKFAxba+D7miFYc
+H8LPlycacOrBWFUuMl5qyqmL67Nah3jAI4pCAwCiqKhko644xkcj0ZzkZtEbaCsLhYOI1zzVJfrc
+Y0cxwRzBXRcs8DHn6Tk8yj8xisHJ0bg4JMNtkHuKDOyPUpYQBtQMYUNYBgiNYIJXw8Hp+jNlEBQs
+C+41Rv5ToOo7COtCdHagJ5eNFFUVVFRKAFZWBs2SKASFlgazWAggBJmBVrEuKGTYqjijUHLRR5GY
+333OyZhgVwoDXp631wX4xePLeTIcmiuOfQ0M6GIIPKhyyQpMbJCBg6GTqJoqGQFeZRQpowMYzThU
+xlTTZjZpWQxd6YqVRssKqbMY0qt2JK2YMVqaN2lVM02YxU0FNtmXTAqkG5VLBppNKlcGxpBw6tm7
+wx3y+jObqaL2FxJR5FKHQ8EY7x5SdpV8kBwaD7VrZ6vE06rP6mPsIDEDcdtht2ID6CCbigCigTMG
+Pj0Yw14QJJCalwu1xR63+/6pPYqHXblm2A6Ng/zWMBySrqyqMk3+SBVSS1XrWb1PCDKGRiepRisr
+FZXm9Oni745p7sY+Cvcu6oxPN0rTvJ2knk4PFuMr8nw30w9+b37V2vnBF4O6IAhSGkcV4w+wVRvm
+cuzKujlBjL1CSEEbzEPE8DC9Rjx8w0imxL5C1C8iH3mHSan+Are1s4a1xjJRWzk0+LhWmic6IioX
+HoiZoeixHUY1GGM874kDBG4sPTWaOTIXmRAqLBVXGzDARM5i9MSJIoTJ2c6xRxl5MN25+Dme2tJu
+XFVIOak/FXJQXss4OTVOZMnrCwMSDDTGWwPpzqo8/JR8D6yglKTgOBmVQsrDaMnQYkv3JMljPdlQ
+gUtXE7EbeHDK+JqXFg71SIVFQtRQppDNPSCOchGJHWCN0RJSGoFbakO1u4qZd2IDJ/L7ehwfIz2A
+k7kGhoEi7HuZv22YrSuGpkVKnl9zBp5ersbYqIcBQRyIylUFdhTbSjlx7jyBAoZ+fAvKBkwSEkDO
+xBwbLOSCF8FR8Cy6qiqgr8PppwU7/CzhnecHSZ8QwEeX2jyUSJgZ5ZhKyxaDusZl5eKESgffzElA
+gclLHuIA0csBhPHALz3No9HsODTat2YnM+h+E3WvRT1V8n0MCpzFNZXImaRJA46zFi7A5Xeo2mrF
+KkyYP3uVPPJho7ZEJQHHMVBzmS+iDGBkcJGepEU36OSKmXcFhNuYuZbKBp/JmlvfCPX7CDlzi5sX
+lZSCAiFbYSJkAKGIxiTMVJkjpJu5Bs5OiTIyRQQSdy+Q4DJWyCRmVQqafHZwDxBtCRini0fDofnv
+oe9ioopK8KDSW1SgAbFW8zEDK4yGH8RqDEtfM7lSYFFxgTIYOiG6Z4vbPYWYMDiM9swvJnYNIi1B
+psQ8D6L8ELBcMDAHlFBHFMSDN1iDDoT4eD73Dxcja1XRsx7PdW/k2akpjDFJXEB9HKV5m5YrEo0x
+qMQRQpCayO6Dl6F92mI5AqsFbFUYmQOhE9xiUyyBuPPuvMKGiRo8eVKeBnqc2SEjFQHr5vKRFTLm
+ZyTcrh5vdYlsSRqXEB7ISRDuJTdBRGUQS4ibYYkTIQ1KXHx1EUWgVoMKVIdMYi9RMkOfAUGP0sTF
+EyFLGfkUyIR2OQ4qqQGFOtuZiXSgEmBgycioChlV5d5ooy8AySxhn8dH7VIkQY4MjBeqeFQNxCeQ
+NcF5VPKT7yQXqdD0gDJ1g3ks9LMefsfQwMab7xLJcRMw3WTLrJl1ky6nW2TLrJl1ky6yZdZM1tkz
+W2TNbZM1tkzFtky6yZrbJl1ky6nd3W2TNbZMusma2nW2RTN1tkzW2TN1tkzFtkzFtkzFtky6yZdZ
+MwFtOtsmXWTLrJlV2dR1V2ZVZnV3rf2nwHkIHunehVtmxcaAMPez9Tu3aU4V+D2sk7MPwenXd7lb
+qfkqurDmrdux4sY0r727Z0+hue1TyphTG7GLPVpiVWmGzTHNs82HdzbOAYgF5MOIpEImxwLyCXHs
+mSN9nJAoqak2Oym/xx5tMeatKcPnbNDsVzk4ej7TYjo69iDVD4fAaOCCmMZgVqhnY+o0GOyVwaN8
+btpsrkyfBXVWyybMV0FHKcFxXCmIXh12QYVG7OheNcXb1HSpzwoZIMwY1J0bIAMCaLJOxkoPB7+C
+cVXBEwQofhHcwEl7wAl5rixIAXAUIqibmUCQKSdXI/6G7DcIWY/Qebx/GvZPB73d4NE0+gZZyfLg
+ZgPHvfKbJ9mUMyOKDFu4qZd4SJ8Zme0WCWS8s2AxjGK4IhhqMXlkAKZ4oWiQM24PDDg2GTIzIcDM
+8wbh3gMHKwX5cPzv4w7SPJ1c3BdFeDobOHrXg7zbzJCS8jflEI3mOSfq6AsosZs5F0DArtgjzGYF
+9fxUcyjnkyAIPUk/n90jUJGp3kBxS6uJ4hcvScNucYEGpJjQO0meIvkuJDIonUQZERIKbinc30dH
+odYLs6NlFD9jNDSS3u0f0FnsaKAccsZkBotVyIp99SApf6RwqXB64yHLFvbQg6mh6jQiJcUY6DDk
+hvvRTkWLHGgxEVW5DOEjio5zD3nhiYwTuffq8XZ4sTUcwOALz0+mZ6+WEyRUoOumNQj20IncUMhS
+3MapBicvLlCQokDYyElDGdSQSMsnxPhjLF5SQYMmT7Q40SPYKcr9z11vORgKJQGY6xz2HAuLjrU0
+LFVlwKrBDkFVdWUZdMCQiKLjX8Bsek8naHlswsjPDxduGhNsAyZNRQRlTO8NDyESIEywwczrKnoU
+4V5PA7xX9LHWenJXI+hvpp0p3x+Vu9G95CnRziVRLkakt9RPqcDFQQMyQYwMiGZeU1tV/wCkxyFx
+UJjmLl8YJ3OAFwv5LiAbi5OxYan8fBB1u/Tyt1iQtnqckLuQDGL40GKF5yPYDjChuRJDohqILAqc
+DIaEWZFk4+VmOa7GK7tA06YrdptptPA0xurhc1Jisbm3EqvRu4cOGzo5kog4sh+hIjKp8Rx+rPw0
+uw2C7MFIYveN00HN4lCvvoWNCw1SgKTU6HjLbkxSQbcKE8wkUNj4BI4iIETugeiCIiKIhPDMUptJ
+4dDmpRU8Epk5uatPpU5ogW01juyfQwWCuD1kDrJAUWY0L8jAs15uEr8jyJJIS8kkJLLSF7lH1X9N
+Gj8TNmBwGzG4tW4w1CBMhIo8vDxr1Mxw15rhemBYhZU+DZoH01WZdkB6FAcFBVJCXXLwBrO69RIU
+uCQMQNTYsWNypcOMUGCCSFKEBkrh1rOkTWkA5lL9dzGREIkyCICGSoXGXLVibn1GtRiJsWACPiIF
+Drjh7ZXmUcWEY7zuoQOZ6hkkilVwfUcYFYugctouvlMCRPwUnfRRDUFOoyS6PAxZynNhDiIZhcDF
+CQpYxF54hHBYtB3WOiXR0n7YAAxMydAx7M/W/w9AkGQoaJMVgVDY7NPSbYrgTQe8lE9r3Pa83me5
+j1N3Di+I9Dp3Hheclu0qzRNRx/n6pjm5LRSYtRo3iiisQJj6HaSH21MzMwGMBxCs71vdkipMVICk
+ywxIUcdgAj02lKnZO8aNw4vRIn1Qupl7WQ/Zfanxo1ASM0SHFS2WmoGmYdDBmT8hKvJAMjiCxnsW
+SZP6BIzRJfw0c0VEOojMIQbwqQx8l0kjO6g8DcPjligCHZQka8zEzWJTuXkZOhoQBjAZJaLjqtlV
+dBUQEfZjqW3rMU/Nt9PD9nDbxdyM3DdtH3IZgbcvb29OHD/I/5Nw9Rp8ZlaHsZ2KBjJKJPgUUfIo
++PGsbPw8UaKtBooYpBhIxnBAQBhhjhXCq97GNn1ObCG0rgru2Yu0YZrTTTGNmMbThzVu44cvvcz+
+B56fcH4M5dEXMvRiRho+w7G+uhyfLBPRkZBSwQJesyPHQxKhBkYRDJRGMTKGQM5aRhCV+DFDgpGY
+neOVLswkYAXFCZMvHKD9Y5UU85JMPjjHNJJjmcPPp1ebZTzVy6JjzY0sNPoc2nR2MbvN7GjeU3kr
+GPrrG7DJ9g8e+v4LDsFh2Cw7BYdgsOcGqUNixYiRGGFT8gpYT20Yc6AOWEOxQBFc/7Pqex4EkuCT
+Zr1wVT2eIscnkyXbC45oeCokXLECxQidwWJKUIhbZAsgRJQDig3ut1liRVEUL0QLixVSFPGtxZJB
+kkzDsIFeToYdBkyM0M4NGl7GSiTRRkkYwaL2m/6FN4F3jAB7soyahpDNTtcpUAIdqEUataqvHyVn
+PljVE0XYiMrDAzhqbikDUuPKQIFdbmh5TtPmkk5dmz8jx/F7H4P1HsJ3ju7ySd8aFwxeQGIHBZ8I
+aG9DS1amYolLilYCTjrdF+STzGWpabPi1f9X+Ir5M+eDtHWq8cBnNGW3DeMym2LtRmiwkVkvUZRk
+lq415enhcUwlSyYM0LReSUk0VyNNP060ztutVVlEw3k++E13hZAnJ2g0XPkgQVXz65awtJsQZVag
+Jg7ISFi/Ti7pyoJc8wSzXOx4m51okdV16bb62kYLtcyEFBVVboZZbQpJqAyq1ASrsiSFi+2zum1B
+LnmIlmudjZtqyKJLZch2KkT7ncUroSHRESodZQhImxoK4/YLtImWLI5j6qWUiP5cZE5v52DioxUk
+/KqN0vsqcA5VMihQc2FDAiZdTsfGCwGLhiChKOPfs3Vp1aYwP5n+J+Cpw35pWPix8Wsw5mT5RIAc
+n1rB0YZZk/hLGwJBzwtFyjzO4qEL7eFrSMGzg55OQA6Js3vTs2ECIk1MyIFIlR9xZ9z9DI9/snN/
+GesBfXJ2TmkOYAtfXQOCd5S1hka4+Tww5HHr6tviES8RPjRFERgUYULnU385lAg0Rt2IZmIw5VRz
+gR+suGKersoOhs7N3JzPkrkp3ToqRRUMxXZu2nJWnJ73bTkYyQjfWAAJgp6jiQmFweX1irdykad9
+B81lqxynm6d8xurENE6xi4FRRKsbnCCFGUhEZe4uGKkrjkyYcol4oyloCoQDTY7CQTUMdlm1XdR1
+YRnd1w/O3PR3ZmLY3G/kailLKpXjsN14rEBRcCcHGMxzIeVD6OFAIKgeDYLk2buvAZBuvQIkgKw5
+i5l6wdiPoKLDk37M7miwoGZQ2HNSZQCOK0Gxd1oWTGpqXEDgMSHXBg0XYyxks4J3K/FuN7ZkcogM
+8Kx0va5/eeLGqrzc3Sy15Pe7PI5bK7tMYV6GQzXCzc8mQ5MnyLKfoUS2TMKRMNH2n2FgmKKSPmPY
+NTjiZsiZJqVgDBIijagpwDXQO4zrkPQ6gOYfUcTL6KkgrWCGYw8RUy8erHcKFi47SI4OSIuZEYOA
+x5izkiY996TKjDGJQ5SYqXGYOSrEIjEDkKOajEC6IOaAWGo4AYABABEM+cUlYuAD1Y4SzMt2Q6Mv
+8n5/Z2+348OFnZ2Hv5QT1U1TxVkmZMhADgXheRDgKGQeTU85VIncL1mLJU6HgplC+3XSiIGch1T6
+BzTfMibdBjWo3BTgqIcRQqKidbAx4/OxbC1uHaKEhUEgVHHQvVGHDieJz9Z1y/BzI3WblgEOca39
+fBs9HxY5GGWj6iIIIo7FBXB4PmqLGFGxljSSICF7FRxSxLzW+2UDsCii3EsSI1ZmYQTmpkqiwNVI
+5SI6lhcn0MTZUciOODlC1i8ma6gsBCNZeYuZeLQCJQCLQCLOjggLFHGC8cEREQrYzIBGcjMWZLnT
+u+S0yB9/0J7F0cYO53O8ngglg7PBNr0CYVsgigAgM2hSekzY3FGIijooQLbtVwjCAqlrrfYZFrl/
+Dv77x3KPM8xQ0hMk0cmTBR6jDhyGT9WMv6T7TIs5IeGSkBMAzliOSSjkKnlhZMGTJEg1xYRKPY2Z
+4yWSYtrRHgYzBU4Igy5Jo2QQMK1SkkksOoKAowR9RwWXZoIMHjk4iSDRehiGd4gYWQbDmgg5KIsp
+Sank5MkFHRp6gkKOQA0AEcwcliMf4QghaLIxFbsOd4LU48e5ROAySSQSxkkEmRsyUbog6O9ZKIuD
+BFE4trFMpzdWNbMqmmPLWyq1y02ZzIhupE0sKMDilCA5SmchmoRe/QcRzBg7PsFEmOpkwKK4KmaM
+nYkQvgFLJeHAy4MxgLDlcEQ8VDzGpA1LHcQLGZnq87KZlxsQL0wFEwDoMB1U2YSxDFS+LHzlDyDg
+HkKDIibgBQn8GB6Lpl5i4lKDE6jjgJAiK3uTqhpjC19DmcoI8+7wVPiOz53zPt9O4P+B+DH5X+OB
+k61Xk5PJj3bPDaSvgZyV5MVQzDzO54n6hSWZAmQPZaQgkCIVQ6zYjyMpinIvciWL5H0sZid4pqKT
+TvRUsUQJzl2TQjgismZgSPMMXIj2FSA9hYnY8drOzDMFRLWBESTw/tdju5ub+D+1ucNMpSvRWThj
+wfysSZIEIhEkUHPURBiBMGCMNB9NcSJQxMS3Xg0C4Y2HRYHneIpXAseYtIoYAoUCYlytHyVjfqe8
+jwjUe9CZH5/Fz4NnDgObdkVMuzRqjIMrEhEjmQiRzIQuej4l0iV1tAgBYikAxUxBddzrJkMbjNXM
+r8Q0RAUEDPTuGf4qL0Vs9bOWkvRhBggLGCcTMUGEtNhO12LApI2xsG5EkaXJmQMCox34hsoaIGsd
+45JIKZ2Z2MiZ4JWRmZE15xGK3GNCxqEDCATTHKjeo7Oj5EZPSgYFwMEDTQx+hgPSjzNA3+wPKhmz
+yXaulELWDx3qWer0Rs7DNniMSYIk1DUDCSQ9CWSSTJ3GIYFChMoCOOE7iIRLBNyBGR9lkQYiVOEA
+S5A9AiglTAsXFRqi1HMjDH+KQAY76EihcCMMYCgkQFFMbpV+GXTq9UIQHFVfwiR6fES4cNd8oiOv
+XsUJ/B+fjlho5qGBwMjI/LDidqiogKUJmrUJMdbHYKRNCJf1PCLpU6h6XC0RSVX5Eh5MSSIxcpYk
+ecqWghdJgAwqKZmFgAydLSDNN9opkuBRMy+ddzmsvBGZlpnM7CJl4PiVUmDBAypMAlowbwCOPCFA
+hYGQzk4NvckBIQ8EbmWzichEjmQjJUkiCSIlVLzELhLwRfMUGPsW2ZOJneesYuGFnR2ZxweZPIQU
+lgO5sydAy+JDeZKRD8/MPgcodHpktSWMJcLH7PPgy6ZgMDXLGFQVPoWcuyf0sIgAfJYcta8yImZl
+wCQGIEz05FMsgZxjioxMmUOKKakkwMiIcKCzJQJRJBxC/CWuCw0NSTH1fT2F4KIRAUqIjoZCJQOn
+1HsM5kib6jWYjEqYcEyLlRp7+txbrETkr3d7+i4+CvF35zkWM8tIzTEssLZ5nZ5jLksgxg71BeHM
+XMvElB6cCycP49f0pJQUdjgNnWkmzW6DkLhERDgVRIfXREQRERVCK1RUVEEEdUQgNFCKxQisVFDy
+rDVRURCHHQHyO8e7jwi+qqqKEVi66DO0UIrFCKiKxUQQQFR7WtPfDaI31d99EDMzMxmKtJSZB0UV
+FCKiKxERUVFCKiEhISEiy3Xd123bdW4iCqoqKioiIKEVioiILoHhFHnccBWLuLggPHdtjuk7tt1t
+lptkpSOu6QkURWqI6Og6oqqLruURUReO1x2A7UUIqIrFRQisVVFV0cjyJzzwLyjysVyxUREFRUXd
+d0FCOuux1RGDkODBwfAHB4ODGIuujqioqGZmZhmFFzQSgqYi1HGDImYpuSap8WRRevj9jt7t+iTo
+rr3Y2PV4H9m8yRVFqVaroqZPbqMPNUg6t2K02TQpKgwkhCQwYkXJrtZx9a91xBkg3l5SQAQIECRw
+OaljIMhSZMsYWHOqkuvDSvCqBI1GdWnta/fybmnkw0rH3tPJ73MHDorDnOby+g+BU83Y4e1XCyaV
+5z5q5JtGzTvMvIwRPZYgTBRQUUE8QpI7fmxNROBfnkMVRxqpoxDNgaCgBsL0gMGZffO5EkWNaFwL
+a4mQLF4o5JDRTAkWPSULpXFGDjvUdNF6F9vZAT6jERhL2M9u69t2uYoIxQgTMDoQNTjOZY6c1Ymx
+U9felsfJ1d0Q6PYwTGOjt7NBMSaEbi8NDTuUgOd950IklIoAh5KT++RS4XNYhpcyuDJwMTLuRWFF
+JFRNCBxIjFCRUU7yImpQwcY2KjkyB7Rz70iJdyqSStSLurk04OYRCTGpaYVU9i1uK1HQUghoXmx1
+EaEg3MDISIw2q2vo9OxngEs2aElzL/HqQRNxSsTMYeywIaBYCmoDFxImXimrDBMsOaDSN32K0x6/
+oPwMfsfvPxFf2scmm7knRTBgRg/SfSWZDQqP2ElGhnJosyMgwWUSabsY4dz3qd2nVWOkpw96uhs/
+Y/MwIlSR9Z+01IgfYKExypQYqVIjkgsWGOquT/mfe5Gz3KevRiTHN1bNn/C02RpVbKPNycjwdXDS
+P9T2PU6N+dtxNlexTd6Or4PY7N1K4Ko5sOp72N3Zk+LhEUyLjYwKgwohA6lOJMLCleok/TyLhlA8
+0ZeGqx+RLYPDtzzwhG4Z/E6v8B8vjMjY83mgQYGA41VxqO6ucXIhDAQC6qt96xxdPiaPt4bySGTZ
+VGNxd/zZONHi9PckUj1Y4pb7C5VwdlO7Rs05tG3m2g0ofsrql1dXDwd5xsNjiYY3eCsHExnxdOHd
+sr8j6W6eFc3DGPFoGOfh8WOLulfwUrka2VycsHgyQM8QLgYvBsgQu5og0dEEm/mdEGRLJmSGIlSL
+naVOokQLyZYkLI2BzKxiVS+7AshQSeDBZzs64OCmLijwSDhzVCkGeRWlYptXFV3TGjp0dNkOSlVN
+K8nh/iTeEqVE2d1BwoG/fhttPhZjo6NFCOecHRydBg8EmCyAwFmWEFECwYIDwMNjOTJs0rJsTKOQ
+P8POVgWDB6tOzh0k0aKjhw2aacsTu6sVLE9rRAgQ1xwcTUUS4UUsMSKhmFBhjGxM9tSp0ch4crHE
+HIzrWCno9MW+c4mYJ3X2XHbdhRAnoZDjhoTltTCfR5GZk9CgxOJnMMAoRIQxcxCiYBcSLjMuHr78
+MCxeki6BC6FiTnIa8nROTzKOxAjgs+RiSjmS5HPQDFo5NEnL2OjyuxPCV2V4O7G6uZSO2mJ5q8G0
+DKPAzlkl2QcI2M94nPOMFnb0IOAA6OwScaCQ0YXBgkZ3GWXgn2kgkgscmzkKCh8PuSeZ3KUlcmyQ
+8ijsUFkEHTxhqaUrqw5N2O2MdzhjrWya6PFs2UYLJxuQsxReSgAizFckFmTJgkQHl5TNSpYwFMgi
+YFxcGBeX4FDgSHcoSLERToxXJRZYVmqwVzywpZwXeDZZVGwwSeO0TKkp2K4EyIWLwiWMAwMjwLgs
+UL3LDopgXF5oyJ4jMqYRHLiotxkVC4vZrDkRSxeM1vwyTkouRmSfU5CjJnZ59GGnRjowMgycGTRR
+0bizBqDko0bpmcWep2MGDZZTzhzR42QYOIHfHEOs2z5FGfZwD43Cb8eCxmJKBcXmBUl0MaF1a7mx
+UGIjEiZIwFgCmrix6pvEkJrMuGKCYktqwpRiMdXviaCiKZDDlGRYABElxF2CReF0TYoGRcTIGQxk
+60xMC4UmITEYUxkKZ61gRKBYo4VLFjnTtd38la8VeTpM83Xvrvm/fyVXvT2FVVK9imO1YKrwUqyn
+sZFPbCubGNCIoRHGDkkCJEv9ApPrYqeiBtU0FDYxYzGNcFyIJreMbGJdFZvRGd3JjTVRSA1/IdyU
+SIdC8kZGQyXy54lSYxgCigoOMTrjEciVs5QvMBSwUHHLOlSgWKiwGoUQ5n2UTqIlp3duOd2Lsa1o
+OhTPvwclpmgOiINMSAinUXGH4HiGIOjfqCOwleslYk8BgiE2YrJv1xJpQbFRKqKkoKqRisYxMSxB
+9quWm/HHZxw1s+Lhu9NnIZu8jsvJ7kEmBsUcEPQaFVg9kmJ7CLbtEKSOJUcIlHAnAGEZzgT8o8SJ
+iIxs6FjUgSUYsYFjQlgTQcao5nI/AQsKTKBMXyilwupEeUkmN4EpynYZ9jQ8hUuImLlCFi2fqknP
+xjGbhiCGeaZQxB0xUxJjFwFHxVJN3mYe18W3j27OHZ2aaYVpUyFOdKDlxPMzIEsLmce8YdZigxEV
+eoV0mTGHI5p62IAQL1yFFKEHLAwpIPH2E7+sGkS50K9p84xoKHAUoUCBuWMMLlgXyCOCJ6Tylwcl
+MyblSBAU2GBhMS4somT0A6yUBTPMUYognnzEZEKkC4wGE7WMrKQJidHHKMSJeY4GIgFxTMoVKhkR
+J3xdhKIx9HHAtWRJyYyeW0Dsjdm5EB1tocDYpupEyOI9+x3gokhTuzZKrKxmpp5uzmxsX28TEVjC
+YqqllHkbsaOMOStKiqVZOFRJipKopKTyvNTH1tmlVFFN8jHNSsYqpD1FZ/OudBzaVMe4vFIpwH+A
+Y0LwiVSQ9krL3jlsA3AAnQQHPlPR0aJNHwIEeg0LAz+b3wxJJUUaPB0JCsQkV7DSORr187PT5Fns
++TseDu5JFhc0BnHRyzyNlGa+biZDlTINgAxJBeK8jYGPA+DY2b/arke1tzPN1TnHSVPJ4ubxc+Th
+yrz7m/xHV0e9sdVOFeMCui2qPKOMjKKO+W56tKDZX5j6yVooIGYPicStQdGCO4zkMHcklFASDIrZ
+I9EDpdzJAwLjgoZ6FUH9YyCS5zRslZLDk6IkULQM8Il1gYuU2Mi2ykC4UDiUCp2EA8hNlP6WPFTo
+s6PBwadWn95GmOGRhTzY4PF2dDgxu4dNbG5RW7ksabPNs0krZo2fY03U80nV+Dd1cnD3sc2gU7Oz
+uxiYrd6MDZUqWqnBcFBxS29RwKC0Pq2JkihILxxy4UgXEDrox5MbqmzGPa3NNNlY0x3UxYkYiGAe
+z4ME+OS6MKXBR5JJNUMoiiCrknok2Sb/dvbs1BkZhg4gXxOwXOYg2TYpBotEUhrHxIASnJiYx3Ho
+MyoTNbQksNKHrLvoiePI47U7TsOxTZzQdACUMnHZiLcR1IlFVLDDDDEiYQVNZAe7EasxQU5XODU0
+18jGFbe3s18Qfne1w7JXPummjCsMfe2YbPBh7LNnr2QcNkXzdan0scPa81/e/kNgfgP9gIeoFH+H
+vev2GSx3+Tl3nHY9/ATe/o/hU44aXoy2Hh6aFb/NiFz+mE/zwBif7ePxfTfmbL8qztkohFPf5/88
+/oyHU/efUfsX3L+VfmUP4F/hX8yk1ms1moZeXlmXl5eWGXl5Zl5eXn+M7eZ15NQR7llkHyCncKGU
+CnwVVe6C95NUPIJ+yRLTc0D+MibqJdd3Y+n9TEhBURcsEYfRP1tieXjd37nE+9GifOK7smB6jFJH
+ZZ1shRaVJXn/sn+5g0ukYqzFUuhPdsf7YNi3N8xCu08xrknDmUHPBwYMJV/1a0aANjiP8SGkVOzY
+5q7kCQok0dEWp9tKKmXo9jeOx6+ZSnYMMh3Kek+1kPdGSIl0se2ZB19/8bGi9pmMXcqjfGxPfyuT
+Vj0Ml1/1vlmYNpjwky/cEKbmPWe87Lw8lcJ81WaSD1+vh+P7qFvSeFeHb24Uy+l0kDithy5tYLib
+VKfidEBC9POvnVEVRIKQ4n1HE9G/MKhOIR9MhSFIUhSFIUh9h/Jhzk6TL/fNPO5QlD1YYkrEySxi
+1Fs8uteN+jlXlEm1jZiYWkxcK/XhkTam1kaRT/gzD7RX8YwKB+wolEdBEREKag7aucIGoGlyaQ0E
+uhCDGVi1oxXQyOoeiVU1MEKAESwmrM3walJe2cayIcVJlgicWIcJEE4kqDoIVVNccUNiN4UN4A4Q
+UKBsSom8byAmSojvBJHv78k0TYoDkkgd3+jRBo2f/Le2gFZap/hZnfGO+sPxc5su+b5vrMUipq3Y
+SWDJISGQ2nJI5opXNzCVtjlw03LIP76orBc/7vx3/rn5v837PZI9th9ZLiJggjRDhA+6R8Se3MMz
+E2/5Ty64wemPb/hxObDbXqxtKWmNaGoZniAMVAEvrQQpuBtW8/3zPMW5bBtMY3mT/fP+5QfYxF3M
+pKK65hMVf9OWftZbte9708jvz1GLE/66elPEjD0mBwWOwzGjpsqQ/vj9O6YTvvpIY0OG3Mw22ZVE
+Cde80ilAv7cL9krOsSFB6ROBklM2sQnmxro2TWnKIr9hyE+Qhl1cTHm0UZiBNxCPDDprLRDUNLqx
+kmsMHGdN62kbWWWesVlU0xknvwf+eRFA/ZGv2n3aOlYA6T/2Zol5j/umgnxzH5m90z9kEWZeZIn9
+0EeUEagj0iRVEUm6WySHUyCZpC4dNtPhV8KvfVa9rzwAABSiqqqrY5mwf4iB6Do5fd7P0/u/rOXf
+wxUN/58Bf7yFf3737u7+fwgjIIsRUkZWSFEUHqLJIeH9eJsh4OHi1diOkDQCHb+P3fZ49ig9JKv6
+zp1mdBsia1/PpUP8I/mV4vJptCHUh6vM7NI2kxmSpPoZ+40wQ2OGtL/NhhNWJJY+hzcOcb0BWQCE
+pVQIOF5TqP7f2Hk8xfV9/vPP/l5qCINLhn+Zro/k6hvzJ0gPakYPjd4mJ+Mj3nNjqCQwigKS4d+2
+uGzS/Ls0FqggLq5rvkbwtRMVuWwoXLge7q8dBtIdl1y9VSG8fLHA4zl/jumeiedq8rqrQjiSPSj8
+QaJHaxGEKgHWqAIaQbRcleFzmajLgrXl2VrbVU0lKMXi7LLWUNa6yni0rK60Ys+qmGLLcv8wIHKG
+c5r04lA7Z9tPs5mep+h+NGGxc1GHpobTkgh+TCRnb3cCUUI1ZLYRfiqSW/wEQCI38mPz1Vd7ywE1
+Rraygh64htvze5skd2TPhlDPFGHNOIDcKKZ/ZZXpEW75qn6zHF/bIJR84QC8e3fmjuxK3021TR9D
+ARTQje4FveZ21scvbRjFThiWdQjTbRb016AhKYPTv6a4eww3GQXMwlgfbFLxkUFiWoh+kEYotT6O
+55nD9JjHzBB9iAQ5B8/oBAvO8r+hztOr/QHjD4w+X8nwd/UceFyf4I5Yt2c4dLWefb3cMPjlByqz
+8n87YqeyN/gQPIggWb5PR+X4fisgw68cNb+/c546ghzP0e7w1HFkjyr2WR76llBVEJKJ6lPTcieC
+8k9rWseojSvQ7KeoED1gge5PT/Sxrv2YdxE+L1HrwKe4YkJFDv7e3soYoREO5O88R4k16kPGpVau
+rBZ2KpEQul470Fl3+3GEBV7wjTn4WbCZq+BDGNxGD+CloKsrghmqSUvt7OpAEOSqp/1EKCGiw1V+
+iSVjWTUak1rBsabaLM8dP8Hiavlx2xFDKLiBT9GM5nR5t4Od6xIdev/EQ0Q8iG/bTwn2KmeUp50x
+HNHUjFJ7n9FB47eP0Hjjbzy8puI7HbooIq4roq7qJEq7qjqJ4kOB6OcaxzR1RXyxtEVx7hDcYXoD
+g77YnbEiUw1xceItnu3PBq4kfi67rd0uJEq4YQ6DkDnqu6oqKYaLruioqKioqK2N3Gig7o6ieXl5
+eeSbgKirh5CIuMXYwJF3VcJxxJSdDyMdAvMNce3IkcJx24giLuqKYaK3Y28Y1pQuG+Gmx2HNBDiB
+ZhmC4jCOE4uZhmLRhmGRnd1k98f6TyGw/6zZwjbGGyvF0Tn0MzMZGUmLmRZkdWoxp4vn3HWDEXdQ
+QQd4xjUCQ88ySHBkyAY5nhOqKqPxP0D++/G/of8zfzr/kMBOe7g01h8IBDxMl9oPYwSkurD7PsmW
+ayRRfzn7v3v4ojH6SOcIGR/h5u8FiKfzwdYFmrWfELsZN98k+ZPKfqzpBD2kKQqx7X+Ll6iGyWoh
+7dERlskE0zIiOSHM1mhsDD93MP06QF2OWYUScbCiiZEpKRNbSSUlKiJkk5W6rNkTbLZKSIiJSXy3
+nbWvJKaStLZk2y1iZEpJKRE0mSkFCCYaKKJ25bu230Xc9xnDWpfp36dByHdQpGZmCPx4+IFZHe4D
+XErP8ZhTLcCl6EBvRCBA535TwCaFQUUEA4/m95pPVlTN5JgqWgGjhPFsVnxuhmVCMk+FAEoqAINU
+80i4zRHOPTtzjlpeQ5e2CDj+KEI7tdIBG0AQ+mQ58/7cggED/SOeLj2uXJMVFSKoiJ0INjx/LlSM
+ZgwopuMMsEN8UcXD0ejKaUmiUV1434jLdv5rbaN3MjszsnW5o5BRRR7/XY+3cQTald35L4mk9szk
+zHHh6+m2Z3fpVtWKrKctJWhOBqh4ckMgJFMlFQMLqyWUQMg0kgnyhJfT9XPpWmu45fqwS2jr0Zsk
+O50zCLY4MHh0/AiBpHhzCUiR34nc2XXBxxhJr0ZXR+NqQkhLEhbQ2g5fwPc4E80gRsDaMgwjglkT
+6vu9MzCKbdlrEm4vJtTOHFSzmZ+9FKNa03+v9esCF6MNfE3bS+sREbHHrBDD6vQ/BsPiawJmE2J+
+ivthCd74A9DzMlgBpAIyIqYl2o8jVxkdYo/2XmoR+gZGoraQhNAIcFG16VRb5glHUnKzWEtujLcF
+bdmD09d27y9wLd/KlW/4tBXle9IBG/H3nHN9zDqDiNpOtrN5ucjmTBj/R9/4t8K9EC8/qyrJHTjE
+6p2U/Ux4NHyM5PYd+Z00umj3NMdikhZzQsLs0iyYYh5Jpu6hS16r6Lbp/HRjnxrAz78dsM6jhYtC
+SRnDfbvaO9daeX4f4ebJOB7iE2qYhxwyUWymSxG22hB0+Hw0FtA35RADZrnl/xHfl4vor+o3t9cO
+LnORu5euXprwdIIyREhuyCOUGvVrW9XWGghTE1aQBrDIiENjSkYkjR4vsxG1dzxHm5OGeK5vA2MY
+wJ6Ufo/LE+oxslJrNpJNTWVBR8a1drFuyCRwvdNH7s4Bmlx0YggQWAqpwGrARD2RkvV0QCMyKo9Z
+Y0dGLuvPHzory6RudP3jGaecErL+VyiJ29ZoJbzJoFnetRgnNTHkzYsaS4HZYenQ52jeXFaCGy5o
+iUJK+S5sI2C0TO+AiM1I2dor5E+o+pPqtHde7AytBEZU14ggZEkhxUdYTbXXzQCO1l7ytIzmQ9mq
+SBGIpkM4nW7e9Eo0+bkMLJGy8QnxBF7sKVOI3RoFYI1xWtqk2tGFWkWhipg5R90RII1IFKKu+6bm
+6bzwuuzxL9UhhBpqMKYmpsaiW2RLCBgQd0ZSnHiOHhnfEHJNT2GcMEtiJID2cs5QCL2Ud3SdaCrV
+iRSQ2gi5rGMZmZmVVVVVVVVVVNNNNNNVNVNVVVVVVVVVVVVVVVNNVVVVNNVNNNNVVVVVVNNNNVVN
+NNNNNVNVVVNVVVVfP7ndzx31CfFfNPh7DlrxQoCeHwpPPNoUoHM7pY6qVOH7r3Pde/N+7+Hc48mc
+tWk1LITXozUlxXlWY7nrXLOJNPsiJBGpApRV00TQ0TSeF12aIgmoomCKg/FhiF1hh6/TWeWq8utr
+L+kdZWrffbVa1VTrW1x85Sj77y881aPb4eeKysDZsl55t8lVlV8EeDHE7Y7HLts8c8c223TqqmZm
+acNucXi7bgYIIGNNNtqrxUu+GAYrzBTsUKIiInJsa4dzX3iqmniFandnwPv++vsMAkHL+3RB3S41
+ISNZEkrBBkkGqIelIvHH48K+/1/Er3+bh/O8/Ydvwypxs1uHC1tvmG9vzF/izOPK6o7PT0kLdq/j
+8/UVVe/q8mVGcXkx0m269azw3ODpgp2QXSsW4bnFbvUueMb39v0d8dJfPXa9l71/m6YERUwukTjF
+SHVHfktb+2nh/Ixnd4maWPJPEpvyeL497TultdGn0tmvd/x+D9flbhKD3143lKSxy8zdZC5TOrMr
+vojjdEHxTlZ3daY9pfA8ovxjG45xjf1a5ZuQU4v4tqZ76v1Nd57+jnuU4YLXXk233o4ZS1y8dXcT
+p7TjyJV5aF9sPQv0x45m/k9HtSAY+vf/Y29+/r06/q8PNfHiSaotSWxSHwgj8jWrxTImNMkCkhQk
+QpYpI1BFRHi8oI2NVLtktG2mvzzJMREuEMkEE2JJTOQ/u8y+o8v8EYMIKpnJUdxVwaDwJtTxtDrl
+6OkHhs0oaoAh0nGbWfHXVVyh133vWLFWoL8unstguHt0w53yx4mEtcYw4aZ36+e0sMo9cTEUPQu+
+mdwWqxwib8YoQVEVd2nDZfQzEBxmXcAY9eNj9kvry2jYGhfAGB5KPxPM7efI4LJ4QoukHcqNlvGF
++exOmC3Pqullz4+ShwODd3HWOHtU9nnzs3HO/jwPBEBCBFARFBAd0AQiOQPf36Y7RH6PFW7ZEXlv
+K+Rj6D1z4jxqPG/VCRCSndowPksj2b3RZ6buPmtvjXvPEQ7HWugj13UrSKlWKlSWCcQRgwVSkqUa
+wxEVSqK69/X9f9Od/l9X3+O8/J2gneoWxO+y932V21Ovv2n2va5+3s9II9QeAMCJ679vl4bZNsPH
+w6/zvZv920EdwaTqEClE9GR4/PPltGnq4Q7YdtiZHwwMeC8wQNTVVQEViG2MbTGPWPi4rCkn+Pj5
+SYPUQDJuK6+i1YVUKrMusgOGx5WJrRZr0xrXJ7/d8jeXxYdWAGHO8vY+jl6eHP2U8iHKEPrRJDRD
+4VJ7Pj3ebz613upDztalVdzJasSS00ylBSoSUeJdXb2dmwoHpOKA7sZxgCAoIFC1GnlCr2yh1vjG
+MeeuTQyKQw7B0qQOWTZCZ1h8/x09bejpbt646bnj2wlyz5+B4d3WcRBKhY7BBDI7jrKlD/Epfdhf
++jTFOVJW7TNFeXyeH0ensTH1pZq3HfaNllVqdfh/M5X4/E3hk/lhftJYooyfUoD4QeVKqdnqyak9
+fGi8uz4fo0o5/R4+Fx5uza3xU4HGJ1qy75dmqndMxQJ8/3R7/d+RfOY/Q100QfHu5p/iYXcW3EWz
+DjLMu6UsvPj+rs9ydQ/Ghp1c2XrLP7GuVs3NZl4OFp8BAz2tPtBcLyQqWPhLIcDsS8SRYj4yP1ZE
+E0zMAbSF+LHWYiY/uINJgYgDuSDQgHaB64jGalNihg7vcddmmFK9VSf6FRs/g8T/W831N3+B/W1q
+fKpx6zPv/Hbrl1/puTnVk7V79VwSYIHlAD5hEgoi0OjZEbCOXL+OvTPLl7uWQ4glfu/quu9fN8x2
+84PB5feHnjMAMwJenPvbOKUEFqTvXAsrqzO9sq25JJMtAIhI8TZvkr8USi6iX77hX5czlm1rV2/T
+z42xkPxR75tYmQfTCZ0YXh5dV7Ns2GOjl08pSdgszRU5xITuaSj5Ga5ebkROKCIlGQQUlItefT64
+Tu7AYRAMBPQecmOQMJ74mpI5ZRyx7jfyhIgdChyLi4IHWSJnpKYmnho2lkRuNUrWpb7tHq+7bjEy
+bdv6cqNe2QVP6LSgSanP451njsHds+n/UlJJHqaO/YYyNtUvE5dLw4xwZnve3VfHBSSUjQP5Qktt
+Hm0eh6SdsvWhnHKIghjZXNHfVAEPXtsQazoYqCJ0igCExLCJKCc4AaOuHIolKuW+jUS4b495XcDp
+wLTUKWQBjJSgQAFakkbnarU+vHkUHdcJIISQZSQeNk7XOfKFJYwbuFxjbGQn8FNqLJLFgjmSHTU1
+RoaAtYiZMSGuvOcdCA+7gBw1sfsQEf3WkUgEMSEda38q/kPgc+fWJ3P6nHw9BIAMV8t1JQ8fBHeV
+9DW+cyab1klafVwSiYXDRrNBLeZINAs71Rpk5KmmS0fJgbFjSXBMOu30HnJxfRyUG2C/G19KSYkt
+DDEQjw15wLz71tMPNnZlCUwSzb5ZLt/WmL/GMPyMP546J8Z9/Yd3RsuR8D4QIdpwdvPGp17sPcN2
+cTsBAnUO/+OSCMRQBCliEX/h/PIJ82XOgZr1dvk5b/Z9xQwMQxISSARCkG549/h8RfFhrozw1nM5
+yqR0n4d2ZsKK/2Ce/B9ED/5YcjlC+WEdMSX64E3WIP6zp6enc3OJHLUoK+u0cDSIrjsSXqhZSUIq
+WxVqrs9xC/2+5+19cmgtP1c1CoUBEQT7CidwIH4heceobux8YSVPHVT0R/P/X+ahBFPEgB6xAHKF
+1kiJ2eYTtYdARyPknw+9DrjdVKInxe5p993Px8J4V/ifucPV8TqmMSdGk10sFKAGeu+HdCGbx+sq
+HMQvKBQV9ECkQ6jJ230aAt7EnbDKKDkiJ8iAnWSgiJ8UQuEk3JERNfyuFDHxlPGfh+2fYxl1hA7R
+iNDgXmfsJnSFCzHsm6qdRO8af1gXJ2rh8BkSgC+Ew+c8IAASRQuNu+BlEECgpmilNRkv42LiB+QP
+zDB0M40PgRERY+Tj/qPs0cKH0HYnkdIh2G01ItE6yRoMOcvOEDPP0SKuxcXP0g6svZGCAIeMgQy6
+oOxd2/sHodNPcEBww25A85sZg4N3jXwcf0dNlV4XHzLCR4wOWbNIM7Kw0eVkVA+pkiIHxBDMRCZk
+g9CvyAlIJKz0IIMDqTyBTMkOnFxMkD8uc1bnt3gyuxERgFbc5GAyJAL3rqVMCud1UVA8jDlTXkaN
+lmpyNIjMlSlAu3nU0x5Poj3oo9GVInxjKzMPPCdbq1VKGO3k4bZu216aZzwwjDxNKrw2MI8IxJpv
+JhnLDJuOGWVH2o5nW9uMTikfDPu0kbVqpnR9PVNwtEcySeDUcm+RL4ka8+ELzYLkYweoIDs6NBIj
+lW1BEmYzpc64zfGMueeJ5uRoxMhg6LJGDxFuTirKBKpaGmmlKKjSxSQrvXk975POr1teuum043Yz
+ffTvY/Nw01sgj5ApCoAnAcPAcfhnP0ZISEJkmSZKaS65VYmmJpWJpiZkmSZKVWkiGJmSSZJkmZJJ
+kmSZJmSZJkmSZJkkmZJkmSZJkkmSZkkmZJJkmSZJkmSZkkmZJJmSZJJmSlYmmkpibnXO4AAAB3Lu
+dc5y5kpWkoSJiGJpiZkpibi4RGkYVVWkkmSZJpWJpVaSlYmZIhpGEVEcyrmxipPOI9kEahBNoI3g
+izPBvxSgMAgQ0AjyKMT4WM+r/oKrJx2K43f3gBeefh4TLhxOBiakE4pqCIIiQFdURMFbhT7MXUVF
+QVd+AmPtUfKhAX7T9f8eZxeMBD4kgTrUBIxsdhP0uqdERw4qD1kwu9xfLGRN9Zzm+6aVSpaV7sZr
+EVGpR6yXXCPGKsgIXMSDYPEQvogUDBpRFUW9jyS27+/0XThpwtuJHrQQUROE2BMVSpNJm7QmVGPq
+KMKosmMSfjhsj3EsTyDwixEqZ0cNH1Pk17sGlbuVYbq9zd/3q8Pi3TzWOeifprO8JiGQ7cDBGCxN
++0oiPDRnVEVUuYIdRFt0/KjuGRoOI6TmaPo3eenPZVVVVQAAAkDbNskAkADMkzAArV2bZSlBEmMC
+dig4tzJ8ILEqfj6tRy/gdpOsfEoTN8E/CONwxJbABDO6OwsFFgxIShxHJgIENgQXgbftCF8neT7e
+KXZ0yAfZy28OJiyfytQFwiPNr3i7BeyRdIaeRkjvk04HeeM/5fT6U7tgUUQwms2mkmprMRjWoo+x
+S6tfoKvFERGsEyaEoDVpbSaKSJ9L5b1+L+Pr8i6kyKkYqP+A+hhP+qx/BA3JBh3/otXT8qkddnU6
+l7v1R9v7QAfyTwH3g4P7iI2NpL/af5xh3ORI6+yerTs75DdXCBZn7cP7b+1XRf+k41yfwX/tr9P6
+eNcLfuZ+X+mXywO/BAr1yEt6UmRgB7vOq/sOYUFLUxAoRBUmcyTi86Sme/BlFmMDKDJAHEw4GY6Y
+FyekmFxMKSSQxAdPUn9ESNYjCnG8+L7S9Ke4pkFrSTixv5ypSCR9pQR0hFG+SpkQ4L1ofd2S8FDN
+gN8IQZQsKciAwo4e83JERxTcHO0lAckTIHtbt3uV/W3Y+Zw4e1Xg04Obk2brsqlNLo3bGzZpTFVs
+rGFOnXGPpY+5XM4VzaeZ3ebhu7dXNs5KcymmP525IqfU57xS4gTMhio52BYcnBi8uLyJgQIERiHT
+2hASgoQKFww4UP3GJkRFKESRcMMwxmDwehg5KGfuNknszZxRgyYGWUUYEhjogTOC0pX7pjKW+x3O
+zUTsxh2yuK9F56TksevsJ82/Pj4MvXu+M9C5FwLE4fvTlhvmmaLL/55YUSl/RPlsQo2OORChSxCr
+cDPLG+014jGS6wp8JKo7J5Tzl/UWvFQTsJjCmOpYLiAMMKjHaSGHFFUlQU7TW8zKeV2T4C8oWOq6
+ZiRIurp/EMOYEXVLz6niLhqNFdzAoOQ5DvhV1eC5w/X66zeDnM7iuK/Aklu/YAPX1nTy+pUVOb4T
+OjH2mizBUn4PYkkvJ32SFnBQsGCjY3JdFSJev0mJYJlCoxVhxgxFcOoSRIU5iiRHOwzAaGLRYYZ8
+xmIMhZggZkg4NGTREkjG5AmQJHjPmLhyQdqmhMoGElFLpEHH4Dg5EUmbGIpE6hyg5UsTFMSANmMS
+GSfw6KMlkDPwlBRR0djBBowWSbHJI2ylfW7uquBsnDfk5tiuGevy5buT1Y/tbTk74rZpyV9TePWS
+lqqyVivO62zk/19v8ESNv2tlWDmrKEoL7B6l0JAyecTp8owAOB7FRJqHn/ntFA/u4F79Sh8R+EPI
+XCXD/o+v+r8n20l+b8/21rve973ve973ve973ve970Gxq1hRJxm5MmiHxyfo/y+R2kenN20RjnkR
+1YZEXwx2dnOIfngj80+yj9LaAZbPwaavwX7lz7I2iDnBGvV1Pt+7iSHSo+nbJHWSG6WD98WFp9Lr
+iVXYLzUak/y14VL4Y3Wgz54/jcdvK6rucunKPZoxuLGfpYvFKAA16zNtDOSONwFVFMebjm+AwTRu
+O2a4jJuuWcOUe5ESCNSBSirhgnI705TwuuMC0QFAUD+M0QRkWxqPaeWhpRPZ7r/VqROUiJgxBHX+
+Y45bInr9pvMfC7SPsdZITItOyK4nwDAPd8E22W/Lbqwf4nJCnUXoZKGCKgG6JwOyNJvPOODHrmJi
+NtOCh4wopQD9fgPIxw7mPx/V+PRxEOmDywL+KTrkZDrDr0oHcHoNneBClRiV/bo7wPBe7v7L7p7n
+y3h8J5v8MHmj4/RBGDqselkWnonv2gD5+ZXs0UBkS0PsDLdekUmYcXA/sgVz+KcYISG16tLwduZV
+/EOhAIooEEUEnHiuna+vHXNauo7w8fWzd+O+dmjnX0IwW568u22/h9/Xhz5r6OvscEI6UHy+TnJB
+zrpRG8R1dSFTHt8/VpIO3tvMn76fCee0SSOczoclGub+tVw05VmB5/rOYnZ3HT+LmF6Y90ut8seM
+BIny+SkOSiavThVlVoCABa4YA5FDyjoZKGSL1RCuoej3MZngid5M6zmSG5OywS8QBFBtw7zPK+Nw
+Q4HPyOke+EuvAA3IXUJQlKUJQlJ0Sro8wQedyfRkElhkebgfNnXrbHkC/GSiZ1mAMfLgAdXYyTTk
+ZYlye5oTTU8XIfS6/U5u8nSR0WHSWetNWNS165EDs+WD6VJ+NhPSxL0+7zvEu+XG2921K2QvZJgZ
+wxFsapVFQ6WVVzoLrPlOXYf6FufBUeSSqdcBhAdDK5A0JSdXZbdY+MbHwc1HtPpFCqIARKWqLf1w
+vhPOrRhd55tckz8JWbyJ1cgpn5+RwwdvWfURwF+ZkTrGJk5wlKD2S0iHu7cRj04BwZOEJSJtw8gI
+fiMhcBDt3e1k4yOvYcvxl7DcA5EocYFWp2l52QcKOHbHrHmyOiEfofjj2Pw5waMgWwOEBRwcliS+
+p6aR9rQLn5+JRpqnGOMpxn4IKE4Q+eHnz20nOVOcc5jpZ0pajip0r7/DHl5B6uUwdaOFAfHIbwnn
+XYXlcDCKqJyzHNgHRo1ofkh6iMWJFfKshRJE/CpHPmFR4njiqpgSonCFUMIQQiBAIXqjAgMoiBIk
+eBItg/8mUxAyyu1utDhhLM5bHn7fZ8IB4kF7KfGMTsO4ddJgHqhf7hUExOJ/j9YqiKhQzI+R4FNB
+TLcUyLH9a0Qt+oEdUQ5Z6HYTQBPwl9ei9NjTp02h8O+RUsSBlUeSIf9pmIjaHNLYNXj/lv68MV6w
+2gFNsAL3MlE2SozqeUHbZQSdiLM9yWlcGRuxCzwbQH6A1QsjNI0zsVpy00P27QRxBpvBH7XM94Hw
+HJ4bcuTk0uGMjscYj8Xk5uydkhdU6KwGE1TFl86JKZrFa71EvNZGamAuBg0MBrz+kTqP7fzzR53N
+FGjR2nb4Kczs8TDkoP4fo/T/J9yJkJ/Zr+vWsqSBjk4bT+zba/32R9ay3VU5MjUn9dRyqO1Sb7jh
+X9raGLU1EP5P9YMOVrWZwWNZoZXYqiIgA6iIgApy/h+s/q/J+v6Y/p/sr+z+/+zg38r/taPPn+z5
+cs6UfTPP+yGrUn3fw/PCeuULH8f979/+H/iY/1a/6P8nr4evu59N/rfTYiFsE+6Gen3A0jaSoDX5
+3MigRUCgA/iaQvsqD+AAHf351vUupPx4tk3H9JIUXFcViYd4GKlwLuWNM0Syt9brUWQziTStmMxH
+7z8ow4D9SbTgQxCSywj/a/vv3dZwjihTOoLJPG/yNn7Fmurz5efHv7uZH9x49LKvWtL5by+EkmcQ
+RxPUzw8PD9xtPHJJMpFpH7nSPQT3e0kdOR4I7j7gAwk/3k1/gPo7nGcjaMGTxzzR+7CSaa+YAagt
+y/87/z7vJmJV5YuL7AkTFQAwSHNTNxzIvgADVMRyPlnE9p2sTJy1cRaYS88pIiWrbqI/0HyOKPi1
+yyDv2IrtjfGf97bmDye2DzHUYQYR5yBD1DtpfgL+o+XKpmoqKmqqqoPh4cQRLR2Hm5+xO70+PDWe
+Ku6o7Q0gcH4RZ6hcC6Aw8xKuRC1Yd4e+QJpDPrM5zv95wnk137v8OP7WENAezaZLE0xfRf2HPeD2
+CEe1oA8s5BI7D12i3V0ydju4I8uISCRhmM9kqx9PbnGeI60+OVKSL7MyCRR8PoX5Pq8+f6WvsgzC
+EIADff+PvY7H1GuWdLtzUU2du9uoPU4DsJn+0QtCkhNbpXeIgUJcnRgAnOcEviQqAF+2zyqxitoD
+ZvG6/kFxfFQjMPE7enU8GagCpxnXdVvO8lmt61ChzRYJF7LoOvQ47ir2httNNsbY24ACvpXm+b5v
+k+fXuk2yVGEAoquEaLR2gzEoltDf+4RVRhYMTs+vuZ8udKt8dPZhed65svSOIUG5ozY2B8siKLi1
+UZyYI3vZ8mYwc8UP9k+znReB9nW6DHkvUbaaqKioqqIqO44nGYjvTQBz7uWdN5Zc1R4SG2yMDvGQ
+6NE/jvG9TSz8ZxjG1iiDUntHbrWAAwT/1b9O8HXWSactiRG5SRfWDPNvBwCR74LNs1l4CyZ4L1Zx
+JA794iQ4+BrlvG987fKz3MnK+Boh63m7MHGc5zpZrMHkTOY4smpTCHr81mLdxJe0kH9QcVC/ilTr
+roRxxWzBHSSNEQSZSQZJHRRmgSICicjdxa5tQ7uI77O5ved5mZmvy1oZeASHviLifXfYujL1Umbk
+1CSvIJHYLrtvVbnAk98nmGhhjm+d1VV2DZ3yQfi4JRve97Lu7v/XO3fK2fLu8T/l/4/7pH3K++om
+nw03erttwkhscZPy2kCpvrFrjCCb3EjYzpPoNkQ/fdZyMVA50hybMkiGVCP79yyXTBJOk8ZPzXXx
+g7PFHMhDQmMSBLMQgAbbhijCxN1dRAL2xdojq6RxaUm8vmnjSz0UhTVU+IhOv+bl0vJnhrc6IRzw
+g/tgX3Wd994Qer/Ox7G8Ewh6Pzx5TWumMtXyOLt4dvHM8WqF8DQM0BGGMuEAiRzMpAiZbbYAAAAA
+AAAAAAAAAAA7uDruAD5O4D37gAD49ubTf8MGg4hxxZnLxsY/AOBs/tZmSAAPKt5rE54hGKKpNcaL
+4bNE421I/5dnLXJpIMKGVPTQwqSlVaV5PPNSvavtEKOWztRbE5LJortfCt9lBy0IiztJcwJdsRgz
+B4jxPEYOK92eJMz7IpRrWm/b11nIdesIS2VAeo0F8FT6INgg9g6WH/lxCHhwJnkggk8+pLyghEzZ
+8vSDODgZjIs2BYC7CoPPIZ5KFBUmv6jSXYSQGImHc5U/ilJKRYSame0JXvIb+SZNTEVJKXHdVAQQ
+OaIKiIiCD4Wlop2mJrmsCk/WYIAgqeB8Z0REPYeo4+lyUqJcYk0TFGL0TQU5mKBAfuPOoQQ9F7Ih
+xDefBzji1bm8+QAdWaIiQPwIAagBch9Bcd9jgOHUCgxp8x/fJYd/wh1UREBE7zwOZxAe+PX+k4h/
+l5q6hT6SEy2Iz2/6j8A/4yfz/rNH/Aao/3Cjsf4j+4kiSSTIzG6k4DR/wGjBHC2P/o6uTZ0bt2Ob
+o2KshHJdrP3V/apLUJhCiGSVRahSrUFsAaDJfNC/ylGz2GeNItYUBsQkvoQI5ODxgwEMWWaZsYxp
+dzWI/4d+fe8XlcsE/BCoYIJAUb5ryMHpZ6HJJWjmDQ2bKMs75LGNRwV3OCDRZjBkyG6foVSpclkC
+kggkPtndvBzAY5BkkGg6MlaNdGCN8ncQhKhAkclHaTuMkk0bOB5oizrHR0bZPaSB4JLNEFGzOzNG
+jZR37kY5cB4OeSjg7bPBu2Z4bdG3rZJB4dsQiaIWHnYgyojFRyWSIc1iE5ujnpIbsZBI/Wrq7ZBM
+WSE2UjrUTrSSRgJKKRIIaIH1+/1+z8t7tZ8f1h8yt7h2+MGEjA1/tgfo6fHWXgz/K8pbKn92BQXm
+If80RNKAzlRNoX88kIVY/f+bm8FvtmEU0eA/ztIByplOEBx45xtwAuWKCuDyi+rqNgb0NGxTKsWy
+GjRW2sRSkMkSwPPBAyCCKEGGHV53Y201m0FFsWxZhZ89SHA3ycRwREBP8Z0DLWJtAbAubjhT58ck
+Qh9+DVjJemNpVesdcVxwa9mU0RvVxXruMvVVrm+GS9sBnHDnh8sLuLbiLafOIqg4xwrOTEIgsXEy
+xyNTkRKhQKl4AC4WLPISRgQMBzAYOhkjGUEGTRwZJKS5NkFjP2r+b937/Sqqq0cnYXY9F2PoGdMn
+nk468Kww8YMYxYYgsJTUYtcQcFNhQwIECmJEcgIym8RdBh2zG6d9pb9Lht8GOUeaHDH0eWOS9mJl
+Szon36Y488KXLITwyXMuG26etwUPAz/qfYv0suJHKzE2prC9pmEMlOpyj6IQRqUoq9XKk5zQkrHB
+OSjVhQpEQwrPgHKF2PEwepeVzFSaunsYECAsIRIFYiCA1yX25VIBI+7+DB07L+JQiV2o6rFn8b0O
+TbSUd/dtu63z7XI2sch94P8BCnL123j++Q+R1e9/O8kn8En9h0gjy9PT0wMlvkyEFQ/OgCfuDVAE
+4/XuergibowfqD3/h2Pu7m9u3tBfSKJ/CF51CYB9XYMn9PvViSJJk+FQ+X9p/fFA1A6WP+nTZ7iR
+P7nyeoO86P4JxIP/cWy/+3jJlHEJ8xFKkYho8Ew/26spLI+T/sEyR5E+BMKSlTkbz+Jllvz1ojZC
++w1P+rsdv+88Y/6XdVeBhTRnBPNOWKVYdX+7R4TmRI/3HsncjMXKxbKvteR2K5z2LgpM9TdjDQUs
+NNGxwdkdzdu5G5yk6phoPe51jKEQhSIEH+gWU7COvDDpc9jsyQslWXFO0900TQ9I82hzN4FgdznA
+5Er/Irg3QnJP4SI49nWBwOhyfb82Gh988Dx5EsSOz/wg8PFYDncvQKdr/yoLzEHQPgMBMyUCqkpu
+Yer3HiexD1HeeancxjDxcEibyWJDU+J2k6Hs6pDud1kJqyGlMKkY8YRPYnNNOR5BiyqIjAwIwowO
+A4LjwUexeKvIet32Cf/SK80T53khuew6EO6xp9k5GxsQ9f1xUT/CFP5afsf938FXJmLVYZM/jMk1
+DaNQR/LBGoIyCMgjII1Hk9P6vyaY+xqRseSf734p9U5g0mTR8tQOESfkdn8k/hvBJu/HfJJJ1kZs
+dSSfc8HCqKUdXBkLwnCGoTZz/GabQobmQ+MOTif9nOT9zfeFf0ZeP4mnzGscZndLJDVLN2I714PY
++5jxU3bzdux8HwWCT8hBZo0MtAssP0/PRKTQYF6EjaZXQ5orTTsakf43B5x5uH7wh7iHvg9FVVtf
+oh4NNKxmLHaGyMRJ7D9Ebq1AyR6eC2NzY/CbxNjRo9HgVo6fkOs0O/frCyJ7KsosYyE7Do6lVh/S
+r9x3QSlUYk9iT1cMP/Oqa0q6NJDWsQ+VmaWev7q5Tc3VDfF0LFvVH8Lk2jH7d9WO48HCq06/3LXa
+5Vv+zOab/+NRxw40c3NVYK9Z82HHCPXrhzLJWqeAhgIYId5mdONHkdGtWtOzY0vTTT3G1HuEam1Y
+n5jxHoWRHJUhyJVRSUPhA4NpJJsJJIB4cuVt8ej+GkOIeqD1tzqChcH8hieBsx3PV3/JX0fRf3E/
+Vsr7j6VQUqVYhdg2j335m37II5QR+yCMkIsEZBG6fuj5LFc3LR23+/QjFi+MV4LbJ/glJxXeRCdP
+7JCJ3dsjyDiQD/EXLuw588HkeQzKk1D9ZG3n/DFVfQeg9BuaI/EYY+fjghhAalKVj04mRASbYzKY
+tVer6G2ycm5joxtriaMs1czMyjMxi7r22/U8Tib7LH1G4QsUh3idZ9iyAqqlhE9mEnNwqlLOsrGT
+aTE00w7xj8/4ZVrf3Kg8DsKpOzsqqpWyfjI8unSzKz8+ZN8m1fnzJrL+fuxPeU1fVI7HeJG5SiyK
+lRSfiNqex1jkmw5DyQ1E/hSPbYfvpLfnc2E0shVBb0YwPiiokWwm7cr+f8yeK2vCN+h7+fDw2eJN
+n8FVSHYqdDgpgUbnRNVUTe6kkpJLtuuskkkkuvkTFOq8oUFEOiovwojDUCxiSBMTBIJ/bymEg7py
+TqWEp7Esw7Ckbmpk0ZNGjb2DZJ23Nxw4ijseBU/W/N4aVZ/wp+l7X3b102/Cqveu+uKJihRGjTMB
+UMMD1XUpre81rXlJ9QkHQkMwmGZR3IfKfN2fFtrbZPAP9Z+o264kCJ8xE8ByhIaQqWHPIWGCJQlI
+mhOzJXnZbgY8w2+WYPp5ke+2oTzMXSj/GliNlmzlAAV9yfcZ1m81s5NEkDDR2GQGTIcjO/RyUWWe
+CzFnHJg2LxpbFMD7MZmBwyDhkzDPERz3h4jc3L4zXaXG0v36J1N6lmYhwTLLMFRvCxMvi/A7KrIg
+OLPN/k8IELE+yPIinU6ExOqctGjeFmEixIp/iBQI/UJBsPI1C1uEGKsqhMPCYYuHgKVpwfWdU4km
+xyTRhHE4Nx/ec2zulHD8RVUpVSowKJUYmFTg0jn6Hq1Ibz4wDmh6vi4kmj1B1gHOeJ8H5XR89KL5
+VkuNMTVq6cSH4jh6Iiry4+LNRPM3BPA7x7DwkdnjHvRimItkmEiwCyJg6u/5IOshzOnJPKJYlKKk
+ljiSrKtx1K/M4Y0qvGzTZjYpoxhZTPFO4J6p4wPeHSHmKSc5JHskeHc7qpTpEru5ROU0TeeKNnzm
+7cpNG3KPzpCZ5SlYObT5uq48j5cmTa7M4erGzY5NPY3aek353qIpkYhYUlWJzVLlmJObG2aY1ydH
+Roxs6JExkFmSAZo0IFkYCgpUTEzKSKFkdakm1QtGmb4lTwc0tOsCxzhqN0JZD1NHxVNjnJzrq7sd
+8rKaY0mhudXmmoOqbsSVyWZ8jk3bjmNHdKriGGJVV8HtKqqqqqqqvdA7T4vmmyWb43MYqphNcjWk
+beRWlUUqlKppMY2hDmpUqTycF8pHubHmk23NPSFNhowrTQ5Fm56mAb2cHEm/GK2lN1FVDVraplgt
+exU3jgc0Tke6SyTdyKsY9D4HTYczabzuakMbpTc7jdqdtjg1TiSxMNvgc65KVS2CtIg0YOkpqKGm
+SUMhjGkMaDBzOhocjUmFTdNzad07OKrUFm7g020MaPfvVW4dCnCpwTaTajxbGZHlD+A/ifijSMkI
+qfvr4bf4uMzMyhhqqWqq6qqqqqj734fB+h78uQbUaQmtP1809cF9OPLR7UBNu7uJX2FblZkn+j7h
+7VVT3sZKxTKKVVUVX4X74VhoX3PH9Nh961PGTlPDTA9E+iGp9EsfQUbUxY9dZVadOna3+TcbtlN6
+1D23kvkfkYaJZ1VyqmpNMTUiYxKrOZqHgJtA82Kq0pd5J7DxMSdVScEOW+hjZiSbSk42aNH3J6rO
+c4TRyYVzKxKmjw5ulkiP4/0sk2/bPusfV/WPrCnCPlPVOuo+r+vmaJtYfrsT8ArxsQneiCkV+9A9
+PEAo/iD8TpHQ3vLbWNMEyr8WHcbIfU+Y+LsqqpSpVVSb4xVZLiqqqZjFVVVVUqvqN0/WfVHMfUc1
+hHSGpDkVHN3T7jlzi2ObucIQC+toApW/1kx4gkmaqlgMoDlLkbBrQJeDJAga0/0BIFEkBT2THEEk
+zVURLC3asi4I/EY+dU3mIyP9s1I2aThjZZOqNnGgwK7M5ct9BvNVBE2jWGjgRKw/NPPYu8G8fEYF
+VU+D4s01REL3PV8RjtTtL8UnhT4InMRmXDWHC6nuOzIsYiMCaioxPJBpA7ivsYnTg5NI7kKZB9oy
+Js/oDoEB6CDoQEntI0w5r7L49rKKKWtq4fRFb7b+h+Q/UVVfLGJVVVUZZGmMmhYywKqYlT1UaaTa
+ZA+kx+Z1eDrhH9XM9h++HN1kWD/y5NQ7Q/ZJMHtFD+xPBw0djobNmGMVSqqlVhs80/nmJPSJDsWB
+xDiRpI6SdFQ3YsVTY3VXpYkptt0uldtvlukkkkkkvevJHMzklklHJN/zz8wYj9in61N5x+h7WK/Q
+9XucNPD7JPRNj8nJyUiNypNk5lTg1kD9B7G6Dwnq9zoD9spulnOlVVKVLWKP0J3HPv+PzMnbujuk
+d7DRxOwNjYBD8h8x1ImyvhKmksWRGipDzjNT2QNNohutOx2dm4n6NsTsnNJJkkOD/vbmOTElSotS
+GMVVUyToVJ5lGTlKng8VViRSLWx5HV5YV7nrK2aa42P1ySV9baV+ebzoeTyYd9kjZsqqrZjEVVUf
+e+/9GN4RtN1dI+SczceTfwYpS2SVUS1KUkmjUbZaVFrXz2PN4m55Ew4MmkdThIPlUSVKiQ+d2SMP
+5yZ3PKyLydJHjPjA0c76wOcDEffyMQ6zJPE6KnpI5jhbVVbGg5ngHpMcHj5oJH02SH3BUPzSgH7P
+6kVEMD6g/OfNo0xcQDbao21fhV621rtemr8a1eBmQCAqqvzdHUHwHA/AGPYQph5p9XkZD6ARTxh8
+p8Ry3lFiiyGpUmUFOY4+L6GYfM00x2wymWD8dN2q2xlnyTbRG9kmFVtvqJGt2GODG5pvVUtyxpsN
+tij79sNGnQdaPsV7w+b6UA7RDSbKle15Kqqqqq3keUhvs2cnVl/JR5JynmP6d/33iR40KOmZao/O
+rVjUq5YyyvIxGWSUp4HWAfGNj0KQ5SuiXRo5DUlVKlR7GGTUvkMhxYg0rgY7MGlgNsTIGteVXpPA
+6kX8PTiJ1nhYZL551JTT9KbGi4ePM3eH58MOaSnefI2YrCx1nT4fG33t69GzZ82nQ46wPA9ipPhZ
+JzKg5e5Mk8Q3UOfclD2e6SSYN5Jwjor3sYymqlzu2OrIhZKpYsdyJOD2t0w9ZDyNJo6dC2GsaNhZ
+Ntq0aSm2jRoppKlTy0ajZg8jBhWy4PRjlePKST6gp9i/W97+DZ/HeQPwcwC94v5wD+lA6UDTGZmW
+WVlhkVzpwu7ogjnOXCOtX3Naocj2K5vF5D609rcFfI+lpPnHyk2ksl2bMNEJ7ZcKiKfCQbt1VVay
+dxqYpVaHM+cpJ9sjwOgqHZRPleQPn7nQqxVJ0gHWBxCL/teWc2x1Sweammg+g/UWJUskVQqqsiiq
+skeUbmGih2KxVRTlIj1P1HT2dp7TUk3J5TkkV2SeGpItMRzc3Ka9r5P6OHDg7MRw59zqmGHbC+Tg
+fG/CJKPmR4/w0/uP1/3LLPNt98V6rbI+yWBpKepClgVJ/VEAh8b5BZP+PkXgj6AlSge+BMIIj3X8
+2XE+o+ZMmyI+UwUl9D7lPpXN8sQIk7IqpKSNCZbEiggf5k5Sa+4OEImh3nQPp2ITBhhrSyRYVVqz
+WXjuvLsHiSs8tlvLa8UmmpUMkVWFO02TQqUba1JVkSVNgAcDpQCUNMEyK6CQluYk7m0cJqKgu1iN
+VJSOxEPgDKvMQVstzsDQDqKCK2DiPBDiKzyYkiJkiIhIw5jzIiFLOGGoRs2kjUCmicDYmmi1QxLN
+oFJGUhHREScGNjSG5pDUDBumm9XCZSWrYbFHI1MTBYNGGRwUhhWjY4WNn4/uWT8jPsNUqwRZ3pGJ
+Eka/NVv0upa4jU2tph9j6M+Ys6hSRJ/XJCWAOjqwSP6JAZIFQkTwhB0oKnN8id6lD9KqB5vf+QtI
+s0YS003ySLSR9B+WJuPoKqqyD4QskkyINFifoPrq8oBcZBJhMJsfmYT9ZSfT5x6doTkdjJI8D6r0
+pPJPE8DYp+9MTecm6dnBJHXYdu6QtdMwHC3GtE4nlP2SRieaeM/m++qYO20OaHmh46hGiWQsI6qm
+z0PIPTR3HSJUfleiqqqrvZfgzYhvDiB6baczaf3nDFDwO0m02Jj2RMK6JHkbJDYdJ1q+blAzWe3T
+Y6xbElKsGiyROINy8HKh0SDpA8Ue/+id/0X+G6Mer6GE+P8JNxu2ZwyXp/I2PkfR4q8oeSI9Uekn
+zobDCe8p9wPt8p9f2pEkMfy/Wwe1xlUfj/S6XPueb9TvWNEstfD2yT3w+57xh/ETyeLR+s5Gh7k2
+kZAp7lSb2Jioaxm397M/7vTU4TffFe7ZceLVKjFSH2fWtWuDR4MfSn4/TTKtzyT8TY9GSI1EvXl9
+edlrkOx2cKqqqu0TT9hiNzCT4opuSJ5hen0h9Zs9D0D2I8TCV7fTip6boAyV9sD8mx7TtIjwtRzR
+OXY7SO7xTES1oUHv9v+LThwwxkjLXEdFFU7Fie0Tt5kcoH0I+KiioqolSWJSxNuk4Id3B8voyfO+
+TkcZhNtQ1EzMaSXs8XifSYfCNEw2KbDUlTw6frnT+YH3lIPBvPxj9x/kfN98+ziywcu0z8zG0LsR
+VEQfqDTgqP5pNm+DvMSVKcpMxmPhPs7teycmKpkmMVS2VVV9URzNtl2P9JZDc3qqr6VMLKKzKmMy
+QZzgfNsbLCbKtW9Iw+pJPkhZ/FzP3zJJofTAxCc0/gSTYyRJwWIcnU2TScTY2lQNQNyNtmSnnP5/
+Ob/VHlJ4xI2ex6MV13DOmp4I4bFVVN0WbpvwGJrL3DY8iRRZDk2jiKttchzRzfvaP3vR5kd4dyE5
+mwPYaN1kq1bYbJH8ZOBzk3m80PUKRWiZJNFkSkabQk/a5j01E9CeyPUjwhg5wOsdUAxVcB5JDJ1k
+LgRDGEOyBqJsjuxsJiMWeZ6BSvUqqrkgCxFIodiwKlAhaBLlAY9Pf5bRk4YkSMxCCQQMvEDmwKYE
+uDKwzzMHQaTAjUGMKQxH4yByRuUk3posIUsnUH/jUhPr7fpK/BrX2/tQgQIgEh97fqffl9KSJ4IF
+5f4jfSeAnbLShQEyAkKD9f0n26PXVT7Ijw1rXowDNYaiuJGihn0lFClH7hhRZX6nVDSyVBgZgg2Z
+MlEhixMLFBhhQmdC1RxYDHWDB2zXBLOEBTKBQOEawaLaHi27tn1SYHyOzEUSRB3la1cAIvBwHNme
++US1LBH6kANLt1lb4jqp0WHlXJUby297M64k7OHNoSPw1lmaxErgogZk0djJYu4zgwQUGDq6NjZT
+o6PFpzbscFaKqp1djDmBEAgNcwUMX8ZjBuiFlMIXJUQbXljGMGXyM8RhnOomdqqWEhdDAOzQI5aF
+2OoIIn29vzggGkYi4+TPcAOCCJwQYOJMTgHjCNQ4ff3kesD53RVThCfBOxxo3bvxg6Fx0FE4nWoh
+Q770QvEoChQM0ummgno9xkRVSqqqqq5Hp5Dyd08JUVVF5OTSOz6CpVjWyvVP8bps2Kqqtqm8i4sm
+QSvGR0VTTz1A9ix4eIxCE8Rv7c1AZhkaw5IJyQ71d1PzkyG52GG7tpGxZ35SsVVVvJsTjE7Y5GYO
+qU33Tk5MhsVHc1lj3U9bP9u32XwW7Y+uh8LGlhNWGNTJPFY7oH7x0Tv7O/rNk2CA44nAOYnjkgcz
+rZIB2FQ6B0kah9LBwx8nkPMN/OHzIIf1bExRUVU1URVsgm9QI7BCH5D2fxH0Bhs/zP0FTlB9v+nj
+iSRP1v2PGaPvl3/nI/DQNzoIMJD88Ify9mArlkpqAHUahNSJsf9xNk/yIiaDq/jsH5F9bH5Pbp8x
+t7d8d/fv44TUioQGiTgNBWj7YM/j+cf4SAeYT4CB6CAx7DZpg4Vs/K2bcUp+bjWhnFumFuOjo3SA
+LDLDjMJF4iduoiJD/ScVijkZTP3DNcmANmiRjCCZFIiizJJAlV0sEy7arvmfI5M42cuRImoG8D8z
+3v3H7DTSfE6nWEdJLOP8D8GD8KyXnhcXWBvEcER+1MkY98ljwTxMNHg3ekj3p6OMYpOU2KU+UiZG
+oOc7Ccgp+mIMCdiyEe5EwdU00SvmV4qH0LIssTSpJVke1+2RDtA0R3YYmyc5EbR1eA5hwnnIjdgk
+0OePkqrTMjBFg2NxzFT4IknNOUD+KdR6Hte9ho5/WHhJI+PNLSinVOAj4JJzngUxFHZ1IfAp3Eyc
+c3sbwyKrMzFqrFlNZBq69EFNkrJJu15QMbwOE6Do6MOEcniT0/zHQkdk3Tr3YfA06bHvqPMTqbGN
+FDtxbOSTRuzdUnMpobDgyTiW9dJwOc5GnKtim8A84gw3NzE5RmG45yyGJqbI6cHTa0fYAdp9yjfI
+fX8r+T6D+sM4fcfKSIbbffyiqGARLKSmhEREfg2+Nak9cffApRkKt/isGgV7QSPikxAPSMiCIQX8
+wYZ/Jh+dvlykbbU/gWdOP3/q/u/r/fcXzvdVW1KUxlWb/rhaFXZV+rNve364tzUYiiCCJvQ2ci1g
+e+ZurrBS1++F1xSzUWFyx2o22222+9L5znOmCy3Uxdr8H2UpjfffUjSMYxz12tk0R1K6s2UBYaX3
+34XWrVhRjO/R794PKe6jjkB6vPJZSyufd6vVr7rPdJmGe6DmGeecJX30sqqsM5ZZ5OSnko5HIiO9
+qZT2zzzu3lvvc96y33yjHbeYQMccc88LYYZ4wuXJdNKvpmaVNR3VbQUvs766666yxx1uY1ta1o1K
+tco+rb7tlvrsUtJ3ZlhbTSUY7WYpE1Zozs86YXwJ75Z1jvnvvu+AubG6lHZYWfatawupV54tpDZS
+6666m19rxVho9r8X22jtbLbPPO11cn2VHIGz3Oz77ScoMwYvJ0VXGwa2UU0kUFHpsy2hKW6muuut
+a62vVd2tfs++cda5bZ552uri+yo5A2e5iRFtNdNolJirHZ4WbVZWnK1myyy00ujGMc5y2XB22i2e
+0Rh4Zk8mEIY4444zEJJEiRIlyFVNZvfB8iAmGjEb0IEnFNsJZBo0XRVcbNtNoptIsijrdm5jEuHc
+zguVXfHbbbSWGNlNa1rWNKNZX1bbZsdtNSlpO7Mu0TaJEd1W+CmtnfTTTTaWOO9zG9rWtGpVrlH3
+bfdst9dilpO7Mu8TeJEd1W+CmtnfTTTTeWOO9zG9rWtGpVrlH3bfdst9dilpO7Zf6395VVVVVVZA
++JjDb15/Dn232vl1jvyhOvLjx48bii3MuE5z1nJqPNYKsN8n3bjLirx0H2sPAiO5lBdNXfTTTTWW
+uNlNq1rWNKNZX0bTZsdtNSlpO7Mu0TaJEdy+C62d9NNNNpY42U2rWtY0o1lfZttmx201KWk7sy8Q
+4nwIehU9CoICJ8ynrD2oIfGJwj9pvP0kSZFUhW5tD+BiWRP2QP6X8yOVf4U5NpH8ZjqcjvB+Z6Nn
+HM/kg7v5QyKeioqH6nOrpPIdDiPBFPJSaQ8GJB9Ic3q7QPOEMknrsg9HgVi2q1vHBHOBUjIGk8jc
+cnoTkEckSlRHc3P2/piVhtR2Vqv8SvWprbyns+PdHgessnxP5YnnUx0djZ34R6Rp0ROcjhuWdHRH
+psnr4T6BJ86iH+q3ohoQ1GLHoiYn8PZ1g+buH+qPA4kREREREoHpDtXsUB8XaWQdfh/XsynvkJ1c
+PjXakeVT+FOvTOL6et5/AukYlL9PcY/pI1VsOt0D1GxsLoN9VbjTTHfSSbWInq7JFebFVVVWok7B
+YgfNB7EYTrzOyaMijCfxxOZ/O9vKeVf1PufcsS/KfTA2agbVZHYofKaQDXubpUBD1gyKHcJsq/E8
+J8Qw1HsNidhTdo2kQ0jpIhwVPtUr8CZHgNJkpuw7REsnh5EPqNn+F/S+l/k28iF/6H2T/pp/TVsf
+0bFtpjdWtX92ozXzRZCNvIpnB/5TUpp3XX9ueT/2AhySH9sIskkdWZxp+fyzboafz5bsQQX6/rM/
+vr9OdWb6V4O/2KNxjLCLus1gtbrvsvhc1qta78/Ufs3Q1ft7PI8J8hyM1BG22n+JlUT0/3j/C5bI
+nvSGEoOv+Y7T+54+ytyniFQgkP5e/5RyFx+Gr7VIoAb73b18tV7LPykcPZZNsEH9goP+wFQ5kJGQ
+Ttph8XD/rIcJFhFkI1BNoAioIZBOWJU+ogyXKhqT+3QWh8BpVxEyOsWhoyebz+Xw+tYpcfno8GFY
+6eRkQQLXO/+LDSMyshPI6AIc58w7SlMv6lv/dE4ClVQpQfKA6/zCIiQs57AQNjsYEBXwV1TAV9NX
+QgNc7qg8aWiRkff2557ybKVSIpwMxjGgYdGBBDzNhfqggXNJAQKSIf5uJ0kbG2gwo/Z8qodczVKE
+TFME8mBCec/b3+bX9EemLvADB6DmAhesWbetuEU0ZBB6oGCDWrs086cIphp/6HYHcg2IjUYCwRoF
+EjSdUidmWKA+z9vJI6QRxuz96EnnteI5Oq/SzUmp4RSjWtN/yfLWc5ADAAUCNGvb5Pl/rfoh7D9L
+OfzOlnOTEBe0QXII7EMSJFIUHu42oSN4I1AZYMgioZEQ29yDFjT1qLUjCDUE5ENT3VIc5E2IbEDj
+ggFbwgnJZASVAlUmVJNiHV7T0Wx48bwRZJA4JIk7EIqRohf9nYgyQjr3kRMgjhISCNiWaKj3nMbO
+9fBmpMz2RSjWtN/D4azkYhWEO8iaSXvJJEdCLAqkMR6JZHubITke5U5yILIQTRI9IK4NOfrT+ieL
++4P2ifzBH+4P+Q/mYJ9SFVfGUx0cU/zMVWjh93/EbSbWykVVWFSxfp5ua2jnZl2MkHYxw8CoyJf9
+SN2hpwinWbHim5jm8po6twUmH6RYNd+mlIxjGMZcjXMD57Fg1haA6iKoZbON2ZUEdy51dx0iHc8A
+/XeQlV5dYZ4aM8pF5eBdPS2HCYtg8vEP5rKYshwmu4dC8IMBwxa89+K4MTdwTWIcEB/kFHJ2hkbe
+EOEPmnzHOTvn5uBVfNNnY73o9JEc6J4t269/k9avSSWU0tY4Zu603RNi4TM0HZzAupXbtDc0czJy
+TLxRRJRZahgdJUwchCIkQuPQWOYwxzeDaSt5tUstsTlWNHsHN70CIopYuDzHS6Ql5+9L2NBTkcCE
+nHIE4BFR73vYVjZqnnMN3DyUqlKNvZvZ6w1DkyKxHwGHmSGTQxmAsJDXuW/ou84+7HnqHkyEgto7
+pUPC7rJ0GjJZyEFklm7odEnI0Yc5886pPT/Oq8Ts+T2OpW09qfE0bHSe2emS8pI4HymPa7DzOPV1
+480nkBeCr0ttFVURBHvNTxdUUXn4B56k8w8jg+khIMEHfaBPl9X3NjLCRmGCkaq1jGr5mx7jsO0/
+T5Dd7WMVjIy+G/DqqqVJJOaryi46xedLLUEGXm4ihWDVu6W1bZORy7Jzk97SqbHIpz1KqlOZr1Gx
+w0pXJ7kqcHN1Yd+dOpq8SfzNNzTi+zNGm0eavBpiY0rTE9p2mj3CoI8SFIe0YmHVrpOo5NK4eTDT
+GNNx7ae45T0dDsbyPY82DYzg7EITHA6KIFYzk4TMrLYqRsYpasHSUerUjgaYqt+WhTknXtCdXCcH
+THNHKKh/q9ZxJrb6H7Njm8FUrHV1/5GnMrqf5f8nSd3M5DRyTzTqqvUh8GxzWO6qrnPQyT3vL5lt
+u8bWqKS1TkdmppPes4PE+DdO0NPpeDzVzLlAZbYfJoQQjhiGwMmmPtWV0iJJrwjka5pMOxTtNjBs
+3VU8DRNFWWPe53/Ffke14vk7Sc+dGHdMeM5sP+99NfcAfCsaAUfmwwfvPa1VVVV+3QCbfxXte3sK
+TRYjJaiWViiKJWyiKxEYqKiIqCilSIKH6H9McPynFNkN15P0cP4tHT8+xGjEiVEn8f2mvs7jY04m
+53B/VB+381fmziV4g2M/yoNpBpL9dKVykNGGfqpfyoJWxNW0Sg/afsFpZBFrDSbFnQCKOTrEJvYQ
+HJ8qOGl1YmkWaizSaTrW0rHhceez+BqWDPHl3mZZngeaDcKCC4OZozNkpC/ajqBq7PTrZ35DE30p
+Ilmz49DaINQ2KpEqA7QsqsjKjdNT2Xghy5DKy0QmpUytgNdnJEO1hp+S+YmEqQZQwJDmPG443GRD
+U1UnJ7BifcbbaEaHIMjZBDbGx7Ma0zd8I9HV8JLu46SsqquZWLB2PDnR59ZWUUDTXj5wNsXmQvts
+68oKAW+fHn3Cx604GPXmOYczvO7d5IqMDwmmmmmziPkbSOSh8izK8JKkV1Mb9Z00alGks1ZHKcdJ
+Po12Nm499heTMWTMPBEktkIhVhCK0g6JsZ2PB7joNYPLyc5i5bUuEgsYAjaXg7GljGESMc5ji4VT
+Vl0cWNt0fMTXb4K79CklJI8AcooFZlCmKwxDTTdy6DgvM0cSXrCXyHJnl4zvx64FljbasmIIgmWo
+DveWQ5M4jDb9B5jzdLzYqAu1rDGKEqbyPQHI6APMDyDRobNFBhaBo7DNNCr3NKhI5/XMcPEP+aP9
+zRyg5slMTTeZwF8wzqbq6qIq0G/tMNHBdhjTwjV/Th5T07K7sMSDTTaeyDXv5HqOVSKhMZCw/p8e
+m/cNs4J0Vaw18CbAZQXmOZ2Eevq20qtgkdjdUJukNd/nEkkYKkfwtG+3ol9IUlQd+5KDg+vn1dt3
+xshx6c/OThu+pKUqSrKsVUIxM49z4dPX4UZhkUGYxJjwOJ/lqsOit86Tav79MgTT5RqPO9SeyQKZ
+PFBmDKyR1V8lJjH1zfexaRW+6o9hG2jFAcJV3lR/0BBpIgThGDtIIbkoGxLzUlOconCTkSnCR4ki
+/Kf28AQ5iyQQKxBSvpMeqRqzb/ea2UjZLFcpMRzWQfmN0fsmt69CESQVQEh8LNt+fZYsfZg0h5dL
+5MPt/JX5HDZ1kkPtDs2PbVs9qmZs4cfIfEcnKlqVTJLTlZhuWbUtbRSmzdKpXE1No3qrmuUZKIsa
+fC65aXlr9LVcDlYsTkzIlSluxxZjS4NWKrUj3/+R0iTkjh6s/3ltPRU+d+8uH4E/OIlnmSREGYJk
+UyCkAophgOCgm5hmoShIgPhH44FpYhF9Shv1p93BpGCTHtU5kqFA6DzJO09e6QkZO0jdX4rD8X9U
+MkTCkUIaSDeEC7pPXjixLhh7C0XxmH/hg1B+74v8w/58zSRkZsGsxCg5XBWBJshpG7JI/5JfB3kI
++Kker+oFqUgAKkWVYfOft+Tc4z/h8CGDoNJwMR64T3HwBIEQqtIxKCESqUIlCRNUpEji+j5oKPWT
+ewxIs/0FXbE2NmtGjClixKy1MptMrxbybS0y7evUSJAIDbbdIgogqigoCShSSSsAeQvxoGtg6UYi
+GCEj9vz48j8S4+6UpFCoJqhwplSwfwsMQSc1ZY2VkIbD1O6PnlTv5nFE99E0LSJEqQpUqkBDyh6d
+z6U4Q+qyUzDCuWcKY9mMs5LGbsgxqNtSdATjupts8CXuCGZ0eoLDYohh6MHok1I1ggoOKKwQWcaC
+sFGBlUQYKMzptpVDSmHIswFHMU1mKZpETHINSssypl4XY2y3kbjm22tmrGKTFhm5BGIiOjZzI309
+p9ytDqn1vpbNOingiOe164Fp/f0yJ9ueLQ3slaxp3VTQ1010kZXlebkpBZNMaU01v31JH6dhu1GL
+D4Kwqy1582Q1TaSG8TGrebCd6qlWTh09TsUGxscVR8gehRToi0v0wvlvKKj/kIVJFIpBVkJLILEC
+kLERKkUgiiFJAqrLASSRjgdoIbSqUCp+b1qb/LfRiT8WaWzzP7bIT7FJipBkpViqOk1tulV41kxa
+KtJaktslghRkkTUKBoh1JCCQUU0GQqBiJKMII0IJAIpICQgJSiokxEOiAchEpKZIGZAFGCFhxFXA
+DCoVRPGtSEenD3z/cf0B0U4jysRyfme8dGzW7UNmsmVKtERuoyRvoce93JRJCHiQ7QQnAYew89Kx
+VWH8WzjR8qxy2+U9VZTZYm1mMZ4tOXI28Q5K5MjFojqRiySlCnywoJhJ8hCZCJBCf55wlDLCQmQg
+IOqHsIU2lPUTuyMBI5sxFkm6yMSFj37QnM9OP+I78iaqtxdFqlVO0R9OMH8FUK+tyk9X/C6N0idA
+dHq9vmPoX9DqfpYc46lP7Tfp62qutUc2myb4WB4ybQjkqWQa/uHgmxpVE/R9Hv4gnKPUR7fegI4n
+LfrLY2H2T9Gf8X93L2/AHkRPQDLj4KASen1B4l8FcYk3fl2sqONRpKPzBQ5EQfzAsJiWJMq2RbaF
+IKCSrOSjkixkk7vRUdT9JKl5rwsj9bZ73LexgJSZUSZUDJUlcaVTUUGaW2aYerKtP78zsPMhPdp8
+78cs4o0Qz6ia+cUTaQJK0gSVFto/AlBbTDVfnX/q/mwTiOXIeL9b5oPmRUj3PhJgmF8JUERNBEL9
+4mHcL+9h/L4WIeTwtj1kx5tMNV6r6+uPofT8i22QWEKkQkSJEU/eY4MnqX2EaRSBiBcJ8Q6CfyM0
+MQEB8J5igiSQMgkIAfWtfH5r6atypWxrAwgvyGB8ISGjmwYbuGKhikMVN2sS3UkRMbZJ9jb1n806
+Puj1L+POIWgwYwcIiDQYZWtfJLir1E9lhqrZbJHEcbs0nZP2s3Su71R8zPcDyEiLUqiBSCoEZgKE
+ktCyT7XtVzOpJus9FaNYVuxImVIdVHPZjvTLCVYRW7TE05KhspSyqJ+ANbOeOfKOF2sc1ODcZHol
+V8RD8ZIgeU47K+aA4nLmHgvkjIRoZYWIO8hzoLy+J2GnRbmuRgrKj4skYSxxCD72GWqZgggqIDij
+akqyZTZ3xIdGskUWNnUwjVjSwiKQ4kORso3MLeMhQdlHtJGwkVrcE21U4VxXo3T9yqsT0kI7UkN5
+4YI9V6Qm8lgjgj0cjyKnZf5qeDirV5NKf+hs0s0mzCskdLE2axl3s3VNRibKytGLCnppppJKxkcJ
+oNqxuxKsbzFktXbGzWL0A3aawtkbLJHFMlQ2Kpqbg30VUjjaSNCvorG23HLNhLbOrg+QjJSjc6wX
+jzoYPcqJ6RPWgJB7/xv8aAnwICbIiU0lLSgFVSK0lIPUD2e0RQ7jyAbifcf0kji5nrRHuC5y4mGI
+c8MXuU7xPpjwX4sCIOshjRgb7GlYY3gNwPgNnR8Sq+n01R9OpJJmL3WNfDBy1jdcsRFAo/A0aOJC
+4HlekkxA5/ca/vkfVeumL5l/WEkH5WQVES1A/KyFDZaHSlGCrkoGmUz6f2R/te17HoeshIc/s/f0
+18pG4MSILgQLxRQhIntOswCLZVXwlQS4NeEaAMAq2LoPaygNIQ1hfr/0eoErsx3v70cQ7prtLgdA
+GuG+/FI8KTuXDRow1X2L+74e/3tnaf6R8JUWQosqUEjQTOhR8EU85CvjQSESDhAmKyJhAuEYQAOw
+yriCMpA28Sv6q72J59smbeROO9N1TJi1L/qyF76/b5ZHcH/v+OmsxAOMQlgNhF5gWIgAGSP+Bz/S
+wJJQfTPojyI8a5fyqYcBtCHLuENbLooYN1CGqIkbBuYQ1JVU20fQgLYv4dCLikJL5xPMEi+bRxPy
+GHxXT+80ahO71PGMailWRhPGRqTRKNTuwPB4KtiNT5NHRvPsqHOQksRFgiwRUIqEfw9cqr2kyb3L
+Mp7ailJHkodEIRfyQsIsLJJJCRAlVjPteox4a9xsbGtn5KOs0eh34KeVJIEjaQCqoPtuFbjqErZT
+9DiB4wSMEiyjN/Atl+K1IHrOgStIiNiZCMEfmvaTIZG7m7m2qDJKDSOzjE77RhHOOKzKPGc29mkg
+RiFDUpI1qbqsKLNZO+/Od4lmN4ciVRUMbR/bUO4jPHxdPie4wX0BB1xBF0q9JOkTgUiQ/wVCPGu1
+3HhGNj553mmitWT2fMTE8z2MD/reGWp6Heeazo81mfHwcleOGAWLGDOO3BQiVXRwIN1PQV5NPTej
+2BHIiPk2N+tVO6hingGHEgzRMsSEOBhhGKRYsDOJEmS2PbKLryvF5eUvBaS1WWUnQGNERGBmGjMT
+qYcEJUUTZlRZtSrVNMoO+hEZEYDdpSE2f4IJnNwcqtcMmSwxaZkp7iBIqI6IBIkUESIei7nVJ81H
+RTIsG83cajX02yrXwTy+ftzeBBUH7KCkpSjMoIHgZAhilQH9hFEireXXVJMmnXXb2p0pZq9KNONC
+aqS03Ua5Xk8HDxbY1Jk6RYJxOteEp5Y9WJHiaNVC7qEBjJzOoJ08WdFThuskJxBHrIiWwRREX+4E
+I0EXS3SGjD7Iw2pIwqStKKgqCuZzbDohts8dBujE9Y0hgkO8lMPBp7ETdJLLvSYVMtllKXMjyVox
+chGKjFMsGFMRM1jJqRFskMsMR05lk+JiAkgJQKRK/WaqRiIj5HMp6a7QYAAAAAAAAAAAAAAAAAAA
+AAAAAAAAAAKAsGHrtwrhwA2AAoAtjAAeOAYANCpKO3Yi3QEu6pNlJ9xbICWoPhBLYBaSTN+ft1qV
+FqI/8KMH5FzwunByuB1qhp0eMcSrdYPAPYQjERCqRAQSLEAlCDwU7Y3N0RhP0QT8vTb/5/j/31+d
+v/KlOX+q7RL7e90gD+forGv3u9AEHHuv/UyY0qFrStSEawZXvKvyl7GjD0xhtSRhUla3MJRT3BB6
+zSG9PB4ujQRqA5Fq1iTsdO21SyEvA/VWCN4VD+UqTToySHFT879GE5cZJVuaE0Gkn7ZXI4rLsCQ7
+xMF0toNdN9hsdujw0GHGkjCKStoxNPF1opY1SRjUNSYaMNGo7i/Lw6fl2zjrLXz29CRKrFLupX6K
+qV9fGnUrVWsMMMyqrHaOcbAMpnPFoV9B758LekbEW9ciujNLYRVKYYSf3la221NSg0QwDRGoGqSa
+INEVCYSSyqkpUpw1knkyeDXYyvmBl4kbJcBupFY49OAhlJ3uMYvJJjO99033vgx6o3P21atTzqPR
+2/d4D9xCxAip9aAHePFPr+LrOs06kcMMim31iLTQrvu39/D0PGOQR9oSGsDNayayUV1LXU1yrWxt
+UkXTDI00fzKdG2SutljMTEqyiKSIViWalo4EmnVGpUdKEQRUSJ+riYohLIboCSKQIDCSAkDEGSEF
+EmYLwVUfaPSp6U+NHiafGCPUh4a8OOGy8FHvOwD1nsS3Pt8819fnpvcnrHF1S0rTBlOmG+IxgmqM
+Amk7aFGJHk9osSp3iD/C5abV1hzzHG2tYWVOeMOUqYVVYxhKERCEYiMECPCJ8N9Zu5DRK0qm6pqq
+302Tjpy5qrZvZVGUNajIhMUptvJaoFSTEnV6Uks3izCE2klZttrUpJs3NKzSspxUYqVUKhYqwqUS
+pVsQKgu7VgWkynjjw3xjfDcIQIkitKuEoyUQ2pExVIhSpYdMTFWDYNtLmgxjNaNKbEGO1hRuS5K3
+pKTCpFLSqsLU1xhqruDlqTgum0YWsplWzMMQqoqkKqlObEyxSyK4hdmsU21tnLaATQwTurd1YJpM
+Sd1GCSLYoTYMoZdE4MBqwYgiI4HDRrgbMbErwndt99tjVRJwjbRhM7EERhJFMS5NCyYcTI1KmimF
+k1qTRowYYMEVSiYAhOYQ5TKJKGD1BTRIMm/HRqpKOBIBkRLoxxVWIrZNZ7bk7STXjbV0iUpZMSpq
+DKPXa/05Owc9cd7ItCOtYakyhobQqgNMu225sFSTEndTMRcOYohCPPWmNrYTM1pi0ojbwGrdASM1
+DZhoQlhw6wBBBdVRIJpO2hRc3dJuSi5BG2RNb6yQMq7XteKhtfCq3ilDLaJGHJQXT0hQ0KwlmIgk
+E+588dfGzB9Id4Lj3xsOIHaexVFwUZJq6YO89XZSHCeIIaTaIiEDYThva1o0WJNlQxVWGrk2yOVk
+aVFWOxUxTJG1mnDJxSZQk0yBJXECkghJahuFZdjSYkGCCBaDHN0tYFlzDgT/UgjPJWWBVYELMN0S
+MYKo2WTS6Rtu0mlQrbGRtq3tMSCOJEJtoVqSEolcbSJpDibcWqQE1IghQII74E2GAG6yymGnQRKz
+IEDAmAYGtCnZC0p1kcJGkJ5RHjIs87ArFUwxP4U7G4JqOqJHYlkSQ35yPv92P7YSJpfGE3lVeaKd
+CnIUdHAuawh4G96iGAjDCMMKGiJCVsLp0ssrq6TUyVJa6XSWYYYw5GEJhkxKZSyAkgSlDQGBIKv+
+PQmCUIIjoTDCgFWE5/D+zfSnkqnsn40NHeaMDUeJfN83Z7FT2dmYs+DGSJjaGCvRgMbp8TN8iyzM
+sMMPintVUPkgFQiYkAEIqvQJhkiKxKP80oJwNzEAMy42dJwU3MLRaaSlqVACNHYWexXy+Xyq+Nti
+sVUqt8h63eGHFTfWLFspimGFpmpmiiphhpqoqqppqoR9wHFXHHG6J6YKGIQGgexsI/j+PCSDyye5
+YVObE99e+/cyZFVOJK2aYmq+C/DvCWEzDaMJQSSQEswPGMdwarLaypUkhGvenmPWqB2b8eHduIPe
+p2qqocg4g/PXOWTlY3VPaiPVjtXE96zk88eVm4+SdRPT7QwEpacaBDvMiMIXRocIaRRBeW0x+aeg
+kg2yCoid+a/ClzyuGKItzD2PAg6mTCYojGFiDEBKEhi6XA02mtfS2L2PzVEh3hVdYxBZdeY3SX16
+MIwaMgYNH1tVOGDMZsVejLLjDUk1VFNzENRBVVoRgILLq6FFKqpFUqqvpLJkifaQzlZzWWUVYI5K
+XFl5oKoqqyNXZd0FUVVZIgbAoKKIH/5txa5sxmrPncEjmpKUn1E9snUJ09fnvWPHgGT3wPBzOsdW
+0sqjIdRqNCppTeWRHzLaH2rPjAk6fgjEh9skj5ld+L0MSNN3dpsuQs0JFZSfNAv8z0nkaWQHufSf
+Uz5mzyEzsdSUeIJsagwMuSkkJQ7AGC4EmKonJ6Od8Z8R3evNk4MEvB/BOSj4s0weTtnchOjDQ2NE
+tTDbThcxOobyXRiRxM1SGxCcyCLpJcha1uMkTFFKLVoZiMS2Y3JhLVRHXMz8qwTVtBBgQQxfJihc
+NBChr1WFBRH+zNJ5WxPRjJox7HtctSexIncdHuY6DYpB5EDdyqRyiXrjhsKDh6B1AZnqsAlMWSzx
+SOlhxIxXaXZbtLst2l2W7TTS6E4kYw4kYw4kYw4kYw4kYUt2l0LdpdC3aXQt2l2QOJGMOJGFQ4kY
+w4kkkYy4t2l0LdpdS3aXQ3aXQ1dpdMlu0uhbtLpi3aXSLdpdIt2l0i3aXUt2l2TiRhKYkYVDiRjD
+iRjDiRjDiSSRjJt+tMxj44TPRn/X/1fl6P+v7f+3/+7df1/7f+2v+z/f6/9sP5bf7F/3w3VzgnAM
+jkdHQ++fK3rVA+FRJgKCfRZEH2lSqJSpJ+JtJWqNEfkfxXNlRGleD8kh+Tcc5+C+nKJB5Sw9fDIb
+z/OriE1vxMalNrxZkLqR+ZydEiToiJJu1rX5mZ2uaOFLVYjCtaq5Hlkz89ZqsOJwrg2TeIjelj0S
+NnER+E0w3WCOsd5pk6STduyc1YgcCFONxE/Qp0bfeF35k0CFIn3fL09e+bbYPwbf0z+fMzi+XfnD
+ll2gEU91rV6qwEQecCXT2gEVTxuIsME5G+2LU2XKkhwEMhpKG1MikcwUz+3UIJGU28Y1d0MIuyHz
+zM2ll6ne5nDQcOHw4DLSQiJ53K4oSEobGhIZHOTFdYlTW9xPJAQN4cpzU9dSUrI6iEAh5020kT6i
+4F+nozvtcLZ5q9CEUMW81VEmDKBSWNFnJ4GUKgGMCzkgyaMEnVkmSjoYdJMsdjgkhbGKtMdnDuxu
+2MU2nNwjU5mJh1dtyknAZJNiZFmVsylJsogrjymzqZ7a5ntHJNGusc3sxgySQSIpHLMRUDZLG0xk
+RvsQJEnBls8iOiDeDQzkwuLsrRjBWpMBXIDNFMqMGTCYSrMEjclcHC72TyNMaIDBwzyay5b4H0wk
+O+p8VV3ijJscLToe2jBRSsTFVAUbJKTIkg2bJVsohJGCNko8k5XBwqUmS4QcDDumTvIkJPNO4lyH
+kRFtCG0BwVbujLCBe5UjahuVDyBKSJpQjxpHOUk7LBwppRN1ToqTSyN1idlHV5TwakjdQ6WJ2dEw
+hssSOTyYh2BNGSefZjlRtDcxE5jq8CnHRuHh1dk7qOLHZUqjZZHgsdo5Gr78GSi0cIfaKkyQcmz+
+08EYOwuCdaMFDOScBgjgVSH6515GwwPwMrMcSFATs8Zzzke/LwcNmDoMHGyDdHcMZFUDKDs1oZkZ
+skAL7BzZ5DFkziShw1yDR3uAOGHAxtHIMKGkbOgkJSt73mRwE9eb0a8xrQsHNkE7KhmD/IpOUXB0
+M0PprkY4qYrounmpnleRx3Y0l0pjrZOKN3V6O2myrlcSZkxjWoqvFpmljGMeMaIHCQR0bnTOaDkz
+vGidphA2QZGIrCY7CTAwYwPIZ2NaWDFo6TiDZWxeGN3j1cJs5OTHDBVnSacaUSrJMcQGAaOohZsx
+iqKC5UHn3LstNnO8OrrpVEnis4U5KeDxkxXfI5LutKaVseCpkkcuvGiTrsd3fUDR226acRNK1xzj
+qbOHhWJ3m5h2YxGLEywpNmJquazVeSk3cV2dm0MVLXE2OamohosnJKd8vd23Y2xwnB2MQGVWDoO5
+yUSN1xPfteKaxBywkkosl12s8DklKVUqY4THi0eCsahpoTGIoaRubUo6KgFvoOTyGTvq89sXiuhs
+JNkmxlX6vHEQ77QczxzXpQo24l7YxyPs5ZKV253MWxjseHLDXJCAODByUGL2AHJi/IZJFkn/W5R4
+BUVBYPLy0tTtZxeRgSNIyQjzCkMCtMD1n0kLGc5goaOmloYsHUAeOrJEaJOwYKCRhLW3HPMOTsrv
+0Xp5ThssqhSqnVjOSlslFDJBi7MyMW+bsOTQHkyzIHB4OiwuD0GecySIntIYgKGHQW99qCwMjVnR
+rDTTHNpieNjq2x4sjo7ni5OyqIs4ujc41KAR2IDPYbJxYhboxRobSaeasSbisKq3PXm2aXuU3eTT
+s3OpOBandWlGmObm2Th4+Emni6OrREEFdyEwaUjCMlzRq7pI8DJKMGAGmxeuHnUeEDzYrhnc07Nm
+1XmxLkSWuinV3btBwuG8OTpzbVIpTk4c0sZpZozYY2I0yePXzBy5nNnbYkcsY0FEQGxiPA0W1sTy
+5ZlnIuYWhdiARQDRtoQVJUrhmqDJsYdjUc1akV4oKY4pPFOqVE8FbvFzbmLokujJkKIMYJJGM7kZ
+6Bx34IOIN5I0MqxkmCJzlJKy6s4IoYdBUjMhoguXwZOSCyLOxWjkZkrQRZBSk0tm4oY6srG5lmUM
+M2ZwUDDOu6WRWdEIEzROw07K7tUiFmGSSyMxkxLWcihIGLwLCm5WsVh1VXNmnPdo0q7t5EzkmAdJ
+KqRAEQibBhx4ml5Sjo45AnoiODogVDCjsEebFsKOC8h0bXBTJFByxQByAmZLIcyGCJdYkSKEBipN
+lZWQoUnPIHvzYrQUtupWwqmVZr9o1JRXAeWEr5jwgsaSG0a4hJS0lrbmsa1GRl5TiXB42Rztra21
+mJRl5eHXOym8A0gkSBScYclFiKyDCFKc6M4u9ucM428bpVwk0BwJUpBpDjmkl6eGaOHAueOebed4
+2OXiJkYwo6HuUdMlAIOECIgkFSCRFglRyFQwEINpFF1CLyN+WsMkMsUMtGtaDoGsqQykbpvxJeNc
+tNoIprc4sEqm8tBVgDtZhQJoTTLhBTE98zvF72JLaga3kbiYGQIyDZFZGquh4HLkiC7BBwQWrbFc
+Gyc1vjFDIxZD41M2gy+d11xU5aUpnTh6rVAyL5wYqZ55vNYd3BLpBcEb5nnmpy0pWZ4rji+KXLbI
+giyAQZmWVccSdVCYmtpJKLPGCqtBFxAkDCB6c8V8JQRRCQDHyj0nq+jvXPNzO9rJZYdMM4IEyKiJ
+kVTXHmSYOHl7Z4dRUpsUy5rXmu/BrN62i0iWNkjwYZNL1WNWRJFwdpV2XUFMLsZAS0WMUMIYYZ4Z
+TAq0GZEghhxUAuzN1AIpmYSgZ2uO2ePTWxDOGm7K0rEGWC0KroJ6CrImAmyYFByRDlPT8TCF2L1J
+CaTatKSTSlpOfRpqSb0tdaMlDazKtTlTlZE6tgiE3akclgd0xFKQDBJJMmdlWCMshiMMSDLJ7Y8L
+Ea34HCYTY6KnldU46NatDXnqSkg7dQrYQbm3TUNR0yTglbPEJwSD2PUqcm/NqmObWzZpVcVk8FN2
+nZow62/Bmy3MGBnMKSXUcTVJ72YCniwnJo0aDowcbRAM4IIOckL5IDlUdZvxWUIEbiEIDgAOWkLr
+PW7xyx4xeLxRl7aG1ZRklmNROsXijQCCGAjz+tobY0znt125r38JxJp2zYQ4diI4uOxJlkhVkSkG
+kOcBhKlINIZzE0QAqTn0xQpXE1KqU0j/Nyc51WVzxkozMHGe/erwgFACRZAIM96mGkAiBqYAqpVQ
+B6u4AABIVUqoaaSAAAbiIbiEgaYgVvU61esCAsYjLcamTF3ySqRZ6WqL7iYzFHBY6JILAB5XSFUP
+L83TGzhB6y98FSwV1ZKHKIpoEGu0NyyJdEvFEEjBjH3IDRyVukEYJODiQosYznmuK3xeaY0wsEEQ
+QAggiiAhLXDnlooCac0wMDZwiwmkoAohxz0c5TUHCPMOa4OJIJN4g5JEkNow39U4I00WRHKhLZEj
+aEGqbNdPriEhCU3cuHV1c3d1ZVXMEu4d1NXMSyKiRlVcxFxNXDu7mrmCWXdVVzE1MS6uqE7qKKUV
+Fjurd1Yy6t3VjLq3RRc1cTVjqrd1Y7q2kklYxH/ZSEzScu8ZzF2zHUwbE5ZD7OE4YDhziaSqHVbK
+tAIYmgAMZq9bvFZDtKQCMCVREQ5LBGiwSwb7cQRsRJNRSBAKEAhoR1OC0gEbjON3rIDFSRJKCDE5
+105Q2kpza3OqJHjqNziZKRjc2lWkydo6px1mMmzyG0mJqDpGR1hXXk302wye5jJOBakcoRmmTMIz
+kaTmHHdVTc7xX8xK8UR+omQzJA9taXtPEMlQmhHkuxJWzVpLZNsmry/7Q1IeJHhk2eNYVg80N5JW
+xsirHRh/t4uRuoT+0n+3kr/c79nDtzeubbR9KwPY+t6Sf83RJIf9h2ROkE5uhZHVIP+gTuIO7YcI
+hY0MOLEkaXNYWTamLEZJE/zyFgVCkioWCoXTIHXeLxNylSu7MirFhN6ICksp0I+gaEIJVNKsxOgs
+8khWfVxFqmzweDRXNjdWlcKivqNm+zxa5xbffu3Njm3NLWzGVTxrFSqmmMOiuFclxwDNni+fts+n
++1jsnbDEtIue99TE7vNN3DESvw1xZy7PNwtOd6RwIYUOCIMtapwB8iTYxYGYLI1SostIHpQNjGkK
+wGZMhDJC8nAMq8yS3i2R6PJjiqWO16HXMdOiaUxjTQ00DTTFZrzrZVnJp32bG15VeGLYGA2bz1qB
+t4MnUAQcMI42RhZIFzyRIwL6IwZEddTk2dcGyitBskSYwMlEcKkbKkRphMWRRyxuutmmsbuxwgDA
+ZGd5Oj1NyFlEnDgzggqizU9AxkrPqYCbIGMauITZbKGLYPTkGWluzZ48PWtvBynR0eKtMKxuU6qj
+RUTokgmjpmCmQWZg0MKKO5JEngkk5PMoo5GjgwlBGJ9eaXmkIFykLulKRvry5cxFREVVNTTNVVRS
+1M0rTVVVJENVVVfPju4D5Hd3AUdug7DoR0KCex94ReK4fUF8lsREQoP+b8sZChmbl5wHACCQLzqk
+aoCISGM2RLfBPoVikxhCYMVVZAwGLLJJWGKT4x7lc1T1YxVY0mzd8t9G32NXqvs1KqS+CJlBRkwj
+1EmEkQETOQgLEIqwQQ0DSQiouEiBEExASODVbVySmoqaSYKMFERRE2UUZNKREg2k2SbLLU342q4A
+AIcqqqtzEo1w0yXV0s80vUQUXM8nNyrMrMrLXIrOHBibVpNta81lranKKNTNjFiNFJo0YxkoSUR7
+DvWDbSAIerkBLoVT2kESbKDCBdP+mUwNLJd6K4gHYCmkTTSrPUS+Tly1tED2xFfx89km6OsehGkk
+PE2d20T3vQHYHo4flr6rkba2zGaXuuLz695eIsWjLWKKIWBgxd8rkCILGoIIySIXcUDqE+FRIUT6
+vOB2SLphj0s9ByiyAEfwEHqVGppLKrARFMlRQzBUKUHeK8jxPEyT3lHRqPE8pKn5m6ioqyVUGFeh
+E9OKd4vuX+RUDQBBEIHjZB4DYUOs5jjoqPljtkMjCozMLAwmcgImD1nqNKH1QbktDOsck0ZkTWZh
+QNQUEIKSG54OIjsQLUzSFNQlkLISNxqoh0VJ8G0NohyQQ+v2/vCHS8SUr2nSRDEGGAO5PX/xG4ml
+k+LZ5abNUzVZLINVJiKlYhG0EDyfUXRhC5BBI9d0KYCyTnNlU1jI4bGmhlEhYWJw+9M6tQRrLZWI
+IrGREkyY1Lxx1bGjRiYokdkPyfqt+bM+/Ylsjq6yPYd8RFe5X3bPC6bLAn1IeKGHR+ZCKk0P8s7O
+qsLsEMdcmp5rDC33cTJXeBV0SAGjCYdec2ED6D505TMeq5rDUT6zaT67qF2fVkZsn16bg21RjLmY
+Rljm2b5r8xzefdfViT9Z6ttinpO5OSbPpfWCe0SWpC1CUoQkRJSliRPbJuPJ30HsFNHSRo9xCfF8
+CfQ+HxHylm04dmg5rNxVXkunJzA4DBX12FEkbwhShJCBpRI6IM6YYppdN2kNImt6kgjCG6oCqSHY
+NNcFbJzUrdHJZ5lgenPFu0Q8d6dHojDfM1w147dC9JPWTMiREEUOEjhJSrBoeXaZxpi03Y0x1rG1
+sVi2xbrq/lTub7wyz+aOj7z3nZJHWKs/jIDyD5WJV+0lU4GlSfqqaiyFkPiR+xYqsFSORtEw5p5b
+4na4e6JVlUccQB3WSqZijjHuJoR7z86zgYqGuls+06OiQvC6VBy65ZdDCCBgM+1z0rOEDRtmy+ie
+DRwDCYVoZBCUssogGckUYDTIVFmU6DAwGzUN82bGjD0aJLWkssbQaGKGnRoycGDBKLF5QQKyEuOX
+U7NwjAzobg2dBkyn3iIxWPBVUFY89zfRu6bZarXZezcGA7LwdWzWPFW2LmXZ4JvprnlSwLoizFEk
+kwSdiBNBcJcEakw2+LsopbQCHsnZJaJnUmS+xOkclgaGcFklKOZu5tN1Y1jTHWQRZJsc3VjlcYwY
+ShSXdEIomRhgZvGsMZQWSyBvY1zXjZIZKck58wTrzkCYUgjb7iejaSI2pAbSlVW73GNFgJKPJBd0
+TBXkoHWShEmgOgJHsgNHaCLyUNCHEVxf7p5HYbKvUDybnJ0kRUkrskmnRFUqbTjbIjT72CZEEojV
+VQROaSUPT88x0KyOy+32c33PgnuXE+G0QQ+PPnjSYSyo9MVWsx6a8VxdJuhWM30xp5b5oNsyDWMa
+pVjepmsROzh6MkkkxNnCaqFlgnxYmKNkFOXNJkQwev3/E+ZG5L4bu2vZ5VW88IBFS8mIzRIe+yCx
+MZswSaKDZJpks6cI0UHCngcsT0QRojBAZDBmeMzPDoovQ1+wqN6OuDc8SZX6DgnkrJ0WE8gXZSHi
+ia7EldEFWYgghxcLTniLD6iiTguMmGdjgoMbyYNUaID7Q7mi6gydjglIwWQNmi43ZrFERJKwDHAw
+sgJjgbCiJDwBjZeVL75MqtSWrfMwMsDAGRh2PsgKPOLWOxNnR5RXJyZDB5mzuSWzgKGYGUbiRdyA
+3JZko4N7WTIzkZg6KJGxhQdskepZuxO43uYOZRujmDsSURMYJgs1EjVtGSSRjJMBIzAoPMkpUQWZ
+NPLbcpBwpmkAitKvLSCM2yCMZiCLl08czFnW65QYGbKIMxvZUDUm5C9mS6MDyLbZRJJQEjGMN0oX
+eywkiBqtzAyRSUSMpUMwbKDcELi0tauIbypwgLViBFtsQYYULEFDfFTMZcy3AQC9/nCEhI6InJOi
+nPlPGQpR6mkJEmSNOu+TGlxK0sG0grZVdckYixP2O8mqB5+JlShqW6VSiGfYDJiQO9KxMS2yUM+7
+uGheYWrMsemENstIEZaEu6Dal5l1VpzLncToCqj68Mr3Rh8VVYk6+gkwOvRUTbKCTMElA8EqGORk
+NNqzlpsVULs1O5rZU2pMrFRhZEQQgLklZONmZFxzAaWRVIBCqSgpSISDkYcVWpNVbbm1633y3stq
+VqYAAFKaAFICAEkgIZFTMxgEClDWjQBWaxARJAABLNhs2SACSUgyTUmwbTUoNs2yYAIUalkBmBrN
+YAAAZkmYAoBspkmDNmxmaKImaqqKroAAMH/1eCnzGtzrF6rFeUqVInOIpB8I4qUwJPeD7/y+G017
+yT6O7O1+TvLokgkEgSQmXyrr3t5breS9pKSIeBGBFVgqj4koCskCwQ8Juke6Ofru8p2kdggk8X4r
+MbRDc4+CvxeOzdFe5Y3nUsSlSVUVYp0czoZIqyeFaVFUqqqrFLDSCyCMc4eqv9Fb/n/XP0vz1c1D
+MNN/op+l+l0aCNSvrLT7T06eAbY8w5Vz0PECyb9MMP9TEkyi3WTCqxza0tH9dxESUEkRJASQEkBI
+FGYRZCLBFgiwRVPR6Tf7zIm1e6VtdoFSm1gMJGcUKU5mEwUVkjcZosU/hgn7bOHyidT3j7xD/ZAf
+Mef675SoiQhYKscpyRGgLk+d3GwpDITwJ1cEL936T2/RoANvpA2IF0Qj7tNgfqf+ctlFOknZTfgq
+46of+QcFDDRjpk1CZGEYGtEqISyGjCTWYBTSOEMDBhGEBpVZF1JhGBBzxAHGNAitmOBQKLlDmOGD
+jQAYndGkaoy6KVa75brrzVymKyswkSSsyCN9OStvdjeHD+7TSN1ZLIQW2MrvpCNC57WSa2rGMHFB
+Kh5oToSiowVIcohg3dPImLungDDJkMQXA93c9uQEecEd0BcKRQ913TwS1wKLoQY0qAGojCaJMJym
+glLNCqSVSKqCgVVJRaWVSUm2xUspbXy3nbyASqk00w0xhsuKqjSyqqYyYqpU2XUmlzDDCrtzamTd
+dnVs22bZTNWzhSilpM7+H9ro2kk3IgggaImBCOzB/HHWdRLkIKkqoJaJJaiFskiBZ24Z3VsnhCiY
+JACIeyRUMhASSQUYkBNpFByQVoVoEGhUQpAdiEDzkKK9AQgobQqtCEGR6NRNSPBknFkTeyQjl/rB
+DCiRLBFIUpClQsEUQ0Yj0Yqe9ATmoLxQE7EBNWPWsLP8K/RXREh0oJid1O6H0YmPLdBHEeCfZ0I5
+bAdEn9gbK63dtKSIHwwApMCmAh4r0SNPZKYGhfARcPw9cx661NVmYtC89+lrTpW6eFjMzGX7eedK
+5Y0zgFqcWXsxOqo/Sru4vLdsU5a9444boEHA0km0ZGgCmAuawOKotcjlD9J89X6tsNZlfPp+nYij
+Ig48Tz+y6XgzMjm0CAYYvmrTox/aaxcjuAIICMFKRcieqvas583bnOTVMGukkiJMOB6OGi4nFSAw
+vmxqdoEEYKBtHVaVRMnDyNSiGM00o32tlbd4IIVDQiQF5QpNUe1wAvAxg0gCsYJWhoXoMC2ZwEKc
+DkhFH87qsh9l4Jj7DtM78Y4PUe7aux3j6PqT9kTJDh9f+syDbZLfO/RkVszS2QqSKSvI+MRBeDo2
+uxGIVT4usdG8L4RvTuSFChgJzA4YTjRSdp7z1aN37jiuSPOF8XmbPcSI8pBDs6zMrLHv1/t0YoJB
+NMkSrDD0EG9EBqIwqQhDkNwhHBzq5EFfuoGwQxUpGYyqMlVUweyzZIskNKVXelSbnkbWqtqtlW6u
+lcKZatrVEVgepIfYBK+BAQoE9qFalB0eWRI92M/51T/6qjwrfMXwtwwjHMNRgyIQF0UQvJH1yRKj
+FV+AdKnu2gbSQK+4o8FRHKDyeUwOv0GDGkxyJDUZSJ2R5e0qqqqioqrFE7zmid52ACGJpclHk/BT
+CatqeMuUVXliskYqbKSO4wEMINWTCoyfZODDqwTDFHkjkQgorgeoQRKD5/OyPCOyzKgkQBDkbEpk
+GiUSUlIzKVclRgEiYgJWJJJBVJlkhLtppy02k0YpJGN7k3BA/UmjCQsEI/bS5ueYgIO3ydGJmGYV
+EhiufQYuo5uxiaRJEIwNDGAmDAlLYolLkLOSq7ZZ/LyrRycFvCww8FxJVQpUhVJaQSO1RPjQXnKn
+vCEFPfCHUWiFA8Q7DgK+0lFoEXw04PcMgHgPFDHm3ieaWR+Hm81ieaoypiycIcDk5kYRLREESRG5
+HeiqVUpoFLz4gaJA0SdpeolL0sf6zHPh+mHfiEKMyclmSMzEMZBlhyETUHz+3wNHI3xXaBqK4ehN
+HIIihtXXiR1maKXYU8O8e+PUBgo0Ajo5+CJxfDNt4yPes06/Hkm0RZpfGw9DHZu7p1IdRAGcl4vJ
+aOSVJ7xNGZD0ogHjrNBlqH+Ry/QaHAwgxZKm+TkaBDEzfzOw4Y3GAZBIyUeh+UgAqi5ywZNOopWV
+IZmZn7ZRvgGzMzMylMly66xXZKWyJs8L/n9Js8Gw+x4myz89mI/vK7aRiyOeNlVSdflh7G/p5lL3
+7XdRTXTWltIXXFJu7cQzCYkxFFZMMECCI/5A0K+c4nmRO1eIgYqkhRxg4Zid77yTwD6Iqlfesxkb
+aMUlqVUxpjZ/KwaFhvYRSxsqMMZMRSxoqhXdWmaKdbdtdM0inXXEuGMr6cTHGTBdsYVZNmJlksWl
+jUpNblXpV5L03SeS6t4xiUYbsuDbaa3bGpN0RhUUxBhH0R8GwvYgg8Ckex4hESTbaLYNGsYtpWNz
+RpHSyYBjiTBaKpvJqME0yQ3+aVMGpYpYNgrWkPqeKbQj/2gqY3j+xdGhDmIASAlRA+bkiIfYSI/N
+KuWIq5/nbk9pYkfthcT0OGm2CD+iyqZa2SpJZUlkpZbKSW2pJLbLNtVLZSWkskllSqUlpbLNSkpt
+SySkrJJSY2qSpUS0srKSVt9BXRLdNVXQFCIEhYSJRCIUBpRIkLQWVVCLLIiqkJimLFIkSIaEEiFi
+QyRwlAiRIlaFBwYRyBIhSJghtorprqa1ulMvqC+mi6u6Aownh13kjGVIl+A4GGiQ1HcX0fPiO6vX
+u9slSqLXIFkqNul6ZFnVmrZ3iXec1FMQ/Gu0kvKf9yciOqonqvrSu27dutV0rLCll0okgxikO8jN
+QYTDtCFKegkRzDDIblsFBEaZYcIsUJM4epFMU3LNKi2S1vI8WJXxSt3zKrcQ5n6qR/kUOCr6y+Rp
+jzrG1sVi2xbqzoJAe0RJPPqeE0XayyjxUmklllTZG2yJNpMsWZqWmmaUkqVsWZSQpVVUWopSy0VJ
+x0/bm75PeeqE0iclKkiabqXrNSA00DYMNtlWKtmERhIrZYRIVYF2j5n4B+TFLGoYfm7HvbwQMavC
+WKCiS21vk1jXx1tri7/LMfB8yvRXePTyHBUbLSyUlaiE0WbMU5UxZP/3ax2bTstX140h4nMwIOg4
+ngJsGjZF2ff7z43WT5Kxa71cfar4ODmxT2uy1UbJ2WT87eJ/VI6QTaHibLVskjp+tjdj3PuN6r9D
+Kt2HHNzjOfRuJi2IixFWHPawmRD/KUuyEIzaVYqCV1yfq0xX9bWJ2bMVZrnj2qlViseUyFVWw38H
+jibzHchLyENok90boRsdnY9hT/Om/Uf4ajzS+By86Mso9xNYGhZmYtLVr7SayJsTMSYJhiLhBA5i
+mA5iPHidhq8+JxeEuRLRRZDkwEDmCGkcxHAcxHiDmI8gcxH8lqaNZjbLhRrHApOMOwO2K4QMVFYY
+jiTMToPIp76979B30T4ZT3cHDUiqm7oaaWcVjdnZ7kmkjTh/EJ3Q7rYFg6IkliGlOWidR/xq+TR7
+ikxZThhrWIekEfoHu73AkyeIuCD03NILTLVH/hZFOxPf7H8H5Z18tLmQRr9XE07jR+Jf8FgHxmyA
+PG0ccfm5iplMhFJWgoBIEaQpBQlKlpmmUIWFDfbEQsMCvya4aASZJorbe1kpZnE2TItDmDnAuPkq
+AGrwmc4XIoIXyfPcYLIlrFR+1QbFkKlQbWREjk4GWBnCtCuMRCn3ZrqqrhiqZWs6dW1ruYlWhBQe
+fhj3je/cuPh8OSJiGOMc0Snm4ki4IJmKpkw5gy5HTPt/N8082yvmdAT2mGJgRqVex7a6s+15v9XE
+AOIoHQQDEL8Pt9c4RkEMgTA0IPpk6ziIev2Cjo85WkAsmSImKoIqcjIiAcTlge7DCB6e33yHR8yJ
+1qpnxnavSdCoffv0H4BBHuhPpU+o+dFEDyqgxCKAwHEGAxVVCHrHlBS0ibytC5JQEQAeZ3zaEyXC
+FwjAhpXaKRBw1mSDeMWuW9NtuW8aN4oNzRbt2KiIOTkompVBXUGoiUMQlQ1CoczJUqKspbAZI0pi
+RdA/QWAjolUiFEP8Z2G3HyRHaJIMKIWyJHFhOJ0JtVURUU7SG8dFiJcPa8OH4PaT1PETaSEE8FLy
+k/D5zYlH0CHIIV/iIcJHCU2dCBb4g/I3w4lmMtmYvtI+a1AVvif0L7/aB5jZYgPSR8Ea7j3mgIje
+TZfYCyST6r7Kc6c+G6mq3yExaUqUygmVHNZIxSIaVixFUP+SyJD66nlTezdRzp20ThI+as1MBzB3
+EhdL3dg7Y6P0nwPbBEj7zmp22d46dbZ987TTRWsmMisVanevy4/HW2GYY1uVHAq2i2yqpw2zc3iD
+5j1h8F/idnR9DT+xj39N2ob4n3LI0rFJlfX51+mPUWYtBnHl/+cePd9X6zn/Of+bpDp/dnOlE9FM
+P5J9wkg8MgqIlw2qgUPydqYHQQoLZBtma2ME7CUMP0IPtIBJ+szIWSzFgVJFFlH1UFhRNQ1GpZE3
+H6SQ4Sh+WD6HYttCgV5t46/3CrtqdIf3LIxH8E/keIjw/UT7Kn42STQor8mLS2JiprTDKxZDVNli
+RhRF5pjsRl9JBQMWwpiKjZNWysNmkYas/Ufw7oev7utXe5+VyaTSt2P0t3weeNTdXLrrmNnOMXiM
+L+lyxo01hIwYzRAQmZMikySW5dyaLWDsWTmhwpCfizr0ReDHBKuv0nBQyYIICTk2ZNGIBk9M3dzp
+kDX5z2mjmCFwVk7cZMHRa6OTRJZJwZOqLBiaCjkRElUeCTmTRgo7kEyWDGGSClJRmuFhUGAjaH3O
+UjiQxKlCrTSHBAThiak6o46x3ILomLILGFkFtQWcPoY6KGNkojDGRBABIeZebbvU9b1dd4GOQQae
+eJqDTJnkAPYXtp9b7HRoI1D6DxVhPg4IqOwHAvOY4RHcck3TTsEGo9Cq2rWJGxminb+PvQaZqiFs
+WrKLKgbNreMjGOGtLZ9TsuwvI/HPwGI+6kerMvI7nwYjyR6sy8jufBiPJHqzC8jufBiPJHqzLyO5
+8GI8kerMvI7nxpjasbZmvh4OX0N5B+0WSPT9rAjLa3CLEEB97BJPjrrNiYGSD+E0iiXE9m/nYDaO
+Gfis4kGOJTwz+CysogPxhkUvTU+kWQcfKQ71/JZ9kwwm8LLDrIr9i32MB2JHvRj7SMHyo7I6XQQO
+pV5x8S+o9fz7caeLydGgjUD7kUeVJIBe3XzzWpMUbFWlqkGSrSm1pLKVSJapK0ltCRZkAIlCiJBp
+UqJY78Nrbpqk2rdOaLGqS2qMlbqVdJNVJqljazayWYgVpQIJIhYJUVpGZEIhwhUyFKAaRaQPkPVB
+2lBVNlk/jX4uJHdp+RFd3zKxEE/K+TrV7RD4IflWIgrMcRMgQD9JCARCP5UPeQfMOg8qp1GKaTeV
+zYFf0Lra9tvu1JJKK1UlUSZKZFsjUyai1UjWssbVkvttXWozWVY2G2qsAkIUJRJkiUiBVIJaAKIU
+IEhgSJBJQh9xg+f3FsaiuAnen6P6Z5JP0xatKWU7rE+J9p7fZmFroxB6co+48DG6ZZ3Pu5QH8yhl
+ilLURahaSZmClhLFsUFjRRFEkYkxSCmmmEc+r26XRCI94cRQO+22Tyi3KNYrt0h2es66fVcjQ/xk
+aRDmR9fxGIctYjuR0SYRtMEqpHA0aHkApoeCZsb2RluZFCXOU0yKjwPhX2hI9UqHpg0ylApSAqMy
+IkRPCId9SH2z7++tVVVER9Xbaqqpr7v3t72NtVVVVV+AfL3ve21Xttve8viaaqbxwdrfmTu22Dg8
+d34KHzT7O1VnCe6SAb5J7PVB5wflsiJbD2gTuQKcTmAPWcoPVoA74pVlSQpY+LZAf1kVOJ6Tcjh4
+Txid1yKe2BoXc5cojEJwjBpQPFE5Fuu6L1SPaAGhXrNOwzwPWe9OZK+5RB6kZB+LT7VifO8m/ckx
+jmxEfD2SIDm7/xLphCZSIZZglggIzQDExPpq+z7Po3PbvrDQwwdPphoIYgiixSPgWMTOzSNH7NMG
+yt13lPM8e+BvCl0oQDyGDFyKPG5hwH57WnDDBxeXmNamH1cKw1MVwkseQZjXPZxyp9On1k6khkSC
+IZgD9ZCPA/r5i7AwsyEEERBMkNTwYxcXMMhE33mnEidIbkpmI37vE3bwwHB9X6ngdJx4D67FzGg/
+GueZdlyFiWlrQZCXNaW0FO65NBgZOLkMQmEbGCQbBhoiG36zk94v6nzvg5uXzYz2Azbmh6tP/S3b
+QqXayqxdKvqteTJ4uzGIqdd43TdImxhA36ERXDEPSe0dF16OVVtIZNKRZrC1mpydm7dzWjAYhiNE
+K+ZRpU9ymzdZ9rurbnEhPjYRzMqjiZKKgVMgYhtJoZviiopWxkwlA4ErqzXVNlsacqwLUkiasxhc
+pSzRTYrG9k6ddK3wl0thCfJsRaDbwREGMDxxyhCxSVjetmzpYzlxopLVl5MRWquWlpK5ZiVmwcTd
+NglhqSI2E4btq2VRpxhzu6p8y9dOGki8jJGlk5aZDmqtsDosmKVbdjGLVqOhZBy1Cm2N1cmzk1w1
+CqTGzMMzM2ySCG0QkxRFl0iSYRAyFYCDME0SRLqDRhKo6lIt7JKGKRGZqQ0rOVkSIVWnOzXDlxOG
+8vGHKUizfOQxCO2SujMQ4QiAug1k7zmGLw2XZgxdByIzYIJuBLuEeNQQnwXxjvliR4U7lKp6TWGE
+EbFkI58RkkRtmzEkNtJoMkzRmCVWAY+JHMQ8mzW2Y4zF5wAHg+wi9DyYL13RfTHPyL+azTyk6xJ4
+j56Im3zh+2g0fNI9jd2XZiT2maKA/wQ+8Ue8OyYT0ibAaDEUA/wEIKNLBSfaZkLYYiJhKihhDkLQ
+oYSp1h3qsKvABVHk/wng2eyfEjlJ7a+DxYkjqclG5o4T2KZjwTSrogxhA0REYrLOpowM0hpQWJAT
+MaymckxVEZhFAcCUZSxkRDYhUe6Oe78J/EUXRzCvXdVHXU0IM9k/pCOZowYjlBkhkuARAWS6IMCp
+EXx6MCvCIjoHgiIjgI71yN6OqD8wmDxHyDdHfCXiLm+GzbDYqlfVrEapyrFjN8MtkrRbmMLbAqx1
+qsxahdmQwtK3aGaVnJjmlK+DMVNWJupSjnDkHDDAk4mE5iMoU7knOiUciCIKewdnouD49LwcPi9y
+Ze3dVEzdhN3ZaiTpOjzIaHEZe3dVeE7JvRkR4Djg6edjTlkQTtKYSbYYZJEPAh3INycohAFcJDcw
+0xrC3tM7BUbDi4YlZJjGLbVkqlcDNIo2gPl3x7y1LNFRS3UsBS1TC1jTcEIB0EjvJj1B0Dt0wy6O
+rI5OX6/R8xH5naexCODkOxo7EkQtgeOwRsQ92xbtwAR8cAHrv6wMgJEKl/D/fAehpB00m0JtCONF
+HAURA1EnPhijThC02YgYwYQ9NWmUCUWLs10pddXtJpSrFVNIY0zQyeZ90ebqbxFcjgh2JJoD1QIn
+zKAns0699hmnsNhWIfVLvQRJanIR/k7JE6yAEfeXjmoh6vkQF+na9VvPwyGUyyof4P8n+3zf7vy/
+7rIlwXqDBJ+CT1soV2T/5/hVB954mHqBDzAQp8yRDE+L3ITE6HvFn0JSPaDkz8X3fdTjyqi4q6VI
+cz9t1TKIHimM0H8+jAZ/EyUzVa1MzNyMVgxi3WLczMzNATXtVU6qpCcEdViXd1X/SJC93isVVXdj
+GA2GCZu7JJJKKBEDKw9whrZuqbYpaNKOS8nr6+wqLyc1fa7ajX8jJhpOkeDbYsWG1JGNSfym7myR
+ssNDxIeJmD9IehXYHhutbrlwzitGmKLjERcoro/3fh/pfvr9F+j93aG05hRET3ieNyfRxKIiI5rl
+hC5ztFHaOYUbYYFGMCY4fCQhoaVu5I7mpSCLG4BiPpSPVkg3e7GBMvCXK8d+DxynhN8BMUKnlIPq
+0JhBBBEIRBhGL1H1YYRooIkZgBGQ1LsS6JIiAmITYgwYPWawNBMu0yS26XZRrKUyWbSy1lNsxVKp
+YpW+DKVsySMFl5KuZrKVJSrybW9XXUhSpUYamnESbRRVVKqTZWlUHSRKEEkYwOLCOiFj0Kh96oeT
+3/vOzsL8wfg+wE/zkfnPuOJFxnxxI8xmr2GQxT76wpVG6bps0bCmw0upGvs/uvt7ZKpKwkW2UVCi
+kQNPieLhKt5ghPJ6R0v5fSB63h6An4D9QesPTc4mIk8Hg9DGgXYFesAaTR3JZ0PmilITUjkf5oKa
+MFkEMMb4ZZw3MVtG5uyWtmXZMtxqBqEmOEaTgIpwpCCRVSE9sEEB7Q3hmoRiFKFIkMkEMGKiH+oJ
+UOa6BHbcxDZAglANPV1JAxJJJI6PTyYTU/JPzeHHcbDpvp7VabTFh9THg5sqtl3ZNNOUjk2YtvF0
+7TrrlMvV73l5L2aNdLIBloscmCdFEDE2vwa4CuXAymnEMcPFqtPFmRs2afJ8GaUpZsrclWNMZJ3c
+mSafqMVWW0WVFThThZph40RckY+OHiEYu3OEOIeDwkEeIx0eCAfzXpF+ElePjXLhBF7UIakZIQRk
+hO+Qhsli105uh95fPe95epGEvaHTm8JqVM1PJ46XFdxcztyXdrVdjGIiIiITERUUURAjEYbJiuiR
+XZDSbAYpxwfJwtl4G/mFPn8tVVVVVVVgemkeKf84UdnG3N9b8pWo7Okn3OP8/yQ4nKzzBOr5CyX5
+5iMYkHmT8uovpsuv6dOWqtma1vtMyLt/8mjT+tR6vp9smPxRhtEfFw0jiIj3PE4HjX0wssWUrqJX
+KBKnsWOFGuOUmSH1Tj23gT6JH9R8QO0hIlIiEJEYhSlRGNJHQf0wacnsk55Pb7/HbfpJ50iVTqqS
+H1gTPHYSe4BZTYyCBkBHgrLpkaipVGqRBahbCJ0VAkTJSL4coajg8lVpu2STOv8mSek+Biy3Uysz
+x7DIo8cDFid05Zpg3fAV5Xvd2le0aXQ0l5N2lNz8BiPVyeXhIV4Xe4/Kc5QTYtBkLxkTHd2M1Yzg
+4mFGSJhgnuewfg/CtJPSaa1qYeylMN6Kh6GAxZJKsQN1TEkpXIrF0ZWRiS5Wfi0mpqWqYqaZWjk2
+GRZfYTlRzUGUiRJ4dHoZblmP24zSu+6gBwPWvmQE3FNbCr6jpOKmt/OKxiT02wrknnWgeoFBYgoU
+2fmD95TRQRMQxCEhKA1KJX/hMYqHzx1kIxyZzgHrHd4/wdR0bKAOGxHqD7qRiCQlpkSK+vUg+n9/
+rEa2v1fNgbcRiZC4piuLHuksSR74Uej2jUQyejzrD2GixIGz5oUCNhiYZgmQKAUhnQowISpoxBD6
+KGDSIrHDZT3HHjfLwr324kHmACISSOeEUax+R2PyvI/Jpk+bDkkWPRtHsz/km0NnkPXQnK9GJG5m
+intVTd9B/Lslx4H0nadD5R7ygYkjyg9YcgobbFMEODtZZVMsoCiWxVMTGmMkx9DGnDdMNKqpGLlB
++RzLy/KsAXjd8GvAgeIibTGGzU0Qu2RushK0btNkMMskRWGk1JUxZBWREabJm0bMwoKGQoGN3UCo
+YXZQ4KaML85BksMkitwYKyMgaVMJBohhZcpAIkMVDeVvVmLk4cZkqK+DYzZtNJG7GZXKVjZvNNFz
+c1itlK0yM2NDZrYIxqMza1UVRN27ZbK3bmMqbvwYw+8XMUXQYHjoO+GQwEIBE4gtB7F3j0YiRS75
+l4x8DQaD4JDuETvkIRtsHvJpPjoSggo6LmfKe930e+O54dAxNfBiOEaZit2iG00mNptqmkk1YpTG
+YmtRik1pdmtmlFuNKzhptG7dBU3XVbNmRqKqUY0YaLLsYy688vEYk0mskmZstWakskiVkrGRLIiI
+iVZKJoy2TbLSUkRNsibZEybJsyqTWsvL1eNgiiDW7yERGCLeNHJHx48EAahyBxjU4SaJ3zfQLsQL
+phjJqsaNlaU0qQqqDGOd1FOHDX/O2OFTSzejW+RnLGUt3axksrG92aUltVNMZKqqsmzdmbi7NNQs
+k2mxtNNaPyU0DZFVYkKWSS8WsZrdpM2zZTFNT4lzDkzA3slj2muJsBkIAG5IqYSqUlMkUGrbZWab
+YrlrlV8KU4DGjHbRHv1aNVLGOcpXYw34BxWVsU3kGTDMQjDMKZmRKQTFgwBlBJeJGCAkmiXDME52
+5XbhRvTmxbUeLb0q9La2uhS0CpjAZJK0qao4si5i4SbEEaw3IcZUiOsh2YMIZtSRxW7asGKXDDgo
+xSlMpkqDMY4YxVLa/x881LKWRzS4ljFmG6wmWJI5qFs2Juw2W15VuuyYjJJJpKS2ShIWIiYmIiIj
+SNBO+y8TSyRZHZjY4bm7dqNt2D6EqK4YHCA5KbQUJHEMyWgIlweOGofMpd12y1ynXSzVyiqLQhS0
+OtGagoaVIlETY04Q9/4/h+YxiyoZdwl+huyahK/1YKqC8wZYl9X2tDFGgek+E7C+xVLJclE80URD
+AeZJoX4YIn3hRSVJ6vioCdt1iFyxxMis4aQvmRCDga4g3rXbJ1r6UtVVdUbbB5x9PAfWTr4+tV8r
+NwQmQp1jGEGKqppAzEHUZP+8QamBjG12xWboY+D8DFwzEcyTEyLfKegaxjFIN6g3lOAuINUZdbtM
+SZMAs7uygYLZEQ1OdzEQUMxVdBRyImCmrpIIGkCxA7uUrZTXhv7j8N4z9YVVVQfo1vpXijLHE/nC
+Z1+g5cSJELUhB4SehGRpJLHw2wQ7c+n6eDvMMyfMQa8uwGiIYSBF8yCKkQsRmEEcyiRpTnJ+ezEQ
+TTMT22BNMhOjgfA/BCGbRe3fHZU+JoX5gAJMUJiGTb4fYZ8G7eIntfchVVimLGMFWRlTvkEcRIFi
+V2YQ+cAhTdBeiiQlqSDwacqhGfexLBFHJvBSPdwdAM/Q3OuGuCe63ARiMMti4wVYaGWTVGMXINCN
+KIiYTqyHROQ6UBiAYJEh1eTV4125XUs2yc3M88sVeN3e623ZM0mvFUVo0Suuq6ZGa5aGrJFbyquw
+tFzUNEjWqi0YoDMGZktFyQLkNJcYcBdLY23CPE8YMPcnER3FTDM1RpjAzRkMSFkZSLCbCakkG0aV
+WzZPmlN1kRW6JhBzRUQ3DhuCmGiBiUamlKJChQKmyQxRIqzdhJ4shjhws3IYgytCyrKspSqymyJZ
+E2TSSUmS0kpSVcJqLrNNKYxskRsS1RtKbVolGpTazYbMjMSqZSQjWtmaL1drolMq0JStjWrKl6bV
+XOV0CgUaEIlQmRRKKUoVazMFFTFkraqLbS1SSKd2Q8lNLHexLtByc2yRvJFkQ95BMKiSRRyRAXBR
+TAQ3VVVfpc55vs5dZq/DJkKpjs1pafRf9Ko8JEnKKlTtIYv7lBlkgYsIYQJEigYYq4Co4S5KidxH
+YIm7GzpXwHFTEWkTQrCpGDILymECWKR5gf1FUF+R6KiBwiAeSZCGQ2XhAOtjcjWxDUwS7IqPn8l8
+9SA3m5TKIx1ak5FFSLUWKSxJVpYgoLBtFk7lgwwE/FKFKUCG5LsRhG5o3WFFICcTqeuCE+CQw9jI
++A+zYjrqIwJWofsqrnyIvodC/cZdKfG4EbQR91Ii2Etg3IRvdkRJm5CPJ4LnOJDqqrrq1tnrEfV2
+HkTUL+ZkkCe1UWkOlEmKb2f6ngnunjPLf519kgj2z29WJ+tRv8WDpso4mEymEuDDSxwMR4wAbENN
+m20qzaGmsVSLvjN2SEp4sSWYbJCbohuawm7GyqjElYaeaSJSkCaZX4EzJMVYxmYWRKLt8tGRN12g
+rSzGmMpzQc4blOhMgKDF8iAI8Ly4E7WsMxMYNGkNJS0QkpCgoVtoMEiVRE0QriogQAJ+yRUiOTaF
+UNiREaMlJUOSkRtEkVFXk2lU5DhgslQ0Y2UM24bbBuLiI6QGETcohUJAN8PKv6tl4rsvUAx/8pVO
+CIcCN3mGyipmQliMkik5PuqE2FLtVp+Se9xmZ+hrJKmZCa0mj52D2LA/pYxxT41ORdc8ZKkRG9Ju
+0w503/7MKRgiKMy2Q1TAqIQH+wOmLQqwSQNDfSaXSVKSbGMnuqSN1N9szjJOoYs0QKhJKyVPMQhQ
+NBA0VYQSUkzP4/ma32tjoqJO6xroxCN1Q/uqOldNQgUBEBEK5hjS5046746tKWx1qac8dNMYsPK8
+by5TYTTT/LYYWrKy2F1o4BgaZhIwjCSVerdxo38476N03YtQ/a/5VTJZOSyUsDPQfkviSKIYD7b7
+tfOvUSkkQkBNFKSNKA4iDggSCQgYghsBoZeYxseJK6nAslCZHoAh2231NU1UQAAAJBJImxQFWDUh
+JubyI1HpHdI7oIOhEOEgiRCkSIfH6Fk8pMiIsgT1nqn9IpgrJVNVMVVFLGYyKlQio0KyrNSxpBF0
+CCjkqK6VAxVP6XHY2GVJrQNpIT9DJ2OSGRHghZCcWw37RFLpQ6oO0ARD081Qz8Bl5ih7Sn+jyjse
+0AHFQ3PA5LeQ0qn6e0/uQfiO0/icEk+KfyK5oqDmUbFGiPe8lT9j46/xH470zJyTo/0MecQ7HKJL
+JjdZMZMbNNFVpGlj1R3eXBZZ62JYoKIgcWyIjCQHDNyAkMV0lk0/3Mk2k/08mKlqfRGMfDzGoBuW
+bRttGNsq0tUlRZTaogSqhEbfP3BZmCLGZuQ6heObGjpNYlCUCEQC7l7TFxd8sHIDsqvaUazK3l3S
+FzcSrlXL4qunkukzSVq9mvJed1uEkgYSoQ44uxhgsUZGGiCaYgfNgu2w4C+aMLhKlmI5hmQDkJR+
+07n4SCNKDtESgyhMkPUZjBaqi2BbFoHmCpDl9pgk62RN7E721D6FQ0quJgnPGmhEQbjOtIOSKMTM
+iJAY+o0MSg228fQTaIlYsPtgDfo7aNJ7DCKMjH2eTHZASEdi98CaQQdSII4VUoAmv16/W9R1KnUh
+52VIiqsq0PCeiyCt4jOzmeslg7VhAhBVMBPBDgf+BlMZRoQE5pDoWWqzU+lFSUm0DalBSGGBBIUp
+RBlBGAECI5qIyweg4OF4c19HdGhH02T/iYrE9222xaOYE5HExY8/cxBr9jwQ2BZIf2/+XI+72+7/
+77h5J2UxzppB0K2KndtHFJHzyT+z/MbbSQ+duYTWZIMJZqSiiKj1h+M3NHSAnqaEKEWOzttER7bU
+qqFFMZMYxPgzDSDP1Ybtdm6bRCrW/5mmpZVkWIKXYgwJDc2w1IQSCksPrkxzmJWORWokqqVN1TKZ
+kznKyW1WskxTljnrN8TFkjeMOTTFIm6xs0yYobuQMgbDZMmIWspixXPmw0ollVZFilVJszFVVSKr
+k1kkxYjC62YmTm0005pJin4VssTW7TVlifEPqfF9EScj8JP9ijtBYPs9PwcFkRViWyd69aEikuRD
+u7cWSIF94WT9IEENELsfmOU0m5H32Imo7wdJJ+DpDEB7gp3k35HqVVj2BHtkpIBVlVZPaZyAh9x0
+nDrKJYkBJGaTykUDSslq1u0NTNq0qWOl1spHYdDDIQedh+6TIwzJ+L7jrfGE8s4ePSRZPEnyeKVv
+jEfkB9HRpIHND4tFYTVJogTFRpKlWqRWiaainJs1FVJVVFRsJhZJWAxMNv6GkPzhoJube2QxSMJC
+bu7c1HJ9UPZBzo+tKn51ajrN3/pr8TSSJVSUVJqSyllCpHg6FfGePNaWfR9L3mKTFJlVQUoTyJ7Y
+3zEjDMIhImQKhwxQfgABkUwlUfOcTQqHUPmJVK+pIj9diZDhKV6/lV3erPm/i2mlQdRkZvMmMwxm
+/tk/PvkjhfsAkaSpKsq1oaCFMTVpAGsMiIQ2NKRiSLGpQlBX4j4kFIgSIUiAEkBmtlVNVlVNtZra
+kpUEE21ChNQWyUs2ixTLWlFRSoS2SBmoKQottRDzmoT+Hh4TRJlSNZyW/hsPjLInD6etzk5b/mjl
+P7NHm9ZJ7PFiZRa5OjbzwdBEweaHgLwJ758TkdMYWnWhNMVpFVmRg1EkQ/fBk0HzNnWlpqXvIxYn
+rfGUlerpdtlXMpZDYI1PneGSp9SRGJSiks2zUixsbSkktZZKWVktSopJLNUrKk2y2rIioiiP3zw/
+Dt+Graw/ex3K0nYqVjD8jIH2BZ/MyQbKiA0R42RRohm4iship0WOa6uzgxNMZ1fQzjnixbzksNzh
+xLbbdRt/1mmls4ak2aKxFQuTAzZJkZQmYawbkybLGg/EkjkNpLayYWyRdzSMibZNoXY2ai7IEk9Z
+7yVNw8hw83W7kyzDPosJIoWOJIYJ8N6+0cPAfjNB1Jsfykoe5WkGElekEJOkFdAmAnQkJgrsmK4m
+klxqlK0lbDRhsphstisVbFUw8QbvdjAmSBG5wYjyR6tZwgjc+DEeSPVmXkdz4MR5IqIlgfASSn7T
+8DrC7WSf/t5QvM6SgfqVHxIPjjsXrJ6E0RGZL/Po0RGjCG6mLExJTsMBlZ2gFw4N/diounveriaf
+i+X0YybTK7b4iyLYKpF4Uxvvob1skXsJRiMyTblWODGR+Kzz5I+xzy88fwgOG99fy4htCJ8WPgQ/
+5COxUfRIUSREV9rdXWZVtspy61S1RaplqsbVRtYNtsUWNVsatEYozNbYkixtCFoFqFVUoIWy21B9
+pHyfW9ySQ96w3bo5dmNRNnDnJOjo4kkgowoWh4m0SQROGL8fM2AU+ijBgowmQNHdcSlZSARj1MB/
+u/7VfyO3zB7ft2R7DTD2H5XeIJ4Vsnig3lWv63omPVEeskQ0FPklI5K5SfOiTq6qVeazHdym8N0E
+xSV4PL5N4DZ7zuDRQRESXQYZJhKOyyoh0Jo0IUsghADWAAUq6ofhSdxgZyrST5tjJzvOpClSMpMS
+4SIwpATBkEAJxobSEIKx9a/SdJjh/LgZ+dHDyom7QEio9QXZqIwOJKbCPguJwHgc3vSP75PKS/Ey
+e5GHxiInCqnm9HsbfpiWHa++2Pk+tjTVfFf836fy1r7XMksbGOf03km7CguYEev78Sgph/C/TsNT
+XhKNnrKMRNyVYX/MskwpvZ63To0EahH4yesjwWR4AQQylDkvAYeA4KwOwODpCGBPE3xT+xer2/Ti
+177h9FMnPnjUWZbycfWm0pzYtdNMFJa/Muvk0q9V6rxtFFtw2ultclspOWuslM1TlRaxa6tNrlja
+KuKqbmoteeXUaLSavGo2jUWiNtjdt+9rzyAEjGsVBAx2ET3QaIhAq7jkueHk5igxlMIXRiYBoj1P
+ZpTgvUifCPSqHUMfkFYPkjRpX7QmCJAiGC0Ji5C4MESuCTEjgMKYCVSosiRwyTROPZEd1WjfJBlS
+SSt0Hia0AcPTnWa9n/8+rNeePg+ni6N/exGVmDLkYjwzInRmOJBzED6tbbBgcYO9UO5USih+JUO9
+LhEGqwan3f/2cUkl4M2BTx5oQvrvBlQ13PFe4WJlpQHmMPAL7A+lQuUVsk/2MnSIipHsIZEMUixs
+eNLxwPhkpyD4CADI1tqRE0UykMEqqqrFVFVY1IGZomSQxxnGhB7JkyNGyXcYQeTApaasgxRbH33R
+prTTRgUqVYmIImJabhYmr0YaF08MxAiG2kokqTX4/l0m8yZZLKkbbJWKvU123K+NLeZEWSNvV1t2
+mSoTIr1bz4zy3mku1WGKSabsZoXbLoZYSVSqK8YuPa7uTRAhwc8oJ7WeCTJbIlVTYGOZZGlTTbRF
+XVSSV5WXe3XRaUtJRjbrt2xSUy2lpLKTZkRoWWKymKVyuKqCpVGlwYUxUwphZVqrZIN6xVTWeOzY
+0yl5Z8XDbfZMx20jAtcXEXbGlanWjJJltG+JtGTkFDSpRmJLPgS0z1fe+q+R66ePj5HXAcbrbzxl
+auG2NFmFsi6dmGaXJvUO8qwjaCIiE5FkxwMDjKqnGKGhzhvoHgw+IEyhEawia4RgFRkS88iYyXDe
+jB/nTNgxJkhYub5ksw3MNUU0jVVNNVfh/X98n65PSawwzDpmnTgp0EGrkoHOQd2QZkFaVV+0wMGf
+y9iCfwMHZ/pPd9kSH2Hgek8nXPstsHK7gUUOgDuCGIZSGpkCIShAeo/bGKKmkSSKpSeYrrye1TkD
+eHP1gf4OkSI+DP37g/kF7pSg5BoOuCJBSIfMS40kTopCO8qL6HNrjFpgxJODGTURqTUqlVO6D/hY
+nzp0ssUMUciHJVVJJicok2CT9GoNzZVQQxEQBMpsguKyJEK4YUotHW5qxi442YxY0CYqMsyyXry3
+W7FMmmqkpV15LqdjrjIcXBuxroNBoeEeROMA25gRCNGeO6HoROEQsBCYiO0GdAI8RhASoiGPtfHk
+fsn805cUu29yuLrlEjYYRNHvv7mS5jyWcPMRhbTbYdRen05wt8SOJo1FIcWPzJ4uD4vSH3CYkn5y
+IIkgopGjxVu9qWB+Ws/x1Zb94fIqEjZ1fBNFNPfsiq0yo2NNZqal1Nvz1BoeD6wT7zPtBUaT7WJD
+8rktsnvlkiyCYD6pT0jB6WSZIiCIgN2Q3IfSEpoYLdI2YcSMIaSND+aI9rZ9tfZXKK5Ktj86mFXU
+vU0x9VI9WZOeRQ3XgwR5I9W+C7u3HStsjI/NAuggG0gnBF0joElaJUPpM6FXWW+JG5minwPQbD1o
+BsPB18PDaHWK6qtS2yrkvM0xtWNszMvI7nwYjyR6t44gAz64TFildyQKK+0nsI+In5LhcscGIcOR
+rS0ej5KIkmvM+hZJI+Kxu0mJWWYVCvVvyw/FiddoSMg+DeRg7U+meA7bh03fFKd1LPtbpR7tvbYm
+Hu9+hB4uSUX/7oUukfRc3+2Jbf6GL0nTciJRoDH+z6DhtsHVHYL1ucl0cN0eZA45eyNDWoUTLMyq
+EEyGjnI5xwyAEorgU8Gg7a7yZFNzJwo5wId7yaSLBYgKSJUSJEGJVNaZTMmNLo1ZOcxzSuZXzsmP
+mfCotCB9vnaNJSOImAi6QCHGamCQKsSWLIsMGRE3+ySI/KoUE4nneYivvfaM9IJz44050GIGSUlU
+lo0T+8gyN2OwnBufeoqyMWIRpD8tlqHNGoPBEE/YRxJCw/ZYsqAGILksN2mJOTimhXpDeCBpoiGg
+iWIXD3IoWrJ0WYTZW6/n9LsakrbMzDCyOodw9IbGykSqsio7wAZkKcVNEKSwADzMMWJAVYlZVJHI
+qEZFmoislKV4RHXMB+lyDqISYUpB3olcpkEJgggslRMiPOITpHiUMSV8JA//2QPh5i6H0DQxPyKH
+5XaSH+NT5BPJAEQJ5FTSovzPM8H5jgSr9UlRUtRKrb6XKDPrtlXxl7PM2afZWN8zVy6ydVZN3pu2
+WdA69LZEVYd5A+Q9Sr4mOwf1yUhIwxEAUBBQ7G5tod4WGD0oCZlGmQoA2jClklUlrKywtRNbIIxo
+shgqmsADaJFSJFIhZVXch0iRammnfUuOpmHEDCVsadGkY0imKBktjpptIiWNigmKm6ZI3XSdkt1a
+1reapNka0SYEyEOFgcw/3jghsptuiQyzgxjUkcpJH7ISKpevrap1PtKD7GFO1kNd2e5uRflk4yXh
+ZyzOpOwgDwTORFowe2CyNaIkAcKlidMYdjYgSBD7mu5D3sEFyTxuh4S8mrxeQ2tWBkruuolhlq0K
+RW5bt06VjamraahiccJMCAHRJ67v1lhkoR96cdj7jEBJ+ouYvdfT68k3HE6BuYSQaYkg3j74qcXU
+YxU7xFs/feZOn1wbkt/yvOy7qnWHift8X1SAQwq1LpkIFd6mAuWBaYovNRgUapYvLpDuHZzebdu2
+rd5L1UeTYtYrs+di6Yp1V4qbtjDZXVVv2WPTWMztqdVSrsZS20tJwiqhS69uJaaOC3Moo25BnxVM
+BUdf3P/2X99lr+eCPPjhrM5OjKxWTtrtqb1aKKRCIoxo5ifujQriRu5XOJoA+HDnImIgIeDnuMcS
+5I4glnO5OHGDg1qV2YIJW9StDM8wtDDC/qiUAiYMtZHJgis/R1nrsQcRriJ/NR6fSOAm4EjzPbaw
+poyxmoFzQYJgQJebjLr03R1fOtHIxm+CQj4mTY509Zs3UBho1KcYIGMglkWQoljIPFE0eQ1gr6YW
+KPA7YGoP8L2cM0SZIPKaVRcnbiKCjODNhhoZwipAYtBenU5IFkrDgulTG4N1Cs4xj5K58MTo4Vct
+XZppoqQOeIIGTRMEytzsJrJ0WuQ/IR3xx7kKWV2g4U8BJzAaKxx1myjAHoUbNOEjZZZjho9ymzTd
+OEhw3SId6ae9XDTJPOp2UmxsYkjFTR3dK3b+Dwm1mmdWsX9ZjRnJNjy70SuKIIGCBm8GCTrAYJMM
+BKxNxHwGL5hoQMIFxaazEuKm5oRJzOjYRbtOSi9FnLPAzi4E9wMa5iK4gDnxWJwx5I83m3aWOXZp
+3bOZ4MnE0YpIEkp+HAddtHetO4wSSR8+/N4eM77t7RYzpUyd6nRzdtZudWmI8rkjqybCooYMnEB5
+jDZZANKxhqe5Wy0UgXjKnZgVylEaghbFBK5MhaKMCEkiSEQGpUEvwQvQ0QwY1IumdFJuuKJJqSQZ
+RSq4CvIAIIJxLPYdHfMjZ2Hjk2UWZcu6nZ5Ou3RZYxarYweOoh7GhzUwkMJaQzimZikLEAwB0QBp
+Y4LlaRiKJNXXGXqDjc1OpupKrqyddGpE0+lTudcmK3VzcNGkkkc6phjKa885MmvmMSMhhCBRgm6D
+vg4xSowCFQaRuK9FOFR1dmTsps88MqbNYk9Jpkjp3RD9NHaijBEOJ2TQgosk2oICgZ6G9EkRRJll
+skdAxQwxiKmElA8HsSFUeMxhrNw/LZEEhwX4nI8dQbHsdDqLzSWt5JnkWrINO2batyZcJEsgaQjo
+6JWTzLCVB1KnYaINj6cngySHg4C0SLbO5ghzbtK0nJjD0Kqp1dHm6tipis86QwjwaMEklks5Ofh5
+lHSoyZOCxnvtoDftwDz9vk6Ls3UE7eiwQE5/zf9mhVaUQNrt9905p1x5VERETzj8UKMb1O6nMYUk
+AxFtL6l2WclL6OijSARoyQjNvMuKGQIEWeWZH6nw1RGX664L2StxKQCKzlh1jd6zNRjyhAImsQYo
+p4iroQCLd4jDmgjfV5jV3m85iS+/bOvpxmUJGThnWdGcAgjGFkxNVGBqDtXd8XhjxBB1JsYdiDy7
+wcly+rMSfjGZW3TO6ARzPNeTnNYjOL5/sLyMWws7FKjtqrOeIdGB86GXTGHgarOGZwMhMbfpWCKi
+mUixKpE7Il3MthUmbC2IE3E1voyCAPh1lBz279sO752FbsVTHo8XNjZyYxwrxUQaGHq8xcPnnNeB
+XlWcRDqmIUQ9s4ySYKLGcjOiYDhr8Y6c+uvEqjg7EHRB/kJEojjIwoYDYHIgDhsMgMbNg1rk3IRA
+kWuQ4bJw4cwRLiewDS9Br5Qg3SNW3nUxr4auwSSOdZMu3qckgySmG0CZspTJlIsnKSad+ffm8bmi
+Xl0YiZ1e/8gfqfyq/alUmiTq+XN6ebL0+Xj4bZz8M9bmZBG1ugh7D1O8N4t0wCWl7nyKmSYv20SG
+CgZ4tJGrfrvN6s4LMmBmzR8Cadazry+MtDOQByAnc96gjyTdETiIZzjkTmY6NdFq7nlnT39Ry25A
+A1csRB5qCvVKCuAqm6gSS5a8wa7Aw/CZRwtBwZMnHxSyUiJt+TrerFKhWCsSe1J+d0NOXKTc+9fZ
+GD0O4LK3oweaswKSktHkGz3LbdRCIBWPykrykX0r6XCI+iPvi/Sfj4Prj9Sj7i5jUkJGn0rNN82P
+6/BOOX0H2VIjzS2E9zTYxUv1OjfTKnuiU+DjZXLjGJJACiKxZiJsGfRclMwOiQkeUAbxnARAZhhB
+lZKLolUxkCpkWVlgUM0GYkZGYQpIkZIUMwMGrMWay9EChycAK3tS7GnbUcBtGxoMrIHQIqcYLRuv
+KDCFOvwvDEjxM0UDEPMVjB2NjWi1HgXh5evTwaSJ4LcQdBg3rE2yZqsTRsNNKVZYaTRNTUWY3l5X
+niLYZnmeV5uvXdS9GVi2xbqybu8dXRgMYrJDvUtk8ld3lW+pJHiokclG1FbGImlgYtHedA+AkRQ0
+REoGwI+RP1aQ9AS7ogKM/qn408kYZZmBjmZGT/HvxR4zvfIeh7tzhM4xG0Yo1GE2LCbFhl5O0WE3
+xGHz5MJejSxqytkYmQRkEZlyUxRpLpyYusvPCyYcvJ2ugvR4fLyd5ueKLDOTFxZkwhdjuAIOOjwX
+d3Qji8JsWE2LCbdcrydXQEXdBYVuzJhy8nb0eHysGWUw7Y41kaMQF0gMgJKHGBBCBAwDnJirnOTD
+wIHDwdnJhDgCxYZyYcvIAh0DoGQdAM5pwMxxqZKmHMcN3V2OXk8eLyeGaGaGaGYqZKmU1JgEGY4h
+LLiwOh5MJhDAliwzkw+cmHOTDnJhPJijEXK88ZueWTCEY62SWWhmlVS2qOXk2vLy7Uq7V1V5aUtN
+zxeTwytNNs1Za0ksteduwyu7hmhydRY3Q7oBOTo5DsHOcmEtd5OeLyW8zQzQy1NZreayDscc5yYc
+vPCvPC5MOcmLrLzx5yeEvFhnJhLFh6eeEOZaZUYZpV5TbXHLy7zyN6ZPD5yYQjHR1dcsmE7o3da6
+7brLyGf1hrl7dEeILhcmEiImikKIaIYQqGEMENBwJ3BCYTA9ue3J2Oc5MOcmHOTCWLDnc8qKnd9k
+OBEPun3MsPSp8X5Np/X0ZD2nqr4vnMNKZWIrJZDZox1+ZELEyyPClNoxliqYREDkLrDMIHA3H3k+
+aKfkDThTqaRO2VEDYhy26n2n+fHNjDA8vcbWg9Qi9xCd77G3ii9tvgICPHul/FQX7mFZVtax/ct2
+mWYfCwl9rQkNMG0No2iJZUVYMFosbYwqoLYt1QnGN9TGdN2y1VFWGiIOqOstXxYkeczRSD3UXwo6
+OvA8p96MntV7145YT2/1pr/LdV+v73APRsqn6VlK7Gk+DSQnvgQ+SJIYT9awnYTFNSwqCioiKP8B
+5pHAEWh/QfhIGJHAu6DjDsz1Uqny+DE+J9rlkPuVLj1NS1ViXotaam5kyNo4Hydo9o2gnktJJdLq
+ViiyVUXxy0oRCwbJAKJBKxUR0JwI+RgkSyl5ZaseLf8wtpVSj7KyKV9VmLNo5x+c6+AYAPmEn+BK
+fzinkHOKMiveBHlcyJFiSZ6HyrhoPKZtBeQFwYUCSlVUqqqer18Gx6Wc7JD5lJE5Dpj+zmx1hI/Z
+Tie90n4fGJMT/zfq6fBskyuyfL8Y4v0fDgHUd4AB65e0ivfKglKjkgFIFIqlCBEoMSMkZLVFRoaa
+rSkW15TV2o1ZCMrdSRDIRuUxZUhUqEHaXBQ0meUiqExfzQYj9wgYao/kLJN/k4ZlWxisuWvpY56z
+MrbJIphAntQVAOwdpjCSR0hWQIoLUXJNibSTYpGYkxV2OoowOCBoCGrWJCQo2Y0mGOROZiFbWcNn
+Ttbu6r0k3kt13Y0xvh3NHiS1lQlWWKEWtDJIw1JB8GsiN3qkwc5A9IaWJY4v0ZFnk9NtllrDPrrk
+SMbC93HHge5KTqjh+ckdUOrmRndau8bRhLUHpUk9H0bakh4IPIGuXuVueOGxZ/DjcQ2T6huT9eFQ
+ThJhyA0h9J8/2fNqtBhdSq2NbD+0lM3wTJ4IKabQwKGmHukw9xyV9hXV7wrrV+dvn9YkWjYwSVjW
+fGBgvhoORpg7UBJFRwQ7BI+EjwJ9xDsR6yiE7z9OB1gC13o/P3wRxuKIsHMbhUAQkWn42GHHHdmZ
+mZmZmqqqqqqqqqqqqqqqqqqqiqrbaqrbaqqqqrbaqqqqqqqqqqqqqqqqqqqqqqqqx3d9s/BhE/A4
+/EsfhfaioBsOGiJ4Z5RPwTD//f8P9n+xqxZ6fPJTZRZKry+xYSJrLMRHufhX4Q+CF9ZaA2NIMtL9
+3B0TB9W44JofWQ0v09Bo/Ajrk2n8MMfTrNeuwzDN4fojY/Fjy+NQD3IygH5OrwzDrYz5f0ajC4pl
+OVBDmiKEylecbksb5Ascae9re6gblQuCzmLj76Dg5OmUHR2C+Tk/hwGyyBisN3R0bNlcjOjwcm54
+N2O5ww58Flt7MXElCWzgxsxCDeM9lhlpccl8KSKIOYMLifSw8IApa2LK5d6Mch0ddaWcLiOBcKmM
+OLNYDGMmSQX1akKsU9bN1wb6P/oYLXhvNyeZgC5GLZzMtbEhJGoGybOCEGAA8HJBzo7cEGiZmyjI
+VETJBWDsSScQaJkOCJJOSTgZV8bLDRyAGrzQbGkLFJ6YZJJ8+hhpQjg6Ou4gXAaZuoOINFUuVY0v
+8xUBbFyJ9ELsSa0dBjjusZENBlMMm7wW7CWTsZwIYwbLZjDKLDAYGLgYyiXJ2GGjJRcoA5KldsdO
+JMbMjFkm4sLxe+mzmwueOLy2OBhU5NGSx7jfYNyYJ7Gii4k8RxjIsYg1xz35MmyRknAjqApOGefO
+TIzKvQzk5xJydFnRRjeqMjQRM882lfGjBAywHDGxNAxYlZ55nF5FQVVUKlnBz5GcFnIM4GKskFs0
+eMBigAoqTvos0XPSSyXoLo124MZIGsEtmGZKCCKUlbMAy2YKMGAhpAbKJRJcZMEAxDSUmiSygwSS
+KOOUmWcdKsLeSKIEzMvsSCVMhyEcJFhDhRa73B0ZNk5XVHOOTNlHGMFF8l9qhVBkN7gDZyQbIOSB
+rnWMmTBRg1oMHHGBmgxLQZ4NtxwHJT5Ag4gyGyIVJCgh96XBJu8CyYIDDRhNDOiAk/RZdIIvRkkb
+NzdNalLpVYYOalOlw7LzskkjFkQsudq7O+TFbTkrHatnaw6uxwAHOvDOiuCdJnBS6CAZyyC0YMGC
+lysnMXAYMJEFkFlCgQDLK5II3eTvxJspgAztoqBv8d9BjgwefYNuGdoy+Vii3KdyFXYrCsvDtywy
+zM+AZC9AZzgSwS8tgRKsnDAVTWXbODAhoCCiAaZJNpcLiEaLntgmmSIklkWHKpd8HC7Mm7Tx1tEk
+Q7REWkwbGi4mK0R0JlA6pRspIERYmU5WWDXZG45N4OKw78snMZIy6sT4gSMnRsOgpCDRcrno5crB
+W+eDlm2bl0blznJGxMpc9G9IA4SSdHRdSKFCk6NHU0TBwQcSQVOjqjY6Y8wMrGOPaCcV0GQA7Nb2
+zDlRoDwQu4pDv4Fx4Wzgg8GjQSMGVAYIJNqh13uaQmaM5JwZwzokkNCLgJH3CyNaCFgCHI9ZhWJ2
+PuM29bgphpLw20455bDix10TGxeznJE7UiWkSZ0XpNQTCmnHRjSU8nwDAcVdilbsXY7Qu0FDkwLB
+k0QDGSKAwnfRk12stTC4EOiCM7sQRWhoOWyXqGkGogG7QS6aKObphmXlrOuNqt1qtmwemfeJzveP
+b3XcvOh9j3uKTe8zKbvRcie9lN3rK48+xcaxuhPRU+x73XofY97r0Pse957Tt7Q+hzJVKKh1JVYE
+IL4SRipMbMjM3+0VCSG6uW2RERmYRpUkTBe/WkkTYBOKmoDkQhktLSPUCSBkKfPvEZBReOt7DcQc
+R2B5jkQvXq3VVyNYiIiPNpVet5dELSWWFWFvVOTZpI4wIyYl3sqm2apLER5eNXbVeSiLbEa95zfR
+auzSaZRGo94JVZcSUCthCAgZ4BCmrZDuPtH0fR+By0tyzMkJEgyzNuHblrpZmluWKGbluiBMcCR9
+SiT7rB+l9NmQPMpvHWSQwWCeBO6yH61Ekm1d68HzvKSQ2FqWqKpYiof80j3Y6WEOZ43uplGhMXMT
+8p787tw+v5Ljs7LuRDGNCHIRPv5buL9ldOH0PkxET1gj4rIhnvTJGYk90NlPbUmwbSyGjbYcljIa
+cZlQiUKU3cgwfvl0QbymG4GSMsTdoY2kkqMlTa1lBmKliiqOSUUgJYYJvpyJ2EkwCZxUTdNwMFNj
+ZxVTgqeC4eG0jobmMKmpPkYRz7TG5142bKoyV1qNyqlgqYyTFrnhibmMaxZrG7kDdqa2rFppwpmm
+MN1c1aUG6ybWOLwjlw5KxtVU3Ycb4cMXE3cJJkJFEsQK8FWZ0j4dYHAISCUknJmKSJXJIzEwzBKJ
+lZEJRXvPDvuQ+oiHyjodDQppbFYVaObkHPwh9ixt9LxpLCQj2LIeSSTf19GOfo2NdHbW6W81Y4er
+Wzq3Nb8zSaWLKsVhvz6g4bdJeGpu01zfS5tuTlwYIDIjBsi1RSMgeLyPOek00Vrdm8RQczXl8+UK
+WVpqUkkstJtKyllNmpZZSklpY2rLCRsSTydJqbjqxJredmN1cNlYxbpnl7YI5vF5o1TVyYskJJqa
+Yc+76lR7F9C+2sb/mbbVjM+WVPHHHtyNdkj/tmpJfHnqOlYqI7HIrdB4vGAEc0+kqDYJQkwhjFjF
+7pV3YiI2lVS2WQ2YxXqxWMWYrGxjoltSy8uq9Z5m6ajGotuKuNkvMRX0woholADpkUAKFE1KKfQS
+pQgaRAhVBP/9CKFCCPxSo/gXfevEjwM0UAf7FgAf6/V6PnqxZMVMjVzRU85rzBWm7N9DwBnhO8RS
+WgXg58VUcTZTuhB/9dI9Kgey83CSJykBoaJH7HTyv6Zv55cjxkcnYyJPsfZBWwS6VUTukgiebxxA
+T4+84rIbcQ1DuCfr9hxSxoabcS2Hysf+e+HfbX0Hido5usydT6n6WxwbtjcqcK++vPY58bt2VeC6
+0NN2DjuhhIOiMCNl0Pd0HGTIdTEOQZwqS2wSqGEQQIZHEdjdRUcbnuwmBOEeGDEGE4xEF0QgneHA
+nd4TvcNcQYuM8ZHOrCIZExnsZMCJwKHBntYvJ6l6rLyVyvUt1HNeLxqUbV1YUM8pxCcYe7tdcIHT
+AZF4MhnCp2QzhWRq6WO4KLqTDuJCcKy9AAZN3KYhSRKSIw9x2H4e68sQgxc0qSySqS0lerrqktJO
+4DA4scScYe7EFxyPYQ6V4SwFpINpMRJC7dqUJImINCjubImOjVtBEuxsZCYg3bsYxjkMIkdwpdz7
+EeJxhdiDWBjBYEilVxUzgK8B+LqXyrmEejSGBLXwBkDR50MJY1W65E4ERguOxxyluIcuo6jJgoEq
+s82Ml/37EkPSIs2S8DG7T0kT/vVz608P2vbSIwURRR0EIhmWCquKZtJRrbla1JWurrtsVMqQjLil
+qI/VUyohpDx1iGFmqRk76cir5y+hpj+SsbZmvzsd5Ic2RiPgompKDzI2fGlqin7VQwYzGjA+gufR
+ifpMfZpyE7G/diZmXgecDvJYk7D7oNIoaJ7SBF1CFAi0IpQqnI8e9U9p5UFDmOcdkJg0jNYVkn7E
++uyfQOkMNnGpPvqTAVzBNpBbEKBCp1eMjbSbrCSlkCqKpVRViFf6m5PZJTxVRHdVO84uyBASr7vg
+CPv1JR6BFEpCXkmdmnsg8g9SEOfSySiWYhw7qSvZQrrEkE1SsssGUWEDghPJmS4gTyEYMwKjLf6Y
+ETmIYmnSMkSQSMp+86trFyQMNlQDcsTgHAbZJoqqKbw4GmMtQF1FKiCWKSnUxcFS0kyXEt3Ywbco
+sybTRz+ebdNyRufBZDJxRVXRJhp6mzRUqlE/I+2SOCCfypCSWWySImzo6Pk8MeNfJwTGzz5piJcH
+YTzQIqQwgCRKhFdvL9Ww/MqAQ+RV9sRcE5QySdJ2IBaPWbaQrSsVMtRZB1SPnR3KhY+8MXiSBoiF
+iebO2A4khDhCVI6q5RHk7k70VXtO/tYkGVELOb+PTPlprVqreY3/lSTyee0yfMr9w2Nju0es9wqt
+uYquYoonYB0H9ogMiGonUP8rk4bSf4TUa3fEVZIdCQKpIlUhUI75Ei2swjFyztUanUhpkAiMJPLA
+IZChQKUmpFEyEpDUqojGjFs0hiGkoRjtMHE7el+ge46VNjj+kOOcP+6VKTEFEUKgBEgUo6R5B2NS
+26Jr1HsEXyCGywdKqnkDtkEpYoIk3J1U6z6qpYVFSiUpKsLFWyQVKFE5QUzJHv0GlklJXymy+sxN
+au80B/dLQUvE2R6x9gijKkEl1PiScAB7E/6j+7ASlHmdqrhnaRpV/zSDAxSJEJ3ggB+g2FTymgHB
+PUYqJ6j7zx3T4b3p7/5jQ/JDq3j6/358klQcjEg++DD9xijie48/noaa1mWToek2djZmvuIiU9ix
+b/hZs1MpZcXFPZBogyXYSDoj5D3BvKYgJBEooGh/3nY5JsjuSm/1wlIL8avthGPvkGiEvd+j35zi
+pMrDZklBlYPR13oxJ8TNU7AiqdCrwI+JDpfkhfmCDiecg858hxM0j/w2xJEL8nvMFH7yV+EkAQ6i
+V4EnIkTZF9p/i+QCVaf7ZA/vPYDl+Z7PlVWipZCzIHVxKXduVul2qkiKVq6SHLxAXTBHc3QhyDED
+zx0kMUjSqQsUqryN5IgmKbSsfYzeEeI+GTS6YMiEhykkkkhw8HHxhtOE8/4Hf+e6huRD/DHXKH2S
+9uwcEF7xSgyJhUBKHWOKidFBPbNKqEDfQBNIESqZiKWThimQRIh2mPsqfJJJvvWELDKWDVSRP4FZ
+WhTGF4ELH0EibJE2JE5EKkEwhRCpE2Q2Xk/Qz7pN4jdTsCdRRQGpeUAHzI/iDeY7zuXvX1iYR7Rd
+CEIXIPdwgBPCBXEkdAwwPXUPX2g/cG8AD27o7uYSCSosQuPXRTMspVnVh81k009itVB4NJiVXDtt
+FNmx/kYxJG6HCcn/GbZFWq79lkX2tkq7OEmzRog+wOHJEjgcDF4OypwebPU4rD1Dk1Flh8fxerNH
+NY/M+jy7I26XtkV2ZpbNrvh9H5JDRkyZJsxEzItvjJcdRFJKVfsKNXx/D8vSSwKhJpHgfZ3+pUAx
+EV2UXrIeuT/Cp808MT1veP2OqdmxtDwVWGH9DEOVUHqIV/mlwgD6iQT+1J8J68Se4zVPeK9tSUhE
+Kn4tKgr1qvaLtof32SJMl54wd6kPOOUhj1KqVapEhAvTdWJHIzRSVM9BhgAbLigqOEgm2WKhyI0e
+Mbx0F8nv/dqPv5Ghf/tAdiL2kkSoPrR7zsJD0bG43u/aH7q2K2YNr/5q2NKxUuVPWxxRpXFPwlfg
+pyNDG9bqzjEN222NSQxYAGG7g7BtjQ2xOCoedi3bAPlkpi7JRyAWIXcFFYCOJHBdIbQnaeQ7ciH0
+lBf9gbGkL2ketVS1uC8LCrrZPg3yvdMY92usknZbUEDYyH0rKkkGS4bTHBIYooGV9JP0/TeCtH4K
+pFlLFRFMYJqplZChRDoBEhDlVXyn3ngbbVEVVVVeKIiw6R/Ij5o9E9Gfc1G3zWa1GLZMTbdREH5R
+UKGqFB+UyUdjAhfaZVAlzcyssuMazU6TWjTFMBLbK5s3gzJYxq5JGMAZlzOWSFuAgzaUHMIuTAUZ
+JLWEQ2FknDMlBR+dT/qgNFFvAyQY0zIQIvJc2MGcYMscDZNEmzBRLGBRgyUSk6BkHkiiaOYJFJAy
+1Bg6goaBjGFJp2yYcybNgBZW67mNmGGzkm9kTh4NK5oON67InMx0cMnIta2RpSzsrFc7MS71cbtN
+tmPNkbtK5qKtMUwqMYxhDmODjEdPQbGkt0oJkhiDOWiQZgSZ0YULdkKDQyNEshkzTTqB0miLkKJv
+madJihKVAatbRrRlMshp2mgEMZLmdFKCyzBEYtlF0XFW6QQUNQNUxkHEIiTkyQUUQkwkwD0aKbak
+MTKgLKdENIppjBpiWKL1tWo2I1O+x/q9wu4CSYQFAJh/Hi3d3Hw/QjQQ9V0JVzXL1XKC9ZjmY5NN
+DxeLmNOjY8hbN9hBrbExMMpdkIWNaRoY8iJgQp6AwTnpbWFmJbGKbNGTUGISS2ISrYpuE3Y8PDmk
+cnsSNhZ+gp0TmRDwRkP+wDmCoiSyUCygAaAAiFUIWUWFlQUhKiQWRJ6FkeDu3QfzsM6Sc3txn5cg
+aVziOjhPFI2I9jyejeT1WKlkKJJpkpUSrLIhCmSQ0cwHqUdJ6D6AlXtIVMjtPU+X+R/o+8PfsYog
+f76kESRIqRICH3klqTxWQfdYm9BP20DEfw//P/l+P2f1fLT6TQ08Qn4z8Gg7In16ePy/mW8UWl80
++GMUjJFGgNJZHwtJbgot3mHgfIpHUb0+gYSX9QrSgxjZm9LCsRM2hMS5MSF4mkzi6Gfx/2bPTPlj
+B/rdNDfMBTfaTLMaxp956DBHMfmEw2/4jjOaLbZ0aj+/19JXGYtWryZx1tJ9eJfvW+VyPUuhdw0H
+eLKLZWkkwW0CznaFZUwKszrjNyFQvirPg4SWQrZ2gTIZ1uEeth4Jluoh0Qdf3VW7iHPH5snLT/J+
+mH54+PMXxxuCCAuKXa7043Xp4xjftuRsKHsdz6X5a9e8qcVWgNJyot8tngvTIpDO5NJX907uZzD+
+K4QYuRk7u7Qd2AZ1w+iTouuNEbwB2y5ItBqrqx9vZOd1f/x3+ruy9fphXBhsxP6K7vzNQ4D/+LuS
+KcKEgsh4Fbg="""
@@ -0,0 +1,241 @@
+""" Timing and I/O instrumentation for gr_modtool.py (--profile, --io-report) """
+
+import os
+import re
+import sys
+import time
+import json
+import pstats
+import cProfile
+import __builtin__
+
+### Profiler #################################################################
+class CountingFile(object):
+    """ Wraps a file object and counts the bytes read from and written to it. """
+    def __init__(self, fid, stats):
+        self._fid = fid
+        self._stats = stats
+
+    def read(self, *args):
+        data = self._fid.read(*args)
+        self._stats['bytes_read'] += len(data)
+        return data
+
+    def readline(self, *args):
+        data = self._fid.readline(*args)
+        self._stats['bytes_read'] += len(data)
+        return data
+
+    def readlines(self, *args):
+        lines = self._fid.readlines(*args)
+        self._stats['bytes_read'] += sum([len(line) for line in lines])
+        return lines
+
+    def __iter__(self):
+        for line in self._fid:
+            self._stats['bytes_read'] += len(line)
+            yield line
+
+    def write(self, data):
+        self._stats['bytes_written'] += len(data)
+        return self._fid.write(data)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self._fid.close()
+
+    def __getattr__(self, attr):
+        return getattr(self._fid, attr)
+
+class Profiler(object):
+    """ Collects per-phase timings and counts file and regex operations.
+
+    Phases are nested; the time spent in a phase does not include the
+    time spent in any phases called from it. While the profiler is not
+    enabled, enter(), leave() and count() don't do anything. """
+    regex_funcs = ('compile', 'search', 'match', 'sub', 'subn', 'split', 'findall', 'finditer')
+    def __init__(self):
+        self.enabled = False
+        self.phase_times = {}
+        self.phase_calls = {}
+        self.counters = {}
+        self.io_stats = {}
+        self.events = []
+        self._stack = []
+        self._last_switch = None
+        self._start_time = None
+        self._orig_open = None
+        self._orig_regex_funcs = {}
+        self._cprofile = None
+        self._src_dir = os.path.dirname(os.path.abspath(__file__))
+
+    def start(self, use_cprofile=False):
+        """ Start profiling: install the open() and re hooks. """
+        self.enabled = True
+        self._start_time = time.time()
+        self._last_switch = self._start_time
+        self._orig_open = __builtin__.open
+        __builtin__.open = self._counting_open
+        for fname in self.regex_funcs:
+            self._orig_regex_funcs[fname] = getattr(re, fname)
+            setattr(re, fname, self._make_counting_regex_func(fname))
+        if use_cprofile:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def stop(self):
+        """ Stop profiling and remove all hooks. """
+        if not self.enabled:
+            return
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        while len(self._stack):
+            self.leave()
+        self._account('other')
+        __builtin__.open = self._orig_open
+        for fname in self.regex_funcs:
+            setattr(re, fname, self._orig_regex_funcs[fname])
+        self.enabled = False
+
+    def _account(self, phase_name):
+        """ Add the time since the last phase switch to the given phase. """
+        now = time.time()
+        self.phase_times[phase_name] = self.phase_times.get(phase_name, 0) + now - self._last_switch
+        self._last_switch = now
+
+    def enter(self, phase_name):
+        """ Enter a phase. """
+        if not self.enabled:
+            return
+        if len(self._stack):
+            self._account(self._stack[-1][0])
+        else:
+            self._account('other')
+        self._stack.append((phase_name, time.time()))
+        self.phase_calls[phase_name] = self.phase_calls.get(phase_name, 0) + 1
+
+    def leave(self):
+        """ Leave the current phase. """
+        if not self.enabled or not len(self._stack):
+            return
+        (phase_name, start) = self._stack.pop()
+        self._account(phase_name)
+        self.events.append({'name': phase_name, 'cat': 'phase', 'ph': 'X',
+                            'ts': int((start - self._start_time) * 1e6),
+                            'dur': int((time.time() - start) * 1e6),
+                            'pid': os.getpid(), 'tid': 0})
+
+    def count(self, counter, increment=1):
+        """ Increase a counter. """
+        if self.enabled:
+            self.counters[counter] = self.counters.get(counter, 0) + increment
+
+    def _counting_open(self, name, mode='r', *args):
+        """ Replacement for open() which counts file reads and writes,
+        as well as the number of bytes read and written per file. """
+        fid = self._orig_open(name, mode, *args)
+        path = os.path.abspath(name)
+        if path not in self.io_stats.keys():
+            self.io_stats[path] = {'reads': 0, 'writes': 0,
+                                   'bytes_read': 0, 'bytes_written': 0}
+        stats = self.io_stats[path]
+        if 'r' in mode or '+' in mode:
+            self.count('file reads')
+            stats['reads'] += 1
+        if 'w' in mode or 'a' in mode or '+' in mode:
+            self.count('file writes')
+            stats['writes'] += 1
+        return CountingFile(fid, stats)
+
+    def files_touched_repeatedly(self):
+        """ Return a sorted list of all files that were read more than once
+        or written more than once. Reading a file and writing it back once
+        is not counted. """
+        return sorted([path for (path, stats) in self.io_stats.items()
+                       if stats['reads'] > 1 or stats['writes'] > 1])
+
+    def _make_counting_regex_func(self, fname):
+        """ Wrap a function from the re module, such that calls from
+        gr_modtool's own code (i.e. not from Cheetah etc.) are counted. """
+        orig_func = self._orig_regex_funcs[fname]
+        def _counting_regex_func(*args, **kwargs):
+            caller = sys._getframe(1).f_code.co_filename
+            if os.path.dirname(os.path.abspath(caller)) == self._src_dir:
+                self.count('regex calls')
+            return orig_func(*args, **kwargs)
+        return _counting_regex_func
+
+    def print_summary(self):
+        """ Print a table with the timings and counters. """
+        total = sum(self.phase_times.values())
+        print '\nProfile summary'
+        print '====================================================================='
+        print '%-12s %8s %10s %7s' % ('Phase', 'Calls', 'Time [s]', '%')
+        for phase_name in sorted(self.phase_times.keys(), key=lambda p: -self.phase_times[p]):
+            print '%-12s %8s %10.4f %6.1f%%' % (phase_name,
+                                               self.phase_calls.get(phase_name, '-'),
+                                               self.phase_times[phase_name],
+                                               100.0 * self.phase_times[phase_name] / max(total, 1e-9))
+        print '%-12s %8s %10.4f' % ('total', '', total)
+        print
+        for counter in sorted(self.counters.keys()):
+            print '%-21s %10d' % (counter, self.counters[counter])
+
+    def print_io_report(self):
+        """ Print the number of reads, writes and bytes per file. Files
+        that were read or written more than once are marked with a '*'. """
+        repeated = self.files_touched_repeatedly()
+        print '\nFile I/O'
+        print '====================================================================='
+        print '  %5s %6s %10s %10s  %s' % ('Reads', 'Writes', 'B read', 'B written', 'File')
+        for path in sorted(self.io_stats.keys()):
+            stats = self.io_stats[path]
+            print '%s %5d %6d %10d %10d  %s' % ({True: '*', False: ' '}[path in repeated],
+                                               stats['reads'], stats['writes'],
+                                               stats['bytes_read'], stats['bytes_written'],
+                                               os.path.relpath(path))
+        print '  %5d %6d %10d %10d  (%d files)' % (
+                sum([s['reads'] for s in self.io_stats.values()]),
+                sum([s['writes'] for s in self.io_stats.values()]),
+                sum([s['bytes_read'] for s in self.io_stats.values()]),
+                sum([s['bytes_written'] for s in self.io_stats.values()]),
+                len(self.io_stats))
+        if len(repeated):
+            print '* %d file(s) read or written more than once.' % len(repeated)
+
+    def dump_stats(self, filename):
+        """ Write the cProfile statistics to filename, for use with pstats. """
+        if self._cprofile is not None:
+            pstats.Stats(self._cprofile).dump_stats(filename)
+
+    def write_trace_json(self, filename):
+        """ Write the phases in the Chrome trace event format (load this
+        in chrome://tracing). """
+        trace = {'traceEvents': sorted(self.events, key=lambda e: e['ts']),
+                 'displayTimeUnit': 'ms',
+                 'otherData': {'counters': self.counters, 'io': self.io_stats}}
+        json.dump(trace, open(filename, 'w'), indent=1)
+
+PROFILER = Profiler()
+
+def profile_phase(phase_name):
+    """ Decorator: Account the time spent in the decorated function to phase_name. """
+    def _decorator(func):
+        def _wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            PROFILER.enter(phase_name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                PROFILER.leave()
+        _wrapper.__name__ = func.__name__
+        _wrapper.__doc__ = func.__doc__
+        return _wrapper
+    return _decorator
@@ -58,7 +58,14 @@ namespace gr {
     class ${blockname}_impl : public ${blockname}
     {
     private:
+#if $blocktype == 'tagged_stream'
+      std::vector<gr_tag_t> d_tags;
+
+    protected:
+      int calculate_output_stream_length(const gr_vector_int &ninput_items);
+#else
       // Nothing to declare in this block.
+#end if
 
     public:
       ${blockname}_impl(${strip_default_values($arglist)});
@@ -72,6 +79,15 @@ namespace gr {
 		       gr_vector_int &ninput_items,
 		       gr_vector_const_void_star &input_items,
 		       gr_vector_void_star &output_items);
+#else if $blocktype == 'tagged_stream'
+      // Where all the action really happens
+      int work(int noutput_items,
+	       gr_vector_int &ninput_items,
+	       gr_vector_const_void_star &input_items,
+	       gr_vector_void_star &output_items);
+#else if $blocktype == 'message'
+      // Handles the messages arriving on the 'in' port
+      void handle_msg(pmt::pmt_t msg);
 #else if $blocktype == 'hier'
 #silent pass
 #else
@@ -97,6 +113,18 @@ ${str_to_fancyc_comment($license)}
 \#endif
 
 \#include <gr_io_signature.h>
+#if $volk
+\#include <volk/volk.h>
+\#include <algorithm>
+#end if
+#if $blocktype == 'message'
+\#include <boost/bind.hpp>
+#end if
+#if $graph
+#for $inc in $graph['includes']
+\#include <$inc>
+#end for
+#end if
 #if $blocktype == 'noblock'
 \#include <${modname}/${blockname}.h>
 #else
@@ -125,18 +153,51 @@ namespace gr {
 #set $decimation = ', <+decimation+>'
 #else if $blocktype == 'interpolator'
 #set $decimation = ', <+interpolation+>'
+#else if $blocktype == 'tagged_stream'
+#set $decimation = ', "%s"' % $len_tag_key
 #else
 #set $decimation = ''
 #end if
-#if $blocktype == 'source'
+#if $vlen > 1
+#set $vlen_factor = ' * %d' % $vlen
+#else
+#set $vlen_factor = ''
+#end if
+#if $in_type
+#set $in_ctype = $ctypes[$in_type]
+#set $in_sizeof = 'sizeof (%s)%s' % ($in_ctype, $vlen_factor)
+#else
+#set $in_ctype = 'float'
+#set $in_sizeof = 'sizeof (<+float+>)'
+#end if
+#if $out_type
+#set $out_ctype = $ctypes[$out_type]
+#set $out_sizeof = 'sizeof (%s)%s' % ($out_ctype, $vlen_factor)
+#else
+#set $out_ctype = 'float'
+#set $out_sizeof = 'sizeof (<+float+>)'
+#end if
+#if $blocktype in ('source', 'message')
 #set $inputsig = '0, 0, 0'
 #else
-#set $inputsig = '<+MIN_IN+>, <+MAX_IN+>, sizeof (<+float+>)'
+#set $inputsig = '<+MIN_IN+>, <+MAX_IN+>, ' + $in_sizeof
 #end if
-#if $blocktype == 'sink'
+#if $blocktype in ('sink', 'message')
 #set $outputsig = '0, 0, 0'
 #else
-#set $outputsig = '<+MIN_IN+>, <+MAX_IN+>, sizeof (<+float+>)'
+#set $outputsig = '<+MIN_OUT+>, <+MAX_OUT+>, ' + $out_sizeof
+#end if
+#if $graph
+#if $graph['ninputs']
+#set $inputsig = '%d, %d, %s' % ($graph['ninputs'], $graph['ninputs'], $in_sizeof)
+#else
+#set $inputsig = '0, 0, 0'
+#end if
+#if $graph['noutputs']
+#set $outputsig = '%d, %d, %s' % ($graph['noutputs'], $graph['noutputs'], $out_sizeof)
+#else
+#set $outputsig = '0, 0, 0'
+#end if
 #end if
     /*
      * The private constructor
@@ -145,12 +206,46 @@ namespace gr {
       : ${grblocktype}("${blockname}",
 		      gr_make_io_signature($inputsig),
 		      gr_make_io_signature($outputsig)$decimation)
-#if $blocktype == 'hier'
+#if $blocktype == 'hier' and $graph
+    {
+#for $blk in $graph['blocks']
+      ${blk['type']} ${blk['id']} = ${blk['make']};
+#for ($hint, $value) in $blk['tuning']
+      ${blk['id']}->set_${hint}($value);
+#end for
+#end for
+
+#for ($src, $src_port, $dst, $dst_port) in $graph['connections']
+      connect(#if $src == 'self' then 'self()' else $src#, $src_port, #if $dst == 'self' then 'self()' else $dst#, $dst_port);
+#end for
+    }
+#else if $blocktype == 'hier'
     {
         connect(self(), 0, d_firstblock, 0);
         // connect other blocks
         connect(d_lastblock, 0, self(), 0);
     }
+#else if $blocktype == 'message' or $volk or $tuning
+    {
+#if $blocktype == 'message'
+      message_port_register_in(pmt::pmt_intern("in"));
+      set_msg_handler(pmt::pmt_intern("in"),
+                      boost::bind(&${blockname}_impl::handle_msg, this, _1));
+      message_port_register_out(pmt::pmt_intern("out"));
+#end if
+#if $volk
+      // Make the scheduler hand out aligned buffers, so the aligned
+      // VOLK kernels can be used whenever possible
+      const int alignment_multiple = volk_get_alignment() / sizeof(${out_ctype});
+      set_alignment(std::max(1, alignment_multiple));
+#end if
+#if $tuning
+      // Buffer and latency tuning
+#for ($hook, $value) in $tuning
+      set_${hook}($value);
+#end for
+#end if
+    }
 #else
     {}
 #end if
@@ -175,8 +270,8 @@ namespace gr {
                        gr_vector_const_void_star &input_items,
                        gr_vector_void_star &output_items)
     {
-        const float *in = (const float *) input_items[0];
-        float *out = (float *) output_items[0];
+        const ${in_ctype} *in = (const ${in_ctype} *) input_items[0];
+        ${out_ctype} *out = (${out_ctype} *) output_items[0];
 
         // Do <+signal processing+>
         // Tell runtime system how many input items we consumed on
@@ -186,6 +281,44 @@ namespace gr {
         // Tell runtime system how many output items we produced.
         return noutput_items;
     }
+#else if $blocktype == 'tagged_stream'
+    int
+    ${blockname}_impl::calculate_output_stream_length(const gr_vector_int &ninput_items)
+    {
+      int noutput_items = /* <+set this+> */ ninput_items[0];
+      return noutput_items;
+    }
+
+    int
+    ${blockname}_impl::work (int noutput_items,
+                       gr_vector_int &ninput_items,
+                       gr_vector_const_void_star &input_items,
+                       gr_vector_void_star &output_items)
+    {
+        const ${in_ctype} *in = (const ${in_ctype} *) input_items[0];
+        ${out_ctype} *out = (${out_ctype} *) output_items[0];
+
+        // Get the tags of the whole packet with a single call, instead of
+        // looking for tags item by item. d_tags keeps its memory between calls.
+        get_tags_in_range(d_tags, 0, nitems_read(0), nitems_read(0) + ninput_items[0]);
+        for (size_t i = 0; i < d_tags.size(); i++) {
+          // <+handle tag+> at d_tags[i].offset - nitems_read(0)
+        }
+
+        // Do <+signal processing+>
+        int packet_len = ninput_items[0]; // <+length of the output packet+>
+
+        // Tell runtime system how many output items we produced.
+        // This is also written to the length tag of the output packet.
+        return packet_len;
+    }
+#else if $blocktype == 'message'
+    void
+    ${blockname}_impl::handle_msg(pmt::pmt_t msg)
+    {
+        // <+process the message+>
+        message_port_pub(pmt::pmt_intern("out"), msg);
+    }
 #else if $blocktype == 'hier'
 #silent pass
 #else
@@ -194,10 +327,26 @@ namespace gr {
 			  gr_vector_const_void_star &input_items,
 			  gr_vector_void_star &output_items)
     {
-        const float *in = (const float *) input_items[0];
-        float *out = (float *) output_items[0];
+        const ${in_ctype} *in = (const ${in_ctype} *) input_items[0];
+        ${out_ctype} *out = (${out_ctype} *) output_items[0];
 
+#if $volk
+#if $blocktype == 'decimator'
+        // Note: There are noutput_items * decimation() input items.
+#else if $blocktype == 'interpolator'
+        // Note: There are noutput_items / interpolation() input items.
+#end if
+        if (is_unaligned()) {
+          // Do <+signal processing+> with the unaligned VOLK kernel, e.g.
+          // volk_32f_s32f_multiply_32f_u(out, in, <+scalar+>, noutput_items);
+        }
+        else {
+          // Do <+signal processing+> with the aligned VOLK kernel, e.g.
+          // volk_32f_s32f_multiply_32f_a(out, in, <+scalar+>, noutput_items);
+        }
+#else
         // Do <+signal processing+>
+#end if
 
         // Tell runtime system how many output items we produced.
         return noutput_items;
@@ -275,60 +424,136 @@ ${str_to_python_comment($license)}
 #if $blocktype in ('sync', 'sink', 'source')
 #set $parenttype = 'gr.sync_block'
 #else
-#set $parenttype = {'hier': 'gr.hier_block2', 'interpolator': 'gr.interp_block', 'decimator': 'gr.decim_block', 'general': 'gr.basic_block'}[$blocktype]
+#set $parenttype = {'hier': 'gr.hier_block2', 'interpolator': 'gr.interp_block', 'decimator': 'gr.decim_block', 'general': 'gr.basic_block', 'message': 'gr.basic_block'}[$blocktype]
 #end if
 #if $blocktype != 'hier'
+#if $blocktype != 'message'
 import numpy
-#if $blocktype == 'source'
+#end if
+#if $blocktype in ('source', 'message')
 #set $inputsig = 'None'
-#else
+#else if $in_type is None
 #set $inputsig = '[<+numpy.float+>]'
+#else if $vlen > 1
+#set $inputsig = '[(%s, %d)]' % ($numpytypes[$in_type], $vlen)
+#else
+#set $inputsig = '[%s]' % $numpytypes[$in_type]
 #end if
-#if $blocktype == 'sink'
+#if $blocktype in ('sink', 'message')
 #set $outputsig = 'None'
-#else
+#else if $out_type is None
 #set $outputsig = '[<+numpy.float+>]'
+#else if $vlen > 1
+#set $outputsig = '[(%s, %d)]' % ($numpytypes[$out_type], $vlen)
+#else
+#set $outputsig = '[%s]' % $numpytypes[$out_type]
 #end if
 #else
-#if $blocktype == 'source'
-#set $inputsig = '0, 0, 0'
+#if $vlen > 1
+#set $vlen_factor = ' * %d' % $vlen
 #else
-#set $inputsig = '<+MIN_IN+>, <+MAX_IN+>, gr.sizeof_<+float+>'
+#set $vlen_factor = ''
 #end if
-#if $blocktype == 'sink'
-#set $outputsig = '0, 0, 0'
+#if $in_type
+#set $in_sizeof = $grsizeof[$in_type] + $vlen_factor
 #else
-#set $outputsig = '<+MIN_OUT+>, <+MAX_OUT+>, gr.sizeof_<+float+>'
+#set $in_sizeof = 'gr.sizeof_<+float+>'
+#end if
+#if $out_type
+#set $out_sizeof = $grsizeof[$out_type] + $vlen_factor
+#else
+#set $out_sizeof = 'gr.sizeof_<+float+>'
+#end if
+#if not $graph
+#set $inputsig = '<+MIN_IN+>, <+MAX_IN+>, ' + $in_sizeof
+#set $outputsig = '<+MIN_OUT+>, <+MAX_OUT+>, ' + $out_sizeof
+#else
+#if $graph['ninputs']
+#set $inputsig = '%d, %d, %s' % ($graph['ninputs'], $graph['ninputs'], $in_sizeof)
+#else
+#set $inputsig = '0, 0, 0'
+#end if
+#if $graph['noutputs']
+#set $outputsig = '%d, %d, %s' % ($graph['noutputs'], $graph['noutputs'], $out_sizeof)
+#else
+#set $outputsig = '0, 0, 0'
+#end if
 #end if
 #end if
 #if $blocktype == 'interpolator'
-#set $deciminterp = ', <+interpolation+>'
+#set $deciminterp = ', interp=interpolation'
 #else if $blocktype == 'decimator'
-#set $deciminterp = ', <+decimation+>'
+#set $deciminterp = ', decim=decimation'
 #else
 #set $deciminterp = ''
 #end if
 from gnuradio import gr
+#if $blocktype == 'message'
+from gruel import pmt
+#end if
+#if $graph
+#for $imp in $graph['imports']
+$imp
+#end for
+#end if
 
 class ${blockname}(${parenttype}):
-    """
+    \"\"\"
     docstring for block ${blockname}
-    """
+    \"\"\"
     def __init__(self#if $arglist == '' then '' else ', '#$arglist):
+#if $blocktype == 'decimator'
+        decimation = <+decimation+>
+#else if $blocktype == 'interpolator'
+        interpolation = <+interpolation+>
+#end if
         ${parenttype}.__init__(self,
 #if $blocktype == 'hier'
             "$blockname",
             gr.io_signature(${inputsig}),  # Input signature
             gr.io_signature(${outputsig})) # Output signature
 
-            # Define blocks and connect them
-            self.connect()
+        # Define blocks and connect them
+#if $graph
+#for $blk in $graph['blocks']
+        self.${blk['id']} = ${blk['make']}
+#for ($hint, $value) in $blk['tuning']
+        self.${blk['id']}.set_${hint}($value)
+#end for
+#end for
+#for ($src, $src_port, $dst, $dst_port) in $graph['connections']
+        self.connect((#if $src == 'self' then 'self' else 'self.' + $src#, $src_port), (#if $dst == 'self' then 'self' else 'self.' + $dst#, $dst_port))
+#end for
+#else
+        self.connect()
+#end if
 #stop
 #else
             name="${blockname}",
             in_sig=${inputsig},
             out_sig=${outputsig}${deciminterp})
 #end if
+#if $blocktype == 'decimator'
+        self._decimation = decimation
+#else if $blocktype == 'interpolator'
+        self._interpolation = interpolation
+#end if
+#if $tuning
+        # Buffer and latency tuning
+#for ($hook, $value) in $tuning
+        self.set_${hook}($value)
+#end for
+#end if
+#if $blocktype == 'message'
+        self.message_port_register_in(pmt.pmt_intern("in"))
+        self.set_msg_handler(pmt.pmt_intern("in"), self.handle_msg)
+        self.message_port_register_out(pmt.pmt_intern("out"))
+
+    def handle_msg(self, msg):
+        # <+process the message+>
+        self.message_port_pub(pmt.pmt_intern("out"), msg)
+#stop
+#end if
 
 #if $blocktype == 'general'
     def forecast(self, noutput_items, ninput_items_required):
@@ -337,13 +562,17 @@ class ${blockname}(${parenttype}):
             ninput_items_required[i] = noutput_items
 
     def general_work(self, input_items, output_items):
-        output_items[0][:] = input_items[0]
-        consume(0, len(input_items[0])
-        \#self.consume_each(len(input_items[0]))
-        return len(output_items[0])
+        in0 = input_items[0]
+        out = output_items[0]
+        nitems = min(len(in0), len(out))
+        # <+signal processing here+>
+        # Write into out in-place (out[:] = ... or numpy ufuncs with out=...),
+        # don't allocate new arrays in every call.
+        out[:nitems] = in0[:nitems]
+        self.consume_each(nitems)
+        return nitems
 #stop
 #end if
-
     def work(self, input_items, output_items):
 #if $blocktype != 'source'
         in0 = input_items[0]
@@ -352,14 +581,30 @@ class ${blockname}(${parenttype}):
         out = output_items[0]
 #end if
         # <+signal processing here+>
-#if $blocktype in ('sync', 'decimator', 'interpolator')
+#if $blocktype != 'sink'
+        # Write into out in-place (out[:] = ... or numpy ufuncs with out=...),
+        # don't allocate new arrays in every call.
+#end if
+#if $blocktype == 'sync'
+#if $in_type == 'complex' and $out_type == 'float'
+        numpy.absolute(in0, out=out)
+#else if $in_type == 'complex' and $out_type not in ('complex', None)
+        out[:] = in0.real
+#else
         out[:] = in0
-        return len(output_items[0])
+#end if
+        return len(out)
+#else if $blocktype == 'decimator'
+        out[:] = in0[::self._decimation]
+        return len(out)
+#else if $blocktype == 'interpolator'
+        out.reshape((len(in0), self._interpolation) + out.shape[1:])[:] = in0[:, numpy.newaxis]
+        return len(out)
 #else if $blocktype == 'sink'
-        return len(input_items[0])
+        return len(in0)
 #else if $blocktype == 'source'
-        out[:] = whatever
-        return len(output_items[0])
+        out.fill(0)
+        return len(out)
 #end if
 
 '''
@@ -372,6 +617,14 @@ ${str_to_fancyc_comment($license)}
 \#include <cppunit/TestAssert.h>
 
 \#include <$modname/${blockname}.h>
+#if $perf_cpp_qa
+\#include "${blockname}_impl.h"
+\#include <gr_io_signature.h>
+\#include <chrono>
+\#include <cstdlib>
+\#include <iostream>
+\#include <vector>
+#end if
 
 namespace gr {
   namespace ${modname} {
@@ -381,6 +634,58 @@ namespace gr {
     {
         // Put test here
     }
+#if $perf_cpp_qa
+
+    /*
+     * Calls work() directly, without a flow graph, on zeroed buffers which
+     * are aligned to 'alignment' bytes, and prints the time per item.
+     * Set QA_CPU_GHZ to the clock frequency of the CPU to get cycles per item.
+     * Note: work() can't use tags here, there is no scheduler.
+     */
+    void
+    qa_${blockname}::t2_time_work()
+    {
+        const int noutput_items = 8192;
+        const int ncalls = 1000;
+        const size_t alignment = 64;
+
+        ${blockname}::sptr blk = ${blockname}::make(<+arguments+>);
+        ${blockname}_impl *impl = dynamic_cast<${blockname}_impl *>(blk.get());
+        CPPUNIT_ASSERT(impl != NULL);
+
+        const int ninput_items = int(noutput_items / blk->relative_rate()) + blk->history() - 1;
+        const int ninputs = blk->input_signature()->min_streams();
+        const int noutputs = blk->output_signature()->min_streams();
+        gr_vector_const_void_star input_items(ninputs);
+        gr_vector_void_star output_items(noutputs);
+        std::vector<std::vector<char> > buffers;
+        for (int i = 0; i < ninputs + noutputs; i++) {
+          size_t nbytes = (i < ninputs)
+              ? ninput_items * blk->input_signature()->sizeof_stream_item(i)
+              : noutput_items * blk->output_signature()->sizeof_stream_item(i - ninputs);
+          buffers.push_back(std::vector<char>(nbytes + alignment, 0));
+          char *buf = &buffers.back()[0];
+          buf += (alignment - size_t(buf) % alignment) % alignment;
+          if (i < ninputs)
+            input_items[i] = buf;
+          else
+            output_items[i - ninputs] = buf;
+        }
+
+        impl->work(noutput_items, input_items, output_items); // Warm up caches
+        std::chrono::high_resolution_clock::time_point start = std::chrono::high_resolution_clock::now();
+        for (int i = 0; i < ncalls; i++) {
+          impl->work(noutput_items, input_items, output_items);
+        }
+        double ns = std::chrono::duration<double, std::nano>(std::chrono::high_resolution_clock::now() - start).count();
+        double ns_per_item = ns / (double(ncalls) * noutput_items);
+        std::cout << std::endl << "${blockname}::work(): " << ns_per_item << " ns/item";
+        if (getenv("QA_CPU_GHZ") != NULL) {
+          std::cout << ", " << ns_per_item * atof(getenv("QA_CPU_GHZ")) << " cycles/item";
+        }
+        std::cout << std::endl;
+    }
+#end if
 
   } /* namespace ${modname} */
 } /* namespace gr */
@@ -405,10 +710,16 @@ namespace gr {
     public:
       CPPUNIT_TEST_SUITE(qa_${blockname});
       CPPUNIT_TEST(t1);
+#if $perf_cpp_qa
+      CPPUNIT_TEST(t2_time_work);
+#end if
       CPPUNIT_TEST_SUITE_END();
 
     private:
       void t1();
+#if $perf_cpp_qa
+      void t2_time_work();
+#end if
     };
 
   } /* namespace ${modname} */
@@ -423,11 +734,56 @@ Templates['qa_python'] = '''\#!/usr/bin/env python
 ${str_to_python_comment($license)}
 #
 
+#if $perf_qa
+import os
+import time
+import ConfigParser
+#end if
 from gnuradio import gr, gr_unittest
+#if $blocktype in ('tagged_stream', 'message')
+from gruel import pmt
+#end if
+#if $blocktype == 'message'
+import time
+#end if
 #if $lang == 'cpp'
-import ${modname}_swig as ${modname}
+import ${bindings_module} as ${modname}
+#set $make_block = '%s.%s' % ($modname, $blockname)
 #else
 from ${blockname} import ${blockname}
+#set $make_block = $blockname
+#end if
+#if $in_type
+#set $in_suffix = $in_type[0]
+#else
+#set $in_suffix = '<+f+>'
+#end if
+#if $out_type
+#set $out_suffix = $out_type[0]
+#else
+#set $out_suffix = '<+f+>'
+#end if
+#if $perf_qa
+#if $vlen > 1
+#set $vlen_factor = ' * %d' % $vlen
+#set $vlen_arg = ', %d' % $vlen
+#set $vlen_divisor = ' / %d' % $vlen
+#else
+#set $vlen_factor = ''
+#set $vlen_arg = ''
+#set $vlen_divisor = ''
+#end if
+#set $in_itemsize = $grsizeof.get($in_type, 'gr.sizeof_<+float+>') + $vlen_factor
+#set $out_itemsize = $grsizeof.get($out_type, 'gr.sizeof_<+float+>') + $vlen_factor
+
+def read_perf_config(section):
+    \""" Return (nitems, min_throughput) for a block from perf.cfg,
+    which is in the same directory as this file. \"""
+    cfg = ConfigParser.SafeConfigParser({'nitems': '1000000', 'min_throughput': '0'})
+    cfg.read(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'perf.cfg'))
+    if not cfg.has_section(section):
+        return (int(cfg.defaults()['nitems']), float(cfg.defaults()['min_throughput']))
+    return (cfg.getint(section, 'nitems'), cfg.getfloat(section, 'min_throughput'))
 #end if
 
 class qa_$blockname (gr_unittest.TestCase):
@@ -439,22 +795,243 @@ class qa_$blockname (gr_unittest.TestCase):
         self.tb = None
 
     def test_001_t (self):
+#if $blocktype == 'tagged_stream'
+        # set up fg: one packet, with a length tag on its first item
+        src_data = <+packet+>
+        tag = gr.gr_tag_t()
+        tag.offset = 0
+        tag.key = pmt.pmt_intern("${len_tag_key}")
+        tag.value = pmt.pmt_from_long(len(src_data))
+        src = gr.vector_source_${in_suffix}(src_data, False, 1, (tag,))
+        dut = ${make_block}(<+arguments+>)
+        dst = gr.vector_sink_${out_suffix}()
+        self.tb.connect(src, dut, dst)
+        self.tb.run ()
+        # check data
+        # The output packet must have exactly one length tag, and
+        # its value must be the length of the output packet.
+        len_tags = [t for t in dst.tags() if pmt.pmt_symbol_to_string(t.key) == "${len_tag_key}"]
+        self.assertEqual(len(len_tags), 1)
+        self.assertEqual(pmt.pmt_to_long(len_tags[0].value), len(dst.data()))
+#else if $blocktype == 'message'
+        # set up fg
+        dut = ${make_block}(<+arguments+>)
+        dbg = gr.message_debug()
+        self.tb.msg_connect(dut, "out", dbg, "store")
+        self.tb.start ()
+        dut.to_basic_block()._post(pmt.pmt_intern("in"), <+message+>)
+        time.sleep(0.1)
+        self.tb.stop ()
+        self.tb.wait ()
+        # check data
+        self.assertEqual(dbg.num_messages(), 1)
+#else if $perf_qa
+        # set up fg
+#if $blocktype != 'source'
+        src_data = <+input data+>
+        src = gr.vector_source_${in_suffix}(src_data, False$vlen_arg)
+#end if
+        dut = ${make_block}(<+arguments+>)
+#if $blocktype == 'sink'
+        self.tb.connect(src, dut)
+        self.tb.run ()
+        # check data
+        # <+check the state of dut+>
+#else
+#if $blocktype == 'source'
+        expected_result = <+expected output+>
+        head = gr.head($out_itemsize, len(expected_result)$vlen_divisor)
+        dst = gr.vector_sink_${out_suffix}(${vlen_arg[2:]})
+        self.tb.connect(dut, head, dst)
+#else
+        expected_result = <+expected output+>
+        dst = gr.vector_sink_${out_suffix}(${vlen_arg[2:]})
+        self.tb.connect(src, dut, dst)
+#end if
+        self.tb.run ()
+        # check data
+        self.assertFloatTuplesAlmostEqual(expected_result, dst.data(), 6)
+#end if
+
+    def test_002_throughput (self):
+        \""" Push nitems items through the block and fail if the throughput is
+        below min_throughput (both are set in perf.cfg, a min_throughput of 0
+        disables the check). \"""
+        (nitems, min_throughput) = read_perf_config("${blockname}")
+#if $blocktype == 'source'
+        itemsize = $out_itemsize
+#else
+        itemsize = $in_itemsize
+#end if
+        dut = ${make_block}(<+arguments+>)
+        head = gr.head(itemsize, nitems)
+#if $blocktype == 'source'
+        self.tb.connect(dut, head, gr.null_sink(itemsize))
+#else if $blocktype == 'sink'
+        self.tb.connect(gr.null_source(itemsize), head, dut)
+#else
+        self.tb.connect(gr.null_source(itemsize), head, dut, gr.null_sink($out_itemsize))
+#end if
+        start = time.time()
+        self.tb.run ()
+        throughput = nitems / max(time.time() - start, 1e-9)
+        print "${blockname}: %.1f items/s (minimum: %.1f items/s)" % (throughput, min_throughput)
+        if min_throughput > 0:
+            self.assertGreaterEqual(throughput, min_throughput)
+#else
         # set up fg
         self.tb.run ()
         # check data
+#end if
 
 
 if __name__ == '__main__':
     gr_unittest.run(qa_${blockname}, "qa_${blockname}.xml")
 '''
 
+# Performance thresholds for the Python QA (python/perf.cfg)
+Templates['perf_cfg'] = '''# Settings for the throughput tests in the Python QA code (qa_*.py,
+# test_002_throughput). Every block has its own section:
+# nitems is the number of items pushed through the block, min_throughput
+# the minimum number of items per second. A min_throughput of 0 only
+# prints the throughput and never fails.
+[DEFAULT]
+nitems = 1000000
+min_throughput = 0
+'''
+
+# Section of a block in python/perf.cfg
+Templates['perf_cfg_section'] = '''
+[${blockname}]
+nitems = 1000000
+min_throughput = 0
+'''
+
+# Python throughput benchmark
+Templates['bm_python'] = '''\#!/usr/bin/env python
+${str_to_python_comment($license)}
+#
+""" Throughput benchmark for ${blockname}: Runs the block between a null
+source, a head block and a null sink and reports samples/s and ns/item. """
+
+import os
+import sys
+import time
+import json
+from optparse import OptionParser
+from gnuradio import gr
+#if $lang == 'cpp'
+import ${bindings_module} as ${modname}
+#set $make_block = '%s.%s' % ($modname, $blockname)
+#else
+from ${blockname} import ${blockname}
+#set $make_block = $blockname
+#end if
+#if $vlen > 1
+#set $vlen_factor = ' * %d' % $vlen
+#else
+#set $vlen_factor = ''
+#end if
+#if $in_type
+#set $in_itemsize = $grsizeof[$in_type] + $vlen_factor
+#else
+#set $in_itemsize = 'gr.sizeof_float # <+input item size+>'
+#end if
+#if $out_type
+#set $out_itemsize = $grsizeof[$out_type] + $vlen_factor
+#else
+#set $out_itemsize = 'gr.sizeof_float # <+output item size+>'
+#end if
+
+# Exit code of a benchmark that can't run yet, run_perf.py skips it
+EXIT_SKIPPED = 77
+NEEDS_VALUE = object()
+
+# The constructor arguments of the block, in order. Arguments without a
+# default value need to be set before the benchmark runs.
+BLOCK_ARGS = (
+#for ($name, $value) in $get_python_arg_values($arglist)
+    ('${name}', #if $value is None then 'NEEDS_VALUE' else $value#),
+#end for
+)
+
+def make_block():
+    """ Return the block under test. """
+    return ${make_block}(*[value for (name, value) in BLOCK_ARGS])
+
+def run_once(nitems, in_itemsize, out_itemsize, max_noutput_items=None):
+    """ Push nitems items through the block, return the time it took. """
+    tb = gr.top_block()
+    block = make_block()
+#if $blocktype == 'source'
+    tb.connect(block, gr.head(out_itemsize, nitems), gr.null_sink(out_itemsize))
+#else if $blocktype == 'sink'
+    tb.connect(gr.null_source(in_itemsize), gr.head(in_itemsize, nitems), block)
+#else
+    tb.connect(gr.null_source(in_itemsize), gr.head(in_itemsize, nitems),
+               block, gr.null_sink(out_itemsize))
+#end if
+    start = time.time()
+    if max_noutput_items is None:
+        tb.run()
+    else:
+        tb.run(max_noutput_items)
+    return time.time() - start
+
+def main():
+    parser = OptionParser(usage='%prog [options]')
+    parser.add_option("-n", "--nitems", type="int", default=10000000,
+            help="Number of items per run.")
+    parser.add_option("-r", "--runs", type="int", default=5,
+            help="Number of runs.")
+    parser.add_option("-m", "--max-noutput-items", type="int", default=None,
+            help="Maximum number of items per call of work().")
+    parser.add_option("--json", action="store_true", default=False,
+            help="Print the results as one line of JSON.")
+    (options, args) = parser.parse_args()
+    missing = [name for (name, value) in BLOCK_ARGS if value is NEEDS_VALUE]
+    if len(missing):
+        print >> sys.stderr, "Skipped: set %s in BLOCK_ARGS of %s." % (
+                ', '.join(missing), os.path.basename(__file__))
+        sys.exit(EXIT_SKIPPED)
+    in_itemsize = $in_itemsize
+    out_itemsize = $out_itemsize
+    times = [run_once(options.nitems, in_itemsize, out_itemsize, options.max_noutput_items)
+             for i in range(options.runs)]
+    if options.json:
+        print json.dumps({'block': '${blockname}',
+                          'nitems': options.nitems,
+                          'runs': options.runs,
+                          'max_noutput_items': options.max_noutput_items,
+                          'best': options.nitems / min(times),
+                          'mean': options.nitems * len(times) / sum(times),
+                          'ns_per_item': min(times) * 1e9 / options.nitems})
+        return
+    print "${blockname}: %d items, %d runs" % (options.nitems, options.runs)
+    for (label, t) in (('best', min(times)), ('mean', sum(times) / len(times))):
+        print "  %s: %14.1f samples/s %10.3f ns/item" % (label,
+                                                         options.nitems / t,
+                                                         t * 1e9 / options.nitems)
+
+if __name__ == '__main__':
+    main()
+'''
+
 Templates['grc_xml'] = '''<?xml version="1.0"?>
 <block>
   <name>$blockname</name>
   <key>${modname}_$blockname</key>
   <category>$modname</category>
   <import>import $modname</import>
+#if $tuning
+  <make>${modname}.${blockname}(${strip_arg_types($arglist)})
+#for ($hook, $value) in $tuning
+self.\$(id).set_${hook}(\$${hook})
+#end for
+</make>
+#else
   <make>${modname}.${blockname}(${strip_arg_types($arglist)})</make>
+#end if
   <!-- Make one 'param' node for every Parameter you want settable from the GUI.
        Sub-nodes:
        * name
@@ -465,6 +1042,18 @@ Templates['grc_xml'] = '''<?xml version="1.0"?>
     <key>...</key>
     <type>...</type>
   </param>
+#if $tuning
+#set $tuning_names = {'output_multiple': 'Output Multiple', 'history': 'History', 'min_output_buffer': 'Min Output Buffer', 'max_output_buffer': 'Max Output Buffer', 'relative_rate': 'Relative Rate'}
+#for ($hook, $value) in $tuning
+  <param>
+    <name>$tuning_names[$hook]</name>
+    <key>$hook</key>
+    <value>$value</value>
+    <type>#if $hook == 'relative_rate' then 'real' else 'int'#</type>
+    <hide>part</hide>
+  </param>
+#end for
+#end if
 
   <!-- Make one 'sink' node per input. Sub-nodes:
        * name (an identifier for the GUI)
@@ -473,7 +1062,17 @@ Templates['grc_xml'] = '''<?xml version="1.0"?>
        * optional (set to 1 for optional inputs) -->
   <sink>
     <name>in</name>
+#if $blocktype == 'message'
+    <type>message</type>
+    <optional>1</optional>
+#else if $in_type
+    <type>$in_type</type>
+#if $vlen > 1
+    <vlen>$vlen</vlen>
+#end if
+#else
     <type><!-- e.g. int, real, complex, byte, short, xxx_vector, ...--></type>
+#end if
   </sink>
 
   <!-- Make one 'source' node per output. Sub-nodes:
@@ -483,8 +1082,21 @@ Templates['grc_xml'] = '''<?xml version="1.0"?>
        * optional (set to 1 for optional inputs) -->
   <source>
     <name>out</name>
+#if $blocktype == 'message'
+    <type>message</type>
+    <optional>1</optional>
+#else if $out_type
+    <type>$out_type</type>
+#if $vlen > 1
+    <vlen>$vlen</vlen>
+#end if
+#else
     <type><!-- e.g. int, real, complex, byte, short, xxx_vector, ...--></type>
+#end if
   </source>
+#if $blocktype == 'tagged_stream'
+  <doc>Tagged stream block: Every input packet starts with a '${len_tag_key}' tag which holds its length.</doc>
+#end if
 </block>
 '''
 
@@ -496,14 +1108,122 @@ gr_modtool help <command> -- Shows the help for a given command. '''
 
 # SWIG string
 Templates['swig_block_magic'] = """#if $version == '36'
+#for $method in $getVar('release_gil', [])
+%thread ${modname}_${blockname}::${method};
+#end for
 GR_SWIG_BLOCK_MAGIC($modname, $blockname);
 %include "${modname}_${blockname}.h"
 #else
+#for $method in $getVar('release_gil', [])
+%thread gr::${modname}::${blockname}::${method};
+#end for
 %include "${modname}/${blockname}.h"
 GR_SWIG_BLOCK_MAGIC2($modname, $blockname);
 #end if
 """
 
+# SWIG file of a single block or a group of blocks (add --swig-split)
+Templates['swig_group_file'] = """/* -*- c++ -*- */
+
+\#define ${modname.upper()}_API
+
+// Don't release the GIL, unless a call is marked with %thread
+// (only has an effect with ENABLE_FAST_SWIG, see CMakeLists.txt)
+%nothread;
+
+%include "gnuradio.i"			// the common stuff
+
+//load generated python docstrings
+%include "${swigname}_doc.i"
+
+%{
+%}
+
+"""
+
+# CMake entry for a SWIG module of a single block or a group of blocks.
+# Every line contains the module name, so rm and disable can find them.
+Templates['swig_group_cmakeentry'] = """
+# SWIG module ${swigname}
+set(GR_SWIG_DOC_FILE \${CMAKE_CURRENT_BINARY_DIR}/${swigname}_doc.i)
+#if $has_block_profile
+GR_BLOCK_PROFILE_FILE(${swigname}.i ${swigname}_i)
+GR_SWIG_MAKE(${swigname} \${${swigname}_i})
+#else
+GR_SWIG_MAKE(${swigname} ${swigname}.i)
+#end if
+GR_SWIG_INSTALL(TARGETS ${swigname} DESTINATION \${GR_PYTHON_DIR}/${modname})
+install(FILES ${swigname}.i \${CMAKE_CURRENT_BINARY_DIR}/${swigname}_doc.i DESTINATION \${GR_INCLUDE_DIR}/${modname}/swig)
+"""
+
+# pybind11 binding of a block (add --bindings pybind11). The arguments
+# of make() come from ParserCCBlock.read_params(). to_basic_block()
+# returns the SWIG object the flow graph code of gnuradio.gr expects.
+Templates['pybind_block'] = '''/* -*- c++ -*- */
+${str_to_fancyc_comment($license)}
+\#include <pybind11/pybind11.h>
+\#include <pybind11/stl.h>
+\#include <pybind11/complex.h>
+\#include <boost/shared_ptr.hpp>
+\#include <gr_basic_block.h>
+\#include <stdexcept>
+\#include "swigpyrun.h"
+
+#if $version == '37'
+\#include <${modname}/${blockname}.h>
+#set $cls = 'gr::%s::%s' % ($modname, $blockname)
+#set $sptr = '%s::sptr' % $cls
+#set $make = '%s::make' % $cls
+#else
+\#include <${modname}_${blockname}.h>
+#set $cls = '%s_%s' % ($modname, $blockname)
+#set $sptr = '%s_%s_sptr' % ($modname, $blockname)
+#set $make = '%s_make_%s' % ($modname, $blockname)
+#end if
+
+namespace py = pybind11;
+
+// The blocks are held in boost::shared_ptrs, like in the SWIG bindings
+PYBIND11_DECLARE_HOLDER_TYPE(T, boost::shared_ptr<T>);
+
+// gr.top_block.connect() etc. only take SWIG objects: wrap the block as
+// the gr_basic_block_sptr of the SWIG bindings of gnuradio.gr
+static py::object to_basic_block(${sptr} self)
+{
+    py::module::import("gnuradio.gr");
+    swig_type_info *type = SWIG_TypeQuery("boost::shared_ptr< gr_basic_block > *");
+    if (type == NULL)
+        throw std::runtime_error("gnuradio.gr has no SWIG type gr_basic_block_sptr");
+    return py::reinterpret_steal<py::object>(
+            SWIG_NewPointerObj(new gr_basic_block_sptr(self), type, SWIG_POINTER_OWN));
+}
+
+PYBIND11_MODULE(${bindings_module}, m)
+{
+    m.doc() = "pybind11 bindings of ${modname}.${blockname}";
+
+    py::class_<${cls}, ${sptr} >(m, "${blockname}")
+#if len($params)
+        .def(py::init(&${make}),
+#for $param in $params[:-1]
+             py::arg("${param['key']}")#if $param['default'] then ' = ' + $param['default'].strip() else ''#,
+#end for
+             py::arg("${params[-1]['key']}")#if $params[-1]['default'] then ' = ' + $params[-1]['default'].strip() else ''#)
+#else
+        .def(py::init(&${make}))
+#end if
+        .def("to_basic_block", &to_basic_block)
+#for $method in $release_gil
+        .def("${method}", &${cls}::${method}, py::call_guard<py::gil_scoped_release>())
+#end for
+        ;
+}
+'''
+
+# CMake entry for the binding of a block, one line per block
+Templates['pybind_cmakeentry'] = """GR_PYBIND_MAKE(${bindings_module} ${blockname}_python.cc)
+"""
+
 ## Old stuff
 # C++ file of a GR block
 Templates['block_cpp36'] = '''/* -*- c++ -*- */
@@ -515,6 +1235,18 @@ ${str_to_fancyc_comment($license)}
 #if $blocktype != 'noblock'
 \#include <gr_io_signature.h>
 #end if
+#if $volk
+\#include <volk/volk.h>
+\#include <algorithm>
+#end if
+#if $blocktype == 'message'
+\#include <boost/bind.hpp>
+#end if
+#if $graph
+#for $inc in $graph['includes']
+\#include <$inc>
+#end for
+#end if
 \#include "${modname}_${blockname}.h"
 
 #if $blocktype == 'noblock'
@@ -536,18 +1268,51 @@ ${modname}_make_${blockname} (${strip_default_values($arglist)})
 #set $decimation = ', <+decimation+>'
 #else if $blocktype == 'interpolator'
 #set $decimation = ', <+interpolation+>'
+#else if $blocktype == 'tagged_stream'
+#set $decimation = ', "%s"' % $len_tag_key
 #else
 #set $decimation = ''
 #end if
-#if $blocktype == 'sink'
+#if $vlen > 1
+#set $vlen_factor = ' * %d' % $vlen
+#else
+#set $vlen_factor = ''
+#end if
+#if $in_type
+#set $in_ctype = $ctypes[$in_type]
+#set $in_sizeof = 'sizeof (%s)%s' % ($in_ctype, $vlen_factor)
+#else
+#set $in_ctype = 'float'
+#set $in_sizeof = 'sizeof (<+float+>)'
+#end if
+#if $out_type
+#set $out_ctype = $ctypes[$out_type]
+#set $out_sizeof = 'sizeof (%s)%s' % ($out_ctype, $vlen_factor)
+#else
+#set $out_ctype = 'float'
+#set $out_sizeof = 'sizeof (<+float+>)'
+#end if
+#if $blocktype in ('source', 'message')
 #set $inputsig = '0, 0, 0'
 #else
-#set $inputsig = '<+MIN_IN+>, <+MAX_IN+>, sizeof (<+float+>)'
+#set $inputsig = '<+MIN_IN+>, <+MAX_IN+>, ' + $in_sizeof
 #end if
-#if $blocktype == 'source'
+#if $blocktype in ('sink', 'message')
 #set $outputsig = '0, 0, 0'
 #else
-#set $outputsig = '<+MIN_OUT+>, <+MAX_OUT+>, sizeof (<+float+>)'
+#set $outputsig = '<+MIN_OUT+>, <+MAX_OUT+>, ' + $out_sizeof
+#end if
+#if $graph
+#if $graph['ninputs']
+#set $inputsig = '%d, %d, %s' % ($graph['ninputs'], $graph['ninputs'], $in_sizeof)
+#else
+#set $inputsig = '0, 0, 0'
+#end if
+#if $graph['noutputs']
+#set $outputsig = '%d, %d, %s' % ($graph['noutputs'], $graph['noutputs'], $out_sizeof)
+#else
+#set $outputsig = '0, 0, 0'
+#end if
 #end if
 
 /*
@@ -558,13 +1323,40 @@ ${modname}_${blockname}::${modname}_${blockname} (${strip_default_values($arglis
 		   gr_make_io_signature($inputsig),
 		   gr_make_io_signature($outputsig)$decimation)
 {
-#if $blocktype == 'hier'
+#if $blocktype == 'hier' and $graph
+#for $blk in $graph['blocks']
+	${blk['type']} ${blk['id']} = ${blk['make']};
+#for ($hint, $value) in $blk['tuning']
+	${blk['id']}->set_${hint}($value);
+#end for
+#end for
+
+#for ($src, $src_port, $dst, $dst_port) in $graph['connections']
+	connect(#if $src == 'self' then 'self()' else $src#, $src_port, #if $dst == 'self' then 'self()' else $dst#, $dst_port);
+#end for
+#else if $blocktype == 'hier'
 		connect(self(), 0, d_firstblock, 0);
 		// <+connect other blocks+>
 		connect(d_lastblock, 0, self(), 0);
+#else if $blocktype == 'message'
+	message_port_register_in(pmt::pmt_intern("in"));
+	set_msg_handler(pmt::pmt_intern("in"),
+			boost::bind(&${modname}_${blockname}::handle_msg, this, _1));
+	message_port_register_out(pmt::pmt_intern("out"));
+#else if $volk
+	// Make the scheduler hand out aligned buffers, so the aligned
+	// VOLK kernels can be used whenever possible
+	const int alignment_multiple = volk_get_alignment() / sizeof(${out_ctype});
+	set_alignment(std::max(1, alignment_multiple));
 #else
 	// Put in <+constructor stuff+> here
 #end if
+#if $tuning
+	// Buffer and latency tuning
+#for ($hook, $value) in $tuning
+	set_${hook}($value);
+#end for
+#end if
 }
 
 
@@ -591,8 +1383,8 @@ ${modname}_${blockname}::general_work (int noutput_items,
 				   gr_vector_const_void_star &input_items,
 				   gr_vector_void_star &output_items)
 {
-	const float *in = (const float *) input_items[0];
-	float *out = (float *) output_items[0];
+	const ${in_ctype} *in = (const ${in_ctype} *) input_items[0];
+	${out_ctype} *out = (${out_ctype} *) output_items[0];
 
 	// Do <+signal processing+>
 	// Tell runtime system how many input items we consumed on
@@ -602,6 +1394,44 @@ ${modname}_${blockname}::general_work (int noutput_items,
 	// Tell runtime system how many output items we produced.
 	return noutput_items;
 }
+#else if $blocktype == 'tagged_stream'
+int
+${modname}_${blockname}::calculate_output_stream_length(const gr_vector_int &ninput_items)
+{
+	int noutput_items = /* <+set this+> */ ninput_items[0];
+	return noutput_items;
+}
+
+int
+${modname}_${blockname}::work (int noutput_items,
+			   gr_vector_int &ninput_items,
+			   gr_vector_const_void_star &input_items,
+			   gr_vector_void_star &output_items)
+{
+	const ${in_ctype} *in = (const ${in_ctype} *) input_items[0];
+	${out_ctype} *out = (${out_ctype} *) output_items[0];
+
+	// Get the tags of the whole packet with a single call, instead of
+	// looking for tags item by item. d_tags keeps its memory between calls.
+	get_tags_in_range(d_tags, 0, nitems_read(0), nitems_read(0) + ninput_items[0]);
+	for (size_t i = 0; i < d_tags.size(); i++) {
+		// <+handle tag+> at d_tags[i].offset - nitems_read(0)
+	}
+
+	// Do <+signal processing+>
+	int packet_len = ninput_items[0]; // <+length of the output packet+>
+
+	// Tell runtime system how many output items we produced.
+	// This is also written to the length tag of the output packet.
+	return packet_len;
+}
+#else if $blocktype == 'message'
+void
+${modname}_${blockname}::handle_msg(pmt::pmt_t msg)
+{
+	// <+process the message+>
+	message_port_pub(pmt::pmt_intern("out"), msg);
+}
 #else if $blocktype == 'hier' or $blocktype == 'noblock'
 #pass
 #else
@@ -610,10 +1440,26 @@ ${modname}_${blockname}::work(int noutput_items,
 		  gr_vector_const_void_star &input_items,
 		  gr_vector_void_star &output_items)
 {
-	const float *in = (const float *) input_items[0];
-	float *out = (float *) output_items[0];
+	const ${in_ctype} *in = (const ${in_ctype} *) input_items[0];
+	${out_ctype} *out = (${out_ctype} *) output_items[0];
 
+#if $volk
+#if $blocktype == 'decimator'
+	// Note: There are noutput_items * decimation() input items.
+#else if $blocktype == 'interpolator'
+	// Note: There are noutput_items / interpolation() input items.
+#end if
+	if (is_unaligned()) {
+		// Do <+signal processing+> with the unaligned VOLK kernel, e.g.
+		// volk_32f_s32f_multiply_32f_u(out, in, <+scalar+>, noutput_items);
+	}
+	else {
+		// Do <+signal processing+> with the aligned VOLK kernel, e.g.
+		// volk_32f_s32f_multiply_32f_a(out, in, <+scalar+>, noutput_items);
+	}
+#else
 	// Do <+signal processing+>
+#end if
 
 	// Tell runtime system how many output items we produced.
 	return noutput_items;
@@ -658,6 +1504,13 @@ class ${modname.upper()}_API ${modname}_${blockname} : public $grblocktype
 	friend ${modname.upper()}_API ${modname}_${blockname}_sptr ${modname}_make_${blockname} (${strip_default_values($arglist)});
 
 	${modname}_${blockname}(${strip_default_values($arglist)});
+#if $blocktype == 'tagged_stream'
+
+	std::vector<gr_tag_t> d_tags;
+
+ protected:
+	int calculate_output_stream_length(const gr_vector_int &ninput_items);
+#end if
 
  public:
   ~${modname}_${blockname}();
@@ -670,6 +1523,15 @@ class ${modname.upper()}_API ${modname}_${blockname} : public $grblocktype
 	    gr_vector_int &ninput_items,
 	    gr_vector_const_void_star &input_items,
 	    gr_vector_void_star &output_items);
+#else if $blocktype == 'tagged_stream'
+	// Where all the action really happens
+	int work (int noutput_items,
+	    gr_vector_int &ninput_items,
+	    gr_vector_const_void_star &input_items,
+	    gr_vector_void_star &output_items);
+#else if $blocktype == 'message'
+	// Handles the messages arriving on the 'in' port
+	void handle_msg(pmt::pmt_t msg);
 #else if $blocktype == 'hier'
 #pass
 #else
@@ -690,6 +1552,14 @@ Templates['qa_cpp36'] = '''/* -*- c++ -*- */
 ${str_to_fancyc_comment($license)}
 
 \#include <boost/test/unit_test.hpp>
+#if $perf_cpp_qa
+\#include <${modname}_${blockname}.h>
+\#include <gr_io_signature.h>
+\#include <chrono>
+\#include <cstdlib>
+\#include <iostream>
+\#include <vector>
+#end if
 
 BOOST_AUTO_TEST_CASE(qa_${modname}_${blockname}_t1){
     BOOST_CHECK_EQUAL(2 + 2, 4);
@@ -700,6 +1570,54 @@ BOOST_AUTO_TEST_CASE(qa_${modname}_${blockname}_t2){
     BOOST_CHECK_EQUAL(2 + 2, 4);
     // TODO BOOST_* test macros here
 }
+#if $perf_cpp_qa
+
+/*
+ * Calls work() directly, without a flow graph, on zeroed buffers which
+ * are aligned to 'alignment' bytes, and prints the time per item.
+ * Set QA_CPU_GHZ to the clock frequency of the CPU to get cycles per item.
+ * Note: work() can't use tags here, there is no scheduler.
+ */
+BOOST_AUTO_TEST_CASE(qa_${modname}_${blockname}_time_work){
+    const int noutput_items = 8192;
+    const int ncalls = 1000;
+    const size_t alignment = 64;
+
+    ${modname}_${blockname}_sptr blk = ${modname}_make_${blockname}(<+arguments+>);
+
+    const int ninput_items = int(noutput_items / blk->relative_rate()) + blk->history() - 1;
+    const int ninputs = blk->input_signature()->min_streams();
+    const int noutputs = blk->output_signature()->min_streams();
+    gr_vector_const_void_star input_items(ninputs);
+    gr_vector_void_star output_items(noutputs);
+    std::vector<std::vector<char> > buffers;
+    for (int i = 0; i < ninputs + noutputs; i++) {
+        size_t nbytes = (i < ninputs)
+            ? ninput_items * blk->input_signature()->sizeof_stream_item(i)
+            : noutput_items * blk->output_signature()->sizeof_stream_item(i - ninputs);
+        buffers.push_back(std::vector<char>(nbytes + alignment, 0));
+        char *buf = &buffers.back()[0];
+        buf += (alignment - size_t(buf) % alignment) % alignment;
+        if (i < ninputs)
+            input_items[i] = buf;
+        else
+            output_items[i - ninputs] = buf;
+    }
+
+    blk->work(noutput_items, input_items, output_items); // Warm up caches
+    std::chrono::high_resolution_clock::time_point start = std::chrono::high_resolution_clock::now();
+    for (int i = 0; i < ncalls; i++) {
+        blk->work(noutput_items, input_items, output_items);
+    }
+    double ns = std::chrono::duration<double, std::nano>(std::chrono::high_resolution_clock::now() - start).count();
+    double ns_per_item = ns / (double(ncalls) * noutput_items);
+    std::cout << "${modname}_${blockname}::work(): " << ns_per_item << " ns/item";
+    if (getenv("QA_CPU_GHZ") != NULL) {
+        std::cout << ", " << ns_per_item * atof(getenv("QA_CPU_GHZ")) << " cycles/item";
+    }
+    std::cout << std::endl;
+}
+#end if
 
 '''
 
@@ -710,3 +1628,135 @@ target_link_libraries($basename gnuradio-$modname \${Boost_LIBRARIES})
 GR_ADD_TEST($basename $basename)
 """
 
+# Compile flags for QA files which use std::chrono
+Templates['qa_cxx11_cmakeentry'] = """
+if(CMAKE_COMPILER_IS_GNUCXX OR CMAKE_CXX_COMPILER_ID MATCHES "Clang")
+  # These QA files time work() with std::chrono, which needs C++11
+  set_source_files_properties(#echo ' '.join($qa_files)#
+    PROPERTIES COMPILE_FLAGS "-std=c++11")
+endif()
+"""
+
+# CMake find module for VOLK (written by 'add --volk' if missing)
+Templates['find_volk_cmake'] = """INCLUDE(FindPkgConfig)
+PKG_CHECK_MODULES(PC_VOLK volk)
+
+FIND_PATH(
+    VOLK_INCLUDE_DIRS
+    NAMES volk/volk.h
+    HINTS \$ENV{VOLK_DIR}/include
+        \${PC_VOLK_INCLUDEDIR}
+    PATHS /usr/local/include
+          /usr/include
+)
+
+FIND_LIBRARY(
+    VOLK_LIBRARIES
+    NAMES volk
+    HINTS \$ENV{VOLK_DIR}/lib
+        \${PC_VOLK_LIBDIR}
+    PATHS /usr/local/lib
+          /usr/local/lib64
+          /usr/lib
+          /usr/lib64
+)
+
+INCLUDE(FindPackageHandleStandardArgs)
+FIND_PACKAGE_HANDLE_STANDARD_ARGS(VOLK DEFAULT_MSG VOLK_LIBRARIES VOLK_INCLUDE_DIRS)
+MARK_AS_ADVANCED(VOLK_LIBRARIES VOLK_INCLUDE_DIRS)
+"""
+
+# Top-level CMake lines to find VOLK
+Templates['volk_cmakeentry'] = """find_package(Volk)
+
+if(NOT VOLK_FOUND)
+    message(FATAL_ERROR "Volk required to compile $modname")
+endif()
+"""
+
+# CMake entry for a benchmark (not part of 'make test', run with 'make benchmark')
+Templates['bm_cmakeentry'] = """
+#if not $has_benchmark_target
+add_custom_target(benchmark)
+#end if
+add_custom_target(benchmark_$blockname env PYTHONPATH=\${CMAKE_BINARY_DIR}/#if $bindings == 'pybind11' then 'pybind' else 'swig'#:\${CMAKE_CURRENT_SOURCE_DIR}:\$ENV{PYTHONPATH} \${PYTHON_EXECUTABLE} \${CMAKE_CURRENT_SOURCE_DIR}/bm_${blockname}.py)
+add_dependencies(benchmark benchmark_$blockname)
+"""
+
+
+# Compiler launcher for 'gr_modtool buildtime': times every compiler call
+Templates['buildtime_launcher'] = '''\#!/usr/bin/env python
+""" Compiler launcher written by 'gr_modtool buildtime'. Usage:
+  buildtime_launcher.py LOGFILE COMPILER [ARGS...]
+Runs the compiler and appends one line of JSON per source to LOGFILE: the
+wall time, and the frontend/backend split from the time report of the
+compiler (-ftime-report for GCC, -ftime-trace for clang). """
+
+import os
+import re
+import sys
+import json
+import time
+import subprocess
+
+def gcc_time_report(stderr):
+    """ Split the output of -ftime-report off the compiler messages,
+    return (frontend seconds, backend seconds, remaining messages) """
+    frontend = backend = None
+    messages = []
+    in_report = False
+    for line in stderr.splitlines(True):
+        if line.startswith('Time variable'):
+            in_report = True
+            frontend = backend = 0.0
+            continue
+        if not in_report:
+            messages.append(line)
+            continue
+        phase = re.match(r'\\s*phase (.+?)\\s*:(?:\\s*[\\d.]+\\s*\\(\\s*\\d+%\\)){2}\\s*([\\d.]+)', line)
+        if phase is not None:
+            if phase.group(1) in ('setup', 'parsing', 'lang. deferred'):
+                frontend += float(phase.group(2))
+            elif phase.group(1) != 'finalize':
+                backend += float(phase.group(2))
+        if line.strip().startswith('TOTAL'):
+            in_report = False
+    return (frontend, backend, ''.join(messages))
+
+def clang_time_trace(objfile):
+    """ Read the -ftime-trace file of an object file,
+    return (frontend seconds, backend seconds) """
+    try:
+        trace = json.load(open(os.path.splitext(objfile)[0] + '.json'))
+    except (IOError, ValueError):
+        return (None, None)
+    durations = dict([(event['name'], event['dur'] / 1e6) for event in trace.get('traceEvents', [])
+                      if event.get('name') in ('Total Frontend', 'Total Backend')])
+    return (durations.get('Total Frontend'), durations.get('Total Backend'))
+
+def main():
+    logfile = sys.argv[1]
+    cmd = sys.argv[2:]
+    start = time.time()
+    proc = subprocess.Popen(cmd, stderr=subprocess.PIPE)
+    stderr = proc.communicate()[1]
+    wall = time.time() - start
+    if '-c' not in cmd or '-o' not in cmd:
+        sys.stderr.write(stderr)
+        return proc.returncode
+    source = cmd[cmd.index('-c') + 1]
+    objfile = cmd[cmd.index('-o') + 1]
+    (frontend, backend, stderr) = gcc_time_report(stderr)
+    if frontend is None:
+        (frontend, backend) = clang_time_trace(objfile)
+    if stderr.strip():
+        sys.stderr.write(stderr)
+    if proc.returncode == 0:
+        entry = {'source': os.path.abspath(source), 'object': objfile, 'wall': wall,
+                 'frontend': frontend, 'backend': backend}
+        open(logfile, 'a').write(json.dumps(entry) + '\\n')
+    return proc.returncode
+
+if __name__ == '__main__':
+    sys.exit(main())
+'''
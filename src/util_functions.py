@@ -3,6 +3,8 @@
 import re
 import sys
 
+from profiler import profile_phase
+
 ### Utility functions ########################################################
 def get_command_from_argv(possible_cmds):
     """ Read the requested command from argv. This can't be done with optparse,
@@ -18,6 +20,7 @@ def get_command_from_argv(possible_cmds):
             return arg
     return None
 
+@profile_phase('edit')
 def append_re_line_sequence(filename, linepattern, newline):
     """Detects the re 'linepattern' in the file. After its last occurrence,
     paste 'newline'. If the pattern does not exist, append the new line
@@ -31,6 +34,7 @@ def append_re_line_sequence(filename, linepattern, newline):
     newfile = oldfile.replace(last_line, last_line + newline + '\n')
     open(filename, 'w').write(newfile)
 
+@profile_phase('edit')
 def remove_pattern_from_file(filename, pattern):
     """ Remove all occurrences of a given pattern from a file. """
     oldfile = open(filename, 'r').read()
@@ -60,6 +64,27 @@ def strip_arg_types(string):
     string = strip_default_values(string)
     return ", ".join([part.strip().split(' ')[-1] for part in string.split(',')])
 
+def get_python_arg_values(string):
+    """ Return the arguments of a C++ or Python argument list as a list of
+    (name, value) tuples, where value is the default value as Python code,
+    or None if there's no default Python understands.
+    Example: "float gain, int n=4, bool on=true" ->
+             [('gain', None), ('n', '4'), ('on', 'True')] """
+    args = []
+    for part in string.split(','):
+        if len(part.strip()) == 0:
+            continue
+        (decl, eq, default) = part.partition('=')
+        name = re.sub(r'[&*]', ' ', decl).split()[-1]
+        default = default.strip()
+        default = {'true': 'True', 'false': 'False'}.get(default, default)
+        default = re.sub(r'^([-+]?(\d+\.\d*|\.\d+|\d+)(e[-+]?\d+)?)[fFlLuU]+$', r'\1', default)
+        if re.match(r'^([-+]?[\d.]+(e[-+]?\d+)?j?|True|False|None|"[^"]*"|\'[^\']*\')$', default) is None:
+            default = None
+        args.append((name, default))
+    return args
+
+@profile_phase('discovery')
 def get_modname():
     """ Grep the current module's name from gnuradio.project or CMakeLists.txt """
     modname_trans = {'howto-write-a-block': 'howto'}